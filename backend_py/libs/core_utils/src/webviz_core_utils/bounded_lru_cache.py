@@ -0,0 +1,156 @@
+import time
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import Callable, Generic, Hashable, TypeVar
+
+KeyT = TypeVar("KeyT", bound=Hashable)
+ValueT = TypeVar("ValueT")
+
+
+@dataclass(frozen=True, kw_only=True)
+class CacheStats:
+    num_entries: int
+    size_bytes: int
+    hits: int
+    misses: int
+    evictions: int
+
+
+@dataclass(slots=True)
+class _CacheEntry(Generic[ValueT]):
+    value: ValueT
+    size_bytes: int
+    expiry_time_s: float | None
+
+
+class BoundedLruCache(Generic[KeyT, ValueT]):
+    """
+    In-process LRU cache that is bounded by total size in bytes and/or by number of entries.
+    Entries can optionally be given a time to live, after which they will be treated as missing.
+
+    When a size budget is specified, the size of each value is determined by the size_fn callback.
+    The optional on_evict callback is invoked whenever an entry is removed to make room for new entries,
+    or is dropped because it has expired.
+
+    Note that this class is not thread safe and is intended to be used from within a single asyncio event loop.
+    """
+
+    def __init__(
+        self,
+        max_size_bytes: int | None = None,
+        max_entries: int | None = None,
+        ttl_s: float | None = None,
+        size_fn: Callable[[ValueT], int] | None = None,
+        on_evict: Callable[[KeyT, ValueT], None] | None = None,
+    ) -> None:
+        if max_size_bytes is None and max_entries is None:
+            raise ValueError("At least one of max_size_bytes or max_entries must be specified")
+        if max_size_bytes is not None and size_fn is None:
+            raise ValueError("A size_fn must be specified when using max_size_bytes")
+
+        self._max_size_bytes = max_size_bytes
+        self._max_entries = max_entries
+        self._default_ttl_s = ttl_s
+        self._size_fn = size_fn
+        self._on_evict = on_evict
+
+        self._entries: OrderedDict[KeyT, _CacheEntry[ValueT]] = OrderedDict()
+        self._size_bytes = 0
+        self._hits = 0
+        self._misses = 0
+        self._evictions = 0
+
+    def get(self, key: KeyT) -> ValueT | None:
+        """
+        Get value for key, marking the entry as most recently used.
+        Returns None if the key is not present or if the entry has expired.
+        """
+        entry = self._entries.get(key)
+        if entry is None:
+            self._misses += 1
+            return None
+
+        if entry.expiry_time_s is not None and time.monotonic() >= entry.expiry_time_s:
+            self._remove_entry(key, notify=True)
+            self._misses += 1
+            return None
+
+        self._entries.move_to_end(key)
+        self._hits += 1
+        return entry.value
+
+    def put(self, key: KeyT, value: ValueT, ttl_s: float | None = None) -> bool:
+        """
+        Insert or replace value for key, evicting least recently used entries as needed.
+        The ttl_s argument overrides the default time to live for this entry.
+        Returns False if the value is larger than the total size budget and was therefore not inserted.
+        """
+        size_bytes = self._size_fn(value) if self._size_fn is not None else 0
+        if self._max_size_bytes is not None and size_bytes > self._max_size_bytes:
+            return False
+
+        if key in self._entries:
+            self._remove_entry(key, notify=False)
+
+        effective_ttl_s = ttl_s if ttl_s is not None else self._default_ttl_s
+        expiry_time_s = time.monotonic() + effective_ttl_s if effective_ttl_s is not None else None
+
+        self._entries[key] = _CacheEntry(value=value, size_bytes=size_bytes, expiry_time_s=expiry_time_s)
+        self._size_bytes += size_bytes
+
+        self._evict_until_within_budget()
+        return True
+
+    def pop(self, key: KeyT) -> ValueT | None:
+        """
+        Remove entry for key and return its value, returns None if the key is not present.
+        Does not invoke the on_evict callback.
+        """
+        entry = self._remove_entry(key, notify=False)
+        return entry.value if entry is not None else None
+
+    def clear(self) -> None:
+        self._entries.clear()
+        self._size_bytes = 0
+
+    def get_stats(self) -> CacheStats:
+        return CacheStats(
+            num_entries=len(self._entries),
+            size_bytes=self._size_bytes,
+            hits=self._hits,
+            misses=self._misses,
+            evictions=self._evictions,
+        )
+
+    def __contains__(self, key: KeyT) -> bool:
+        entry = self._entries.get(key)
+        if entry is None:
+            return False
+        return entry.expiry_time_s is None or time.monotonic() < entry.expiry_time_s
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def _evict_until_within_budget(self) -> None:
+        while self._entries and self._is_over_budget():
+            oldest_key = next(iter(self._entries))
+            self._remove_entry(oldest_key, notify=True)
+            self._evictions += 1
+
+    def _is_over_budget(self) -> bool:
+        if self._max_size_bytes is not None and self._size_bytes > self._max_size_bytes:
+            return True
+        if self._max_entries is not None and len(self._entries) > self._max_entries:
+            return True
+        return False
+
+    def _remove_entry(self, key: KeyT, notify: bool) -> _CacheEntry[ValueT] | None:
+        entry = self._entries.pop(key, None)
+        if entry is None:
+            return None
+
+        self._size_bytes -= entry.size_bytes
+        if notify and self._on_evict is not None:
+            self._on_evict(key, entry.value)
+
+        return entry
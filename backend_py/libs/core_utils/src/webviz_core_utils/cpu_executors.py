@@ -0,0 +1,210 @@
+import asyncio
+import functools
+import logging
+import multiprocessing
+import threading
+import time
+from concurrent.futures import Executor, ProcessPoolExecutor, ThreadPoolExecutor
+from dataclasses import dataclass
+from enum import StrEnum
+from typing import Callable, Protocol, TypeVar, TypeVarTuple
+
+R = TypeVar("R")
+Ts = TypeVarTuple("Ts")
+
+LOGGER = logging.getLogger(__name__)
+
+
+class ExecutorKind(StrEnum):
+    """
+    THREAD is intended for work that mostly releases the GIL (numpy, polars, pyarrow),
+    while PROCESS is intended for pure Python work that holds the GIL (e.g. xtgeo parsing).
+    """
+
+    THREAD = "thread"
+    PROCESS = "process"
+
+
+class MetricsSink(Protocol):
+    def set_metric(self, metric_name: str, duration_ms: int | float) -> None: ...
+
+
+class PrefixedMetricsSink:
+    """
+    Metrics sink that prefixes the metric names before passing them on to another sink.
+    Use when several executor jobs report to the same sink, so that the metrics of one job do not overwrite another's.
+    """
+
+    def __init__(self, metrics_sink: MetricsSink, prefix: str) -> None:
+        self._metrics_sink = metrics_sink
+        self._prefix = prefix
+
+    def set_metric(self, metric_name: str, duration_ms: int | float) -> None:
+        self._metrics_sink.set_metric(f"{self._prefix}-{metric_name}", duration_ms)
+
+
+@dataclass(frozen=True, kw_only=True)
+class ExecutorStats:
+    kind: ExecutorKind
+    max_workers: int
+    num_in_flight: int
+    queue_depth: int
+    num_completed: int
+    total_wait_ms: float
+    max_wait_ms: float
+
+
+class _TrackedExecutor:
+    """
+    Wraps a concurrent.futures executor and keeps track of how many jobs are queued and how long they wait.
+
+    The queue depth is the number of submitted jobs that exceed the number of workers. The wait time is measured
+    from submission until the job starts running in a worker, using time.monotonic() which is system-wide and
+    thus comparable across processes on the same host.
+    """
+
+    def __init__(self, kind: ExecutorKind, executor: Executor, max_workers: int) -> None:
+        self._kind = kind
+        self._executor = executor
+        self._max_workers = max_workers
+        self._lock = threading.Lock()
+        self._num_in_flight = 0
+        self._num_completed = 0
+        self._total_wait_ms = 0.0
+        self._max_wait_ms = 0.0
+
+    async def run_async(self, func: Callable[[], R], metrics_sink: MetricsSink | None) -> R:
+        # The queue depth seen by this job, i.e. the number of jobs waiting for a worker including this one
+        with self._lock:
+            queue_depth = max(0, self._num_in_flight - self._max_workers + 1)
+            self._num_in_flight += 1
+
+        submit_time_s = time.monotonic()
+        try:
+            loop = asyncio.get_running_loop()
+            start_time_s, result = await loop.run_in_executor(
+                self._executor, functools.partial(_call_and_report_start_time, func)
+            )
+        finally:
+            with self._lock:
+                self._num_in_flight -= 1
+
+        wait_ms = max(0.0, (start_time_s - submit_time_s) * 1000)
+        with self._lock:
+            self._num_completed += 1
+            self._total_wait_ms += wait_ms
+            self._max_wait_ms = max(self._max_wait_ms, wait_ms)
+
+        if metrics_sink is not None:
+            metrics_sink.set_metric(f"{self._kind}-exec-wait", wait_ms)
+            metrics_sink.set_metric(f"{self._kind}-exec-queue", queue_depth)
+
+        return result
+
+    def get_stats(self) -> ExecutorStats:
+        with self._lock:
+            return ExecutorStats(
+                kind=self._kind,
+                max_workers=self._max_workers,
+                num_in_flight=self._num_in_flight,
+                queue_depth=max(0, self._num_in_flight - self._max_workers),
+                num_completed=self._num_completed,
+                total_wait_ms=self._total_wait_ms,
+                max_wait_ms=self._max_wait_ms,
+            )
+
+    def shutdown(self) -> None:
+        self._executor.shutdown(wait=False, cancel_futures=True)
+
+
+def _call_and_report_start_time(func: Callable[[], R]) -> tuple[float, R]:
+    # Must be a module level function so that it can be pickled when running in a process pool
+    start_time_s = time.monotonic()
+    return start_time_s, func()
+
+
+# Process-wide state (private to module)
+_thread_executor: _TrackedExecutor | None = None  # pylint: disable=invalid-name
+_process_executor: _TrackedExecutor | None = None  # pylint: disable=invalid-name
+
+
+def init_cpu_executors(num_thread_workers: int, num_process_workers: int) -> None:
+    """
+    One-time initialization of the process-wide executors used for offloading CPU-bound work from the event loop.
+
+    If num_process_workers is 0, no process pool is created and work targeted for the process pool
+    will run in the thread pool instead. The worker processes are started using 'spawn' to avoid
+    forking a process that may already be running threads.
+    """
+    # pylint: disable=global-statement
+    global _thread_executor
+    global _process_executor
+    if _thread_executor is not None:
+        raise RuntimeError("CPU executors are already initialized")
+
+    if num_thread_workers < 1:
+        raise ValueError("Number of thread workers must be at least 1")
+
+    thread_pool = ThreadPoolExecutor(max_workers=num_thread_workers, thread_name_prefix="cpu_executor")
+    _thread_executor = _TrackedExecutor(ExecutorKind.THREAD, thread_pool, num_thread_workers)
+
+    if num_process_workers > 0:
+        process_pool = ProcessPoolExecutor(
+            max_workers=num_process_workers, mp_context=multiprocessing.get_context("spawn")
+        )
+        _process_executor = _TrackedExecutor(ExecutorKind.PROCESS, process_pool, num_process_workers)
+
+    LOGGER.info(f"Initialized CPU executors ({num_thread_workers=}, {num_process_workers=})")
+
+
+def shutdown_cpu_executors() -> None:
+    """
+    Shut down the process-wide executors, any queued work that has not yet started is cancelled.
+    """
+    # pylint: disable=global-statement
+    global _thread_executor
+    global _process_executor
+
+    for tracked_executor in [_thread_executor, _process_executor]:
+        if tracked_executor is not None:
+            tracked_executor.shutdown()
+
+    _thread_executor = None
+    _process_executor = None
+
+
+def get_cpu_executor_stats() -> list[ExecutorStats]:
+    return [executor.get_stats() for executor in [_thread_executor, _process_executor] if executor is not None]
+
+
+async def run_in_thread_executor_async(
+    func: Callable[[*Ts], R], *args: *Ts, metrics_sink: MetricsSink | None = None
+) -> R:
+    """
+    Run func in the thread pool executor and await the result.
+
+    If the executors have not been initialized, func is run in asyncio's default executor instead.
+    If metrics_sink is specified (e.g. PerfMetrics or ResponsePerfMetrics), the wait time and queue depth
+    at submission will be recorded as 'thread-exec-wait' and 'thread-exec-queue'.
+    """
+    bound_func = functools.partial(func, *args)
+    if _thread_executor is None:
+        return await asyncio.to_thread(bound_func)
+
+    return await _thread_executor.run_async(bound_func, metrics_sink)
+
+
+async def run_in_process_executor_async(
+    func: Callable[[*Ts], R], *args: *Ts, metrics_sink: MetricsSink | None = None
+) -> R:
+    """
+    Run func in the process pool executor and await the result.
+
+    Both func, the arguments and the return value must be picklable. If no process pool has been configured,
+    func is run in the thread pool instead, see run_in_thread_executor_async().
+    """
+    if _process_executor is None:
+        return await run_in_thread_executor_async(func, *args, metrics_sink=metrics_sink)
+
+    bound_func = functools.partial(func, *args)
+    return await _process_executor.run_async(bound_func, metrics_sink)
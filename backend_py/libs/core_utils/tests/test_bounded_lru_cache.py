@@ -0,0 +1,81 @@
+import time
+
+import pytest
+
+from webviz_core_utils.bounded_lru_cache import BoundedLruCache
+
+
+def test_evicts_least_recently_used_when_over_size_budget() -> None:
+    evicted_keys: list[str] = []
+    cache: BoundedLruCache[str, bytes] = BoundedLruCache(
+        max_size_bytes=10, size_fn=len, on_evict=lambda key, _value: evicted_keys.append(key)
+    )
+
+    cache.put("a", b"1234")
+    cache.put("b", b"1234")
+
+    # Touch "a" so that "b" becomes the least recently used entry
+    assert cache.get("a") == b"1234"
+
+    cache.put("c", b"1234")
+
+    assert "b" not in cache
+    assert cache.get("a") == b"1234"
+    assert cache.get("c") == b"1234"
+    assert evicted_keys == ["b"]
+
+    stats = cache.get_stats()
+    assert stats.num_entries == 2
+    assert stats.size_bytes == 8
+    assert stats.evictions == 1
+
+
+def test_evicts_when_over_max_entries() -> None:
+    cache: BoundedLruCache[int, str] = BoundedLruCache(max_entries=2)
+    cache.put(1, "one")
+    cache.put(2, "two")
+    cache.put(3, "three")
+
+    assert len(cache) == 2
+    assert cache.get(1) is None
+    assert cache.get(2) == "two"
+    assert cache.get(3) == "three"
+
+
+def test_replacing_entry_updates_size() -> None:
+    cache: BoundedLruCache[str, bytes] = BoundedLruCache(max_size_bytes=100, size_fn=len)
+    cache.put("a", b"12345")
+    cache.put("a", b"12")
+
+    assert cache.get_stats().size_bytes == 2
+    assert cache.pop("a") == b"12"
+    assert cache.get_stats().size_bytes == 0
+
+
+def test_value_larger_than_budget_is_rejected() -> None:
+    cache: BoundedLruCache[str, bytes] = BoundedLruCache(max_size_bytes=4, size_fn=len)
+    cache.put("small", b"12")
+
+    assert not cache.put("big", b"12345")
+    assert cache.get("big") is None
+    assert cache.get("small") == b"12"
+
+
+def test_expired_entries_are_treated_as_missing() -> None:
+    cache: BoundedLruCache[str, str] = BoundedLruCache(max_entries=10, ttl_s=60)
+    cache.put("default_ttl", "value")
+    cache.put("short_ttl", "value", ttl_s=0.01)
+
+    time.sleep(0.02)
+
+    assert cache.get("default_ttl") == "value"
+    assert cache.get("short_ttl") is None
+    assert "short_ttl" not in cache
+
+
+def test_invalid_configuration_raises() -> None:
+    with pytest.raises(ValueError):
+        BoundedLruCache()
+
+    with pytest.raises(ValueError):
+        BoundedLruCache(max_size_bytes=10)
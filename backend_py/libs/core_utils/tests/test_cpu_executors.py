@@ -0,0 +1,110 @@
+# pylint: disable=async-suffix
+
+import asyncio
+import threading
+import time
+from typing import Iterator
+
+import pytest
+
+from webviz_core_utils.cpu_executors import (
+    ExecutorKind,
+    PrefixedMetricsSink,
+    get_cpu_executor_stats,
+    init_cpu_executors,
+    run_in_process_executor_async,
+    run_in_thread_executor_async,
+    shutdown_cpu_executors,
+)
+from webviz_core_utils.perf_metrics import PerfMetrics
+
+
+@pytest.fixture(name="single_thread_executor")
+def fixture_single_thread_executor() -> Iterator[None]:
+    init_cpu_executors(num_thread_workers=1, num_process_workers=0)
+    yield
+    shutdown_cpu_executors()
+
+
+def _get_thread_name() -> str:
+    return threading.current_thread().name
+
+
+def _sleep_and_return(value: int, sleep_s: float) -> int:
+    time.sleep(sleep_s)
+    return value
+
+
+@pytest.mark.asyncio
+async def test_run_in_thread_executor_runs_off_event_loop(single_thread_executor: None) -> None:
+    # pylint: disable=unused-argument
+    thread_name = await run_in_thread_executor_async(_get_thread_name)
+    assert thread_name.startswith("cpu_executor")
+    assert thread_name != threading.current_thread().name
+
+
+@pytest.mark.asyncio
+async def test_wait_time_and_queue_depth_are_recorded(single_thread_executor: None) -> None:
+    # pylint: disable=unused-argument
+    first_metrics = PerfMetrics()
+    second_metrics = PerfMetrics()
+
+    results = await asyncio.gather(
+        run_in_thread_executor_async(_sleep_and_return, 1, 0.1, metrics_sink=first_metrics),
+        run_in_thread_executor_async(_sleep_and_return, 2, 0.0, metrics_sink=second_metrics),
+    )
+    assert results == [1, 2]
+
+    # With a single worker, the second job must wait for the first one to finish
+    assert first_metrics.to_dict()["thread-exec-queue"] == 0
+    assert second_metrics.to_dict()["thread-exec-queue"] == 1
+    assert second_metrics.to_dict()["thread-exec-wait"] >= 50
+
+    stats_list = get_cpu_executor_stats()
+    assert len(stats_list) == 1
+    assert stats_list[0].kind == ExecutorKind.THREAD
+    assert stats_list[0].num_completed == 2
+    assert stats_list[0].num_in_flight == 0
+
+
+@pytest.mark.asyncio
+async def test_prefixed_metrics_sink_keeps_metrics_of_each_job(single_thread_executor: None) -> None:
+    # pylint: disable=unused-argument
+    perf_metrics = PerfMetrics()
+
+    await run_in_thread_executor_async(_sleep_and_return, 1, 0.0, metrics_sink=PrefixedMetricsSink(perf_metrics, "a"))
+    await run_in_thread_executor_async(_sleep_and_return, 2, 0.0, metrics_sink=PrefixedMetricsSink(perf_metrics, "b"))
+
+    metric_names = set(perf_metrics.to_dict())
+    assert {"a-thread-exec-wait", "a-thread-exec-queue", "b-thread-exec-wait", "b-thread-exec-queue"} <= metric_names
+    assert "thread-exec-wait" not in metric_names
+
+
+@pytest.mark.asyncio
+async def test_process_executor_falls_back_to_threads_when_not_configured(single_thread_executor: None) -> None:
+    # pylint: disable=unused-argument
+    thread_name = await run_in_process_executor_async(_get_thread_name)
+    assert thread_name.startswith("cpu_executor")
+
+
+@pytest.mark.asyncio
+async def test_exceptions_are_propagated(single_thread_executor: None) -> None:
+    # pylint: disable=unused-argument
+    def _raise() -> None:
+        raise ValueError("failed")
+
+    with pytest.raises(ValueError):
+        await run_in_thread_executor_async(_raise)
+
+    assert get_cpu_executor_stats()[0].num_in_flight == 0
+
+
+@pytest.mark.asyncio
+async def test_runs_in_default_executor_when_not_initialized() -> None:
+    assert await run_in_thread_executor_async(_sleep_and_return, 3, 0.0) == 3
+
+
+def test_init_twice_raises(single_thread_executor: None) -> None:
+    # pylint: disable=unused-argument
+    with pytest.raises(RuntimeError):
+        init_cpu_executors(num_thread_workers=1, num_process_workers=0)
@@ -56,6 +56,21 @@ class GridGeometryResponse(BaseModel):
     stats: Stats | None
 
 
+class GridGeometryStreamHeader(BaseModel):
+    # Element counts of the arrays that follow in the stream
+    vertex_count: int
+    poly_count: int
+    polys_element_count: int
+    origin_utm_x: float
+    origin_utm_y: float
+    grid_dimensions: GridDimensions
+
+
+class GridGeometryStreamTrailer(BaseModel):
+    bounding_box: BoundingBox3D
+    stats: Stats | None
+
+
 class MappedGridPropertiesRequest(BaseModel):
     sas_token: str
     blob_store_base_uri: str
@@ -0,0 +1,139 @@
+import struct
+from enum import IntEnum
+
+import numpy as np
+from numpy.typing import NDArray
+from pydantic import BaseModel
+
+from .api_schemas import GridGeometryStreamHeader, GridGeometryStreamTrailer
+
+# Binary format of the grid geometry stream
+#
+# The stream is a sequence of frames, each consisting of a fixed size prefix followed by the frame's payload.
+# The prefix holds the frame kind (uint8) and the payload size in bytes (uint32), both little endian.
+#
+# The first frame is always a HEADER frame with the json encoded GridGeometryStreamHeader, which gives the total
+# number of elements of each array. It is followed by any number of array chunk frames holding raw little endian
+# array data, in the order of the array within each kind. The last frame is a TRAILER frame with the json encoded
+# GridGeometryStreamTrailer.
+
+_FRAME_PREFIX = struct.Struct("<BI")
+
+
+class FrameKind(IntEnum):
+    HEADER = 1
+    VERTICES = 2
+    POLYS = 3
+    POLY_SOURCE_CELL_INDICES = 4
+    TRAILER = 5
+
+
+_ARRAY_DTYPES: dict[FrameKind, np.dtype] = {
+    FrameKind.VERTICES: np.dtype("<f4"),
+    FrameKind.POLYS: np.dtype("<u4"),
+    FrameKind.POLY_SOURCE_CELL_INDICES: np.dtype("<u4"),
+}
+
+
+def encode_json_frame(kind: FrameKind, model: BaseModel) -> bytes:
+    payload = model.model_dump_json().encode()
+    return _FRAME_PREFIX.pack(kind, len(payload)) + payload
+
+
+def encode_array_frame(kind: FrameKind, arr: NDArray) -> tuple[bytes, memoryview]:
+    """
+    Encode a chunk of array data, returning the frame prefix and a view of the array data as the payload.
+    The two can be written separately, thus avoiding a copy of the array data.
+    """
+    payload = memoryview(np.ascontiguousarray(arr, dtype=_ARRAY_DTYPES[kind])).cast("B")
+    return _FRAME_PREFIX.pack(kind, payload.nbytes), payload
+
+
+class DecodedGridGeometry(BaseModel, arbitrary_types_allowed=True):
+    header: GridGeometryStreamHeader
+    trailer: GridGeometryStreamTrailer
+    vertices: NDArray[np.float32]
+    polys: NDArray[np.uint32]
+    poly_source_cell_indices: NDArray[np.uint32]
+
+
+class GridGeometryStreamDecoder:
+    """
+    Incremental decoder for the grid geometry stream.
+
+    The arrays are allocated once the header frame has been received, and the content of each array chunk frame is
+    copied straight into its array. Only incomplete frames are buffered, so memory use beyond the final arrays is
+    proportional to the chunk size of the stream.
+    """
+
+    def __init__(self) -> None:
+        self._buffer = bytearray()
+        self._header: GridGeometryStreamHeader | None = None
+        self._trailer: GridGeometryStreamTrailer | None = None
+        self._arrays: dict[FrameKind, NDArray] = {}
+        self._fill_counts: dict[FrameKind, int] = {}
+
+    def feed(self, data: bytes) -> None:
+        self._buffer.extend(data)
+
+        pos = 0
+        while len(self._buffer) - pos >= _FRAME_PREFIX.size:
+            kind, payload_size = _FRAME_PREFIX.unpack_from(self._buffer, pos)
+            payload_start = pos + _FRAME_PREFIX.size
+            payload_end = payload_start + payload_size
+            if len(self._buffer) < payload_end:
+                break
+
+            with memoryview(self._buffer) as buffer_view:
+                self._handle_frame(FrameKind(kind), buffer_view[payload_start:payload_end])
+            pos = payload_end
+
+        del self._buffer[:pos]
+
+    def get_result(self) -> DecodedGridGeometry:
+        if self._header is None or self._trailer is None or self._buffer:
+            raise ValueError("Grid geometry stream is incomplete")
+
+        for kind, arr in self._arrays.items():
+            if self._fill_counts[kind] != len(arr):
+                raise ValueError(f"Grid geometry stream has {self._fill_counts[kind]} of {len(arr)} {kind.name} values")
+
+        return DecodedGridGeometry(
+            header=self._header,
+            trailer=self._trailer,
+            vertices=self._arrays[FrameKind.VERTICES],
+            polys=self._arrays[FrameKind.POLYS],
+            poly_source_cell_indices=self._arrays[FrameKind.POLY_SOURCE_CELL_INDICES],
+        )
+
+    def _handle_frame(self, kind: FrameKind, payload: memoryview) -> None:
+        if kind == FrameKind.HEADER:
+            self._header = GridGeometryStreamHeader.model_validate_json(bytes(payload))
+            self._allocate_arrays(self._header)
+            return
+
+        if self._header is None:
+            raise ValueError(f"Got {kind.name} frame before header in grid geometry stream")
+
+        if kind == FrameKind.TRAILER:
+            self._trailer = GridGeometryStreamTrailer.model_validate_json(bytes(payload))
+            return
+
+        chunk = np.frombuffer(payload, dtype=_ARRAY_DTYPES[kind])
+        start = self._fill_counts[kind]
+        target_arr = self._arrays[kind]
+        if start + len(chunk) > len(target_arr):
+            raise ValueError(f"Too many {kind.name} values in grid geometry stream")
+
+        target_arr[start : start + len(chunk)] = chunk
+        self._fill_counts[kind] = start + len(chunk)
+
+    def _allocate_arrays(self, header: GridGeometryStreamHeader) -> None:
+        element_counts = {
+            FrameKind.VERTICES: 3 * header.vertex_count,
+            FrameKind.POLYS: header.polys_element_count,
+            FrameKind.POLY_SOURCE_CELL_INDICES: header.poly_count,
+        }
+        for kind, element_count in element_counts.items():
+            self._arrays[kind] = np.empty(element_count, dtype=_ARRAY_DTYPES[kind].newbyteorder("="))
+            self._fill_counts[kind] = 0
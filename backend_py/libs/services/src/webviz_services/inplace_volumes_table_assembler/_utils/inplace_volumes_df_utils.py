@@ -40,20 +40,21 @@ def validate_inplace_volumes_df_selector_columns(
         )
 
 
-def sum_inplace_volumes_grouped_by_indices_and_real_df(
-    inplace_volumes_df: pl.DataFrame,
+def sum_inplace_volumes_grouped_by_indices_and_real_lf(
+    inplace_volumes_lf: pl.LazyFrame,
     group_by_indices: list[InplaceVolumes.TableIndexColumns] | None,
-) -> pl.DataFrame:
+) -> pl.LazyFrame:
     """
-    Create a Polars DataFrame with summed volumes per index to group by and realization.
+    Create a Polars LazyFrame with summed volumes per index to group by and realization.
 
-    This function groups a DataFrame of inplace volumes by specified index columns and realizations,
+    This function groups a LazyFrame of inplace volumes by specified index columns and realizations,
     summing the volume columns within each group. The result is a single row per realization and requested group by index.
 
-    This function assumes that the inplace_volumes_df has been filtered to only contain rows of interest, i.e. index value, realizations, etc.
+    This function assumes that the inplace_volumes_lf has been filtered to only contain rows of interest, i.e. index value, realizations, etc.
+    The grouping is only added to the query plan, i.e. nothing is computed until the returned LazyFrame is collected.
 
     ### Output Columns
-    The resulting DataFrame will always include:
+    The resulting LazyFrame will always include:
     - `"REAL"`: The realization identifier (always present).
     - All columns specified in `group_by_indices`, if any.
     - Volume columns (e.g., `"STOIIP"`, `"GIIP"`, `"HCPV"`) — all columns that are not index columns or `"REAL"`.
@@ -65,17 +66,17 @@ def sum_inplace_volumes_grouped_by_indices_and_real_df(
     ### Example
     **Input**
     ```
-    inplace_volumes_df.columns = ["FLUID", "ZONE", "REGION", "FACIES", "REAL", "STOIIP", "GIIP", "HCPV"]
+    inplace_volumes_lf.columns = ["FLUID", "ZONE", "REGION", "FACIES", "REAL", "STOIIP", "GIIP", "HCPV"]
     group_by_indices = [InplaceVolumes.TableIndexColumns.ZONE]
     ```
     **Output**
     ```
-    per_group_summed_df.columns = ["ZONE", "REAL", "STOIIP", "GIIP", "HCPV"]
+    per_group_summed_lf.columns = ["ZONE", "REAL", "STOIIP", "GIIP", "HCPV"]
     ```
     """
-    column_names = inplace_volumes_df.columns
+    column_names = inplace_volumes_lf.collect_schema().names()
 
-    # Verify that the DataFrame has the required columns (always require FLUID column)
+    # Verify that the LazyFrame has the required columns (always require FLUID column)
     required_index_columns: set[str] = {e.value for e in group_by_indices} if group_by_indices else set()
     required_selector_columns = {"REAL"} | required_index_columns
     missing_selector_columns = required_selector_columns - set(column_names)
@@ -91,11 +92,11 @@ def sum_inplace_volumes_grouped_by_indices_and_real_df(
     volume_columns = [col for col in column_names if col not in InplaceVolumes.selector_columns()]
 
     # Selector columns not in group by will be excluded, these should not be aggregated
-    per_group_summed_df = inplace_volumes_df.group_by(columns_to_group_by_for_sum).agg(
+    per_group_summed_lf = inplace_volumes_lf.group_by(columns_to_group_by_for_sum).agg(
         [pl.col(col).drop_nulls().sum().alias(col) for col in volume_columns]
     )
 
-    return per_group_summed_df
+    return per_group_summed_lf
 
 
 def create_inplace_volumes_df_per_unique_fluid_value(
@@ -1,5 +1,6 @@
 import asyncio
 import logging
+from typing import Literal
 
 import pyarrow as pa
 import polars as pl
@@ -37,12 +38,17 @@ from ._utils.inplace_results_df_utils import create_per_fluid_results_df, create
 from ._utils.inplace_volumes_df_utils import (
     create_inplace_volumes_df_per_unique_fluid_value,
     remove_invalid_optional_index_columns,
-    sum_inplace_volumes_grouped_by_indices_and_real_df,
+    sum_inplace_volumes_grouped_by_indices_and_real_lf,
     validate_inplace_volumes_df_selector_columns,
 )
 
 LOGGER = logging.getLogger(__name__)
 
+# Tables with at least this number of rows are collected using the streaming engine of Polars, which processes the
+# query plan in batches and thereby bounds the memory used for intermediate results. The in-memory engine is faster
+# for smaller tables.
+_STREAMING_ENGINE_MIN_ROW_COUNT = 10_000_000
+
 
 class InplaceVolumesTableAssembler:
     """
@@ -271,7 +277,9 @@ class InplaceVolumesTableAssembler:
         Note:
         - This function finds all necessary volumes from requested result names. Calculation of properties and calculated volumes has to be done outside this function.
         - If group_by_indices is None or does not include FLUID, the fluids will be summed in the result, and BO and BG properties will be excluded from the result names.
+        - The filtering and summing of the volumes table is executed as a single Polars query plan, i.e. without materializing intermediate DataFrames.
         """
+        # pylint: disable=too-many-locals
 
         if group_by_indices == []:
             raise InvalidParameterError("Group by indices must be non-empty list or None", Service.GENERAL)
@@ -290,31 +298,52 @@ class InplaceVolumesTableAssembler:
             valid_result_names
         )
 
-        # Create volumes df filtered on indices values and realizations, for all necessary volumes
-        row_filtered_volumes_df = await self._get_row_filtered_inplace_volumes_df_async(
+        # Build lazy query plan for the volumes filtered on indices values and realizations, for all necessary volumes
+        volumes_table_df, row_filtered_volumes_lf = await self._get_row_filtered_inplace_volumes_lf_async(
             table_name, all_necessary_volume_names, realizations, indices_with_values
         )
 
-        if row_filtered_volumes_df.is_empty():
-            # If no data is found for the given indices and realizations, return empty dictionary
+        if volumes_table_df.is_empty():
+            # If no data is found for the table, return empty dictionary
             empty_dict: dict[str, pl.DataFrame] = {}
             return (empty_dict, categorized_result_names)
 
         # Ensure valid inplace volumes DataFrame (contains necessary index columns and realization column)
-        validate_inplace_volumes_df_selector_columns(row_filtered_volumes_df)
+        validate_inplace_volumes_df_selector_columns(volumes_table_df)
+
+        # Add summing of inplace volumes grouped by selected index columns, fluid and realization to the query plan
+        # - Always group by FLUID, so that the unique fluids are available if the fluids are to be accumulated
+        # - Resulting DataFrame has selector columns: REAL + FLUID + index columns in group_by_indices
+        group_by_indices_and_fluid = list(group_by_indices or [])
+        if sum_fluids:
+            group_by_indices_and_fluid.append(InplaceVolumes.TableIndexColumns.FLUID)
+        volume_sums_by_indices_fluid_and_real_lf = sum_inplace_volumes_grouped_by_indices_and_real_lf(
+            row_filtered_volumes_lf, group_by_indices_and_fluid
+        )
 
-        # Create summed inplace volumes table data grouped by selected index columns and realization
-        # - Resulting DataFrame has selector columns: REAL + index columns in group_by_indices
-        volume_sums_by_indices_and_real_df = sum_inplace_volumes_grouped_by_indices_and_real_df(
-            row_filtered_volumes_df, group_by_indices
+        # Execute the query plan, i.e. filtering and summing of the volumes table, without intermediate DataFrames
+        timer = PerfTimer()
+        collect_engine: Literal["streaming", "auto"] = (
+            "streaming" if volumes_table_df.height >= _STREAMING_ENGINE_MIN_ROW_COUNT else "auto"
+        )
+        volume_sums_by_indices_fluid_and_real_df = volume_sums_by_indices_fluid_and_real_lf.collect(
+            engine=collect_engine
         )
+        LOGGER.debug(
+            f"Time collecting accumulated inplace volumes DataFrame: {timer.lap_ms()}ms ({collect_engine=}, "
+            f"{volumes_table_df.height} rows -> {volume_sums_by_indices_fluid_and_real_df.height} rows)"
+        )
+
+        if volume_sums_by_indices_fluid_and_real_df.is_empty():
+            # If no data is found for the given indices and realizations, return empty dictionary
+            return ({}, categorized_result_names)
 
         # Dictionary with DataFrame per unique fluid value
         # - If not grouped by fluid, the fluids are accumulated and column FLUID is not present in the DataFrame
         accumulated_inplace_volumes_real_df_per_fluid_value_dict: dict[str, pl.DataFrame] = {}
-        if InplaceVolumes.TableIndexColumns.FLUID in volume_sums_by_indices_and_real_df.columns:
+        if not sum_fluids:
             accumulated_inplace_volumes_real_df_per_fluid_value_dict = create_inplace_volumes_df_per_unique_fluid_value(
-                volume_sums_by_indices_and_real_df
+                volume_sums_by_indices_fluid_and_real_df
             )
         else:
             expected_fluids = next(
@@ -324,7 +353,9 @@ class InplaceVolumesTableAssembler:
 
             # Accumulated fluids
             unique_fluids = sorted(
-                row_filtered_volumes_df[InplaceVolumes.TableIndexColumns.FLUID.value].unique().to_numpy().tolist()
+                volume_sums_by_indices_fluid_and_real_df[InplaceVolumes.TableIndexColumns.FLUID.value]
+                .unique()
+                .to_list()
             )
 
             if sorted(expected_fluids) != unique_fluids:
@@ -333,9 +364,12 @@ class InplaceVolumesTableAssembler:
                     Service.GENERAL,
                 )
 
+            # Sum the volumes of the fluids, i.e. group the (small) per fluid sums by the selected index columns and realization
             summed_fluids_string = " + ".join(unique_fluids)
             accumulated_inplace_volumes_real_df_per_fluid_value_dict[summed_fluids_string] = (
-                volume_sums_by_indices_and_real_df
+                sum_inplace_volumes_grouped_by_indices_and_real_lf(
+                    volume_sums_by_indices_fluid_and_real_df.lazy(), group_by_indices
+                ).collect()
             )
 
         return (
@@ -343,21 +377,22 @@ class InplaceVolumesTableAssembler:
             categorized_result_names,
         )
 
-    async def _get_row_filtered_inplace_volumes_df_async(
+    async def _get_row_filtered_inplace_volumes_lf_async(
         self,
         table_name: str,
         volume_names: set[str],
         realizations: list[int] | None,
         indices_with_values: list[InplaceVolumesIndexWithValues],
-    ) -> pl.DataFrame:
+    ) -> tuple[pl.DataFrame, pl.LazyFrame]:
         """
-        This function creates an inplace volumes DataFrame for requested volumes, filtered on the provided indices values and realizations.
+        This function gets the inplace volumes DataFrame for requested volumes, and creates a LazyFrame filtered on the provided indices values and realizations.
 
         - The requested volume names: Set of volume columns, and necessary volume names to calculate properties and calculated volumes.
         - The calculation of properties and calculated volumes are handled outside this function.
 
         ### Returns:
-            - pl.DataFrame: A Polars DataFrame with selector (index + "REAL") and volume columns.
+            - pl.DataFrame: A Polars DataFrame with selector (index + "REAL") and volume columns, i.e. the unfiltered table.
+            - pl.LazyFrame: A Polars LazyFrame with the row filtering of the DataFrame added to its query plan.
         """
         # Check for empty identifier selections
         has_empty_index_selection = any(not index_with_values.values for index_with_values in indices_with_values)
@@ -366,25 +401,20 @@ class InplaceVolumesTableAssembler:
                 "Each provided index column must have at least one selected value", Service.GENERAL
             )
 
-        timer = PerfTimer()
-
         # Get the inplace volumes table as DataFrame
         volumes_table_df: pl.DataFrame = await self._get_inplace_volumes_table_as_polars_df_async(
             table_name=table_name, volume_columns=volume_names
         )
 
-        # Create dataframe filtered on indices and realizations
-        row_filtered_volumes_table_df = InplaceVolumesTableAssembler._create_row_filtered_inplace_volumes_df(
+        # Create LazyFrame filtered on indices and realizations
+        row_filtered_volumes_table_lf = InplaceVolumesTableAssembler._create_row_filtered_inplace_volumes_lf(
             table_name=table_name,
             inplace_volumes_df=volumes_table_df,
             realizations=realizations,
             indices_with_values=indices_with_values,
         )
 
-        timer_create_row_filtered_df = timer.lap_ms()
-        LOGGER.debug(f"Time creating row filtered DataFrame: {timer_create_row_filtered_df}ms")
-
-        return row_filtered_volumes_table_df
+        return (volumes_table_df, row_filtered_volumes_table_lf)
 
     async def _get_inplace_volumes_table_as_polars_df_async(
         self, table_name: str, volume_columns: set[str]
@@ -424,16 +454,17 @@ class InplaceVolumesTableAssembler:
         return inplace_volumes_table_df
 
     @staticmethod
-    def _create_row_filtered_inplace_volumes_df(
+    def _create_row_filtered_inplace_volumes_lf(
         table_name: str,
         inplace_volumes_df: pl.DataFrame,
         realizations: list[int] | None,
         indices_with_values: list[InplaceVolumesIndexWithValues],
-    ) -> pl.DataFrame:
+    ) -> pl.LazyFrame:
         """
-        Create DataFrame filtered on indices values and realizations - i.e. selector column values.
+        Create LazyFrame filtered on indices values and realizations - i.e. selector column values.
 
-        The function filters the provided inplace volumes table DataFrame based on the indices and realizations provided.
+        The function adds a filter on the indices and realizations provided to the query plan of the inplace volumes table DataFrame.
+        The filter is a single predicate expression, which is evaluated when the LazyFrame is collected.
         If realizations is None, all realizations are included.
         """
         if realizations is not None and len(realizations) == 0:
@@ -450,23 +481,18 @@ class InplaceVolumesTableAssembler:
                     Service.GENERAL,
                 )
 
-        timer = PerfTimer()
-        column_names = inplace_volumes_df.columns
+        # Build predicate for rows - default all rows
+        predicate = pl.lit(True)
 
-        # Build mask for rows - default all rows
-        num_rows = inplace_volumes_df.height
-        mask = pl.Series([True] * num_rows)
-
-        # Mask/filter out rows with ignored identifier values
+        # Filter out rows with ignored identifier values
         for index_name in InplaceVolumes.TableIndexColumns:
             if index_name.value in column_names:
-                ignored_index_values_mask = inplace_volumes_df[index_name.value].is_in(IGNORED_INDEX_COLUMN_VALUES)
-                mask = mask & ~ignored_index_values_mask
+                predicate = predicate & ~pl.col(index_name.value).is_in(IGNORED_INDEX_COLUMN_VALUES)
 
-        # Add mask for realizations
+        # Add predicate for realizations
         if realizations is not None:
             # Check if every element in realizations exists in inplace_volumes_table_df["REAL"]
-            real_values_set = set(inplace_volumes_df["REAL"].to_numpy().tolist())
+            real_values_set = set(inplace_volumes_df["REAL"].unique().to_list())
             missing_realizations_set = set(realizations) - real_values_set
 
             if missing_realizations_set:
@@ -475,21 +501,15 @@ class InplaceVolumesTableAssembler:
                     Service.GENERAL,
                 )
 
-            realization_mask = inplace_volumes_df["REAL"].is_in(realizations)
-            mask = mask & realization_mask
+            predicate = predicate & pl.col("REAL").is_in(realizations)
 
-        # Add mask for each identifier filter
+        # Add predicate for each identifier filter
         for index_with_values in indices_with_values:
             if not index_with_values.values:
-                mask = pl.Series([False] * num_rows)
+                predicate = pl.lit(False)
                 break
 
             index_column_name = index_with_values.index.value
-            index_mask = inplace_volumes_df[index_column_name].is_in(index_with_values.values)
-            mask = mask & index_mask
-
-        filtered_df = inplace_volumes_df.filter(mask)
-        time_row_filtering = timer.lap_ms()
-        LOGGER.debug(f"DATAFRAME row filtering (based on selectors): {time_row_filtering}ms")
+            predicate = predicate & pl.col(index_column_name).is_in(index_with_values.values)
 
-        return filtered_df
+        return inplace_volumes_df.lazy().filter(predicate)
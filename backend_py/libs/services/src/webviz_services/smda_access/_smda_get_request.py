@@ -1,12 +1,31 @@
+import asyncio
+import hashlib
 import logging
-from typing import List
+from dataclasses import dataclass
+from typing import AsyncIterator, List
 
+import polars as pl
+from pydantic_core import from_json
 from webviz_core_utils.perf_timer import PerfTimer
 
 from webviz_services.services_config import get_services_config
+from webviz_services.utils.stale_while_revalidate_cache import StaleWhileRevalidateCache
 from webviz_services.utils.httpx_async_client_wrapper import HTTPX_ASYNC_CLIENT_WRAPPER
+from webviz_services.utils.json_size import estimate_json_items_size_bytes
 from webviz_services.service_exceptions import ServiceRequestError, NoDataError, Service
 
+_ITEMS_PER_PAGE = 10000
+
+# Field-level data in SMDA changes rarely, so results are shared between requests of the same user for a while.
+# Stale entries are still served (and refreshed in the background) for up to an hour after they were loaded.
+#
+# The cache is scoped per access token rather than per user id. SMDA decides per user which data can be accessed, and
+# the access token is the only identity available at this layer. Results are therefore never shared between users,
+# and a user gets a new cache scope whenever their token is refreshed (typically about once an hour).
+_CACHE_FRESH_TTL_S = 10 * 60
+_CACHE_STALE_TTL_S = 50 * 60
+_CACHE_MAX_ENTRIES = 2000
+
 LOGGER = logging.getLogger(__name__)
 
 
@@ -26,45 +45,175 @@ async def smda_get_request_async(access_token: str, endpoint: str, params: dict)
     Uses `next` pagination to get all results.
     https://smda.equinor.com/learn/develop/smda-rest-api/#_next
     """
+    results: List[dict] = []
+    async for page_results in smda_get_request_pages_async(access_token, endpoint, params):
+        results.extend(page_results)
+
+    return results
+
+
+async def smda_get_request_as_dataframe_async(access_token: str, endpoint: str, params: dict) -> pl.DataFrame:
+    """
+    Same as smda_get_request_async(), but returns the results as a polars DataFrame.
+
+    Each page is converted to a DataFrame as soon as it arrives, so that the per-row Python dicts of a page can be
+    released before the next page is parsed. This keeps peak memory down for large result sets.
+    """
+    page_df_list: List[pl.DataFrame] = []
+    async for page_results in smda_get_request_pages_async(access_token, endpoint, params):
+        page_df_list.append(pl.DataFrame(page_results))
+
+    # Relaxed concatenation since columns that are all null within a page will be inferred with the Null dtype
+    return pl.concat(page_df_list, how="vertical_relaxed", rechunk=True)
+
+
+async def smda_get_request_cached_async(access_token: str, endpoint: str, params: dict) -> List[dict]:
+    """
+    Cached version of smda_get_request_async(), with stale-while-revalidate semantics.
+    The returned results are shared with other callers using the same access token and must not be modified.
+    Until init_smda_request_caches() has been called, results are not cached.
+    """
+    if _results_cache is None:
+        return await smda_get_request_async(access_token, endpoint, params)
+
+    return await _results_cache.get_or_load_async(
+        _make_cache_key(access_token, endpoint, params), lambda: smda_get_request_async(access_token, endpoint, params)
+    )
+
+
+async def smda_get_request_as_dataframe_cached_async(access_token: str, endpoint: str, params: dict) -> pl.DataFrame:
+    """
+    Cached version of smda_get_request_as_dataframe_async(), with stale-while-revalidate semantics.
+    Until init_smda_request_caches() has been called, results are not cached.
+    """
+    if _dataframe_cache is None:
+        return await smda_get_request_as_dataframe_async(access_token, endpoint, params)
+
+    return await _dataframe_cache.get_or_load_async(
+        _make_cache_key(access_token, endpoint, params),
+        lambda: smda_get_request_as_dataframe_async(access_token, endpoint, params),
+    )
+
+
+async def smda_get_request_pages_async(access_token: str, endpoint: str, params: dict) -> AsyncIterator[List[dict]]:
+    """
+    Generic GET request to SMDA API, yielding the results one page at a time.
+
+    Since SMDA uses cursor based `next` pagination, the request for the next page cannot be issued until the current
+    page has been received. As soon as a page has been received and decoded, the request for the next page is started
+    in the background, so that it is in flight while the caller processes the current page.
+    """
     urlstring = f"https://api.gateway.equinor.com/smda/v2.0/smda-api/{endpoint}?"
-    params = params if params else {}
-    params.update({"_items": 10000})
+    first_page_params = {**params, "_items": _ITEMS_PER_PAGE} if params else {"_items": _ITEMS_PER_PAGE}
     headers = _make_headers(access_token)
 
     timer = PerfTimer()
-    single_lap_timer = PerfTimer()
 
-    results: List[dict] = []
-    page: int = 1
-    while True:
-        response = await HTTPX_ASYNC_CLIENT_WRAPPER.client.get(urlstring, params=params, headers=headers, timeout=60)
-        LOGGER.debug(f"TIME SMDA fetch '{endpoint}', page {page}, took {single_lap_timer.lap_s():.2f} seconds")
-        page += 1
-        if response.status_code == 200:
-            result = response.json()["data"]["results"]
-            if not result:
+    page_num = 1
+    fetch_task: asyncio.Task[_SmdaPage] | None = asyncio.create_task(
+        _fetch_page_async(urlstring, first_page_params, headers, endpoint, page_num)
+    )
+    try:
+        while fetch_task is not None:
+            page = await fetch_task
+            fetch_task = None
+
+            if not page.results:
                 raise NoDataError(f"No data found for endpoint: '{endpoint}'", Service.SMDA)
 
-            results.extend(result)
-
-            next_request = response.json()["data"]["next"]
-            if next_request is None:
-                break
-            params["_next"] = next_request
-        elif response.status_code == 404:
-            LOGGER.error(f"{str(response.status_code) } {endpoint} either does not exists or can not be found")
-            raise ServiceRequestError(
-                f"[{str(response.status_code)}] '{endpoint}' either does not exists or can not be found",
-                Service.SMDA,
-            )
-        else:
-            raise ServiceRequestError(
-                f"[{str(response.status_code)}] Cannot fetch data from endpoint: '{endpoint}'", Service.SMDA
-            )
-
-    LOGGER.debug(f"TIME SMDA fetch '{endpoint}' took {timer.lap_s():.2f} seconds")
+            if page.next_cursor is not None:
+                page_num += 1
+                next_page_params = {**first_page_params, "_next": page.next_cursor}
+                fetch_task = asyncio.create_task(
+                    _fetch_page_async(urlstring, next_page_params, headers, endpoint, page_num)
+                )
 
-    return results
+            yield page.results
+    finally:
+        # The caller may stop iterating early (or fail), in which case any prefetch in flight is no longer needed
+        if fetch_task is not None:
+            fetch_task.cancel()
+
+    LOGGER.debug(f"TIME SMDA fetch '{endpoint}' ({page_num} pages) took {timer.lap_s():.2f} seconds")
+
+
+def _make_cache_key(access_token: str, endpoint: str, params: dict) -> str:
+    # Hash the access token so that we never hold on to (or log) the actual token as part of a key
+    token_scope_str = hashlib.sha256(access_token.encode()).hexdigest()
+    params_str = "&".join(f"{key}={params[key]}" for key in sorted(params))
+    return f"{token_scope_str}:{endpoint}?{params_str}"
+
+
+def _make_results_cache(max_size_bytes: int) -> StaleWhileRevalidateCache[List[dict]]:
+    return StaleWhileRevalidateCache(
+        name="smda_results",
+        fresh_ttl_s=_CACHE_FRESH_TTL_S,
+        stale_ttl_s=_CACHE_STALE_TTL_S,
+        max_size_bytes=max_size_bytes,
+        max_entries=_CACHE_MAX_ENTRIES,
+        size_fn=estimate_json_items_size_bytes,
+    )
+
+
+def _make_dataframe_cache(max_size_bytes: int) -> StaleWhileRevalidateCache[pl.DataFrame]:
+    return StaleWhileRevalidateCache(
+        name="smda_dataframes",
+        fresh_ttl_s=_CACHE_FRESH_TTL_S,
+        stale_ttl_s=_CACHE_STALE_TTL_S,
+        max_size_bytes=max_size_bytes,
+        max_entries=_CACHE_MAX_ENTRIES,
+        size_fn=lambda df: int(df.estimated_size()),
+    )
+
+
+# Process-wide state (private to module)
+_results_cache: StaleWhileRevalidateCache[List[dict]] | None = None  # pylint: disable=invalid-name
+_dataframe_cache: StaleWhileRevalidateCache[pl.DataFrame] | None = None  # pylint: disable=invalid-name
+
+
+def init_smda_request_caches(max_size_bytes: int) -> None:
+    """
+    One-time initialization of the process-wide caches of SMDA request results.
+    The size budget is split evenly between the cache of raw results and the cache of DataFrames.
+    """
+    # pylint: disable=global-statement
+    global _results_cache, _dataframe_cache
+    if _results_cache is not None:
+        raise RuntimeError("SMDA request caches are already initialized")
+
+    _results_cache = _make_results_cache(max_size_bytes // 2)
+    _dataframe_cache = _make_dataframe_cache(max_size_bytes // 2)
+
+
+@dataclass(frozen=True)
+class _SmdaPage:
+    results: List[dict]
+    next_cursor: str | None
+
+
+async def _fetch_page_async(urlstring: str, params: dict, headers: dict, endpoint: str, page_num: int) -> _SmdaPage:
+    timer = PerfTimer()
+
+    response = await HTTPX_ASYNC_CLIENT_WRAPPER.client.get(urlstring, params=params, headers=headers, timeout=60)
+    if response.status_code == 404:
+        LOGGER.error(f"{str(response.status_code) } {endpoint} either does not exists or can not be found")
+        raise ServiceRequestError(
+            f"[{str(response.status_code)}] '{endpoint}' either does not exists or can not be found",
+            Service.SMDA,
+        )
+    if response.status_code != 200:
+        raise ServiceRequestError(
+            f"[{str(response.status_code)}] Cannot fetch data from endpoint: '{endpoint}'", Service.SMDA
+        )
+    fetch_s = timer.lap_s()
+
+    # Decode the raw body once, using pydantic's fast JSON parser rather than response.json()
+    response_data = from_json(response.content)["data"]
+    decode_s = timer.lap_s()
+
+    LOGGER.debug(f"TIME SMDA fetch '{endpoint}', page {page_num}, took {fetch_s:.2f}s (decode {decode_s:.2f}s)")
+
+    return _SmdaPage(results=response_data["results"], next_cursor=response_data["next"])
 
 
 async def smda_get_aggregation_request_async(access_token: str, endpoint: str, params: dict) -> dict:
@@ -21,7 +21,8 @@ from .types import (
 )
 from .utils.queries import data_model_to_projection_param
 from .stratigraphy_utils import sort_stratigraphic_names_by_hierarchy
-from ._smda_get_request import smda_get_request_async, smda_get_aggregation_request_async
+from ._smda_get_request import smda_get_request_cached_async, smda_get_aggregation_request_async
+from ._smda_get_request import smda_get_request_as_dataframe_cached_async
 
 LOGGER = logging.getLogger(__name__)
 
@@ -42,7 +43,12 @@ class SmdaAccess:
         self._smda_token = access_token
 
     async def _smda_get_request_async(self, endpoint: str, params: dict) -> List[dict]:
-        return await smda_get_request_async(access_token=self._smda_token, endpoint=endpoint, params=params)
+        return await smda_get_request_cached_async(access_token=self._smda_token, endpoint=endpoint, params=params)
+
+    async def _smda_get_request_as_dataframe_async(self, endpoint: str, params: dict) -> pl.DataFrame:
+        return await smda_get_request_as_dataframe_cached_async(
+            access_token=self._smda_token, endpoint=endpoint, params=params
+        )
 
     async def _smda_get_aggregation_request_async(self, endpoint: str, params: dict) -> dict:
         return await smda_get_aggregation_request_async(access_token=self._smda_token, endpoint=endpoint, params=params)
@@ -217,19 +223,25 @@ class SmdaAccess:
             for wellbore_header in wellbore_headers_results
         }
 
-        # Iterate over the survey headers and update the information from wellbore headers if available
+        # Iterate over the survey headers and add the information from wellbore headers if available.
+        # Note that the results are shared through the request cache, so they must be copied rather than modified.
+        merged_results: List[dict] = []
         for survey_header in survey_header_results:
             unique_id = survey_header["unique_wellbore_identifier"]
 
             wellbore_header = wellbore_headers_dict.get(unique_id)
             if wellbore_header:
-                survey_header["wellbore_purpose"] = wellbore_header.get("wellbore_purpose")
-                survey_header["wellbore_status"] = wellbore_header.get("wellbore_status")
-                survey_header["kickoff_depth_md"] = wellbore_header.get("kickoff_depth_md")
-                survey_header["kickoff_depth_tvd"] = wellbore_header.get("kickoff_depth_tvd")
-                survey_header["parent_wellbore"] = wellbore_header.get("parent_wellbore")
-
-        return [WellboreHeader(**result) for result in survey_header_results]
+                survey_header = {
+                    **survey_header,
+                    "wellbore_purpose": wellbore_header.get("wellbore_purpose"),
+                    "wellbore_status": wellbore_header.get("wellbore_status"),
+                    "kickoff_depth_md": wellbore_header.get("kickoff_depth_md"),
+                    "kickoff_depth_tvd": wellbore_header.get("kickoff_depth_tvd"),
+                    "parent_wellbore": wellbore_header.get("parent_wellbore"),
+                }
+            merged_results.append(survey_header)
+
+        return [WellboreHeader(**result) for result in merged_results]
 
     async def get_wellbore_trajectories_async(
         self, field_identifier: str, wellbore_uuids: Optional[List[str]] = None
@@ -245,14 +257,14 @@ class SmdaAccess:
         if wellbore_uuids:
             params["wellbore_uuid"] = ", ".join(wellbore_uuids)
 
-        result = await self._smda_get_request_async(endpoint=SmdaEndpoints.WELLBORE_SURVEY_SAMPLES, params=params)
+        # Field-wide survey samples can be millions of rows, so get them directly as a polars DataFrame
+        resultdf = await self._smda_get_request_as_dataframe_async(
+            endpoint=SmdaEndpoints.WELLBORE_SURVEY_SAMPLES, params=params
+        )
 
-        if not result:
+        if resultdf.is_empty():
             raise NoDataError(f"No wellbore surveys found for {field_identifier=}, {wellbore_uuids=}.", Service.SMDA)
 
-        # Convert the result to polars for processing
-        resultdf = pl.DataFrame(result)
-
         # Identify wellbores with any null values in survey columns
         columns_to_check = ["tvd_msl", "md", "easting", "northing"]
 
@@ -1,10 +1,13 @@
+import hashlib
 import logging
 from typing import List, Optional
 
 from webviz_core_utils.perf_timer import PerfTimer
 
 from webviz_services.services_config import get_services_config
+from webviz_services.utils.stale_while_revalidate_cache import StaleWhileRevalidateCache
 from webviz_services.utils.httpx_async_client_wrapper import HTTPX_ASYNC_CLIENT_WRAPPER
+from webviz_services.utils.json_size import estimate_json_items_size_bytes
 from webviz_services.service_exceptions import (
     Service,
     InvalidDataError,
@@ -12,6 +15,16 @@ from webviz_services.service_exceptions import (
     AuthorizationError,
 )
 
+# Well data in SSDL changes rarely, so results are shared between requests of the same user for a while.
+# Stale entries are still served (and refreshed in the background) for up to an hour after they were loaded.
+#
+# The cache is scoped per access token rather than per user id. SSDL decides per user which data can be accessed, and
+# the access token is the only identity available at this layer. Results are therefore never shared between users,
+# and a user gets a new cache scope whenever their token is refreshed (typically about once an hour).
+_CACHE_FRESH_TTL_S = 10 * 60
+_CACHE_STALE_TTL_S = 50 * 60
+_CACHE_MAX_ENTRIES = 2000
+
 LOGGER = logging.getLogger(__name__)
 
 
@@ -49,3 +62,59 @@ async def ssdl_get_request_async(access_token: str, endpoint: str, params: Optio
 
     LOGGER.debug(f"TIME SSDL fetch {endpoint} took {timer.lap_s():.2f} seconds")
     return results
+
+
+async def ssdl_get_request_cached_async(access_token: str, endpoint: str, params: Optional[dict] = None) -> List[dict]:
+    """
+    Cached version of ssdl_get_request_async(), with stale-while-revalidate semantics.
+    The returned results are shared with other callers using the same access token and must not be modified.
+    Until init_ssdl_request_cache() has been called, results are not cached.
+    """
+    if _results_cache is None:
+        return await ssdl_get_request_async(access_token, endpoint, params)
+
+    return await _results_cache.get_or_load_async(
+        _make_cache_key(access_token, endpoint, params), lambda: ssdl_get_request_async(access_token, endpoint, params)
+    )
+
+
+def _make_cache_key(access_token: str, endpoint: str, params: Optional[dict]) -> str:
+    # Hash the access token so that we never hold on to (or log) the actual token as part of a key
+    token_scope_str = hashlib.sha256(access_token.encode()).hexdigest()
+    params = params if params else {}
+    params_str = "&".join(f"{key}={params[key]}" for key in sorted(params))
+    return f"{token_scope_str}:{endpoint}?{params_str}"
+
+
+def _estimate_results_size_bytes(results: List[dict] | dict) -> int:
+    # Some endpoints return a dict of lists rather than a list
+    if isinstance(results, dict):
+        return sum(estimate_json_items_size_bytes(items) for items in results.values() if isinstance(items, list))
+    return estimate_json_items_size_bytes(results)
+
+
+def _make_results_cache(max_size_bytes: int) -> StaleWhileRevalidateCache[List[dict]]:
+    return StaleWhileRevalidateCache(
+        name="ssdl_results",
+        fresh_ttl_s=_CACHE_FRESH_TTL_S,
+        stale_ttl_s=_CACHE_STALE_TTL_S,
+        max_size_bytes=max_size_bytes,
+        max_entries=_CACHE_MAX_ENTRIES,
+        size_fn=_estimate_results_size_bytes,
+    )
+
+
+# Process-wide state (private to module)
+_results_cache: StaleWhileRevalidateCache[List[dict]] | None = None  # pylint: disable=invalid-name
+
+
+def init_ssdl_request_cache(max_size_bytes: int) -> None:
+    """
+    One-time initialization of the process-wide cache of SSDL request results.
+    """
+    # pylint: disable=global-statement
+    global _results_cache
+    if _results_cache is not None:
+        raise RuntimeError("SSDL request cache is already initialized")
+
+    _results_cache = _make_results_cache(max_size_bytes)
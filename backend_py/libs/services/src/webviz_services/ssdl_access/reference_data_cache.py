@@ -0,0 +1,98 @@
+import logging
+import time
+from dataclasses import dataclass
+
+from webviz_core_utils.background_tasks import run_in_background_task
+
+from webviz_services.utils.stale_while_revalidate_cache import StaleWhileRevalidateCache
+
+from .well_access import WellAccess
+
+# Reference data, such as the list of fields, changes very rarely and is the same for all users, so it is shared
+# across users and kept for much longer than other SSDL results.
+_CACHE_FRESH_TTL_S = 6 * 60 * 60
+_CACHE_STALE_TTL_S = 18 * 60 * 60
+
+# A lookup miss may be a field that was added after the fields were cached, so a miss triggers a reload of the
+# fields. The reloads are rate limited by the time since the fields were last loaded, since unknown identifiers would
+# otherwise cause a reload on every lookup.
+_MISS_RELOAD_MIN_INTERVAL_S = 5 * 60
+
+_FIELDS_KEY = "fields"
+
+_last_fields_load_time_s: float | None = None  # pylint: disable=invalid-name
+
+LOGGER = logging.getLogger(__name__)
+
+
+@dataclass(frozen=True, kw_only=True)
+class _FieldsLookup:
+    field_uuid_by_identifier: dict[str, str]
+
+
+async def get_field_uuid_async(access_token: str, field_identifier: str) -> str | None:
+    """
+    Resolve an official field identifier to its SSDL field uuid, returns None if the field is not known to SSDL.
+    """
+    fields_lookup = await _get_fields_lookup_async(access_token)
+    field_uuid = fields_lookup.field_uuid_by_identifier.get(field_identifier)
+    if field_uuid is not None or not _try_claim_miss_reload():
+        return field_uuid
+
+    LOGGER.debug(f"Field {field_identifier} not found in reference data cache, reloading fields from SSDL")
+    try:
+        fields_lookup = await _REFERENCE_DATA_CACHE.reload_async(_FIELDS_KEY, lambda: _load_fields_async(access_token))
+    except Exception as exc:  # pylint: disable=broad-exception-caught
+        LOGGER.warning(f"Failed to reload SSDL fields after lookup miss: {exc}")
+        return None
+
+    return fields_lookup.field_uuid_by_identifier.get(field_identifier)
+
+
+def warm_reference_data_in_background(access_token: str) -> None:
+    """
+    Start loading the reference data in a background task, unless it is already cached.
+
+    SSDL only accepts user tokens, so the cache cannot be warmed at startup. Instead, call this function early in the
+    flow of a user (e.g. when wellbores of a field are listed), so that later lookups are served from the cache.
+    """
+    if _REFERENCE_DATA_CACHE.get_stats().num_entries > 0:
+        return
+
+    run_in_background_task(_get_fields_lookup_async(access_token))
+
+
+def _try_claim_miss_reload() -> bool:
+    # pylint: disable=global-statement
+    global _last_fields_load_time_s
+
+    now_s = time.monotonic()
+    if _last_fields_load_time_s is not None and now_s - _last_fields_load_time_s < _MISS_RELOAD_MIN_INTERVAL_S:
+        return False
+
+    _last_fields_load_time_s = now_s
+    return True
+
+
+async def _get_fields_lookup_async(access_token: str) -> _FieldsLookup:
+    return await _REFERENCE_DATA_CACHE.get_or_load_async(_FIELDS_KEY, lambda: _load_fields_async(access_token))
+
+
+async def _load_fields_async(access_token: str) -> _FieldsLookup:
+    # pylint: disable=global-statement
+    global _last_fields_load_time_s
+    _last_fields_load_time_s = time.monotonic()
+
+    fields = await WellAccess(access_token).get_fields_async()
+    LOGGER.debug(f"Loaded {len(fields)} SSDL fields into reference data cache")
+    return _FieldsLookup(field_uuid_by_identifier={field.field_identifier: field.field_uuid for field in fields})
+
+
+_REFERENCE_DATA_CACHE: StaleWhileRevalidateCache[_FieldsLookup] = StaleWhileRevalidateCache(
+    name="ssdl_reference_data",
+    fresh_ttl_s=_CACHE_FRESH_TTL_S,
+    stale_ttl_s=_CACHE_STALE_TTL_S,
+    max_size_bytes=16 * 1024 * 1024,
+    max_entries=16,
+    size_fn=lambda fields_lookup: 100 * len(fields_lookup.field_uuid_by_identifier),
+)
@@ -5,7 +5,7 @@ from webviz_services.service_exceptions import (
     Service,
     InvalidDataError,
 )
-from ._ssdl_get_request import ssdl_get_request_async
+from ._ssdl_get_request import ssdl_get_request_async, ssdl_get_request_cached_async
 
 from . import types
 
@@ -17,9 +17,13 @@ class WellAccess:
         self._ssdl_token = access_token
 
     async def get_fields_async(self) -> List[types.FieldInfo]:
-        """Get list of fields"""
+        """
+        Get list of fields.
+        Always fetched from SSDL, since the fields are cached process-wide in reference_data_cache, which must be
+        able to see newly added fields when it reloads.
+        """
         return await self._fetch_and_validate_list_async(
-            endpoint="Field", model_type=types.FieldInfo, error_context="field"
+            endpoint="Field", model_type=types.FieldInfo, error_context="field", use_cache=False
         )
 
     async def get_field_perforations_async(self, field_uuid: str) -> List[types.WellborePerforation]:
@@ -103,6 +107,7 @@ class WellAccess:
         error_context: str = "",
         deduplicate: bool = False,
         handle_dict_values: bool = False,
+        use_cache: bool = True,
     ) -> List[T]:
         """
         Generic helper to fetch data from SSDL and validate it into a list of Pydantic models.
@@ -114,8 +119,10 @@ class WellAccess:
             error_context: Context string for error messages
             deduplicate: Whether to remove duplicates using a set
             handle_dict_values: Whether to handle dict responses by iterating over values
+            use_cache: Whether to use the (per user) results cache of SSDL requests
         """
-        ssdl_data = await ssdl_get_request_async(access_token=self._ssdl_token, endpoint=endpoint, params=params)
+        get_request_async = ssdl_get_request_cached_async if use_cache else ssdl_get_request_async
+        ssdl_data = await get_request_async(access_token=self._ssdl_token, endpoint=endpoint, params=params)
 
         try:
             result: List[T] = []
@@ -3,8 +3,10 @@ from typing import Sequence, cast
 
 import polars as pl
 import pyarrow as pa
+from webviz_core_utils.cpu_executors import run_in_thread_executor_async
 
 
+from .sumo_access.parameter_types import EnsembleSensitivity
 from .utils.arrow_helpers import create_float_downcasting_schema
 from .utils.statistic_function import StatisticFunction
 from .service_exceptions import Service, InvalidParameterError
@@ -37,36 +39,7 @@ def compute_vector_statistics_table(
     if summary_vector_table.num_rows == 0:
         return None
 
-    if statistic_functions is None:
-        statistic_functions = [
-            StatisticFunction.MIN,
-            StatisticFunction.MAX,
-            StatisticFunction.MEAN,
-            StatisticFunction.P10,
-            StatisticFunction.P90,
-            StatisticFunction.P50,
-        ]
-
-    # Polars column expression with drop NaN values for aggregations (null value dropped by default)
-    valid_col_expr = pl.col(vector_name).drop_nans()
-
-    # Build list of statistic expressions based on requested functions
-    statistics_expressions: list[pl.Expr] = []
-    for stat_func in statistic_functions:
-        if stat_func == StatisticFunction.MIN:
-            statistics_expressions.append(valid_col_expr.min().alias("MIN"))
-        elif stat_func == StatisticFunction.MAX:
-            statistics_expressions.append(valid_col_expr.max().alias("MAX"))
-        elif stat_func == StatisticFunction.MEAN:
-            statistics_expressions.append(valid_col_expr.mean().alias("MEAN"))
-        elif stat_func == StatisticFunction.P10:
-            # Inverted due to oil industry convention (P10 = 90th percentile)
-            statistics_expressions.append(valid_col_expr.quantile(0.9, interpolation="linear").alias("P10"))
-        elif stat_func == StatisticFunction.P90:
-            # Inverted due to oil industry convention (P90 = 10th percentile)
-            statistics_expressions.append(valid_col_expr.quantile(0.1, interpolation="linear").alias("P90"))
-        elif stat_func == StatisticFunction.P50:
-            statistics_expressions.append(valid_col_expr.quantile(0.5, interpolation="linear").alias("P50"))
+    statistics_expressions = _create_statistics_expressions(vector_name, statistic_functions)
 
     # Create Polars DataFrame from Arrow table and compute statistics
     # - Sumo summary data is often float32
@@ -104,6 +77,102 @@ def compute_vector_statistics(
             list[int], summary_vector_table.column("REAL").unique().to_numpy().astype(int).tolist()
         )
 
+    return _create_vector_statistics(statistics_table, unique_realizations)
+
+
+def compute_vector_statistics_per_sensitivity_case(
+    summary_vector_table: pa.Table,
+    vector_name: str,
+    statistic_functions: Sequence[StatisticFunction] | None,
+    sensitivities: Sequence[EnsembleSensitivity],
+) -> dict[tuple[str, str], VectorStatistics]:
+    """
+    Compute statistics for the specified summary vector for every case of every sensitivity in a single pass.
+
+    The realizations of each case are attached to the table as SENS and CASE label columns through one join with
+    the realization to case mapping, after which all statistics are computed with one group_by on SENS, CASE and DATE.
+    A realization may belong to several cases, in which case its rows are included in each of them.
+
+    Returns a dict keyed by (sensitivity name, case name). Cases without any rows in the table are omitted.
+    """
+    if statistic_functions is not None and len(statistic_functions) == 0:
+        raise InvalidParameterError("At least one statistic must be requested", Service.GENERAL)
+
+    statistics_expressions = _create_statistics_expressions(vector_name, statistic_functions)
+
+    vector_df = pl.DataFrame(summary_vector_table.select(["DATE", "REAL", vector_name]))
+    real_dtype = vector_df.schema["REAL"]
+
+    mapping_rows = [
+        (sensitivity.name, case.name, real)
+        for sensitivity in sensitivities
+        for case in sensitivity.cases
+        for real in case.realizations
+    ]
+    mapping_df = pl.DataFrame(
+        mapping_rows, schema={"SENS": pl.String, "CASE": pl.String, "REAL": real_dtype}, orient="row"
+    )
+
+    labeled_df = vector_df.join(mapping_df, on="REAL", how="inner")
+    if labeled_df.is_empty():
+        return {}
+
+    group_keys = ["SENS", "CASE"]
+    statistics_df = labeled_df.group_by([*group_keys, "DATE"]).agg(statistics_expressions).sort([*group_keys, "DATE"])
+    realizations_df = labeled_df.group_by(group_keys).agg(pl.col("REAL").unique(maintain_order=True))
+
+    realizations_per_case: dict[tuple[str, str], list[int]] = {
+        (row[0], row[1]): row[2] for row in realizations_df.iter_rows()
+    }
+
+    ret_dict: dict[tuple[str, str], VectorStatistics] = {}
+    for group_key_values, case_statistics_df in statistics_df.partition_by(group_keys, as_dict=True).items():
+        sens_name, case_name = cast(tuple[str, str], group_key_values)
+        case_statistics_table = case_statistics_df.drop(group_keys).to_arrow()
+        case_statistics_table = case_statistics_table.cast(
+            create_float_downcasting_schema(case_statistics_table.schema)
+        )
+
+        ret_dict[(sens_name, case_name)] = _create_vector_statistics(
+            case_statistics_table, sorted(realizations_per_case[(sens_name, case_name)])
+        )
+
+    return ret_dict
+
+
+async def compute_vector_statistics_per_sensitivity_case_async(
+    summary_vector_table: pa.Table,
+    vector_name: str,
+    statistic_functions: Sequence[StatisticFunction] | None,
+    sensitivities: Sequence[EnsembleSensitivity],
+) -> dict[tuple[str, str], VectorStatistics]:
+    """
+    Same as compute_vector_statistics_per_sensitivity_case(), but runs the computation in the thread pool executor.
+    """
+    return await run_in_thread_executor_async(
+        compute_vector_statistics_per_sensitivity_case,
+        summary_vector_table,
+        vector_name,
+        statistic_functions,
+        sensitivities,
+    )
+
+
+async def compute_vector_statistics_async(
+    summary_vector_table: pa.Table,
+    vector_name: str,
+    statistic_functions: Sequence[StatisticFunction] | None,
+) -> VectorStatistics | None:
+    """
+    Same as compute_vector_statistics(), but runs the computation in the thread pool executor so that
+    the event loop is not blocked. Polars releases the GIL while computing the statistics.
+    """
+    return await run_in_thread_executor_async(
+        compute_vector_statistics, summary_vector_table, vector_name, statistic_functions
+    )
+
+
+def _create_vector_statistics(statistics_table: pa.Table, realizations: list[int]) -> VectorStatistics:
     values_dict: dict[StatisticFunction, list[float]] = {}
     column_names = statistics_table.column_names
     for stat_func in StatisticFunction:
@@ -111,10 +180,45 @@ def compute_vector_statistics(
             # ! We assume the list never has None-values
             values_dict[stat_func] = cast(list[float], statistics_table.column(stat_func.value).to_numpy().tolist())
 
-    ret_data = VectorStatistics(
-        realizations=unique_realizations,
+    return VectorStatistics(
+        realizations=realizations,
         timestamps_utc_ms=statistics_table["DATE"].to_numpy().astype(int).tolist(),
         values_dict=values_dict,
     )
 
-    return ret_data
+
+def _create_statistics_expressions(
+    vector_name: str, statistic_functions: Sequence[StatisticFunction] | None
+) -> list[pl.Expr]:
+    if statistic_functions is None:
+        statistic_functions = [
+            StatisticFunction.MIN,
+            StatisticFunction.MAX,
+            StatisticFunction.MEAN,
+            StatisticFunction.P10,
+            StatisticFunction.P90,
+            StatisticFunction.P50,
+        ]
+
+    # Polars column expression with drop NaN values for aggregations (null value dropped by default)
+    valid_col_expr = pl.col(vector_name).drop_nans()
+
+    # Build list of statistic expressions based on requested functions
+    statistics_expressions: list[pl.Expr] = []
+    for stat_func in statistic_functions:
+        if stat_func == StatisticFunction.MIN:
+            statistics_expressions.append(valid_col_expr.min().alias("MIN"))
+        elif stat_func == StatisticFunction.MAX:
+            statistics_expressions.append(valid_col_expr.max().alias("MAX"))
+        elif stat_func == StatisticFunction.MEAN:
+            statistics_expressions.append(valid_col_expr.mean().alias("MEAN"))
+        elif stat_func == StatisticFunction.P10:
+            # Inverted due to oil industry convention (P10 = 90th percentile)
+            statistics_expressions.append(valid_col_expr.quantile(0.9, interpolation="linear").alias("P10"))
+        elif stat_func == StatisticFunction.P90:
+            # Inverted due to oil industry convention (P90 = 10th percentile)
+            statistics_expressions.append(valid_col_expr.quantile(0.1, interpolation="linear").alias("P90"))
+        elif stat_func == StatisticFunction.P50:
+            statistics_expressions.append(valid_col_expr.quantile(0.5, interpolation="linear").alias("P50"))
+
+    return statistics_expressions
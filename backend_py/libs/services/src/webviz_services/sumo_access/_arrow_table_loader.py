@@ -1,4 +1,5 @@
 import asyncio
+import hashlib
 import logging
 
 import pyarrow as pa
@@ -6,6 +7,7 @@ from fmu.sumo.explorer.explorer import SearchContext, SumoClient
 from fmu.sumo.explorer.objects import Table
 
 from webviz_core_utils.perf_metrics import PerfMetrics
+from webviz_services.utils.single_flight import SingleFlightGroup
 from webviz_services.service_exceptions import (
     InvalidDataError,
     InvalidParameterError,
@@ -15,14 +17,26 @@ from webviz_services.service_exceptions import (
     ServiceLayerException,
 )
 
+from .arrow_table_cache import get_arrow_table_cache
+
 LOGGER = logging.getLogger(__name__)
 
+# Process-wide single-flight group for loading of aggregated columns
+_AGG_COLUMN_SINGLE_FLIGHT: SingleFlightGroup[pa.Table] = SingleFlightGroup("agg_column")
+
 
 class ArrowTableLoader:
-    def __init__(self, sumo_client: SumoClient, case_uuid: str, ensemble_name: str):
+    def __init__(
+        self, sumo_client: SumoClient, case_uuid: str, ensemble_name: str, ensemble_fingerprint: str | None = None
+    ):
+        """
+        If an ensemble fingerprint is specified, aggregated columns will be looked up in and stored to the
+        process-wide Arrow table cache (if initialized), using the fingerprint as part of the cache key.
+        """
         self._sumo_client: SumoClient = sumo_client
         self._case_uuid: str = case_uuid
         self._ensemble_name: str = ensemble_name
+        self._ensemble_fingerprint: str | None = ensemble_fingerprint
         self._req_table_name: str | None = None
         self._req_content_types: list[str] | None = None
         self._req_tagname: str | None = None
@@ -49,6 +63,29 @@ class ArrowTableLoader:
 
         perf_metrics = PerfMetrics()
 
+        table_cache = get_arrow_table_cache() if self._ensemble_fingerprint else None
+        if table_cache:
+            cached_table = await table_cache.get_async(self._make_agg_column_cache_key(column_name))
+            perf_metrics.record_lap("cache-lookup")
+            if cached_table is not None:
+                LOGGER.debug(
+                    f"ArrowTableLoader.get_aggregated_single_column() got cached table in: {perf_metrics.to_string()}, {column_name=}, {self._make_req_info_str()}"
+                )
+                return cached_table
+
+        # Concurrent identical loads (within the scope of the same user token) are collapsed into a single load
+        token_scope_str = self._make_token_scope_str()
+        if token_scope_str is None:
+            return await self._load_aggregated_single_column_async(column_name)
+
+        single_flight_key = f"scope:{token_scope_str}:{self._make_agg_column_address_str(column_name)}"
+        return await _AGG_COLUMN_SINGLE_FLIGHT.do_async(
+            single_flight_key, lambda: self._load_aggregated_single_column_async(column_name)
+        )
+
+    async def _load_aggregated_single_column_async(self, column_name: str) -> pa.Table:
+        perf_metrics = PerfMetrics()
+
         sc_tables_basis = SearchContext(sumo=self._sumo_client).tables.filter(
             uuid=self._case_uuid,
             ensemble=self._ensemble_name,
@@ -121,6 +158,10 @@ class ArrowTableLoader:
         arrow_table: pa.Table = await sumo_table_obj.to_arrow_async()
         perf_metrics.record_lap("to-arrow")
 
+        table_cache = get_arrow_table_cache() if self._ensemble_fingerprint else None
+        if table_cache:
+            table_cache.put(self._make_agg_column_cache_key(column_name), arrow_table)
+
         LOGGER.debug(
             f"ArrowTableLoader.get_aggregated_single_column() took: {perf_metrics.to_string()}, {column_name=}, {self._make_req_info_str()}"
         )
@@ -178,10 +219,13 @@ class ArrowTableLoader:
                 )
 
         # Now we can merge the tables by appending the "value" columns
+        # Pass the full field (not just the name) so that the field metadata of each column is preserved
         merged_aggregated_table = first_aggregated_table
         for i in range(1, len(column_name_and_aggregated_table_pairs)):
             column_name, aggregated_table = column_name_and_aggregated_table_pairs[i]
-            merged_aggregated_table = merged_aggregated_table.append_column(column_name, aggregated_table[column_name])
+            merged_aggregated_table = merged_aggregated_table.append_column(
+                aggregated_table.schema.field(column_name), aggregated_table[column_name]
+            )
 
         return merged_aggregated_table
 
@@ -220,6 +264,31 @@ class ArrowTableLoader:
 
         return arrow_table
 
+    def _make_agg_column_address_str(self, column_name: str) -> str:
+        # The address must include all the filter criteria that determine which table we end up with
+        content_types_str = ",".join(sorted(self._req_content_types)) if self._req_content_types else None
+        return (
+            f"case:{self._case_uuid}:ens:{self._ensemble_name}"
+            f":table:{self._req_table_name}:content:{content_types_str}:tag:{self._req_tagname}"
+            f":std:{self._req_standard_result}:col:{column_name}"
+        )
+
+    def _make_agg_column_cache_key(self, column_name: str) -> str:
+        return f"{self._make_agg_column_address_str(column_name)}:fp:{self._ensemble_fingerprint}"
+
+    def _make_token_scope_str(self) -> str | None:
+        # Hash the access token so that we never hold on to (or log) the actual token as part of a key.
+        # Returns None if the Sumo client has no usable token, in which case there is no scope to share loads within.
+        try:
+            access_token = self._sumo_client.authenticate()
+        except Exception:  # pylint: disable=broad-exception-caught
+            return None
+
+        if not access_token:
+            return None
+
+        return hashlib.sha256(access_token.encode()).hexdigest()
+
     def _make_req_info_str(self) -> str:
         info_str = f"table_name={self._req_table_name}, content_type={self._req_content_types}"
         if self._req_tagname is not None:
@@ -1,5 +1,4 @@
-from dataclasses import dataclass
-from typing import Dict
+from typing import Dict, Literal
 
 import numpy as np
 import pyarrow as pa
@@ -17,7 +16,7 @@ def _truncate_day_to_monday(datetime_day: np.datetime64) -> np.datetime64:
 def _quarter_start_month(datetime_day: np.datetime64) -> np.datetime64:
     # A bit hackish, utilizes the fact that datetime64 is relative to epoch
     # 1970-01-01 which is the first day in Q1.
-    datetime_month = np.datetime64(str(datetime_day), "M")
+    datetime_month = datetime_day.astype("datetime64[M]")
     return datetime_month - (datetime_month.astype(int) % 3)
 
 
@@ -31,22 +30,22 @@ def generate_normalized_sample_dates(min_date: np.datetime64, max_date: np.datet
     stop: np.datetime64
 
     if freq == Frequency.DAILY:
-        start = np.datetime64(str(min_date), "D")
-        stop = np.datetime64(str(max_date), "D")
+        start = min_date.astype("datetime64[D]")
+        stop = max_date.astype("datetime64[D]")
         if stop < max_date:
             stop += 1
         sampledates = np.arange(start, stop + 1)
     elif freq == Frequency.WEEKLY:
-        start = _truncate_day_to_monday(np.datetime64(str(min_date), "D"))
-        stop = _truncate_day_to_monday(np.datetime64(str(max_date), "D"))
+        start = _truncate_day_to_monday(min_date.astype("datetime64[D]"))
+        stop = _truncate_day_to_monday(max_date.astype("datetime64[D]"))
         if start > min_date:
             start -= 7
         if stop < max_date:
             stop += 7
         sampledates = np.arange(start, stop + 1, 7)
     elif freq == Frequency.MONTHLY:
-        start = np.datetime64(str(min_date), "M")
-        stop = np.datetime64(str(max_date), "M")
+        start = min_date.astype("datetime64[M]")
+        stop = max_date.astype("datetime64[M]")
         if stop < max_date:
             stop += 1
         sampledates = np.arange(start, stop + 1)
@@ -57,8 +56,8 @@ def generate_normalized_sample_dates(min_date: np.datetime64, max_date: np.datet
             stop += 3
         sampledates = np.arange(start, stop + 1, 3)
     elif freq == Frequency.YEARLY:
-        start = np.datetime64(str(min_date), "Y")
-        stop = np.datetime64(str(max_date), "Y")
+        start = min_date.astype("datetime64[Y]")
+        stop = max_date.astype("datetime64[Y]")
         if stop < max_date:
             stop += 1
         sampledates = np.arange(start, stop + 1)
@@ -129,29 +128,98 @@ def resample_single_real_table(table: pa.Table, freq: Frequency) -> pa.Table:
     return ret_table
 
 
-@dataclass
-class RealInterpolationInfo:
-    raw_dates_np: np.ndarray
-    raw_dates_np_as_uint: np.ndarray
-    sample_dates_np: np.ndarray
-    sample_dates_np_as_uint: np.ndarray
+class _SegmentedSampleLocator:
+    """
+    Locates the sample dates of all realizations among the raw dates of a table that is segmented on REAL.
 
+    To be able to do a single searchsorted over the whole table, the dates of each segment are offset by the
+    segment's rank in the table times the total date span, which makes the keys globally increasing.
+    In the common case where all realizations share the exact same raw dates (and thus the same sample dates),
+    searchsorted is only done for the first segment and the resulting indices are offset to the other segments.
+    """
 
-def _extract_real_interpolation_info(
-    table: pa.Table, start_row_idx: int, row_count: int, freq: Frequency
-) -> RealInterpolationInfo:
-    real_dates = table["DATE"].slice(start_row_idx, row_count).to_numpy()
+    # pylint: disable=too-many-arguments
+    def __init__(
+        self,
+        raw_dates_ms: np.ndarray,
+        seg_first_row: np.ndarray,
+        real_counts: np.ndarray,
+        sample_dates_ms: np.ndarray,
+        sample_real_idx: np.ndarray,
+    ) -> None:
+        self._raw_dates_ms = raw_dates_ms
+        self._seg_first_row = seg_first_row
+        self._real_counts = real_counts
+        self._sample_dates_ms = sample_dates_ms
+        self._sample_real_idx = sample_real_idx
+        self._keys: tuple[np.ndarray, np.ndarray] | None = None
+
+        self._shared_raw_dates_ms: np.ndarray | None = None
+        self._shared_sample_dates_ms: np.ndarray | None = None
+        num_reals = len(seg_first_row)
+        if np.all(real_counts == real_counts[0]):
+            dates_per_segment = raw_dates_ms.reshape(num_reals, real_counts[0])
+            if np.all(dates_per_segment == dates_per_segment[0]):
+                self._shared_raw_dates_ms = dates_per_segment[0]
+                self._shared_sample_dates_ms = sample_dates_ms[0 : len(sample_dates_ms) // num_reals]
+
+    def searchsorted(self, side: Literal["left", "right"]) -> np.ndarray:
+        """
+        Returns the global row indices in the table where the sample dates would be inserted, see np.searchsorted()
+        """
+        if self._shared_raw_dates_ms is not None and self._shared_sample_dates_ms is not None:
+            local_idx = np.searchsorted(self._shared_raw_dates_ms, self._shared_sample_dates_ms, side=side)
+            return np.add.outer(self._seg_first_row, local_idx).reshape(-1)
+
+        raw_keys, sample_keys = self._get_keys()
+        return np.searchsorted(raw_keys, sample_keys, side=side)
+
+    def _get_keys(self) -> tuple[np.ndarray, np.ndarray]:
+        if self._keys is None:
+            num_reals = len(self._seg_first_row)
+            segment_rank = np.empty(num_reals, dtype=np.int64)
+            segment_rank[np.argsort(self._seg_first_row)] = np.arange(num_reals)
+
+            base_ms = min(self._raw_dates_ms.min(), self._sample_dates_ms.min())
+            span_ms = max(self._raw_dates_ms.max(), self._sample_dates_ms.max()) - base_ms + 1
+
+            raw_keys = (self._raw_dates_ms - base_ms) + np.repeat(
+                np.arange(num_reals, dtype=np.int64) * span_ms, self._real_counts[np.argsort(segment_rank)]
+            )
+            sample_keys = (self._sample_dates_ms - base_ms) + segment_rank[self._sample_real_idx] * span_ms
+            self._keys = (raw_keys, sample_keys)
+
+        return self._keys
+
+
+def _generate_sample_dates_per_real(
+    raw_dates_ms: np.ndarray, seg_first_row: np.ndarray, freq: Frequency
+) -> tuple[np.ndarray, np.ndarray]:
+    """
+    Generate the sample dates for all realizations, concatenated in the order given by seg_first_row.
+    Each distinct sample grid is only generated once.
+    Returns the concatenated sample dates and the number of sample dates per realization.
+    """
+    seg_first_row_in_table_order = np.sort(seg_first_row)
+    table_order_to_real_idx = np.argsort(seg_first_row)
+    seg_min_dates = np.empty(len(seg_first_row), dtype=np.int64)
+    seg_max_dates = np.empty(len(seg_first_row), dtype=np.int64)
+    seg_min_dates[table_order_to_real_idx] = np.minimum.reduceat(raw_dates_ms, seg_first_row_in_table_order)
+    seg_max_dates[table_order_to_real_idx] = np.maximum.reduceat(raw_dates_ms, seg_first_row_in_table_order)
+
+    unique_ranges, grid_idx_per_real = np.unique(
+        np.stack((seg_min_dates, seg_max_dates), axis=1), axis=0, return_inverse=True
+    )
+    grid_idx_per_real = grid_idx_per_real.reshape(-1)
+    sample_grid_list = [
+        generate_normalized_sample_dates(np.datetime64(min_ms, "ms"), np.datetime64(max_ms, "ms"), freq)
+        for min_ms, max_ms in unique_ranges.tolist()
+    ]
 
-    min_raw_date = np.min(real_dates)
-    max_raw_date = np.max(real_dates)
-    sample_dates = generate_normalized_sample_dates(min_raw_date, max_raw_date, freq)
+    sample_dates_np = np.concatenate([sample_grid_list[grid_idx] for grid_idx in grid_idx_per_real])
+    sample_count_per_real = np.array([len(grid) for grid in sample_grid_list], dtype=np.int64)[grid_idx_per_real]
 
-    return RealInterpolationInfo(
-        raw_dates_np=real_dates,
-        raw_dates_np_as_uint=real_dates.astype(np.uint64),
-        sample_dates_np=sample_dates,
-        sample_dates_np_as_uint=sample_dates.astype(np.uint64),
-    )
+    return sample_dates_np, sample_count_per_real
 
 
 def resample_segmented_multi_real_table(table: pa.Table, freq: Frequency) -> pa.Table:
@@ -161,65 +229,93 @@ def resample_segmented_multi_real_table(table: pa.Table, freq: Frequency) -> pa.
     The table must be segmented on REAL (so that all rows from a single realization are contiguous) and within each REAL
     segment, it must be sorted on DATE.
     The segmentation is needed since interpolations must be done per realization and we use slicing on rows for speed.
+
+    All realizations are interpolated in one vectorized pass per column, giving the same results as doing np.interp()
+    or interpolate_backfill() per realization. The returned table is sorted on REAL and has a single chunk per column.
     """
     # pylint: disable=too-many-locals
 
     real_arr_np = table.column("REAL").to_numpy()
     unique_reals, first_occurrence_idx, real_counts = np.unique(real_arr_np, return_index=True, return_counts=True)
+    seg_first_row = first_occurrence_idx.astype(np.int64)
+    seg_last_row = seg_first_row + real_counts - 1
+
+    raw_dates_ms = table.column("DATE").to_numpy().astype("datetime64[ms]").astype(np.int64)
+
+    sample_dates_np, sample_count_per_real = _generate_sample_dates_per_real(raw_dates_ms, seg_first_row, freq)
+    sample_dates_ms = sample_dates_np.astype(np.int64)
+    sample_real_idx = np.repeat(np.arange(len(unique_reals)), sample_count_per_real)
+
+    locator = _SegmentedSampleLocator(raw_dates_ms, seg_first_row, real_counts, sample_dates_ms, sample_real_idx)
+    sample_first_row = seg_first_row[sample_real_idx]
+    sample_last_row = seg_last_row[sample_real_idx]
+    sample_is_before_first_raw_date = sample_dates_ms < raw_dates_ms[sample_first_row]
 
-    output_columns_dict: Dict[str, pa.ChunkedArray] = {}
+    # Row indices and weights for the interpolation, computed on first use since they are shared by all columns
+    linear_params: tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray] | None = None
+    backfill_idx: np.ndarray | None = None
 
-    real_interpolation_info_dict: Dict[int, RealInterpolationInfo] = {}
+    output_columns_dict: Dict[str, np.ndarray] = {}
 
     for colname in table.schema.names:
         if colname in ["DATE", "REAL"]:
             continue
 
-        is_rate = is_rate_from_field_meta(table.field(colname))
-        raw_whole_numpy_arr = table.column(colname).to_numpy()
-
-        vec_arr_list = []
-        for i, real in enumerate(unique_reals):
-            start_row_idx = first_occurrence_idx[i]
-            row_count = real_counts[i]
-
-            rii = real_interpolation_info_dict.get(real)
-            if not rii:
-                rii = _extract_real_interpolation_info(table, start_row_idx, row_count, freq)
-                real_interpolation_info_dict[real] = rii
-
-            raw_numpy_arr = raw_whole_numpy_arr[start_row_idx : start_row_idx + row_count]
-
-            if is_rate:
-                inter = interpolate_backfill(
-                    rii.sample_dates_np_as_uint,
-                    rii.raw_dates_np_as_uint,
-                    raw_numpy_arr,
-                    0,
-                    0,
-                )
-            else:
-                inter = np.interp(rii.sample_dates_np_as_uint, rii.raw_dates_np_as_uint, raw_numpy_arr)
+        raw_values = table.column(colname).to_numpy().astype(np.float64)
 
-            arr_length = len(rii.sample_dates_np_as_uint)
-            if arr_length != len(inter):
-                raise RuntimeError("Unequal length between date and value arrays")
+        if is_rate_from_field_meta(table.field(colname)):
+            # Mimic interpolate_backfill() with 0 as the left and right fill value.
+            # Samples that should be filled point to an extra zero value appended after the raw values.
+            if backfill_idx is None:
+                backfill_idx = locator.searchsorted(side="left")
+                backfill_idx[(backfill_idx > sample_last_row) | sample_is_before_first_raw_date] = len(raw_values)
 
-            vec_arr_list.append(inter)
+            inter = np.append(raw_values, 0.0)[backfill_idx]
+        else:
+            # Mimic np.interp(), which clamps to the end values outside the range of the raw dates.
+            # The offsets are zeroed wherever np.interp() returns a raw value directly, so that a single expression
+            # with the same floating point operations as np.interp() can be used for all samples.
+            if linear_params is None:
+                left_idx = np.clip(locator.searchsorted(side="right") - 1, sample_first_row, sample_last_row)
+                right_idx = np.minimum(left_idx + 1, sample_last_row)
+                is_single_point = left_idx == right_idx
+                dx = (sample_dates_ms - raw_dates_ms[left_idx]).astype(np.float64)
+                dx[is_single_point | sample_is_before_first_raw_date] = 0.0
+                step = (raw_dates_ms[right_idx] - raw_dates_ms[left_idx]).astype(np.float64)
+                step[is_single_point] = 1.0
+                linear_params = (left_idx, right_idx, dx, step)
+
+            left_idx, right_idx, dx, step = linear_params
+            inter = _interpolate_linear(raw_values[left_idx], raw_values[right_idx], dx, step)
+
+        # Cast to the column's type using numpy, this is much faster than letting pa.table() do the conversion
+        output_columns_dict[colname] = inter.astype(table.field(colname).type.to_pandas_dtype())
+
+    output_columns_dict["DATE"] = sample_dates_np
+    output_columns_dict["REAL"] = np.repeat(unique_reals, sample_count_per_real)
 
-        output_columns_dict[colname] = pa.chunked_array(vec_arr_list)
+    ret_table = pa.table(output_columns_dict, schema=table.schema)
 
-    date_arr_list = []
-    real_arr_list = []
-    for real in unique_reals:
-        rii = real_interpolation_info_dict[real]
-        arr_length = len(rii.sample_dates_np)
-        date_arr_list.append(rii.sample_dates_np)
-        real_arr_list.append(np.full(arr_length, real))
+    return ret_table
 
-    output_columns_dict["DATE"] = pa.chunked_array(date_arr_list)
-    output_columns_dict["REAL"] = pa.chunked_array(real_arr_list)
 
-    ret_table = pa.table(output_columns_dict, schema=table.schema)
+def _interpolate_linear(
+    left_values: np.ndarray, right_values: np.ndarray, dx: np.ndarray, step: np.ndarray
+) -> np.ndarray:
+    """
+    Linear interpolation between left and right values, with the same handling of non-finite values as np.interp().
 
-    return ret_table
+    That is, the left value is returned as is where dx is zero, where the result is NaN the interpolation is retried
+    from the right value, and if that also gives NaN while the left and right values are equal, the left value is used.
+    """
+    with np.errstate(invalid="ignore"):
+        slope = (right_values - left_values) / step
+        inter = slope * dx + left_values
+
+        is_nan = np.isnan(inter)
+        if is_nan.any():
+            inter[is_nan] = slope[is_nan] * (dx[is_nan] - step[is_nan]) + right_values[is_nan]
+            use_left = np.isnan(inter) & (left_values == right_values)
+            inter[use_left] = left_values[use_left]
+
+    return np.where(dx == 0, left_values, inter)
@@ -0,0 +1,217 @@
+import asyncio
+import hashlib
+import logging
+import os
+import uuid
+from pathlib import Path
+from typing import Protocol
+
+import pyarrow as pa
+import redis.asyncio as redis
+from webviz_core_utils.background_tasks import run_in_background_task
+from webviz_core_utils.bounded_lru_cache import BoundedLruCache, CacheStats
+from webviz_core_utils.perf_metrics import PerfMetrics
+
+_REDIS_KEY_PREFIX = "arrow_table_cache"
+_DISK_FILE_SUFFIX = ".arrows"
+
+LOGGER = logging.getLogger(__name__)
+
+
+class ArrowIpcStore(Protocol):
+    async def get_async(self, key: str) -> bytes | None: ...
+
+    async def put_async(self, key: str, ipc_bytes: bytes) -> None: ...
+
+
+class ArrowTableCache:
+    """
+    Process-wide cache of decoded Arrow tables.
+
+    The first tier is an in-memory LRU cache holding the decoded pa.Table objects, bounded by a byte size budget.
+    The optional second tier stores the tables serialized as Arrow IPC streams, either in Redis or on local disk,
+    so that entries survive evictions from the memory tier and can be shared between processes.
+
+    Note that the cache keys must fully identify the table contents, typically by including the ensemble
+    fingerprint, since there is no invalidation of entries. Pa.Table objects are immutable, so the same
+    cached table instance can safely be handed out to multiple callers.
+    """
+
+    def __init__(self, mem_max_size_bytes: int, second_tier_store: ArrowIpcStore | None) -> None:
+        self._mem_cache: BoundedLruCache[str, pa.Table] = BoundedLruCache(
+            max_size_bytes=mem_max_size_bytes, size_fn=lambda table: table.nbytes
+        )
+        self._second_tier_store = second_tier_store
+
+    async def get_async(self, key: str) -> pa.Table | None:
+        table = self._mem_cache.get(key)
+        if table is not None:
+            return table
+
+        if self._second_tier_store is None:
+            return None
+
+        perf_metrics = PerfMetrics()
+
+        try:
+            ipc_bytes = await self._second_tier_store.get_async(key)
+        except Exception as exc:  # pylint: disable=broad-exception-caught
+            LOGGER.warning(f"ArrowTableCache failed to read from second tier, treating as cache miss: {exc}")
+            return None
+        perf_metrics.record_lap("tier2-get")
+
+        if ipc_bytes is None:
+            return None
+
+        table = _deserialize_table(ipc_bytes)
+        perf_metrics.record_lap("deserialize")
+
+        self._mem_cache.put(key, table)
+
+        LOGGER.debug(f"ArrowTableCache got table from second tier in: {perf_metrics.to_string()} [{table.nbytes=}]")
+        return table
+
+    def put(self, key: str, table: pa.Table) -> None:
+        """
+        Put table into the memory tier and schedule a write to the second tier (if configured).
+        The second tier write is done in the background and is not awaited.
+        """
+        self._mem_cache.put(key, table)
+
+        if self._second_tier_store is not None:
+            run_in_background_task(self._put_in_second_tier_async(self._second_tier_store, key, table))
+
+    def get_stats(self) -> CacheStats:
+        return self._mem_cache.get_stats()
+
+    @staticmethod
+    async def _put_in_second_tier_async(second_tier_store: ArrowIpcStore, key: str, table: pa.Table) -> None:
+        # Serialization copies the whole table, so keep it off the event loop
+        ipc_bytes = await asyncio.to_thread(_serialize_table, table)
+        await second_tier_store.put_async(key, ipc_bytes)
+
+
+class RedisArrowIpcStore:
+    """
+    Second tier store that keeps the serialized tables in Redis with a fixed TTL.
+    """
+
+    def __init__(self, redis_url: str, ttl_s: int) -> None:
+        # Note that we need the raw bytes back from Redis, so decode_responses must be False here
+        self._redis_client: redis.Redis = redis.Redis.from_url(redis_url, decode_responses=False)
+        self._ttl_s = ttl_s
+
+    async def get_async(self, key: str) -> bytes | None:
+        return await self._redis_client.get(self._make_full_redis_key(key))
+
+    async def put_async(self, key: str, ipc_bytes: bytes) -> None:
+        await self._redis_client.set(name=self._make_full_redis_key(key), value=ipc_bytes, ex=self._ttl_s)
+
+    def _make_full_redis_key(self, key: str) -> str:
+        return f"{_REDIS_KEY_PREFIX}:{key}"
+
+
+class DiskArrowIpcStore:
+    """
+    Second tier store that keeps the serialized tables as files in a local directory.
+
+    The total size of the files is bounded, and the least recently used files are deleted when the budget is
+    exceeded. Any files already present in the directory are indexed on construction, oldest files first.
+    """
+
+    def __init__(self, cache_dir: str, max_size_bytes: int) -> None:
+        self._cache_dir = Path(cache_dir)
+        self._cache_dir.mkdir(parents=True, exist_ok=True)
+
+        # Index of the files on disk, maps from file name to file size
+        # Evicted files are only collected by the index, the actual deletion is done by the caller of put()
+        self._evicted_file_names: list[str] = []
+        self._file_index: BoundedLruCache[str, int] = BoundedLruCache(
+            max_size_bytes=max_size_bytes,
+            size_fn=lambda file_size: file_size,
+            on_evict=lambda file_name, _file_size: self._evicted_file_names.append(file_name),
+        )
+
+        existing_files = sorted(self._cache_dir.glob(f"*{_DISK_FILE_SUFFIX}"), key=lambda p: p.stat().st_mtime)
+        for file_path in existing_files:
+            self._file_index.put(file_path.name, file_path.stat().st_size)
+        self._delete_files(self._take_evicted_file_names())
+
+    async def get_async(self, key: str) -> bytes | None:
+        file_name = _make_file_name(key)
+        if self._file_index.get(file_name) is None:
+            return None
+
+        try:
+            return await asyncio.to_thread((self._cache_dir / file_name).read_bytes)
+        except FileNotFoundError:
+            self._file_index.pop(file_name)
+            return None
+
+    async def put_async(self, key: str, ipc_bytes: bytes) -> None:
+        file_name = _make_file_name(key)
+        await asyncio.to_thread(_write_file_atomic, self._cache_dir / file_name, ipc_bytes)
+        self._file_index.put(file_name, len(ipc_bytes))
+
+        evicted_file_names = self._take_evicted_file_names()
+        if evicted_file_names:
+            await asyncio.to_thread(self._delete_files, evicted_file_names)
+
+    def _take_evicted_file_names(self) -> list[str]:
+        evicted_file_names = self._evicted_file_names
+        self._evicted_file_names = []
+        return evicted_file_names
+
+    def _delete_files(self, file_names: list[str]) -> None:
+        for file_name in file_names:
+            try:
+                os.remove(self._cache_dir / file_name)
+            except FileNotFoundError:
+                pass
+
+
+# Process-wide state (private to module)
+_global_cache: ArrowTableCache | None = None  # pylint: disable=invalid-name
+
+
+def init_arrow_table_cache(mem_max_size_bytes: int, second_tier_store: ArrowIpcStore | None) -> None:
+    """
+    One-time initialization of the process-wide Arrow table cache.
+    Until this function has been called, get_arrow_table_cache() will return None and caching is disabled.
+    """
+    # pylint: disable=global-statement
+    global _global_cache
+    if _global_cache is not None:
+        raise RuntimeError("ArrowTableCache is already initialized")
+
+    _global_cache = ArrowTableCache(mem_max_size_bytes, second_tier_store)
+
+
+def get_arrow_table_cache() -> ArrowTableCache | None:
+    """
+    Get the process-wide Arrow table cache, returns None if the cache has not been initialized.
+    """
+    return _global_cache
+
+
+def _serialize_table(table: pa.Table) -> bytes:
+    sink = pa.BufferOutputStream()
+    with pa.ipc.new_stream(sink, table.schema) as writer:
+        writer.write_table(table)
+    return sink.getvalue().to_pybytes()
+
+
+def _deserialize_table(ipc_bytes: bytes) -> pa.Table:
+    with pa.ipc.open_stream(pa.py_buffer(ipc_bytes)) as reader:
+        return reader.read_all()
+
+
+def _make_file_name(key: str) -> str:
+    return hashlib.sha256(key.encode()).hexdigest() + _DISK_FILE_SUFFIX
+
+
+def _write_file_atomic(file_path: Path, data: bytes) -> None:
+    # Write to a temporary file first and then rename, so that readers never see partially written files
+    tmp_file_path = file_path.with_name(f"{file_path.name}.{uuid.uuid4().hex}.tmp")
+    tmp_file_path.write_bytes(data)
+    os.replace(tmp_file_path, file_path)
@@ -0,0 +1,228 @@
+import asyncio
+import dataclasses
+import hashlib
+import json
+import logging
+import os
+import uuid
+from pathlib import Path
+
+import numpy as np
+from webviz_core_utils.background_tasks import run_in_background_task
+from webviz_core_utils.bounded_lru_cache import BoundedLruCache, CacheStats
+from webviz_core_utils.perf_metrics import PerfMetrics
+
+from webviz_services.utils.decoded_surface import DecodedSurface, DecodedSurfaceDef
+
+_VALUES_FILE_SUFFIX = ".npy"
+_META_FILE_SUFFIX = ".json"
+
+LOGGER = logging.getLogger(__name__)
+
+
+class DecodedSurfaceCache:
+    """
+    Process-wide cache of decoded surfaces, i.e. surfaces that have already been downloaded and parsed.
+
+    The first tier is an in-memory LRU cache holding DecodedSurface objects, bounded by a byte size budget.
+    The optional second tier stores the values arrays as .npy files on local disk, which are memory mapped when
+    read back, so that entries survive evictions from the memory tier without having to be re-downloaded.
+
+    Note that the cache keys must fully identify the surface contents, typically by combining the surface address
+    with the ensemble fingerprint, since there is no invalidation of entries. The cached values arrays are shared
+    between callers and must be treated as read-only.
+    """
+
+    def __init__(self, mem_max_size_bytes: int, disk_store: "DiskDecodedSurfaceStore | None") -> None:
+        self._mem_cache: BoundedLruCache[str, DecodedSurface] = BoundedLruCache(
+            max_size_bytes=mem_max_size_bytes, size_fn=lambda surf: surf.nbytes
+        )
+        self._disk_store = disk_store
+
+    async def get_async(self, key: str) -> DecodedSurface | None:
+        decoded_surf = self._mem_cache.get(key)
+        if decoded_surf is not None:
+            return decoded_surf
+
+        if self._disk_store is None:
+            return None
+
+        perf_metrics = PerfMetrics()
+
+        try:
+            decoded_surf = await self._disk_store.get_async(key)
+        except Exception as exc:  # pylint: disable=broad-exception-caught
+            LOGGER.warning(f"DecodedSurfaceCache failed to read from disk tier, treating as cache miss: {exc}")
+            return None
+        perf_metrics.record_lap("disk-get")
+
+        if decoded_surf is None:
+            return None
+
+        self._mem_cache.put(key, decoded_surf)
+
+        LOGGER.debug(f"DecodedSurfaceCache got surface from disk tier in: {perf_metrics.to_string()}")
+        return decoded_surf
+
+    def put(self, key: str, decoded_surf: DecodedSurface) -> None:
+        """
+        Put surface into the memory tier and schedule a write to the disk tier (if configured).
+        The disk tier write is done in the background and is not awaited.
+        """
+        decoded_surf.values.flags.writeable = False
+        self._mem_cache.put(key, decoded_surf)
+
+        if self._disk_store is not None:
+            run_in_background_task(self._disk_store.put_async(key, decoded_surf))
+
+    def get_stats(self) -> CacheStats:
+        return self._mem_cache.get_stats()
+
+
+class DiskDecodedSurfaceStore:
+    """
+    Disk tier that keeps the values of each surface as a .npy file, alongside a small .json file holding the
+    surface definition and bounding box.
+
+    The total size of the .npy files is bounded, and the least recently used files are deleted when the budget
+    is exceeded. Any files already present in the directory are indexed on construction, oldest files first, and
+    leftovers from interrupted writes (temporary files and .json files without a .npy file) are deleted.
+    """
+
+    def __init__(self, cache_dir: str, max_size_bytes: int) -> None:
+        self._cache_dir = Path(cache_dir)
+        self._cache_dir.mkdir(parents=True, exist_ok=True)
+
+        # Index of the entries on disk, maps from file stem to size of the values file
+        # Evicted entries are only collected by the index, the actual deletion is done by the caller of put()
+        self._evicted_file_stems: list[str] = []
+        self._file_index: BoundedLruCache[str, int] = BoundedLruCache(
+            max_size_bytes=max_size_bytes,
+            size_fn=lambda file_size: file_size,
+            on_evict=lambda file_stem, _file_size: self._evicted_file_stems.append(file_stem),
+        )
+
+        self._delete_incomplete_files()
+        existing_files = sorted(self._cache_dir.glob(f"*{_VALUES_FILE_SUFFIX}"), key=lambda p: p.stat().st_mtime)
+        for file_path in existing_files:
+            self._file_index.put(file_path.stem, file_path.stat().st_size)
+        self._delete_files(self._take_evicted_file_stems())
+
+    async def get_async(self, key: str) -> DecodedSurface | None:
+        file_stem = _make_file_stem(key)
+        if self._file_index.get(file_stem) is None:
+            return None
+
+        try:
+            return await asyncio.to_thread(self._load_entry, file_stem)
+        except (FileNotFoundError, KeyError):
+            # KeyError if the meta file was written by an older version without the value range
+            self._file_index.pop(file_stem)
+            await asyncio.to_thread(self._delete_files, [file_stem])
+            return None
+
+    async def put_async(self, key: str, decoded_surf: DecodedSurface) -> None:
+        file_stem = _make_file_stem(key)
+        file_size = await asyncio.to_thread(self._write_entry, file_stem, decoded_surf)
+        self._file_index.put(file_stem, file_size)
+
+        evicted_file_stems = self._take_evicted_file_stems()
+        if evicted_file_stems:
+            await asyncio.to_thread(self._delete_files, evicted_file_stems)
+
+    def _take_evicted_file_stems(self) -> list[str]:
+        evicted_file_stems = self._evicted_file_stems
+        self._evicted_file_stems = []
+        return evicted_file_stems
+
+    def _load_entry(self, file_stem: str) -> DecodedSurface:
+        meta_dict = json.loads((self._cache_dir / f"{file_stem}{_META_FILE_SUFFIX}").read_text())
+        values = np.load(self._cache_dir / f"{file_stem}{_VALUES_FILE_SUFFIX}", mmap_mode="r")
+
+        surface_def = DecodedSurfaceDef(**meta_dict["surface_def"])
+        # The min/max values are stored in the meta file, so that a hit does not have to scan the whole values array
+        return DecodedSurface.from_values(
+            surface_def,
+            values,
+            bbox=tuple(meta_dict["bbox"]),
+            value_min=meta_dict["value_min"],
+            value_max=meta_dict["value_max"],
+        )
+
+    def _write_entry(self, file_stem: str, decoded_surf: DecodedSurface) -> int:
+        meta_dict = {
+            "surface_def": dataclasses.asdict(decoded_surf.surface_def),
+            "bbox": [decoded_surf.xmin, decoded_surf.xmax, decoded_surf.ymin, decoded_surf.ymax],
+            "value_min": decoded_surf.value_min,
+            "value_max": decoded_surf.value_max,
+        }
+
+        # The values file is written last, since its presence is what marks the entry as complete
+        values_file_path = self._cache_dir / f"{file_stem}{_VALUES_FILE_SUFFIX}"
+        _write_file_atomic(self._cache_dir / f"{file_stem}{_META_FILE_SUFFIX}", json.dumps(meta_dict).encode())
+        _write_npy_file_atomic(values_file_path, decoded_surf.values)
+
+        return values_file_path.stat().st_size
+
+    def _delete_files(self, file_stems: list[str]) -> None:
+        for file_stem in file_stems:
+            for suffix in [_VALUES_FILE_SUFFIX, _META_FILE_SUFFIX]:
+                try:
+                    os.remove(self._cache_dir / f"{file_stem}{suffix}")
+                except FileNotFoundError:
+                    pass
+
+    def _delete_incomplete_files(self) -> None:
+        # The meta file is written before the values file, so a meta file without values is from an interrupted write
+        incomplete_file_paths = list(self._cache_dir.glob("*.tmp"))
+        for meta_file_path in self._cache_dir.glob(f"*{_META_FILE_SUFFIX}"):
+            if not meta_file_path.with_suffix(_VALUES_FILE_SUFFIX).exists():
+                incomplete_file_paths.append(meta_file_path)
+
+        for file_path in incomplete_file_paths:
+            try:
+                os.remove(file_path)
+            except FileNotFoundError:
+                pass
+
+
+# Process-wide state (private to module)
+_global_cache: DecodedSurfaceCache | None = None  # pylint: disable=invalid-name
+
+
+def init_decoded_surface_cache(mem_max_size_bytes: int, disk_store: DiskDecodedSurfaceStore | None) -> None:
+    """
+    One-time initialization of the process-wide decoded surface cache.
+    Until this function has been called, get_decoded_surface_cache() will return None and caching is disabled.
+    """
+    # pylint: disable=global-statement
+    global _global_cache
+    if _global_cache is not None:
+        raise RuntimeError("DecodedSurfaceCache is already initialized")
+
+    _global_cache = DecodedSurfaceCache(mem_max_size_bytes, disk_store)
+
+
+def get_decoded_surface_cache() -> DecodedSurfaceCache | None:
+    """
+    Get the process-wide decoded surface cache, returns None if the cache has not been initialized.
+    """
+    return _global_cache
+
+
+def _make_file_stem(key: str) -> str:
+    return hashlib.sha256(key.encode()).hexdigest()
+
+
+def _write_file_atomic(file_path: Path, data: bytes) -> None:
+    # Write to a temporary file first and then rename, so that readers never see partially written files
+    tmp_file_path = file_path.with_name(f"{file_path.name}.{uuid.uuid4().hex}.tmp")
+    tmp_file_path.write_bytes(data)
+    os.replace(tmp_file_path, file_path)
+
+
+def _write_npy_file_atomic(file_path: Path, values: np.ndarray) -> None:
+    tmp_file_path = file_path.with_name(f"{file_path.name}.{uuid.uuid4().hex}.tmp")
+    with open(tmp_file_path, "wb") as file:
+        np.save(file, values, allow_pickle=False)
+    os.replace(tmp_file_path, file_path)
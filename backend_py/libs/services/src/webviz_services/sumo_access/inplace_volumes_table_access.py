@@ -1,12 +1,15 @@
 import logging
-from typing import Any, Optional
+from dataclasses import dataclass
+from typing import Any, Awaitable, Callable, Optional, TypeVar
 
 import pyarrow as pa
 from fmu.datamodels.standard_results.enums import StandardResultName
 from fmu.sumo.explorer.explorer import SearchContext, SumoClient
+from webviz_core_utils.bounded_lru_cache import BoundedLruCache
 from webviz_core_utils.perf_metrics import PerfMetrics
 
 from webviz_services.service_exceptions import InvalidDataError, Service
+from webviz_services.utils.single_flight import SingleFlightGroup
 
 from ._arrow_table_loader import ArrowTableLoader
 from .sumo_client_factory import create_sumo_client
@@ -18,65 +21,77 @@ LOGGER = logging.getLogger(__name__)
 # Index column values to ignore, i.e. remove from the inplace volume tables
 IGNORED_INDEX_COLUMN_VALUES = ["Totals", None]
 
+T = TypeVar("T")
+
+
+@dataclass(frozen=True, kw_only=True)
+class _EnsembleTablesInfo:
+    is_deprecated_format: bool
+    table_names: list[str]
+
+
+# The inplace volumes metadata of an ensemble, i.e. the table format, the table names and the columns with index unique
+# values of each table, is immutable for a given ensemble fingerprint. It is therefore cached and shared between
+# requests, so that only the aggregated table data has to be fetched per request. The caches are bypassed when the
+# ensemble fingerprint is unknown. The cached objects are shared between callers and must not be modified.
+_METADATA_CACHE_TTL_S = 60 * 60
+_METADATA_CACHE_MAX_ENTRIES = 500
+_TABLES_INFO_CACHE: BoundedLruCache[str, _EnsembleTablesInfo] = BoundedLruCache(
+    max_entries=_METADATA_CACHE_MAX_ENTRIES, ttl_s=_METADATA_CACHE_TTL_S
+)
+_TABLES_INFO_LOAD_GROUP: SingleFlightGroup[_EnsembleTablesInfo] = SingleFlightGroup("inplace_volumes_tables_info")
+_COLUMNS_META_CACHE: BoundedLruCache[str, VolumeColumnsAndIndexUniqueValues] = BoundedLruCache(
+    max_entries=_METADATA_CACHE_MAX_ENTRIES, ttl_s=_METADATA_CACHE_TTL_S
+)
+_COLUMNS_META_LOAD_GROUP: SingleFlightGroup[VolumeColumnsAndIndexUniqueValues] = SingleFlightGroup(
+    "inplace_volumes_columns_meta"
+)
+
 
 class InplaceVolumesTableAccess:
     """
     Class for accessing and retrieving inplace volumes table data from Sumo.
     """
 
-    _table_names: list[str] | None = None
-
-    def __init__(self, sumo_client: SumoClient, case_uuid: str, ensemble_name: str):
+    def __init__(
+        self, sumo_client: SumoClient, case_uuid: str, ensemble_name: str, ensemble_fingerprint: str | None = None
+    ):
         self._sumo_client = sumo_client
         self._case_uuid: str = case_uuid
         self._ensemble_name: str = ensemble_name
+        self._ensemble_fingerprint: str | None = ensemble_fingerprint
         self._ensemble_context = SearchContext(sumo=self._sumo_client).filter(
             uuid=self._case_uuid, ensemble=self._ensemble_name
         )
+        self._tables_info: _EnsembleTablesInfo | None = None
 
     @classmethod
-    def from_ensemble_name(cls, access_token: str, case_uuid: str, ensemble_name: str) -> "InplaceVolumesTableAccess":
+    def from_ensemble_name(
+        cls, access_token: str, case_uuid: str, ensemble_name: str, ensemble_fingerprint: str | None = None
+    ) -> "InplaceVolumesTableAccess":
         sumo_client = create_sumo_client(access_token)
-        return cls(sumo_client=sumo_client, case_uuid=case_uuid, ensemble_name=ensemble_name)
+        return cls(
+            sumo_client=sumo_client,
+            case_uuid=case_uuid,
+            ensemble_name=ensemble_name,
+            ensemble_fingerprint=ensemble_fingerprint,
+        )
 
     async def is_deprecated_format_async(self) -> bool:
         """
         Check if the inplace volumes table is of deprecated format.
 
         Deprecated format means that the table does not have the 'standard_result' field set to 'inplace_volumes'.
-
-        This function will initialize _table_names for cache purposes
         """
-        if self._table_names is not None:
-            return False
-
-        # See if the table has the standard_result field set to 'inplace_volumes'
-        table_context = self._ensemble_context.tables.filter(standard_result=StandardResultName.inplace_volumes)
-        table_names = await table_context.names_async
-        if table_names:
-            self._table_names = table_names
-            return False
-
-        # Check if deprecated format (do not initialize _table_names)
-        table_context = self._ensemble_context.tables.filter(content="volumes")
-        table_names = await table_context.names_async
-        if table_names:
-            return True
-
-        # If no tables found for new format, set empty list of table names
-        self._table_names = []
-        return False
+        tables_info = await self._get_tables_info_async()
+        return tables_info.is_deprecated_format
 
     async def get_inplace_volumes_table_names_async(self) -> list[str]:
         """
         Get list of inplace volumes table names for the given case and ensemble.
         """
-        if self._table_names is not None:
-            return self._table_names
-
-        table_context = self._ensemble_context.tables.filter(standard_result=StandardResultName.inplace_volumes)
-        self._table_names = await table_context.names_async
-        return self._table_names
+        tables_info = await self._get_tables_info_async()
+        return tables_info.table_names
 
     async def get_inplace_volumes_aggregated_table_async(
         self, table_name: str, volume_columns: Optional[set[str]] = None
@@ -113,7 +128,9 @@ class InplaceVolumesTableAccess:
 
         requested_columns = available_response_names if volume_columns is None else list(volume_columns)
 
-        table_loader = ArrowTableLoader(self._sumo_client, self._case_uuid, self._ensemble_name)
+        table_loader = ArrowTableLoader(
+            self._sumo_client, self._case_uuid, self._ensemble_name, self._ensemble_fingerprint
+        )
         table_loader.require_standard_result(StandardResultName.inplace_volumes)
         table_loader.require_table_name(table_name)
         pa_table = await table_loader.get_aggregated_multiple_columns_async(requested_columns)
@@ -141,7 +158,9 @@ class InplaceVolumesTableAccess:
                 f"No realizations found in the ensemble {self._case_uuid}, {self._ensemble_name}",
                 Service.SUMO,
             )
-        table_loader = ArrowTableLoader(self._sumo_client, self._case_uuid, self._ensemble_name)
+        table_loader = ArrowTableLoader(
+            self._sumo_client, self._case_uuid, self._ensemble_name, self._ensemble_fingerprint
+        )
         table_loader.require_standard_result(StandardResultName.inplace_volumes)
         table_loader.require_table_name(table_name)
 
@@ -162,13 +181,48 @@ class InplaceVolumesTableAccess:
         """
         Get object with list of inplace volume columns and dictionary of index columns with their unique column values for the inplace volumes table.
         """
+        return await _get_or_load_cached_async(
+            _COLUMNS_META_CACHE,
+            _COLUMNS_META_LOAD_GROUP,
+            self._make_metadata_cache_key(f"table:{table_name}"),
+            lambda: self._load_volume_columns_and_index_unique_values_async(table_name),
+        )
+
+    async def _get_tables_info_async(self) -> _EnsembleTablesInfo:
+        if self._tables_info is None:
+            self._tables_info = await _get_or_load_cached_async(
+                _TABLES_INFO_CACHE,
+                _TABLES_INFO_LOAD_GROUP,
+                self._make_metadata_cache_key("tables_info"),
+                self._load_tables_info_async,
+            )
+
+        return self._tables_info
+
+    async def _load_tables_info_async(self) -> _EnsembleTablesInfo:
+        # See if the table has the standard_result field set to 'inplace_volumes'
+        table_context = self._ensemble_context.tables.filter(standard_result=StandardResultName.inplace_volumes)
+        table_names = await table_context.names_async
+        if table_names:
+            return _EnsembleTablesInfo(is_deprecated_format=False, table_names=table_names)
+
+        # Check if deprecated format, otherwise there are no inplace volumes tables in the ensemble
+        table_context = self._ensemble_context.tables.filter(content="volumes")
+        deprecated_table_names = await table_context.names_async
+        return _EnsembleTablesInfo(is_deprecated_format=bool(deprecated_table_names), table_names=[])
+
+    async def _load_volume_columns_and_index_unique_values_async(
+        self, table_name: str
+    ) -> VolumeColumnsAndIndexUniqueValues:
         realizations = await self._ensemble_context.realizationids_async
         if len(realizations) == 0:
             raise InvalidDataError(
                 f"No realizations found in the ensemble {self._case_uuid}, {self._ensemble_name}",
                 Service.SUMO,
             )
-        table_loader = ArrowTableLoader(self._sumo_client, self._case_uuid, self._ensemble_name)
+        table_loader = ArrowTableLoader(
+            self._sumo_client, self._case_uuid, self._ensemble_name, self._ensemble_fingerprint
+        )
         table_loader.require_standard_result(StandardResultName.inplace_volumes)
         table_loader.require_table_name(table_name)
 
@@ -187,3 +241,34 @@ class InplaceVolumesTableAccess:
         return VolumeColumnsAndIndexUniqueValues(
             volume_columns=volumetric_columns, index_unique_values_map=index_column_unique_values_map
         )
+
+    def _make_metadata_cache_key(self, metadata_name: str) -> str | None:
+        if not self._ensemble_fingerprint:
+            return None
+
+        return f"{self._case_uuid}::{self._ensemble_name}::{self._ensemble_fingerprint}::{metadata_name}"
+
+
+async def _get_or_load_cached_async(
+    cache: BoundedLruCache[str, T],
+    load_group: SingleFlightGroup[T],
+    cache_key: str | None,
+    load_func: Callable[[], Awaitable[T]],
+) -> T:
+    """
+    Get value from cache, or load it while collapsing concurrent loads of the same key.
+    Caching is bypassed when cache_key is None.
+    """
+    if cache_key is None:
+        return await load_func()
+
+    value = cache.get(cache_key)
+    if value is not None:
+        return value
+
+    async def load_and_cache_async() -> T:
+        loaded_value = await load_func()
+        cache.put(cache_key, loaded_value)
+        return loaded_value
+
+    return await load_group.do_async(cache_key, load_and_cache_async)
@@ -24,18 +24,28 @@ ALLOWED_RFT_RESPONSE_NAMES = ["PRESSURE", "SGAS", "SWAT", "SOIL"]
 
 
 class RftAccess:
-    def __init__(self, sumo_client: SumoClient, case_uuid: str, ensemble_name: str):
+    def __init__(
+        self, sumo_client: SumoClient, case_uuid: str, ensemble_name: str, ensemble_fingerprint: str | None = None
+    ):
         self._sumo_client = sumo_client
         self._case_uuid: str = case_uuid
         self._ensemble_name: str = ensemble_name
+        self._ensemble_fingerprint: str | None = ensemble_fingerprint
         self._ensemble_context = SearchContext(sumo=self._sumo_client).filter(
             uuid=self._case_uuid, ensemble=self._ensemble_name
         )
 
     @classmethod
-    def from_ensemble_name(cls, access_token: str, case_uuid: str, ensemble_name: str) -> "RftAccess":
+    def from_ensemble_name(
+        cls, access_token: str, case_uuid: str, ensemble_name: str, ensemble_fingerprint: str | None = None
+    ) -> "RftAccess":
         sumo_client = create_sumo_client(access_token)
-        return cls(sumo_client=sumo_client, case_uuid=case_uuid, ensemble_name=ensemble_name)
+        return cls(
+            sumo_client=sumo_client,
+            case_uuid=case_uuid,
+            ensemble_name=ensemble_name,
+            ensemble_fingerprint=ensemble_fingerprint,
+        )
 
     async def get_rft_info_async(self) -> RftTableDefinition:
         """Get a collection of rft tables for a case and ensemble"""
@@ -59,7 +69,9 @@ class RftAccess:
         columns = await table_context.columns_async
         available_response_names = [col for col in columns if col in ALLOWED_RFT_RESPONSE_NAMES]
 
-        table_loader = ArrowTableLoader(self._sumo_client, self._case_uuid, self._ensemble_name)
+        table_loader = ArrowTableLoader(
+            self._sumo_client, self._case_uuid, self._ensemble_name, self._ensemble_fingerprint
+        )
         table_loader.require_content_type("rft")
         table_loader.require_table_name(table_names[0])
         table = await table_loader.get_aggregated_multiple_columns_async(available_response_names)
@@ -91,7 +103,9 @@ class RftAccess:
         timer = PerfMetrics()
         column_names = [response_name, "DEPTH"]
 
-        table_loader = ArrowTableLoader(self._sumo_client, self._case_uuid, self._ensemble_name)
+        table_loader = ArrowTableLoader(
+            self._sumo_client, self._case_uuid, self._ensemble_name, self._ensemble_fingerprint
+        )
         table_loader.require_content_type("rft")
 
         table = await table_loader.get_aggregated_multiple_columns_async(column_names)
@@ -4,6 +4,7 @@ from typing import List, Optional, Sequence, Tuple, Set
 import numpy as np
 import pyarrow as pa
 import pyarrow.compute as pc
+from webviz_core_utils.cpu_executors import run_in_thread_executor_async
 from webviz_core_utils.perf_timer import PerfTimer
 
 from fmu.sumo.explorer.explorer import SearchContext, SumoClient
@@ -33,15 +34,25 @@ LOGGER = logging.getLogger(__name__)
 
 
 class SummaryAccess:
-    def __init__(self, sumo_client: SumoClient, case_uuid: str, ensemble_name: str):
+    def __init__(
+        self, sumo_client: SumoClient, case_uuid: str, ensemble_name: str, ensemble_fingerprint: str | None = None
+    ):
         self._sumo_client = sumo_client
         self._case_uuid: str = case_uuid
         self._ensemble_name: str = ensemble_name
+        self._ensemble_fingerprint: str | None = ensemble_fingerprint
 
     @classmethod
-    def from_ensemble_name(cls, access_token: str, case_uuid: str, ensemble_name: str) -> "SummaryAccess":
+    def from_ensemble_name(
+        cls, access_token: str, case_uuid: str, ensemble_name: str, ensemble_fingerprint: str | None = None
+    ) -> "SummaryAccess":
         sumo_client = create_sumo_client(access_token)
-        return cls(sumo_client=sumo_client, case_uuid=case_uuid, ensemble_name=ensemble_name)
+        return cls(
+            sumo_client=sumo_client,
+            case_uuid=case_uuid,
+            ensemble_name=ensemble_name,
+            ensemble_fingerprint=ensemble_fingerprint,
+        )
 
     @otel_span_decorator()
     async def get_available_vectors_async(self) -> List[VectorInfo]:
@@ -106,13 +117,44 @@ class SummaryAccess:
         The vector column will be of type float32.
         If `resampling_frequency` is None, the data will be returned with full/raw resolution.
         """
+        table, vector_metadata_list = await self.get_vectors_table_async(
+            [vector_name], resampling_frequency, realizations
+        )
+        return table, vector_metadata_list[0]
+
+    @otel_span_decorator()
+    async def get_vectors_table_async(
+        self,
+        vector_names: Sequence[str],
+        resampling_frequency: Optional[Frequency],
+        realizations: Optional[Sequence[int]],
+    ) -> Tuple[pa.Table, List[VectorMetadata]]:
+        """
+        Get pyarrow.Table containing values for the specified vectors and the specified realizations.
+        The vectors are loaded concurrently and are resampled together, sharing the same per-realization dates.
+        If realizations is None, data for all available realizations will be returned.
+        The returned table will always contain a 'DATE' and 'REAL' column in addition to the requested vectors.
+        The 'DATE' column will be of type timestamp[ms] and the 'REAL' column will be of type int16.
+        The vector columns will be of type float32.
+        The returned list of vector metadata has one entry per requested vector, in the same order as vector_names.
+        If `resampling_frequency` is None, the data will be returned with full/raw resolution.
+        """
+        if not vector_names:
+            raise InvalidParameterError("List of requested vector names is empty", Service.SUMO)
+        if len(set(vector_names)) != len(vector_names):
+            raise InvalidParameterError(
+                f"List of requested vector names contains duplicates: {vector_names}", Service.SUMO
+            )
+
         timer = PerfTimer()
 
-        table_loader = ArrowTableLoader(self._sumo_client, self._case_uuid, self._ensemble_name)
+        table_loader = ArrowTableLoader(
+            self._sumo_client, self._case_uuid, self._ensemble_name, self._ensemble_fingerprint
+        )
         # New metadata uses simulationtimeseries, but most existing cases use timeseries
         table_loader.require_content_type(["timeseries", "simulationtimeseries"])
-        table = await table_loader.get_aggregated_single_column_async(vector_name)
-        _validate_single_vector_table(table, vector_name)
+        table = await table_loader.get_aggregated_multiple_columns_async(list(vector_names))
+        _validate_vectors_table(table, vector_names)
         et_loading_ms = timer.lap_ms()
 
         if realizations is not None:
@@ -134,26 +176,29 @@ class SummaryAccess:
 
         # The resampling algorithm below uses the field metadata to determine if the vector is a rate or not.
         # For now, fail hard if metadata is not present. This test could be refined, but should suffice now.
-        vector_metadata = create_vector_metadata_from_field_meta(table.schema.field(vector_name))
-        if not vector_metadata:
-            raise InvalidDataError(f"Did not find valid metadata for vector {vector_name}", Service.SUMO)
+        vector_metadata_list: List[VectorMetadata] = []
+        for vector_name in vector_names:
+            vector_metadata = create_vector_metadata_from_field_meta(table.schema.field(vector_name))
+            if not vector_metadata:
+                raise InvalidDataError(f"Did not find valid metadata for vector {vector_name}", Service.SUMO)
+            vector_metadata_list.append(vector_metadata)
 
         # Do the actual resampling
         timer.lap_ms()
         if resampling_frequency is not None:
-            table = resample_segmented_multi_real_table(table, resampling_frequency)
+            table = await run_in_thread_executor_async(resample_segmented_multi_real_table, table, resampling_frequency)
         et_resampling_ms = timer.lap_ms()
 
         # Should we always combine the chunks?
         table = table.combine_chunks()
 
         LOGGER.debug(
-            f"Got summary vector data from Sumo in: {timer.elapsed_ms()}ms "
+            f"Got summary data for {len(vector_names)} vector(s) from Sumo in: {timer.elapsed_ms()}ms "
             f"(loading={et_loading_ms}ms, resampling={et_resampling_ms}ms) "
-            f"({vector_name=} {resampling_frequency=} {table.shape=})"
+            f"({vector_names=} {resampling_frequency=} {table.shape=})"
         )
 
-        return table, vector_metadata
+        return table, vector_metadata_list
 
     @otel_span_decorator()
     async def get_vector_async(
@@ -163,30 +208,7 @@ class SummaryAccess:
         realizations: Optional[Sequence[int]],
     ) -> List[RealizationVector]:
         table, vector_metadata = await self.get_vector_table_async(vector_name, resampling_frequency, realizations)
-
-        real_arr_np = table.column("REAL").to_numpy()
-        unique_reals, first_occurrence_idx, real_counts = np.unique(real_arr_np, return_index=True, return_counts=True)
-
-        whole_date_np_arr = table.column("DATE").to_numpy()
-        whole_value_np_arr = table.column(vector_name).to_numpy()
-
-        ret_arr: List[RealizationVector] = []
-        for i, real in enumerate(unique_reals):
-            start_row_idx = first_occurrence_idx[i]
-            row_count = real_counts[i]
-            date_np_arr = whole_date_np_arr[start_row_idx : start_row_idx + row_count]
-            value_np_arr = whole_value_np_arr[start_row_idx : start_row_idx + row_count]
-
-            ret_arr.append(
-                RealizationVector(
-                    realization=real,
-                    timestamps_utc_ms=date_np_arr.astype(int).tolist(),
-                    values=value_np_arr.tolist(),
-                    metadata=vector_metadata,
-                )
-            )
-
-        return ret_arr
+        return create_realization_vector_list(table, vector_name, vector_metadata)
 
     @otel_span_decorator()
     async def get_single_real_vectors_table_async(
@@ -208,7 +230,9 @@ class SummaryAccess:
             raise InvalidParameterError("List of requested vector names is empty", Service.SUMO)
 
         timer = PerfTimer()
-        table_loader = ArrowTableLoader(self._sumo_client, self._case_uuid, self._ensemble_name)
+        table_loader = ArrowTableLoader(
+            self._sumo_client, self._case_uuid, self._ensemble_name, self._ensemble_fingerprint
+        )
         table_loader.require_content_type(["timeseries", "simulationtimeseries"])
         table = await table_loader.get_single_realization_async(realization)
 
@@ -271,7 +295,9 @@ class SummaryAccess:
         if not hist_vec_name:
             return None
 
-        table_loader = ArrowTableLoader(self._sumo_client, self._case_uuid, self._ensemble_name)
+        table_loader = ArrowTableLoader(
+            self._sumo_client, self._case_uuid, self._ensemble_name, self._ensemble_fingerprint
+        )
         table_loader.require_content_type(["timeseries", "simulationtimeseries"])
         table = await table_loader.get_aggregated_single_column_async(hist_vec_name)
         _validate_single_vector_table(table, hist_vec_name)
@@ -293,7 +319,7 @@ class SummaryAccess:
 
         # Do the actual resampling
         if resampling_frequency is not None:
-            table = resample_segmented_multi_real_table(table, resampling_frequency)
+            table = await run_in_thread_executor_async(resample_segmented_multi_real_table, table, resampling_frequency)
 
         date_np_arr = table.column("DATE").to_numpy()
         value_np_arr = table.column(hist_vec_name).to_numpy()
@@ -348,20 +374,57 @@ class SummaryAccess:
         return pc.unique(table.column("DATE")).to_numpy().astype(int).tolist()
 
 
+def create_realization_vector_list(
+    table: pa.Table, vector_name: str, vector_metadata: VectorMetadata
+) -> List[RealizationVector]:
+    """
+    Create list of RealizationVector for the specified vector column in a table containing DATE and REAL columns.
+    The table must be segmented on REAL, as is the case for tables returned by SummaryAccess.
+    """
+    real_arr_np = table.column("REAL").to_numpy()
+    unique_reals, first_occurrence_idx, real_counts = np.unique(real_arr_np, return_index=True, return_counts=True)
+
+    whole_date_np_arr = table.column("DATE").to_numpy()
+    whole_value_np_arr = table.column(vector_name).to_numpy()
+
+    ret_arr: List[RealizationVector] = []
+    for i, real in enumerate(unique_reals):
+        start_row_idx = first_occurrence_idx[i]
+        row_count = real_counts[i]
+        date_np_arr = whole_date_np_arr[start_row_idx : start_row_idx + row_count]
+        value_np_arr = whole_value_np_arr[start_row_idx : start_row_idx + row_count]
+
+        ret_arr.append(
+            RealizationVector(
+                realization=real,
+                timestamps_utc_ms=date_np_arr.astype(int).tolist(),
+                values=value_np_arr.tolist(),
+                metadata=vector_metadata,
+            )
+        )
+
+    return ret_arr
+
+
 def _validate_single_vector_table(arrow_table: pa.Table, vector_name: str) -> None:
+    _validate_vectors_table(arrow_table, [vector_name])
+
+
+def _validate_vectors_table(arrow_table: pa.Table, vector_names: Sequence[str]) -> None:
 
     # Verify that we got the expected columns
     if not "DATE" in arrow_table.column_names:
         raise InvalidDataError("Table does not contain a DATE column", Service.SUMO)
     if not "REAL" in arrow_table.column_names:
         raise InvalidDataError("Table does not contain a REAL column", Service.SUMO)
-    if not vector_name in arrow_table.column_names:
-        raise InvalidDataError(f"Table does not contain a {vector_name} column", Service.SUMO)
-    if arrow_table.num_columns != 3:
-        raise InvalidDataError("Table should contain exactly 3 columns", Service.SUMO)
+    for vector_name in vector_names:
+        if not vector_name in arrow_table.column_names:
+            raise InvalidDataError(f"Table does not contain a {vector_name} column", Service.SUMO)
+    if arrow_table.num_columns != 2 + len(vector_names):
+        raise InvalidDataError(f"Table should contain exactly {2 + len(vector_names)} columns", Service.SUMO)
 
     # Verify that we got the expected columns
-    if sorted(arrow_table.column_names) != sorted(["DATE", "REAL", vector_name]):
+    if sorted(arrow_table.column_names) != sorted(["DATE", "REAL", *vector_names]):
         raise InvalidDataError(f"Unexpected columns in table {arrow_table.column_names=}", Service.SUMO)
 
     # Verify that the column datatypes are as we expect
@@ -370,10 +433,11 @@ def _validate_single_vector_table(arrow_table: pa.Table, vector_name: str) -> No
         raise InvalidDataError(f"Unexpected type for DATE column {schema.field('DATE').type=}", Service.SUMO)
     if schema.field("REAL").type != pa.int16():
         raise InvalidDataError(f"Unexpected type for REAL column {schema.field('REAL').type=}", Service.SUMO)
-    if schema.field(vector_name).type != pa.float32():
-        raise InvalidDataError(
-            f"Unexpected type for {vector_name} column {schema.field(vector_name).type=}", Service.SUMO
-        )
+    for vector_name in vector_names:
+        if schema.field(vector_name).type != pa.float32():
+            raise InvalidDataError(
+                f"Unexpected type for {vector_name} column {schema.field(vector_name).type=}", Service.SUMO
+            )
 
 
 def _is_historical_vector_name(vector_name: str) -> bool:
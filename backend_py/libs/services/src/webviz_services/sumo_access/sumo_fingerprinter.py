@@ -2,9 +2,11 @@ import asyncio
 
 import logging
 from dataclasses import dataclass
+from typing import Mapping, Sequence, cast
 
 import redis.asyncio as redis
 from fmu.sumo.explorer.explorer import SearchContext, SumoClient
+from webviz_core_utils.bounded_lru_cache import BoundedLruCache
 from webviz_core_utils.perf_metrics import PerfMetrics
 from webviz_core_utils.timestamp_utils import timestamp_utc_ms_to_iso_str
 
@@ -16,22 +18,33 @@ from .sumo_client_factory import create_sumo_client
 
 _REDIS_KEY_PREFIX = "sumo_fingerprinter"
 
+# Limits for the in-process part of the shared tier, and for how long a verified (user, case) access is remembered
+_SHARED_MEM_MAX_ENTRIES = 5000
+_VERIFIED_ACCESS_MAX_ENTRIES = 20000
+_VERIFIED_ACCESS_TTL_S = 10 * 60
+
 LOGGER = logging.getLogger(__name__)
 
 
 class SumoFingerprinterFactory:
     _instance = None
 
-    def __init__(self, redis_client: redis.Redis):
+    def __init__(self, redis_client: redis.Redis, shared_tier: "_SharedFingerprintTier | None"):
         self._redis_client: redis.Redis = redis_client
+        self._shared_tier = shared_tier
 
     @classmethod
-    def initialize(cls, redis_url: str) -> None:
+    def initialize(cls, redis_url: str, use_shared_tier: bool = True) -> None:
+        """
+        Initialize the factory. If use_shared_tier is True, fingerprints are also cached in a user independent tier,
+        see _SharedFingerprintTier.
+        """
         if cls._instance is not None:
             raise RuntimeError("SumoFingerprinterFactory is already initialized")
 
         redis_client = redis.Redis.from_url(redis_url, decode_responses=True)
-        cls._instance = cls(redis_client)
+        shared_tier = _SharedFingerprintTier() if use_shared_tier else None
+        cls._instance = cls(redis_client, shared_tier)
 
     @classmethod
     def get_instance(cls) -> "SumoFingerprinterFactory":
@@ -45,41 +58,113 @@ class SumoFingerprinterFactory:
         if not authenticated_user:
             raise ValueError("An authenticated user must be specified")
 
-        return SumoFingerprinter(authenticated_user, self._redis_client, cache_ttl_s)
+        return SumoFingerprinter(authenticated_user, self._redis_client, cache_ttl_s, self._shared_tier)
+
+
+class _SharedFingerprintTier:
+    """
+    User independent cache tier for ensemble fingerprints.
+
+    The fingerprint only describes the content of an ensemble, so it is the same for everyone with access to the case.
+    This tier consists of Redis keys that only depend on case and ensemble, with an in-process LRU in front.
+    Entries must only be served to a user after that user's access to the case has been verified, and the verified
+    (user, case) pairs are remembered here for a while. The tier is only filled with fingerprints calculated by users
+    that could see documents in the case.
+    """
+
+    def __init__(self) -> None:
+        self._mem_fps: BoundedLruCache[str, str] = BoundedLruCache(max_entries=_SHARED_MEM_MAX_ENTRIES)
+        self._verified_access: BoundedLruCache[str, bool] = BoundedLruCache(
+            max_entries=_VERIFIED_ACCESS_MAX_ENTRIES, ttl_s=_VERIFIED_ACCESS_TTL_S
+        )
+
+    def has_verified_access(self, user_id: str, case_uuid: str) -> bool:
+        return self._verified_access.get(f"{user_id}:{case_uuid}") is not None
+
+    def mark_access_verified(self, user_id: str, case_uuid: str) -> None:
+        self._verified_access.put(f"{user_id}:{case_uuid}", True)
+
+    def get_from_memory(self, case_uuid: str, ensemble_name: str) -> str | None:
+        return self._mem_fps.get(self.make_redis_key(case_uuid, ensemble_name))
+
+    def put_in_memory(self, case_uuid: str, ensemble_name: str, fingerprint: str, ttl_s: int) -> None:
+        self._mem_fps.put(self.make_redis_key(case_uuid, ensemble_name), fingerprint, ttl_s)
+
+    @staticmethod
+    def make_redis_key(case_uuid: str, ensemble_name: str) -> str:
+        return f"{_REDIS_KEY_PREFIX}:shared:case:{case_uuid}:ens:{ensemble_name}"
 
 
 class SumoFingerprinter:
-    def __init__(self, authenticated_user: AuthenticatedUser, redis_client: redis.Redis, cache_ttl_s: int):
+    def __init__(
+        self,
+        authenticated_user: AuthenticatedUser,
+        redis_client: redis.Redis,
+        cache_ttl_s: int,
+        shared_tier: _SharedFingerprintTier | None = None,
+    ):
         self._access_token: str = authenticated_user.get_sumo_access_token()
         self._sumo_client: SumoClient = create_sumo_client(self._access_token)
         self._user_id = authenticated_user.get_user_id()
         self._redis_client = redis_client
         self._cache_ttl_s = cache_ttl_s
+        self._shared_tier = shared_tier
 
     async def get_or_calc_ensemble_fp_async(self, case_uuid: str, ensemble_name: str) -> str:
         """
         Get from cache or calculate the fingerprint string for contents of an ensemble.
         See calc_ensemble_fp_async() for details.
+
+        With the shared tier enabled, the lookup order is: the in-process LRU (if the user's access to the case is
+        already verified), then the user's own Redis key and the shared Redis key in a single MGET. A hit on the shared
+        Redis key requires a cheap access check against Sumo before being used.
         """
         perf_metrics = PerfMetrics()
 
+        shared_tier = self._shared_tier
+        if shared_tier and shared_tier.has_verified_access(self._user_id, case_uuid):
+            mem_fp = shared_tier.get_from_memory(case_uuid, ensemble_name)
+            if mem_fp is not None:
+                return mem_fp
+
         redis_key = self._make_full_redis_key(case_uuid=case_uuid, ensemble_name=ensemble_name)
 
-        cached_fp = await self._redis_client.get(redis_key)
+        shared_fp: str | None = None
+        if shared_tier:
+            shared_redis_key = shared_tier.make_redis_key(case_uuid, ensemble_name)
+            cached_fp, shared_fp = await self._redis_client.mget([redis_key, shared_redis_key])
+        else:
+            cached_fp = await self._redis_client.get(redis_key)
         perf_metrics.record_lap("redis-get")
+
         if cached_fp is not None:
+            if shared_tier:
+                # Found under the user's own key, so the user has been able to calculate it earlier
+                shared_tier.mark_access_verified(self._user_id, case_uuid)
+                shared_tier.put_in_memory(case_uuid, ensemble_name, cached_fp, self._cache_ttl_s)
             # LOGGER.debug(f"get_or_calc_ensemble_fp_async() - from cache in: {perf_metrics.to_string()} [{cached_fp=}]")
             return cached_fp
 
-        new_fp = await calc_ensemble_fp_async(self._sumo_client, case_uuid, ensemble_name, None)
+        if shared_tier and shared_fp is not None:
+            has_access = await self._verify_case_access_async(case_uuid)
+            perf_metrics.record_lap("verify-access")
+            if has_access:
+                shared_tier.mark_access_verified(self._user_id, case_uuid)
+                shared_tier.put_in_memory(case_uuid, ensemble_name, shared_fp, self._cache_ttl_s)
+                return shared_fp
+
+        fp_result = (await _calc_ensemble_fp_results_async(self._sumo_client, [(case_uuid, ensemble_name)]))[0]
+        if isinstance(fp_result, Exception):
+            raise fp_result
         perf_metrics.record_lap("calc-fp")
 
         # Schedule the Redis set call, but don't await it
-        asyncio.create_task(self._redis_client.set(name=redis_key, value=new_fp, ex=self._cache_ttl_s))
+        fps_to_store = self._register_and_collect_fps_to_store({(case_uuid, ensemble_name): fp_result})
+        asyncio.create_task(self._store_fps_async(fps_to_store))
         perf_metrics.record_lap("schedule-redis-set")
 
         # LOGGER.debug(f"get_or_calc_ensemble_fp_async() - calculated in: {perf_metrics.to_string()} [{new_fp=}]")
-        return new_fp
+        return fp_result.fingerprint
 
     async def calc_and_store_ensemble_fp_async(self, case_uuid: str, ensemble_name: str) -> str:
         """
@@ -87,18 +172,75 @@ class SumoFingerprinter:
         This method does not check the cache first, it will always calculate a new fingerprint and write it to the cache.
         See calc_ensemble_fp_async() for details.
         """
+        new_fp = (await self.calc_and_store_ensemble_fps_async([(case_uuid, ensemble_name)]))[0]
+        if isinstance(new_fp, Exception):
+            raise new_fp
+
+        return new_fp
+
+    async def calc_and_store_ensemble_fps_async(
+        self, ensemble_idents: Sequence[tuple[str, str]]
+    ) -> list[str | Exception]:
+        """
+        Bulk version of calc_and_store_ensemble_fp_async() for a list of (case_uuid, ensemble_name) pairs.
+
+        Case level digests are only calculated once per case, and all new fingerprints are written to the cache in a
+        single pipelined round-trip. Returns a list with the fingerprint, or the exception raised while calculating it,
+        per ensemble.
+        """
         perf_metrics = PerfMetrics()
 
-        redis_key = self._make_full_redis_key(case_uuid=case_uuid, ensemble_name=ensemble_name)
+        fp_results = await _calc_ensemble_fp_results_async(self._sumo_client, ensemble_idents)
+        perf_metrics.record_lap("calc-fps")
 
-        new_fp = await calc_ensemble_fp_async(self._sumo_client, case_uuid, ensemble_name, None)
-        perf_metrics.record_lap("calc-fp")
+        await self._store_fps_async(self._register_and_collect_fps_to_store(dict(zip(ensemble_idents, fp_results))))
+        perf_metrics.record_lap("redis-store")
 
-        await self._redis_client.set(name=redis_key, value=new_fp, ex=self._cache_ttl_s)
-        perf_metrics.record_lap("redis-set")
+        LOGGER.debug(
+            f"calc_and_store_ensemble_fps_async() - {len(ensemble_idents)} ensembles in: {perf_metrics.to_string()}"
+        )
+        return [fp_result if isinstance(fp_result, Exception) else fp_result.fingerprint for fp_result in fp_results]
 
-        # LOGGER.debug(f"calc_and_store_ensemble_fp_async() - calculated in: {perf_metrics.to_string()} [{new_fp=}]")
-        return new_fp
+    def _register_and_collect_fps_to_store(
+        self, fp_results: Mapping[tuple[str, str], "_EnsembleFpResult | Exception"]
+    ) -> dict[str, str]:
+        """
+        Collect the Redis keys and values to store for newly calculated fingerprints, always under the user's own key.
+        When the user could see documents in the case, the fingerprint also goes into the shared tier.
+        """
+        fps_to_store: dict[str, str] = {}
+        for (case_uuid, ensemble_name), fp_result in fp_results.items():
+            if isinstance(fp_result, Exception):
+                continue
+
+            fps_to_store[self._make_full_redis_key(case_uuid, ensemble_name)] = fp_result.fingerprint
+
+            if self._shared_tier and fp_result.case_is_visible:
+                self._shared_tier.mark_access_verified(self._user_id, case_uuid)
+                self._shared_tier.put_in_memory(case_uuid, ensemble_name, fp_result.fingerprint, self._cache_ttl_s)
+                fps_to_store[self._shared_tier.make_redis_key(case_uuid, ensemble_name)] = fp_result.fingerprint
+
+        return fps_to_store
+
+    async def _store_fps_async(self, redis_keys_and_fps: dict[str, str]) -> None:
+        """
+        Write fingerprints to the cache with a single MSET and one EXPIRE per key, sent in one pipelined round-trip
+        """
+        if not redis_keys_and_fps:
+            return
+
+        async with self._redis_client.pipeline(transaction=False) as pipe:
+            pipe.mset(cast(Mapping[str | bytes, str], redis_keys_and_fps))
+            for redis_key in redis_keys_and_fps:
+                pipe.expire(redis_key, self._cache_ttl_s)
+            await pipe.execute()
+
+    async def _verify_case_access_async(self, case_uuid: str) -> bool:
+        """
+        Cheap check of whether the user can see any documents in the case, a single count query against Sumo
+        """
+        num_docs = await SearchContext(self._sumo_client).filter(uuid=case_uuid).length_async()
+        return num_docs > 0
 
     def _make_full_redis_key(self, case_uuid: str, ensemble_name: str) -> str:
         return f"{_REDIS_KEY_PREFIX}:user:{self._user_id}:case:{case_uuid}:ens:{ensemble_name}"
@@ -144,16 +286,69 @@ async def calc_ensemble_fp_async(
     # LOGGER.debug(f"calc_ensemble_fp_async() case: {_digest_to_str(case_digest)}")
     # LOGGER.debug(f"calc_ensemble_fp_async() ens:  {_digest_to_str(ens_digest)}")
 
+    fingerprint = _make_ensemble_fp(case_digest, ens_digest)
+
+    # LOGGER.debug(f"calc_ensemble_fp_async() took: {perf_metrics.to_string()} - fingerprint: {fingerprint}")
+
+    return fingerprint
+
+
+@dataclass(frozen=True)
+class _EnsembleFpResult:
+    fingerprint: str
+    case_is_visible: bool  # True if the caller could see any documents, i.e. has access to the case
+
+
+async def _calc_ensemble_fp_results_async(
+    sumo_client: SumoClient, ensemble_idents: Sequence[tuple[str, str]]
+) -> list[_EnsembleFpResult | Exception]:
+    unique_case_uuids = list(dict.fromkeys(case_uuid for case_uuid, _ensemble_name in ensemble_idents))
+    unique_ensemble_idents = list(dict.fromkeys(ensemble_idents))
+
+    all_results = await asyncio.gather(
+        *[_gather_case_digest_async(sumo_client, case_uuid) for case_uuid in unique_case_uuids],
+        *[
+            _gather_ensemble_digest_async(sumo_client, case_uuid, ensemble_name, None)
+            for case_uuid, ensemble_name in unique_ensemble_idents
+        ],
+        return_exceptions=True,
+    )
+
+    case_digests = dict(zip(unique_case_uuids, all_results[: len(unique_case_uuids)]))
+    ensemble_digests = dict(zip(unique_ensemble_idents, all_results[len(unique_case_uuids) :]))
+
+    ret_results: list[_EnsembleFpResult | Exception] = []
+    for case_uuid, ensemble_name in ensemble_idents:
+        case_digest = case_digests[case_uuid]
+        ens_digest = ensemble_digests[(case_uuid, ensemble_name)]
+        if not isinstance(case_digest, DocSetDigest):
+            ret_results.append(_as_exception(case_digest))
+        elif not isinstance(ens_digest, DocSetDigest):
+            ret_results.append(_as_exception(ens_digest))
+        else:
+            ret_results.append(
+                _EnsembleFpResult(
+                    fingerprint=_make_ensemble_fp(case_digest, ens_digest),
+                    case_is_visible=case_digest.total_num_docs > 0 or ens_digest.total_num_docs > 0,
+                )
+            )
+
+    return ret_results
+
+
+def _make_ensemble_fp(case_digest: "DocSetDigest", ens_digest: "DocSetDigest") -> str:
     # Choose the max timestamp from either the case or the ensemble
     max_timestamp = max(0, case_digest.max_timestamp_utc_ms)
     max_timestamp = max(max_timestamp, ens_digest.max_timestamp_utc_ms)
     max_time_iso_str = timestamp_utc_ms_to_iso_str(max_timestamp) if max_timestamp > 0 else "NO_TS"
 
-    fingerprint = f"{max_time_iso_str}__case:{case_digest.total_num_docs}:{case_digest.checksum}__ens:{ens_digest.total_num_docs}:{ens_digest.checksum}"
+    return f"{max_time_iso_str}__case:{case_digest.total_num_docs}:{case_digest.checksum}__ens:{ens_digest.total_num_docs}:{ens_digest.checksum}"
 
-    # LOGGER.debug(f"calc_ensemble_fp_async() took: {perf_metrics.to_string()} - fingerprint: {fingerprint}")
 
-    return fingerprint
+def _as_exception(result: object) -> Exception:
+    if isinstance(result, Exception):
+        return result
+    return RuntimeError(f"Unexpected result when gathering digest: {result!r}")
 
 
 @dataclass(frozen=True)
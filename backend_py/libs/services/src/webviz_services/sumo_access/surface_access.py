@@ -12,6 +12,7 @@ from fmu.sumo.explorer import TimeFilter, TimeType
 from fmu.sumo.explorer.explorer import SumoClient, SearchContext
 from fmu.sumo.explorer.objects import Surface
 
+from webviz_core_utils.cpu_executors import run_in_process_executor_async
 from webviz_core_utils.exponential_backoff_timer import ExponentialBackoffTimer
 from webviz_core_utils.perf_metrics import PerfMetrics
 from webviz_services.utils.otel_span_tracing import otel_span_decorator, start_otel_span, start_otel_span_async
@@ -186,7 +187,7 @@ class SurfaceAccess:
             perf_metrics.record_lap("download")
 
         with start_otel_span("xtgeo-read", {"webviz.data.size_mb": size_mb}):
-            xtgeo_surf = xtgeo.surface_from_file(byte_stream)
+            xtgeo_surf = await run_in_process_executor_async(xtgeo.surface_from_file, byte_stream)
             perf_metrics.record_lap("xtgeo-read")
 
         if are_all_surface_values_undefined(xtgeo_surf):
@@ -234,7 +235,7 @@ class SurfaceAccess:
         byte_stream: BytesIO = await sumo_surf.blob_async
         perf_metrics.record_lap("download")
 
-        xtgeo_surf = xtgeo.surface_from_file(byte_stream)
+        xtgeo_surf = await run_in_process_executor_async(xtgeo.surface_from_file, byte_stream)
         perf_metrics.record_lap("xtgeo-read")
 
         if are_all_surface_values_undefined(xtgeo_surf):
@@ -9,9 +9,10 @@ from sumo.wrapper import SumoClient
 
 from webviz_core_utils.b64 import B64FloatArray, B64IntArray, B64UintArray
 from webviz_core_utils.b64 import b64_decode_float_array_to_list, b64_decode_int_array
-from webviz_core_utils.b64 import b64_encode_float_array_as_float32
+from webviz_core_utils.b64 import b64_encode_float_array_as_float32, b64_encode_uint_array_as_smallest_size
 from webviz_core_utils.perf_metrics import PerfMetrics, make_metrics_string_s
 from webviz_server_schemas.user_grid3d_ri import api_schemas as server_api_schemas
+from webviz_server_schemas.user_grid3d_ri.grid_geometry_stream import DecodedGridGeometry, GridGeometryStreamDecoder
 
 from webviz_services.utils.authenticated_user import AuthenticatedUser
 from webviz_services.service_exceptions import Service
@@ -152,13 +153,44 @@ class UserGrid3dService:
             ijk_index_filter=effective_ijk_index_filter,
         )
 
+        perf_metrics.reset_lap_timer()
+        decoded_geometry = await self._call_grid_geometry_stream_endpoint_async(request_body)
+        perf_metrics.record_lap("call-user-session")
+
+        if decoded_geometry is None:
+            # User session is running an older image without the streaming endpoint
+            return await self._get_grid_geometry_from_json_endpoint_async(request_body, perf_metrics)
+
+        header = decoded_geometry.header
+        trailer = decoded_geometry.trailer
+        ret_obj = GridGeometry(
+            vertices_b64arr=b64_encode_float_array_as_float32(decoded_geometry.vertices),
+            polys_b64arr=b64_encode_uint_array_as_smallest_size(decoded_geometry.polys),
+            poly_source_cell_indices_b64arr=b64_encode_uint_array_as_smallest_size(
+                decoded_geometry.poly_source_cell_indices
+            ),
+            origin_utm_x=header.origin_utm_x,
+            origin_utm_y=header.origin_utm_y,
+            grid_dimensions=GridDimensions.model_validate(header.grid_dimensions.model_dump()),
+            bounding_box=BoundingBox3D.model_validate(trailer.bounding_box.model_dump()),
+        )
+        perf_metrics.record_lap("convert")
+
+        self._log_grid_and_poly_info(".get_grid_geometry_async()", header.grid_dimensions, trailer.stats)
+        self._log_perf_messages(".get_grid_geometry_async()", perf_metrics, trailer.stats)
+
+        return ret_obj
+
+    async def _get_grid_geometry_from_json_endpoint_async(
+        self, request_body: server_api_schemas.GridGeometryRequest, perf_metrics: PerfMetrics
+    ) -> GridGeometry:
         perf_metrics.reset_lap_timer()
         response = await self._call_service_endpoint_post_async(
             endpoint="get_grid_geometry",
             body_pydantic_model=request_body,
             operation_descr="getting grid geometry from grid3d user session",
         )
-        perf_metrics.record_lap("call-user-session")
+        perf_metrics.record_lap("call-user-session-json")
 
         api_obj = server_api_schemas.GridGeometryResponse.model_validate_json(response.content)
         perf_metrics.record_lap("parse-response")
@@ -344,6 +376,61 @@ class UserGrid3dService:
 
         LOGGER.debug(f"{prefix} {msg}")
 
+    async def _call_grid_geometry_stream_endpoint_async(
+        self, request_body: server_api_schemas.GridGeometryRequest
+    ) -> DecodedGridGeometry | None:
+        """
+        Call the streaming grid geometry endpoint, decoding the binary frames as they arrive
+
+        Returns None if the user session does not provide the streaming endpoint (HTTP 404), which is the case
+        for sessions that are still running an older image.
+        """
+        endpoint = "get_grid_geometry_stream"
+        url = f"{self._base_url}/{endpoint}"
+        operation_descr = "getting grid geometry from grid3d user session"
+        LOGGER.debug(f"._call_grid_geometry_stream_endpoint_async() - {endpoint=}, {url=}")
+
+        decoder = GridGeometryStreamDecoder()
+
+        async with httpx.AsyncClient(timeout=self._call_timeout) as client:
+            try:
+                async with client.stream("POST", url=url, content=request_body.model_dump_json()) as response:
+                    if response.status_code == 404:
+                        LOGGER.info(f"Endpoint '{endpoint}' not found in user session, falling back to JSON endpoint")
+                        return None
+                    if response.is_error:
+                        await response.aread()
+                    response.raise_for_status()
+
+                    async for chunk in response.aiter_bytes():
+                        decoder.feed(chunk)
+
+            except httpx.TimeoutException as e:
+                LOGGER.error(
+                    f"Error calling '{endpoint}' endpoint, request timed out for POST to {url=}\n  exception: {e}"
+                )
+                raise ServiceTimeoutError(f"Timeout {operation_descr}", Service.USER_SESSION) from e
+
+            except httpx.RequestError as e:
+                LOGGER.error(
+                    f"Error calling '{endpoint}' endpoint, request error occurred for POST to {url=}\n  exception: {e}"
+                )
+                raise ServiceRequestError(f"Error {operation_descr}", Service.USER_SESSION) from e
+
+            except httpx.HTTPStatusError as e:
+                LOGGER.error(
+                    f"Error calling '{endpoint}' endpoint, HTTP error {e.response.status_code} for POST to {url=}"
+                    f"\n  response: {e.response.text}"
+                    f"\n  exception: {e}"
+                )
+                raise ServiceRequestError(f"Error {operation_descr}", Service.USER_SESSION) from e
+
+        try:
+            return decoder.get_result()
+        except ValueError as e:
+            LOGGER.error(f"Error decoding response from '{endpoint}' endpoint: {e}")
+            raise ServiceRequestError(f"Error {operation_descr}, invalid response", Service.USER_SESSION) from e
+
     async def _call_service_endpoint_get_async(
         self, endpoint: str, query_params: dict[str, str], operation_descr: str
     ) -> httpx.Response:
@@ -0,0 +1,125 @@
+from dataclasses import dataclass
+
+import numpy as np
+import xtgeo
+from numpy.typing import NDArray
+
+from webviz_services.utils.surface_helpers import get_min_max_surface_values
+
+
+@dataclass(frozen=True, kw_only=True)
+class DecodedSurfaceDef:
+    ncol: int
+    nrow: int
+    xinc: float
+    yinc: float
+    xori: float
+    yori: float
+    rotation: float
+    yflip: int
+
+
+@dataclass(frozen=True, kw_only=True)
+class DecodedSurface:
+    """
+    A regular surface that has been decoded to a plain float32 numpy array, detached from xtgeo.
+
+    The values array has the same layout as xtgeo's values array, that is, shape (ncol, nrow), but undefined
+    values are represented as NaN instead of being masked. The bounding box and min/max values are computed
+    once on creation, so that converting to the API response formats does not require an xtgeo surface.
+    Note that min/max are computed from the original float64 values, before downcasting to float32.
+    """
+
+    surface_def: DecodedSurfaceDef
+    values: NDArray[np.float32]
+    xmin: float
+    xmax: float
+    ymin: float
+    ymax: float
+    value_min: float | None  # None if all values are undefined
+    value_max: float | None
+
+    @classmethod
+    def from_xtgeo_surface(cls, xtgeo_surf: xtgeo.RegularSurface) -> "DecodedSurface":
+        min_max = get_min_max_surface_values(xtgeo_surf)
+        values = np.ma.filled(xtgeo_surf.values.astype(np.float32), fill_value=np.nan)
+        surface_def = DecodedSurfaceDef(
+            ncol=xtgeo_surf.ncol,
+            nrow=xtgeo_surf.nrow,
+            xinc=xtgeo_surf.xinc,
+            yinc=xtgeo_surf.yinc,
+            xori=xtgeo_surf.xori,
+            yori=xtgeo_surf.yori,
+            rotation=xtgeo_surf.rotation,
+            yflip=xtgeo_surf.yflip,
+        )
+        return cls.from_values(
+            surface_def,
+            values,
+            bbox=(xtgeo_surf.xmin, xtgeo_surf.xmax, xtgeo_surf.ymin, xtgeo_surf.ymax),
+            value_min=min_max.min if min_max else None,
+            value_max=min_max.max if min_max else None,
+        )
+
+    @classmethod
+    def from_values(
+        cls,
+        surface_def: DecodedSurfaceDef,
+        values: NDArray[np.float32],
+        bbox: tuple[float, float, float, float],
+        value_min: float | None,
+        value_max: float | None,
+    ) -> "DecodedSurface":
+        """
+        Create from an already decoded values array, bbox is given as (xmin, xmax, ymin, ymax).
+        The values array is not copied, so it may well be a read-only memory mapped array.
+        The min/max values are not recomputed from the values array, they must be given by the caller.
+        """
+        if values.shape != (surface_def.ncol, surface_def.nrow):
+            raise ValueError(f"Shape of values array {values.shape} does not match surface definition")
+
+        return cls(
+            surface_def=surface_def,
+            values=values,
+            xmin=float(bbox[0]),
+            xmax=float(bbox[1]),
+            ymin=float(bbox[2]),
+            ymax=float(bbox[3]),
+            value_min=float(value_min) if value_min is not None else None,
+            value_max=float(value_max) if value_max is not None else None,
+        )
+
+    def to_xtgeo_surface(self) -> xtgeo.RegularSurface:
+        """
+        Create a new xtgeo surface from this surface, e.g. for resampling. The values are copied.
+        """
+        surf_def = self.surface_def
+        masked_values = self.get_masked_values()
+        return xtgeo.RegularSurface(
+            ncol=surf_def.ncol,
+            nrow=surf_def.nrow,
+            xinc=surf_def.xinc,
+            yinc=surf_def.yinc,
+            xori=surf_def.xori,
+            yori=surf_def.yori,
+            rotation=surf_def.rotation,
+            yflip=surf_def.yflip,
+            values=masked_values,
+        )
+
+    def get_flat_float32_values_for_api(self) -> NDArray[np.float32]:
+        """
+        Returns the values rotated 90 degrees left and flattened, which is the layout expected by the frontend.
+        See also surface_to_float32_numpy_array().
+        """
+        return np.rot90(self.values).flatten()
+
+    def get_masked_values(self) -> np.ma.MaskedArray:
+        """
+        Returns the values as a 2d float64 masked array, equivalent to xtgeo's values array
+        """
+        return np.ma.masked_invalid(self.values.astype(np.float64))
+
+    @property
+    def nbytes(self) -> int:
+        return self.values.nbytes
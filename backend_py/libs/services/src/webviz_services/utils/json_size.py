@@ -0,0 +1,30 @@
+import sys
+from typing import Any
+
+# Number of items that are measured when estimating the size of a list of decoded JSON items
+_NUM_SAMPLE_ITEMS = 20
+
+
+def estimate_json_items_size_bytes(items: list[Any]) -> int:
+    """
+    Estimate the memory used by a list of decoded JSON items (as returned by json.loads() or response.json()).
+
+    The deep size of an evenly spaced sample of the items is measured and scaled by the number of items.
+    Dict keys are not counted, since the JSON decoder reuses the same key string objects for all items of a response.
+    """
+    if not items:
+        return sys.getsizeof(items)
+
+    step = max(1, len(items) // _NUM_SAMPLE_ITEMS)
+    sample_items = items[::step]
+    sample_size_bytes = sum(_deep_size_bytes(item) for item in sample_items)
+
+    return sys.getsizeof(items) + int(sample_size_bytes * len(items) / len(sample_items))
+
+
+def _deep_size_bytes(obj: Any) -> int:
+    if isinstance(obj, dict):
+        return sys.getsizeof(obj) + sum(_deep_size_bytes(value) for value in obj.values())
+    if isinstance(obj, list):
+        return sys.getsizeof(obj) + sum(_deep_size_bytes(value) for value in obj)
+    return sys.getsizeof(obj)
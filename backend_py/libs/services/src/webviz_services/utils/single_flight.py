@@ -0,0 +1,93 @@
+import asyncio
+import logging
+from dataclasses import dataclass
+from typing import Awaitable, Callable, Generic, TypeVar
+
+ResultT = TypeVar("ResultT")
+
+LOGGER = logging.getLogger(__name__)
+
+
+@dataclass(frozen=True, kw_only=True)
+class SingleFlightStats:
+    num_calls: int
+    num_executions: int
+    num_coalesced_waiters: int
+    num_in_flight: int
+
+
+@dataclass(slots=True)
+class _Flight(Generic[ResultT]):
+    task: asyncio.Task[ResultT]
+    num_waiters: int
+
+
+class SingleFlightGroup(Generic[ResultT]):
+    """
+    Collapses concurrent calls with identical keys into a single execution.
+
+    The first caller for a given key starts the actual work in a task, while any callers arriving with the same
+    key before that work has finished will await the very same task and receive the same result (or exception).
+    Once the work has finished, the key is released and the next call will trigger a new execution.
+
+    The key must identify both the data being loaded and the scope of the caller (e.g. the user's access token),
+    since results will be shared between all callers with the same key.
+
+    Note that this class is intended to be used from within a single asyncio event loop.
+    """
+
+    def __init__(self, name: str) -> None:
+        self._name = name
+        self._flights: dict[str, _Flight[ResultT]] = {}
+        self._num_calls = 0
+        self._num_executions = 0
+        self._num_coalesced_waiters = 0
+
+    async def do_async(self, key: str, work_factory: Callable[[], Awaitable[ResultT]]) -> ResultT:
+        """
+        Execute the work produced by work_factory, or join an already in-flight execution for the same key.
+        """
+        self._num_calls += 1
+
+        flight = self._flights.get(key)
+        if flight is not None:
+            flight.num_waiters += 1
+            self._num_coalesced_waiters += 1
+        else:
+            self._num_executions += 1
+            task = asyncio.create_task(self._run_work_async(work_factory))
+            flight = _Flight(task=task, num_waiters=0)
+            self._flights[key] = flight
+            task.add_done_callback(lambda _task: self._on_flight_done(key, flight))
+
+        # Shield the shared task so that cancellation of one caller does not cancel the work for the other callers
+        return await asyncio.shield(flight.task)
+
+    def get_stats(self) -> SingleFlightStats:
+        return SingleFlightStats(
+            num_calls=self._num_calls,
+            num_executions=self._num_executions,
+            num_coalesced_waiters=self._num_coalesced_waiters,
+            num_in_flight=len(self._flights),
+        )
+
+    async def _run_work_async(self, work_factory: Callable[[], Awaitable[ResultT]]) -> ResultT:
+        return await work_factory()
+
+    def _on_flight_done(self, key: str, flight: _Flight[ResultT]) -> None:
+        if self._flights.get(key) is flight:
+            del self._flights[key]
+
+        # Mark any exception as retrieved, the callers that awaited the task will have received it
+        if not flight.task.cancelled():
+            flight.task.exception()
+
+        # Only logged when coalescing actually happened, which keeps the volume down while still showing how much
+        # upstream work the group is saving
+        if flight.num_waiters > 0:
+            stats = self.get_stats()
+            LOGGER.info(
+                f"SingleFlightGroup[{self._name}] coalesced {flight.num_waiters} waiter(s) into one execution "
+                f"(total calls={stats.num_calls}, executions={stats.num_executions}, "
+                f"coalesced={stats.num_coalesced_waiters}, in flight={stats.num_in_flight})"
+            )
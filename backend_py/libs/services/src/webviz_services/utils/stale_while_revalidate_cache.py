@@ -0,0 +1,103 @@
+import logging
+import time
+from dataclasses import dataclass
+from typing import Awaitable, Callable, Generic, TypeVar
+
+from webviz_core_utils.background_tasks import run_in_background_task
+from webviz_core_utils.bounded_lru_cache import BoundedLruCache, CacheStats
+
+from .single_flight import SingleFlightGroup
+
+ValueT = TypeVar("ValueT")
+
+LOGGER = logging.getLogger(__name__)
+
+
+@dataclass(frozen=True, slots=True)
+class _SwrEntry(Generic[ValueT]):
+    value: ValueT
+    size_bytes: int
+    loaded_time_s: float
+
+
+class StaleWhileRevalidateCache(Generic[ValueT]):
+    """
+    In-process cache with stale-while-revalidate semantics, bounded by total (estimated) size and number of entries.
+
+    Entries younger than fresh_ttl_s are returned as is. Entries older than that, but younger than
+    fresh_ttl_s + stale_ttl_s, are also returned immediately, but will trigger a refresh of the entry in a background
+    task. Older entries are treated as missing. Concurrent loads of the same missing key are coalesced into a single
+    call to the loader, and so are refreshes.
+
+    Failed loads are never cached, and a failed background refresh leaves the stale entry in place until it expires.
+
+    Note that cached values are shared between all callers (also between users) and must not be modified.
+    """
+
+    def __init__(
+        self,
+        name: str,
+        fresh_ttl_s: float,
+        stale_ttl_s: float,
+        max_size_bytes: int,
+        max_entries: int,
+        size_fn: Callable[[ValueT], int],
+    ) -> None:
+        self._name = name
+        self._fresh_ttl_s = fresh_ttl_s
+        self._size_fn = size_fn
+        self._lru_cache: BoundedLruCache[str, _SwrEntry[ValueT]] = BoundedLruCache(
+            max_size_bytes=max_size_bytes,
+            max_entries=max_entries,
+            ttl_s=fresh_ttl_s + stale_ttl_s,
+            size_fn=lambda entry: entry.size_bytes,
+        )
+        self._load_group: SingleFlightGroup[ValueT] = SingleFlightGroup(name)
+        self._refreshing_keys: set[str] = set()
+        self._num_stale_hits = 0
+
+    async def get_or_load_async(self, key: str, loader: Callable[[], Awaitable[ValueT]]) -> ValueT:
+        """
+        Get value for key, calling loader to produce the value if it is not cached.
+        A stale value will be returned right away, and loader will be used to refresh it in the background.
+        """
+        entry = self._lru_cache.get(key)
+        if entry is None:
+            return await self._load_group.do_async(key, lambda: self._load_and_put_async(key, loader))
+
+        if time.monotonic() - entry.loaded_time_s > self._fresh_ttl_s:
+            self._num_stale_hits += 1
+            if key not in self._refreshing_keys:
+                self._refreshing_keys.add(key)
+                run_in_background_task(self._refresh_async(key, loader))
+
+        return entry.value
+
+    async def reload_async(self, key: str, loader: Callable[[], Awaitable[ValueT]]) -> ValueT:
+        """
+        Load value for key and replace any cached entry, regardless of its age.
+        Concurrent reloads (and loads) of the same key are coalesced into a single call to the loader.
+        """
+        return await self._load_group.do_async(key, lambda: self._load_and_put_async(key, loader))
+
+    def get_stats(self) -> CacheStats:
+        return self._lru_cache.get_stats()
+
+    def get_num_stale_hits(self) -> int:
+        return self._num_stale_hits
+
+    def clear(self) -> None:
+        self._lru_cache.clear()
+
+    async def _load_and_put_async(self, key: str, loader: Callable[[], Awaitable[ValueT]]) -> ValueT:
+        value = await loader()
+        entry = _SwrEntry(value=value, size_bytes=self._size_fn(value), loaded_time_s=time.monotonic())
+        self._lru_cache.put(key, entry)
+        return value
+
+    async def _refresh_async(self, key: str, loader: Callable[[], Awaitable[ValueT]]) -> None:
+        try:
+            await self._load_group.do_async(key, lambda: self._load_and_put_async(key, loader))
+            LOGGER.debug(f"StaleWhileRevalidateCache[{self._name}] refreshed stale entry in background")
+        finally:
+            self._refreshing_keys.discard(key)
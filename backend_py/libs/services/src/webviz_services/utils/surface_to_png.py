@@ -6,8 +6,18 @@ import xtgeo
 
 def surface_to_png_bytes_optimized(surface: xtgeo.RegularSurface) -> bytes:
     # Note that returned values array is a 2d masked array
-    surf_values_ma: np.ma.MaskedArray = surface.values
+    return surface_values_to_png_bytes(surface.values)
 
+
+def surface_values_to_png_bytes(
+    surf_values_ma: np.ma.MaskedArray, value_range: tuple[float, float] | None = None
+) -> bytes:
+    """
+    Encode a 2d masked array of surface values, laid out as xtgeo's values array, as an RGBA png image
+
+    The values are scaled using value_range, given as (min, max), if specified, otherwise using the min/max of
+    the array. Pass value_range to make the scaling match min/max values that are reported alongside the image.
+    """
     surf_values_ma = np.flip(surf_values_ma.transpose(), axis=0)  # type: ignore
     # LOGGER.debug(f"flip/transpose: {timer.lap_s():.2f}s")
 
@@ -16,8 +26,11 @@ def surface_to_png_bytes_optimized(surface: xtgeo.RegularSurface) -> bytes:
     # LOGGER.debug(f"get valid_arr: {timer.lap_s():.2f}s")
 
     shape = surf_values_ma.shape
-    min_val = surf_values_ma.min()
-    max_val = surf_values_ma.max()
+    if value_range is not None:
+        min_val, max_val = value_range
+    else:
+        min_val = surf_values_ma.min()
+        max_val = surf_values_ma.max()
     # LOGGER.debug(f"minmax: {timer.lap_s():.2f}s")
 
     if min_val == 0.0 and max_val == 0.0:
@@ -30,6 +43,9 @@ def surface_to_png_bytes_optimized(surface: xtgeo.RegularSurface) -> bytes:
 
     # Get a NON-masked array with all undefined entries filled with 0
     scaled_values = scaled_values_ma.filled(0)
+    if value_range is not None:
+        # Guard against values slightly outside the given range, which would otherwise wrap around when cast
+        np.clip(scaled_values, 0, 256 * 256 * 256 - 1, out=scaled_values)
 
     # LOGGER.debug(f"scale and fill: {timer.lap_s():.2f}s")
 
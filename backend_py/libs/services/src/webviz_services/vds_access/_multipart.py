@@ -0,0 +1,55 @@
+from webviz_services.service_exceptions import InvalidDataError, Service
+
+
+def parse_multipart_body_parts(content: bytes, content_type: str) -> list[memoryview]:
+    """
+    Split the body of a multipart response into the content of its parts, without copying any data.
+
+    Each returned part is a memoryview into the original content, so that e.g. binary array data can be wrapped
+    directly by numpy using np.frombuffer(). Note that the returned views keep the full response content alive.
+    The headers of each part are skipped.
+    """
+    boundary = _extract_boundary(content_type)
+    delimiter = b"--" + boundary
+    content_view = memoryview(content)
+
+    pos = content.find(delimiter)
+    if pos < 0:
+        raise InvalidDataError("Multipart boundary not found in response body", service=Service.VDS)
+
+    parts: list[memoryview] = []
+    while True:
+        pos += len(delimiter)
+
+        # The closing delimiter is followed by "--"
+        if content.startswith(b"--", pos):
+            break
+
+        # Headers (if any) start on the line after the delimiter and are terminated by an empty line
+        line_end = content.find(b"\r\n", pos)
+        headers_end = content.find(b"\r\n\r\n", line_end) if line_end >= 0 else -1
+        if headers_end < 0:
+            raise InvalidDataError("Malformed part headers in multipart response", service=Service.VDS)
+
+        body_start = headers_end + 4
+        next_delimiter_pos = content.find(b"\r\n" + delimiter, body_start)
+        if next_delimiter_pos < 0:
+            raise InvalidDataError("Multipart response is missing closing boundary", service=Service.VDS)
+
+        parts.append(content_view[body_start:next_delimiter_pos])
+        pos = next_delimiter_pos + 2
+
+    return parts
+
+
+def _extract_boundary(content_type: str) -> bytes:
+    mime_type, *params = content_type.split(";")
+    if not mime_type.strip().lower().startswith("multipart/"):
+        raise InvalidDataError(f"Expected multipart response, got content type: {content_type}", service=Service.VDS)
+
+    for param in params:
+        name, _, value = param.strip().partition("=")
+        if name.lower() == "boundary" and value:
+            return value.strip('"').encode("latin-1")
+
+    raise InvalidDataError(f"No boundary found in content type: {content_type}", service=Service.VDS)
@@ -1,18 +1,23 @@
+import asyncio
+import functools
 import logging
 from typing import List, Tuple
 import json
 
 import numpy as np
 from numpy.typing import NDArray
-from requests_toolbelt.multipart.decoder import MultipartDecoder, BodyPart
 import httpx
+from webviz_core_utils.background_tasks import run_in_background_task
+from webviz_core_utils.bounded_lru_cache import BoundedLruCache
 
 from webviz_services.service_exceptions import InvalidDataError, Service
 
 from webviz_services.services_config import get_services_config
 from webviz_services.utils.httpx_async_client_wrapper import HTTPX_ASYNC_CLIENT_WRAPPER
+from webviz_services.utils.single_flight import SingleFlightGroup
 from webviz_services.service_exceptions import ServiceRequestError
 
+from ._multipart import parse_multipart_body_parts
 from .response_types import VdsArray, VdsAxis, VdsMetadata, VdsFenceMetadata, VdsSliceMetadata
 from .request_types import (
     VdsCoordinates,
@@ -24,22 +29,64 @@ from .request_types import (
     VdsSliceRequest,
     VdsDirection,
 )
+from .vds_slice_cache import VdsSliceCache, get_vds_slice_cache
 
 LOGGER = logging.getLogger(__name__)
 
+# Metadata of a vds cube is immutable for a given url, so it can be cached and shared between requests.
+# The cache is keyed by vds url only, the sas token merely grants access to the cube.
+_METADATA_CACHE_TTL_S = 60 * 60
+_METADATA_CACHE_MAX_ENTRIES = 500
+_METADATA_CACHE: BoundedLruCache[str, VdsMetadata] = BoundedLruCache(
+    max_entries=_METADATA_CACHE_MAX_ENTRIES, ttl_s=_METADATA_CACHE_TTL_S
+)
+_METADATA_LOAD_GROUP: SingleFlightGroup[VdsMetadata] = SingleFlightGroup("vds_metadata")
+
 
-def bytes_to_ndarray_float32(bytes_data: bytes, shape: List[int]) -> NDArray[np.float32]:
+def buffer_to_flat_ndarray_float32(buffer: bytes | memoryview, shape: List[int]) -> NDArray[np.float32]:
     """
-    Convert bytes to numpy ndarray with row-major order, i.e. "C" order
+    Wrap a buffer of little endian float32 values with row-major order, i.e. "C" order, as a flat numpy array.
+
+    The buffer is not copied, hence the returned array is read-only when the buffer is immutable.
     """
-    return np.ndarray(shape=shape, dtype="<f4", buffer=bytes_data, order="C")
+    num_values = int(np.prod(shape))
+    if len(buffer) != num_values * 4:
+        raise InvalidDataError(
+            f"Expected {num_values * 4} bytes for array of shape {shape}, got {len(buffer)}", service=Service.VDS
+        )
 
+    return np.frombuffer(buffer, dtype="<f4", count=num_values)
 
-def bytes_to_flatten_ndarray_float32(bytes_data: bytes, shape: List[int]) -> NDArray[np.float32]:
+
+def _get_neighbour_line_numbers(
+    metadata: VdsMetadata, direction: VdsDirection, line_no: int, distance: int
+) -> list[int]:
     """
-    Convert bytes to numpy flatten ndarray with row-major order, i.e. "C" order
+    Get the line numbers of up to `distance` neighbouring lines on each side of line_no, ordered by distance.
+
+    The line spacing and valid range are taken from the cube's axis for the direction. No neighbours are returned
+    if the axis is unknown or the line spacing is not a whole number, as the slice requests take integer line numbers.
     """
-    return bytes_to_ndarray_float32(bytes_data, shape).flatten(order="C")
+    axis_index_for_direction = {VdsDirection.INLINE: 0, VdsDirection.CROSSLINE: 1, VdsDirection.DEPTH: 2}
+    axis_index = axis_index_for_direction.get(direction)
+    if axis_index is None or axis_index >= len(metadata.axis):
+        return []
+
+    axis = metadata.axis[axis_index]
+    if axis.samples < 2:
+        return []
+
+    step = (axis.max - axis.min) / (axis.samples - 1)
+    if step <= 0 or not float(step).is_integer():
+        return []
+
+    neighbour_line_numbers: list[int] = []
+    for offset in range(1, distance + 1):
+        for candidate in (line_no + offset * int(step), line_no - offset * int(step)):
+            if axis.min <= candidate <= axis.max:
+                neighbour_line_numbers.append(candidate)
+
+    return neighbour_line_numbers
 
 
 class VdsAccess:
@@ -80,85 +127,125 @@ class VdsAccess:
         return response
 
     async def get_metadata_async(self) -> VdsMetadata:
-        """Gets metadata from the cube"""
+        """Gets metadata from the cube, cached per vds url"""
+        metadata = _METADATA_CACHE.get(self.vds_url)
+        if metadata is not None:
+            return metadata
+
+        return await _METADATA_LOAD_GROUP.do_async(self.vds_url, self._fetch_and_cache_metadata_async)
+
+    async def _fetch_and_cache_metadata_async(self) -> VdsMetadata:
         endpoint = "metadata"
 
         metadata_request = VdsMetadataRequest(vds=self.vds_url, sas=self.sas)
         response = await self._query_async(endpoint, metadata_request)
 
-        metadata = response.json()
-        return VdsMetadata(**metadata)
+        metadata = VdsMetadata(**response.json())
+        _METADATA_CACHE.put(self.vds_url, metadata)
+        return metadata
 
     async def get_inline_slice_async(self, line_no: int) -> Tuple[NDArray[np.float32], VdsSliceMetadata]:
-        endpoint = "slice"
-        slice_request = VdsSliceRequest(
-            vds=self.vds_url,
-            sas=self.sas,
-            direction=VdsDirection.INLINE,
-            line_no=line_no,
-        )
-        response = await self._query_async(endpoint, slice_request)
-
-        parts = self._extract_and_validate_body_parts_from_response(response)
-        response_metadata = json.loads(parts[0].content)
-        metadata = VdsSliceMetadata(
-            format=response_metadata["format"],
-            shape=response_metadata["shape"],
-            x_axis=VdsAxis(**response_metadata["x"]),
-            y_axis=VdsAxis(**response_metadata["y"]),
-            geospatial=response_metadata["geospatial"],
-        )
-        self._assert_valid_metadata_format_and_shape(metadata)
+        return await self._get_slice_async(VdsDirection.INLINE, line_no)
 
-        byte_array = parts[1].content
+    async def get_crossline_slice_async(self, line_no: int) -> Tuple[NDArray[np.float32], VdsSliceMetadata]:
+        return await self._get_slice_async(VdsDirection.CROSSLINE, line_no)
 
-        # Flattened array with row major order, i.e. C-order in numpy
-        flattened_fence_traces_float32_array = bytes_to_flatten_ndarray_float32(byte_array, shape=metadata.shape)
+    async def get_depth_slice_async(self, depth_slice_no: int) -> Tuple[NDArray[np.float32], VdsSliceMetadata]:
+        return await self._get_slice_async(VdsDirection.DEPTH, depth_slice_no)
+
+    async def get_inline_crossline_and_depth_slices_async(
+        self, inline_no: int, crossline_no: int, depth_slice_no: int
+    ) -> Tuple[
+        Tuple[NDArray[np.float32], VdsSliceMetadata],
+        Tuple[NDArray[np.float32], VdsSliceMetadata],
+        Tuple[NDArray[np.float32], VdsSliceMetadata],
+    ]:
+        """
+        Gets an inline, a crossline and a depth slice from the cube, with the three requests issued concurrently.
 
-        return (flattened_fence_traces_float32_array, metadata)
+        Returns tuple of (flattened slice array, slice metadata) for the inline, crossline and depth slice respectively.
+        Neighbouring slices are not prefetched here, since that would multiply the load on the VDS server by the
+        number of directions for every call.
+        """
+        async with asyncio.TaskGroup() as tg:
+            inline_task = tg.create_task(self._get_slice_async(VdsDirection.INLINE, inline_no, allow_prefetch=False))
+            crossline_task = tg.create_task(
+                self._get_slice_async(VdsDirection.CROSSLINE, crossline_no, allow_prefetch=False)
+            )
+            depth_slice_task = tg.create_task(
+                self._get_slice_async(VdsDirection.DEPTH, depth_slice_no, allow_prefetch=False)
+            )
 
-    async def get_crossline_slice_async(self, line_no: int) -> Tuple[NDArray[np.float32], VdsSliceMetadata]:
-        endpoint = "slice"
-        slice_request = VdsSliceRequest(
-            vds=self.vds_url,
-            sas=self.sas,
-            direction=VdsDirection.CROSSLINE,
-            line_no=line_no,
-        )
-        response = await self._query_async(endpoint, slice_request)
+        return (inline_task.result(), crossline_task.result(), depth_slice_task.result())
 
-        parts = self._extract_and_validate_body_parts_from_response(response)
+    async def _get_slice_async(
+        self, direction: VdsDirection, line_no: int, allow_prefetch: bool = True
+    ) -> Tuple[NDArray[np.float32], VdsSliceMetadata]:
+        slice_cache = get_vds_slice_cache()
+        if slice_cache is None:
+            return await self._fetch_slice_async(direction, line_no)
 
-        response_metadata = json.loads(parts[0].content)
-        metadata = VdsSliceMetadata(
-            format=response_metadata["format"],
-            shape=response_metadata["shape"],
-            x_axis=VdsAxis(**response_metadata["x"]),
-            y_axis=VdsAxis(**response_metadata["y"]),
-            geospatial=response_metadata["geospatial"],
+        vds_slice = await slice_cache.get_or_load_async(
+            self.vds_url, direction, line_no, lambda: self._fetch_slice_async(direction, line_no)
         )
-        self._assert_valid_metadata_format_and_shape(metadata)
 
-        byte_array = parts[1].content
+        if allow_prefetch and slice_cache.prefetch_distance > 0:
+            run_in_background_task(self._prefetch_neighbour_slices_async(slice_cache, direction, line_no))
 
-        # Flattened array with row major order, i.e. C-order in numpy
-        flattened_fence_traces_float32_array = bytes_to_flatten_ndarray_float32(byte_array, shape=metadata.shape)
+        return vds_slice
 
-        return (flattened_fence_traces_float32_array, metadata)
+    async def _prefetch_neighbour_slices_async(
+        self, slice_cache: VdsSliceCache, direction: VdsDirection, line_no: int
+    ) -> None:
+        """
+        Speculatively load the neighbouring lines of a slice into the cache, nearest lines first.
+        Lines that are already cached are skipped, and failures are only logged since nobody is waiting for them.
+        """
+        metadata = await self.get_metadata_async()
+        neighbour_line_numbers = _get_neighbour_line_numbers(
+            metadata, direction, line_no, slice_cache.prefetch_distance
+        )
+        line_numbers_to_fetch = [
+            neighbour_line_no
+            for neighbour_line_no in neighbour_line_numbers
+            if not slice_cache.contains(self.vds_url, direction, neighbour_line_no)
+        ]
+        if not line_numbers_to_fetch:
+            return
+
+        results = await asyncio.gather(
+            *[
+                slice_cache.get_or_load_async(
+                    self.vds_url,
+                    direction,
+                    neighbour_line_no,
+                    functools.partial(self._fetch_slice_async, direction, neighbour_line_no),
+                    is_prefetch=True,
+                )
+                for neighbour_line_no in line_numbers_to_fetch
+            ],
+            return_exceptions=True,
+        )
 
-    async def get_depth_slice_async(self, depth_slice_no: int) -> Tuple[NDArray[np.float32], VdsSliceMetadata]:
+        num_failed = sum(1 for result in results if isinstance(result, BaseException))
+        if num_failed > 0:
+            LOGGER.debug(f"Prefetch of {num_failed} of {len(results)} neighbouring {direction.value} slices failed")
+
+    async def _fetch_slice_async(
+        self, direction: VdsDirection, line_no: int
+    ) -> Tuple[NDArray[np.float32], VdsSliceMetadata]:
         endpoint = "slice"
         slice_request = VdsSliceRequest(
             vds=self.vds_url,
             sas=self.sas,
-            direction=VdsDirection.DEPTH,
-            line_no=depth_slice_no,
+            direction=direction,
+            line_no=line_no,
         )
         response = await self._query_async(endpoint, slice_request)
 
-        parts = self._extract_and_validate_body_parts_from_response(response)
+        metadata_part, data_part = self._extract_and_validate_body_parts_from_response(response)
 
-        response_metadata = json.loads(parts[0].content)
+        response_metadata = json.loads(bytes(metadata_part))
         metadata = VdsSliceMetadata(
             format=response_metadata["format"],
             shape=response_metadata["shape"],
@@ -168,12 +255,10 @@ class VdsAccess:
         )
         self._assert_valid_metadata_format_and_shape(metadata)
 
-        byte_array = parts[1].content
+        # Flattened array with row major order, i.e. C-order in numpy, wrapping the response content without copying
+        flattened_slice_traces_float32_array = buffer_to_flat_ndarray_float32(data_part, shape=metadata.shape)
 
-        # Flattened array with row major order, i.e. C-order in numpy
-        flattened_fence_traces_float32_array = bytes_to_flatten_ndarray_float32(byte_array, shape=metadata.shape)
-
-        return (flattened_fence_traces_float32_array, metadata)
+        return (flattened_slice_traces_float32_array, metadata)
 
     async def get_flattened_fence_traces_array_and_metadata_async(
         self, coordinates: VdsCoordinates, coordinate_system: VdsCoordinateSystem = VdsCoordinateSystem.CDP
@@ -249,44 +334,35 @@ class VdsAccess:
         # Fence query returns two parts - metadata and data
         response = await self._query_async(endpoint, fence_request)
 
-        parts = self._extract_and_validate_body_parts_from_response(response)
+        metadata_part, data_part = self._extract_and_validate_body_parts_from_response(response)
 
-        metadata = VdsFenceMetadata(**json.loads(parts[0].content))
+        metadata = VdsFenceMetadata(**json.loads(bytes(metadata_part)))
         self._assert_valid_metadata_format_and_shape(metadata)
 
-        byte_array = parts[1].content
-
         # fence array data: [[t11, t12, ..., t1n], [t21, t22, ..., t2n], ..., [tm1, tm2, ..., tmn]]
         # m = num_traces, n = num_samples_per_trace
         num_traces = metadata.shape[0]
         num_samples_per_trace = metadata.shape[1]
 
-        # Flattened array with row major order, i.e. C-order in numpy
-        flattened_fence_traces_float32_array = bytes_to_flatten_ndarray_float32(byte_array, shape=metadata.shape)
+        # Flattened array with row major order, i.e. C-order in numpy, wrapping the response content without copying
+        response_float32_array = buffer_to_flat_ndarray_float32(data_part, shape=metadata.shape)
 
-        # Convert every value of `hard_coded_fill_value` to np.nan
-        flattened_fence_traces_float32_array[flattened_fence_traces_float32_array == hard_coded_fill_value] = np.nan
+        # Convert every value of `hard_coded_fill_value` to np.nan, producing the one and only copy of the data
+        flattened_fence_traces_float32_array = np.where(
+            response_float32_array == hard_coded_fill_value, np.float32(np.nan), response_float32_array
+        )
         return (flattened_fence_traces_float32_array, num_traces, num_samples_per_trace)
 
-    def _extract_and_validate_body_parts_from_response(self, response: httpx.Response) -> Tuple[BodyPart, BodyPart]:
-        """Extract parts from response's body and validate them"""
+    def _extract_and_validate_body_parts_from_response(self, response: httpx.Response) -> Tuple[memoryview, memoryview]:
+        """Extract the metadata and data parts from response's body and validate them, without copying the content"""
 
-        # Use MultipartDecoder with httpx's Response content and headers
-        decoder = MultipartDecoder(content=response.content, content_type=response.headers["Content-Type"])
-        parts = decoder.parts
+        parts = parse_multipart_body_parts(response.content, response.headers["Content-Type"])
 
         # Validate parts from decoded response
-        if len(parts) != 2 or not parts[0].content or not parts[1].content:
+        if len(parts) != 2 or not parts[0] or not parts[1]:
             raise InvalidDataError(f"Expected two parts in multipart response, got {len(parts)}", service=Service.VDS)
 
-        # Expect each part in parts tuple to be BodyPart
-        if not isinstance(parts[0], BodyPart) or not isinstance(parts[1], BodyPart):
-            raise InvalidDataError(
-                f"Expected parts in multipart response to be of type 'BodyPart', got {type(parts[0])}, {type(parts[1])}",
-                service=Service.VDS,
-            )
-
-        return parts
+        return (parts[0], parts[1])
 
     def _assert_valid_metadata_format_and_shape(self, metadata: VdsArray) -> None:
         if metadata.format != "<f4":
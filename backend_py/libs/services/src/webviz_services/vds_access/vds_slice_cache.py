@@ -0,0 +1,103 @@
+from typing import Awaitable, Callable
+
+import numpy as np
+from numpy.typing import NDArray
+from webviz_core_utils.bounded_lru_cache import BoundedLruCache, CacheStats
+
+from webviz_services.utils.single_flight import SingleFlightGroup
+
+from .request_types import VdsDirection
+from .response_types import VdsSliceMetadata
+
+VdsSlice = tuple[NDArray[np.float32], VdsSliceMetadata]
+
+
+class VdsSliceCache:
+    """
+    Process-wide cache of seismic slices, keyed by vds url, slice direction and line number.
+
+    The slices are stored as the flattened (read-only) float32 arrays returned by VdsAccess, and the cache is bounded
+    by the total size of these arrays. As for the VDS metadata, the key does not include the sas token since the
+    content of a cube is immutable for a given url.
+
+    When prefetch_distance is larger than 0, VdsAccess will speculatively load up to that many neighbouring lines on
+    each side of a requested slice in the background, so that scrolling through a cube is served from the cache.
+
+    Note that the cached slices are shared between all callers and must not be modified.
+    """
+
+    def __init__(self, max_size_bytes: int, prefetch_distance: int) -> None:
+        self._lru_cache: BoundedLruCache[str, VdsSlice] = BoundedLruCache(
+            max_size_bytes=max_size_bytes, size_fn=lambda vds_slice: vds_slice[0].nbytes
+        )
+        self._load_group: SingleFlightGroup[VdsSlice] = SingleFlightGroup("vds_slice")
+        self._prefetch_distance = prefetch_distance
+        self._num_prefetched = 0
+
+    @property
+    def prefetch_distance(self) -> int:
+        return self._prefetch_distance
+
+    def contains(self, vds_url: str, direction: VdsDirection, line_no: int) -> bool:
+        return _make_key(vds_url, direction, line_no) in self._lru_cache
+
+    async def get_or_load_async(
+        self,
+        vds_url: str,
+        direction: VdsDirection,
+        line_no: int,
+        loader: Callable[[], Awaitable[VdsSlice]],
+        is_prefetch: bool = False,
+    ) -> VdsSlice:
+        """
+        Get slice from the cache, calling loader to fetch it if it is missing.
+        Concurrent loads of the same slice, e.g. a request for a slice that is currently being prefetched, are coalesced.
+        """
+        key = _make_key(vds_url, direction, line_no)
+        vds_slice = self._lru_cache.get(key)
+        if vds_slice is not None:
+            return vds_slice
+
+        async def load_and_put_async() -> VdsSlice:
+            loaded_slice = await loader()
+            loaded_slice[0].flags.writeable = False
+            self._lru_cache.put(key, loaded_slice)
+            if is_prefetch:
+                self._num_prefetched += 1
+            return loaded_slice
+
+        return await self._load_group.do_async(key, load_and_put_async)
+
+    def get_stats(self) -> CacheStats:
+        return self._lru_cache.get_stats()
+
+    def get_num_prefetched(self) -> int:
+        return self._num_prefetched
+
+
+def _make_key(vds_url: str, direction: VdsDirection, line_no: int) -> str:
+    return f"{vds_url}::{direction.value}::{line_no}"
+
+
+# Process-wide state (private to module)
+_global_cache: VdsSliceCache | None = None  # pylint: disable=invalid-name
+
+
+def init_vds_slice_cache(max_size_bytes: int, prefetch_distance: int) -> None:
+    """
+    One-time initialization of the process-wide seismic slice cache.
+    Until this function has been called, get_vds_slice_cache() will return None and caching is disabled.
+    """
+    # pylint: disable=global-statement
+    global _global_cache
+    if _global_cache is not None:
+        raise RuntimeError("VdsSliceCache is already initialized")
+
+    _global_cache = VdsSliceCache(max_size_bytes, prefetch_distance)
+
+
+def get_vds_slice_cache() -> VdsSliceCache | None:
+    """
+    Get the process-wide seismic slice cache, returns None if the cache has not been initialized.
+    """
+    return _global_cache
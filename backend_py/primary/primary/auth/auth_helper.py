@@ -2,6 +2,7 @@ import base64
 import logging
 import os
 import time
+from dataclasses import dataclass
 from typing import Literal, Optional, TypeAlias, get_args
 
 import jwt
@@ -10,6 +11,7 @@ import starsessions
 from fastapi import APIRouter, Request, Response
 from fastapi.responses import RedirectResponse
 from pydantic import BaseModel, ValidationError
+from webviz_core_utils.bounded_lru_cache import BoundedLruCache
 from webviz_core_utils.perf_metrics import PerfMetrics
 from webviz_services.utils.authenticated_user import AuthenticatedUser
 
@@ -20,6 +22,15 @@ LOGGER = logging.getLogger(__name__)
 # Alias for the literal that lists the resource names we use
 _ResourceName: TypeAlias = Literal["graph", "sumo", "smda", "ssdl", "pdm"]
 
+# The user auth info is considered in need of a refresh when any of its items expires in less than this
+_MIN_REMAINING_VALIDITY_S = 5 * 60
+
+# In-process cache of user auth info, keyed by session id, so that most requests can skip loading the session from
+# the session store. Entries are dropped when they need a refresh, and are invalidated on login and logout. Since
+# logout in another process/replica can not invalidate the entries here, the time to live is also capped.
+_USER_AUTH_CACHE_MAX_ENTRIES = 2000
+_USER_AUTH_CACHE_MAX_TTL_S = 10 * 60
+
 
 class _TokenEntry(BaseModel):
     token: str
@@ -55,6 +66,17 @@ class _UserAuthInfo(BaseModel):
         return authenticated_user_obj
 
 
+@dataclass(frozen=True, kw_only=True)
+class _CachedUserAuth:
+    user_auth_info: _UserAuthInfo
+    authenticated_user: AuthenticatedUser
+
+
+_USER_AUTH_CACHE: BoundedLruCache[str, _CachedUserAuth] = BoundedLruCache(
+    max_entries=_USER_AUTH_CACHE_MAX_ENTRIES, ttl_s=_USER_AUTH_CACHE_MAX_TTL_S
+)
+
+
 class AuthHelper:
     def __init__(self) -> None:
         self.router = APIRouter()
@@ -65,6 +87,7 @@ class AuthHelper:
     async def _login_route(self, request: Request, redirect_url_after_login: Optional[str] = None) -> RedirectResponse:
         await starsessions.load_session(request)
         request.session.clear()
+        AuthHelper.invalidate_cached_user(request)
 
         all_scopes_list = config.GRAPH_SCOPES.copy()
 
@@ -92,6 +115,7 @@ class AuthHelper:
     # pylint: disable-next=async-suffix
     async def _authorized_callback_route(self, request: Request) -> Response:
         await starsessions.load_session(request)
+        AuthHelper.invalidate_cached_user(request)
 
         try:
             token_cache = _load_token_cache_from_session(request)
@@ -139,6 +163,11 @@ class AuthHelper:
         except:  # nosec # pylint: disable=bare-except
             pass
 
+        # Next, try the in-process cache, which does not require the session to be loaded
+        cached_authenticated_user = AuthHelper.get_cached_authenticated_user(request_with_session)
+        if cached_authenticated_user:
+            return cached_authenticated_user
+
         if not starsessions.is_loaded(request_with_session):
             raise ValueError("Session data has not been loaded for this request")
 
@@ -146,11 +175,12 @@ class AuthHelper:
         perf_metrics.record_lap("load-user-auth-info")
         if user_auth_info_from_session:
             first_item_expires_in = user_auth_info_from_session.earliest_expiry_time - time.time()
-            if first_item_expires_in >= 5 * 60:
+            if first_item_expires_in >= _MIN_REMAINING_VALIDITY_S:
                 authenticated_user = user_auth_info_from_session.to_authenticated_user()
 
-                # Store/cache the AuthenticatedUser object in the request's state
+                # Store/cache the AuthenticatedUser object in the request's state and in the in-process cache
                 request_with_session.state.authenticated_user_obj = authenticated_user
+                _put_in_user_auth_cache(request_with_session, user_auth_info_from_session, authenticated_user)
 
                 LOGGER.debug(
                     f"get_authenticated_user() got user auth info (valid for {first_item_expires_in:.0f}s) from session in: {perf_metrics.to_string()}"
@@ -180,12 +210,57 @@ class AuthHelper:
 
         # Attach the newly created AuthenticatedUser object to the request's state so that we can avoid going to the
         # session store if this function is called multiple times during the processing of a single request.
+        # Also store it in the in-process cache so that subsequent requests can skip the session store altogether.
         request_with_session.state.authenticated_user_obj = authenticated_user
+        _put_in_user_auth_cache(request_with_session, new_user_auth_info, authenticated_user)
 
         LOGGER.debug(f"get_authenticated_user() create/refresh took: {perf_metrics.to_string()}")
 
         return authenticated_user
 
+    @staticmethod
+    def get_cached_authenticated_user(request: Request) -> Optional[AuthenticatedUser]:
+        """
+        Get the AuthenticatedUser object for the request's session from the in-process cache, without loading the
+        session. Returns None if there is no valid entry for the session.
+        """
+        session_id = starsessions.get_session_id(request)
+        if not session_id:
+            return None
+
+        # Entries expire from the cache once the user auth info needs to be refreshed
+        cached_user_auth = _USER_AUTH_CACHE.get(session_id)
+        if not cached_user_auth:
+            return None
+
+        request.state.authenticated_user_obj = cached_user_auth.authenticated_user
+        return cached_user_auth.authenticated_user
+
+    @staticmethod
+    def invalidate_cached_user(request: Request) -> None:
+        """
+        Remove the request's session from the in-process cache, must be called whenever the session is cleared
+        """
+        session_id = starsessions.get_session_id(request)
+        if session_id:
+            _USER_AUTH_CACHE.pop(session_id)
+
+
+def _put_in_user_auth_cache(
+    request_with_session: Request, user_auth_info: _UserAuthInfo, authenticated_user: AuthenticatedUser
+) -> None:
+    session_id = starsessions.get_session_id(request_with_session)
+    if not session_id:
+        return
+
+    ttl_s = min(
+        user_auth_info.earliest_expiry_time - time.time() - _MIN_REMAINING_VALIDITY_S, _USER_AUTH_CACHE_MAX_TTL_S
+    )
+    if ttl_s > 0:
+        _USER_AUTH_CACHE.put(
+            session_id, _CachedUserAuth(user_auth_info=user_auth_info, authenticated_user=authenticated_user), ttl_s
+        )
+
 
 def _acquire_access_token_for_resource_scopes(
     cca: msal.ConfidentialClientApplication, resource_name: _ResourceName, account: str
@@ -54,11 +54,16 @@ class EnforceLoggedInMiddleware:
         if path_is_protected:
             request = Request(scope, receive)
 
-            await starsessions.load_session(request)
-            perf_metrics.record_lap("load-session")
+            # Only go to the session store if the user is not found in the in-process cache
+            authenticated_user = AuthHelper.get_cached_authenticated_user(request)
+            perf_metrics.record_lap("get-cached-auth-user")
 
-            authenticated_user = AuthHelper.get_authenticated_user(request)
-            perf_metrics.record_lap("get-auth-user")
+            if authenticated_user is None:
+                await starsessions.load_session(request)
+                perf_metrics.record_lap("load-session")
+
+                authenticated_user = AuthHelper.get_authenticated_user(request)
+                perf_metrics.record_lap("get-auth-user")
 
             is_logged_in = authenticated_user is not None
 
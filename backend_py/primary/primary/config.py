@@ -25,6 +25,46 @@ RESOURCE_SCOPES_DICT = {
 REDIS_USER_SESSION_URL = "redis://redis-user-session:6379"
 REDIS_CACHE_URL = "redis://redis-cache:6379"
 
+# Ensemble fingerprints are also cached in a user independent tier (in-process LRU in front of Redis), which is only
+# served to users whose access to the case has been verified.
+SUMO_FINGERPRINT_SHARED_TIER_ENABLED = (
+    os.getenv("WEBVIZ_SUMO_FINGERPRINT_SHARED_TIER_ENABLED", "true").lower() == "true"
+)
+
+# Process-wide cache of aggregated Arrow tables loaded from Sumo.
+# The optional second tier can be either "redis" (uses REDIS_CACHE_URL) or "disk", leave unset to disable it.
+ARROW_TABLE_CACHE_MEM_BUDGET_MB = int(os.getenv("WEBVIZ_ARROW_TABLE_CACHE_MEM_BUDGET_MB", "512"))
+ARROW_TABLE_CACHE_SECOND_TIER = os.getenv("WEBVIZ_ARROW_TABLE_CACHE_SECOND_TIER")
+ARROW_TABLE_CACHE_REDIS_TTL_S = 60 * 60
+ARROW_TABLE_CACHE_DISK_DIR = os.getenv("WEBVIZ_ARROW_TABLE_CACHE_DISK_DIR", "/tmp/webviz_arrow_table_cache")
+ARROW_TABLE_CACHE_DISK_BUDGET_MB = int(os.getenv("WEBVIZ_ARROW_TABLE_CACHE_DISK_BUDGET_MB", "4096"))
+
+# Process-wide cache of decoded surfaces, keyed by surface address and ensemble fingerprint.
+# The optional disk tier stores the surface values as memory mapped .npy files, set the directory to enable it.
+DECODED_SURFACE_CACHE_MEM_BUDGET_MB = int(os.getenv("WEBVIZ_DECODED_SURFACE_CACHE_MEM_BUDGET_MB", "512"))
+DECODED_SURFACE_CACHE_DISK_DIR = os.getenv("WEBVIZ_DECODED_SURFACE_CACHE_DISK_DIR")
+DECODED_SURFACE_CACHE_DISK_BUDGET_MB = int(os.getenv("WEBVIZ_DECODED_SURFACE_CACHE_DISK_BUDGET_MB", "4096"))
+
+# Process-wide cache of final encoded surface data responses (per data format and resample target).
+# Only used when the decoded surface cache is able to provide a cache key, i.e. when the ensemble fingerprint is known.
+SURFACE_RESPONSE_CACHE_MEM_BUDGET_MB = int(os.getenv("WEBVIZ_SURFACE_RESPONSE_CACHE_MEM_BUDGET_MB", "256"))
+
+# Process-wide cache of seismic slices, keyed by vds url, direction and line number.
+# After each single slice request, up to VDS_SLICE_PREFETCH_DISTANCE neighbouring lines on each side are loaded in
+# the background. Prefetching adds load on the VDS server, so it is disabled (0) by default.
+VDS_SLICE_CACHE_MEM_BUDGET_MB = int(os.getenv("WEBVIZ_VDS_SLICE_CACHE_MEM_BUDGET_MB", "256"))
+VDS_SLICE_PREFETCH_DISTANCE = int(os.getenv("WEBVIZ_VDS_SLICE_PREFETCH_DISTANCE", "0"))
+
+# Process-wide caches of SMDA and SSDL request results (stale-while-revalidate, scoped per access token).
+# For SMDA the budget is split between the cache of raw results and the cache of DataFrames.
+SMDA_REQUEST_CACHE_MEM_BUDGET_MB = int(os.getenv("WEBVIZ_SMDA_REQUEST_CACHE_MEM_BUDGET_MB", "128"))
+SSDL_REQUEST_CACHE_MEM_BUDGET_MB = int(os.getenv("WEBVIZ_SSDL_REQUEST_CACHE_MEM_BUDGET_MB", "64"))
+
+# Executors for offloading CPU-bound work (decoding, encoding, statistics, resampling) from the event loop.
+# The process pool is used for work that holds the GIL (xtgeo parsing), set to 0 to run that work in the thread pool.
+CPU_EXECUTOR_NUM_THREAD_WORKERS = int(os.getenv("WEBVIZ_CPU_EXECUTOR_NUM_THREAD_WORKERS", "4"))
+CPU_EXECUTOR_NUM_PROCESS_WORKERS = int(os.getenv("WEBVIZ_CPU_EXECUTOR_NUM_PROCESS_WORKERS", "2"))
+
 _is_on_radix_platform = is_running_on_radix_platform()
 if _is_on_radix_platform:
     COSMOS_DB_URL = os.getenv("WEBVIZ_COSMOS_DB_URL", "https://webviz-db.documents.azure.com:443/")
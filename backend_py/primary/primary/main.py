@@ -11,10 +11,17 @@ from starsessions import SessionMiddleware
 from starsessions.stores.redis import RedisStore
 from uvicorn.middleware.proxy_headers import ProxyHeadersMiddleware
 
+from webviz_core_utils.cpu_executors import init_cpu_executors, shutdown_cpu_executors
 from webviz_services.services_config import ServicesConfig, init_services_config
+from webviz_services.smda_access._smda_get_request import init_smda_request_caches
+from webviz_services.ssdl_access._ssdl_get_request import init_ssdl_request_cache
+from webviz_services.sumo_access.arrow_table_cache import ArrowIpcStore, DiskArrowIpcStore, RedisArrowIpcStore
+from webviz_services.sumo_access.arrow_table_cache import init_arrow_table_cache
+from webviz_services.sumo_access.decoded_surface_cache import DiskDecodedSurfaceStore, init_decoded_surface_cache
 from webviz_services.sumo_access.sumo_fingerprinter import SumoFingerprinterFactory
 from webviz_services.utils.httpx_async_client_wrapper import HTTPX_ASYNC_CLIENT_WRAPPER
 from webviz_services.utils.task_meta_tracker import TaskMetaTrackerFactory
+from webviz_services.vds_access.vds_slice_cache import init_vds_slice_cache
 
 from primary.auth.auth_helper import AuthHelper
 from primary.auth.enforce_logged_in_middleware import EnforceLoggedInMiddleware
@@ -36,6 +43,7 @@ from primary.routers.pvt.router import router as pvt_router
 from primary.routers.rft.router import router as rft_router
 from primary.routers.seismic.router import router as seismic_router
 from primary.routers.surface.router import router as surface_router
+from primary.routers.surface.surface_response_cache import init_surface_response_cache
 from primary.routers.timeseries.router import router as timeseries_router
 from primary.routers.vfp.router import router as vfp_router
 from primary.routers.well.router import router as well_router
@@ -80,6 +88,30 @@ services_config = ServicesConfig(
 init_services_config(services_config)
 
 
+def create_arrow_table_cache_second_tier_store() -> ArrowIpcStore | None:
+    if config.ARROW_TABLE_CACHE_SECOND_TIER == "redis":
+        return RedisArrowIpcStore(redis_url=config.REDIS_CACHE_URL, ttl_s=config.ARROW_TABLE_CACHE_REDIS_TTL_S)
+    if config.ARROW_TABLE_CACHE_SECOND_TIER == "disk":
+        return DiskArrowIpcStore(
+            cache_dir=config.ARROW_TABLE_CACHE_DISK_DIR,
+            max_size_bytes=config.ARROW_TABLE_CACHE_DISK_BUDGET_MB * 1024 * 1024,
+        )
+    if config.ARROW_TABLE_CACHE_SECOND_TIER:
+        LOGGER.warning(f"Unknown second tier for Arrow table cache: {config.ARROW_TABLE_CACHE_SECOND_TIER}")
+
+    return None
+
+
+def create_decoded_surface_cache_disk_store() -> DiskDecodedSurfaceStore | None:
+    if not config.DECODED_SURFACE_CACHE_DISK_DIR:
+        return None
+
+    return DiskDecodedSurfaceStore(
+        cache_dir=config.DECODED_SURFACE_CACHE_DISK_DIR,
+        max_size_bytes=config.DECODED_SURFACE_CACHE_DISK_BUDGET_MB * 1024 * 1024,
+    )
+
+
 def custom_generate_unique_id(route: APIRoute) -> str:
     return f"{route.name}"
 
@@ -105,7 +137,28 @@ async def lifespan_handler_async(_fastapi_app: FastAPI) -> AsyncIterator[None]:
     await PersistenceStoresSingleton.initialize_with_credential_async(config.COSMOS_DB_URL, azure_services_credential)
 
     TaskMetaTrackerFactory.initialize(redis_url=config.REDIS_CACHE_URL)
-    SumoFingerprinterFactory.initialize(redis_url=config.REDIS_CACHE_URL)
+    SumoFingerprinterFactory.initialize(
+        redis_url=config.REDIS_CACHE_URL, use_shared_tier=config.SUMO_FINGERPRINT_SHARED_TIER_ENABLED
+    )
+    init_arrow_table_cache(
+        mem_max_size_bytes=config.ARROW_TABLE_CACHE_MEM_BUDGET_MB * 1024 * 1024,
+        second_tier_store=create_arrow_table_cache_second_tier_store(),
+    )
+    init_decoded_surface_cache(
+        mem_max_size_bytes=config.DECODED_SURFACE_CACHE_MEM_BUDGET_MB * 1024 * 1024,
+        disk_store=create_decoded_surface_cache_disk_store(),
+    )
+    init_surface_response_cache(max_size_bytes=config.SURFACE_RESPONSE_CACHE_MEM_BUDGET_MB * 1024 * 1024)
+    init_vds_slice_cache(
+        max_size_bytes=config.VDS_SLICE_CACHE_MEM_BUDGET_MB * 1024 * 1024,
+        prefetch_distance=config.VDS_SLICE_PREFETCH_DISTANCE,
+    )
+    init_smda_request_caches(max_size_bytes=config.SMDA_REQUEST_CACHE_MEM_BUDGET_MB * 1024 * 1024)
+    init_ssdl_request_cache(max_size_bytes=config.SSDL_REQUEST_CACHE_MEM_BUDGET_MB * 1024 * 1024)
+    init_cpu_executors(
+        num_thread_workers=config.CPU_EXECUTOR_NUM_THREAD_WORKERS,
+        num_process_workers=config.CPU_EXECUTOR_NUM_PROCESS_WORKERS,
+    )
 
     # This part, after the yield, will be executed after the application has finished.
     yield
@@ -113,6 +166,7 @@ async def lifespan_handler_async(_fastapi_app: FastAPI) -> AsyncIterator[None]:
     await PersistenceStoresSingleton.shutdown_async()
     await azure_services_credential.close()
     await HTTPX_ASYNC_CLIENT_WRAPPER.stop_async()
+    shutdown_cpu_executors()
 
 
 # Note that if WEBVIZ_SKIP_LIFESPAN_GENERATE_API_ONLY is set to true,
@@ -0,0 +1,52 @@
+import logging
+
+from webviz_services.sumo_access.arrow_table_cache import get_arrow_table_cache
+from webviz_services.sumo_access.decoded_surface_cache import get_decoded_surface_cache
+from webviz_services.sumo_access.sumo_fingerprinter import get_sumo_fingerprinter_for_user
+from webviz_services.utils.authenticated_user import AuthenticatedUser
+
+LOGGER = logging.getLogger(__name__)
+
+
+async def get_ensemble_fp_for_table_cache_async(
+    authenticated_user: AuthenticatedUser, case_uuid: str, ensemble_name: str
+) -> str | None:
+    """
+    Get the ensemble fingerprint to pass on to access classes that support caching of Arrow tables.
+
+    Returns None if the Arrow table cache is not enabled, or if the fingerprint could not be determined,
+    in which case the access classes will bypass the cache and always fetch data from Sumo.
+    """
+    if get_arrow_table_cache() is None:
+        return None
+
+    return await _get_ensemble_fp_or_none_async(authenticated_user, case_uuid, ensemble_name)
+
+
+async def get_ensemble_fp_for_surface_cache_async(
+    authenticated_user: AuthenticatedUser, case_uuid: str, ensemble_name: str
+) -> str | None:
+    """
+    Get the ensemble fingerprint to use as part of the key for the decoded surface cache.
+
+    Returns None if the decoded surface cache is not enabled, or if the fingerprint could not be determined,
+    in which case the cache should be bypassed.
+    """
+    if get_decoded_surface_cache() is None:
+        return None
+
+    return await _get_ensemble_fp_or_none_async(authenticated_user, case_uuid, ensemble_name)
+
+
+async def _get_ensemble_fp_or_none_async(
+    authenticated_user: AuthenticatedUser, case_uuid: str, ensemble_name: str
+) -> str | None:
+    # Use the same TTL as when determining fingerprints for statistical surface tasks.
+    # Note that the explore endpoint that calculates/refreshes fingerprints sets a TTL of 5 minutes.
+    fingerprinter = get_sumo_fingerprinter_for_user(authenticated_user=authenticated_user, cache_ttl_s=2 * 60)
+
+    try:
+        return await fingerprinter.get_or_calc_ensemble_fp_async(case_uuid, ensemble_name)
+    except Exception as exc:  # pylint: disable=broad-exception-caught
+        LOGGER.warning(f"Unable to determine ensemble fingerprint, bypassing cache: {exc}")
+        return None
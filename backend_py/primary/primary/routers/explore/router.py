@@ -1,6 +1,5 @@
-import asyncio
 import logging
-from typing import List, Coroutine, Any
+from typing import List
 
 from fastapi import APIRouter, Depends, Path, Query, Body, Response
 
@@ -115,11 +114,10 @@ async def post_refresh_fingerprints_for_ensembles(
     # Given that currently we will have the frontend call this endpoint every 5 minutes, a TTL of 5 minutes seems reasonable
     fingerprinter = get_sumo_fingerprinter_for_user(authenticated_user=authenticated_user, cache_ttl_s=5 * 60)
 
-    coros_arr: list[Coroutine[Any, Any, str]] = []
-    for ident in ensemble_idents:
-        coros_arr.append(fingerprinter.calc_and_store_ensemble_fp_async(ident.caseUuid, ident.ensembleName))
-
-    raw_results = await asyncio.gather(*coros_arr, return_exceptions=True)
+    # Case level digests are shared between ensembles of the same case, and all fingerprints are written in one go
+    raw_results = await fingerprinter.calc_and_store_ensemble_fps_async(
+        [(ident.caseUuid, ident.ensembleName) for ident in ensemble_idents]
+    )
     perf_metrics.record_lap("calc-and-write-fingerprints")
 
     ret_fingerprints: list[str | None] = []
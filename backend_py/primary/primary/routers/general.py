@@ -40,6 +40,7 @@ async def get_alive_protected() -> str:
 async def post_logout(request: Request) -> str:
     await starsessions.load_session(request)
     request.session.clear()
+    AuthHelper.invalidate_cached_user(request)
 
     return "Logout OK"
 
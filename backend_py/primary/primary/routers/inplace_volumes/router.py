@@ -10,6 +10,7 @@ from webviz_services.sumo_access.inplace_volumes_table_access import InplaceVolu
 from webviz_services.utils.authenticated_user import AuthenticatedUser
 from primary.auth.auth_helper import AuthHelper
 from primary.middleware.cache_control_middleware import cache_time, CacheTime
+from primary.routers._shared.ensemble_fingerprint import get_ensemble_fp_for_table_cache_async
 from primary.routers.inplace_volumes.converters import (
     convert_schema_to_indices,
     convert_schema_to_indices_with_values,
@@ -43,8 +44,9 @@ async def get_inplace_table_definitions(
 ) -> list[schemas.InplaceVolumesTableDefinition]:
     """Get the inplace volumes tables definitions for a given ensemble."""
 
+    ensemble_fp = await get_ensemble_fp_for_table_cache_async(authenticated_user, case_uuid, ensemble_name)
     access = InplaceVolumesTableAccess.from_ensemble_name(
-        authenticated_user.get_sumo_access_token(), case_uuid, ensemble_name
+        authenticated_user.get_sumo_access_token(), case_uuid, ensemble_name, ensemble_fp
     )
 
     is_deprecated_format = await access.is_deprecated_format_async()
@@ -91,8 +93,9 @@ async def post_get_aggregated_per_realization_inplace_table_data(
 
     perf_metrics.record_lap("decode realizations array")
 
+    ensemble_fp = await get_ensemble_fp_for_table_cache_async(authenticated_user, case_uuid, ensemble_name)
     access = InplaceVolumesTableAccess.from_ensemble_name(
-        authenticated_user.get_sumo_access_token(), case_uuid, ensemble_name
+        authenticated_user.get_sumo_access_token(), case_uuid, ensemble_name, ensemble_fp
     )
 
     is_deprecated_format = await access.is_deprecated_format_async()
@@ -161,8 +164,9 @@ async def post_get_aggregated_statistical_inplace_table_data(
 
     perf_metrics.record_lap("decode realizations array")
 
+    ensemble_fp = await get_ensemble_fp_for_table_cache_async(authenticated_user, case_uuid, ensemble_name)
     access = InplaceVolumesTableAccess.from_ensemble_name(
-        authenticated_user.get_sumo_access_token(), case_uuid, ensemble_name
+        authenticated_user.get_sumo_access_token(), case_uuid, ensemble_name, ensemble_fp
     )
 
     perf_metrics.record_lap("get-access")
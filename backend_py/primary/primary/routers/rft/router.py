@@ -8,6 +8,7 @@ from webviz_services.utils.authenticated_user import AuthenticatedUser
 
 from primary.auth.auth_helper import AuthHelper
 from primary.middleware.cache_control_middleware import cache_time, CacheTime
+from primary.routers._shared.ensemble_fingerprint import get_ensemble_fp_for_table_cache_async
 from primary.utils.query_string_utils import decode_uint_list_str
 
 from . import schemas
@@ -26,7 +27,10 @@ async def get_rft_table_definition(
     ensemble_name: Annotated[str, Query(description="Ensemble name")],
 ) -> schemas.RftTableDefinition:
     """Get the RFT table definition for a given ensemble."""
-    access = RftAccess.from_ensemble_name(authenticated_user.get_sumo_access_token(), case_uuid, ensemble_name)
+    ensemble_fp = await get_ensemble_fp_for_table_cache_async(authenticated_user, case_uuid, ensemble_name)
+    access = RftAccess.from_ensemble_name(
+        authenticated_user.get_sumo_access_token(), case_uuid, ensemble_name, ensemble_fp
+    )
     rft_table_def = await access.get_rft_info_async()
 
     return converters.to_api_table_definition(rft_table_def)
@@ -53,7 +57,10 @@ async def get_rft_realization_data(
     if realizations_encoded_as_uint_list_str:
         realizations = decode_uint_list_str(realizations_encoded_as_uint_list_str)
 
-    access = RftAccess.from_ensemble_name(authenticated_user.get_sumo_access_token(), case_uuid, ensemble_name)
+    ensemble_fp = await get_ensemble_fp_for_table_cache_async(authenticated_user, case_uuid, ensemble_name)
+    access = RftAccess.from_ensemble_name(
+        authenticated_user.get_sumo_access_token(), case_uuid, ensemble_name, ensemble_fp
+    )
     data = await access.get_rft_well_realization_data_async(
         well_name=well_name,
         response_name=response_name,
@@ -1,3 +1,4 @@
+import asyncio
 from typing import List, Optional, Tuple
 
 from fastapi import APIRouter, Body, Depends, HTTPException, Query
@@ -72,9 +73,9 @@ async def get_seismic_slices(
 
     vds_access = VdsAccess(sas_token=vds_handle.sas_token, vds_url=vds_handle.vds_url)
 
-    inline_tuple = await vds_access.get_inline_slice_async(line_no=inline_number)
-    crossline_tuple = await vds_access.get_crossline_slice_async(line_no=crossline_number)
-    depth_slice_tuple = await vds_access.get_depth_slice_async(depth_slice_no=depth_slice_number)
+    inline_tuple, crossline_tuple, depth_slice_tuple = await vds_access.get_inline_crossline_and_depth_slices_async(
+        inline_no=inline_number, crossline_no=crossline_number, depth_slice_no=depth_slice_number
+    )
 
     return (
         converters.to_api_vds_slice_data(flattened_slice_traces_array=inline_tuple[0], metadata=inline_tuple[1]),
@@ -126,15 +127,18 @@ async def post_get_seismic_fence(
 
     # Retrieve fence and post as seismic intersection using cdp coordinates for vds-slice
     # NOTE: Correct coordinate format and scaling - see VdsCoordinateSystem?
-    [
-        flattened_fence_traces_array,
-        num_traces,
-        num_samples_per_trace,
-    ] = await vds_access.get_flattened_fence_traces_array_and_metadata_async(
-        coordinates=VdsCoordinates(polyline.x_points, polyline.y_points),
-        coordinate_system=VdsCoordinateSystem.CDP,
-    )
-    meta: VdsMetadata = await vds_access.get_metadata_async()
+    # The fence and the cube metadata are independent, so they are requested concurrently
+    async with asyncio.TaskGroup() as tg:
+        fence_task = tg.create_task(
+            vds_access.get_flattened_fence_traces_array_and_metadata_async(
+                coordinates=VdsCoordinates(polyline.x_points, polyline.y_points),
+                coordinate_system=VdsCoordinateSystem.CDP,
+            )
+        )
+        meta_task = tg.create_task(vds_access.get_metadata_async())
+
+    flattened_fence_traces_array, num_traces, num_samples_per_trace = fence_task.result()
+    meta: VdsMetadata = meta_task.result()
 
     if len(meta.axis) != 3:
         raise HTTPException(status_code=400, detail=f"Expected 3 axes, got {len(meta.axis)}")
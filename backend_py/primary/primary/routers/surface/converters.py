@@ -9,12 +9,9 @@ from webviz_services.smda_access.types import StratigraphicSurface
 from webviz_services.sumo_access.surface_types import SurfaceMetaSet
 from webviz_services.utils.surface_intersect_with_polyline import XtgeoSurfaceIntersectionPolyline
 from webviz_services.utils.surface_intersect_with_polyline import XtgeoSurfaceIntersectionResult
-from webviz_services.utils.surface_helpers import (
-    surface_to_float32_numpy_array,
-    get_min_max_surface_values,
-    WellTrajectory,
-)
-from webviz_services.utils.surface_to_png import surface_to_png_bytes_optimized
+from webviz_services.utils.decoded_surface import DecodedSurface
+from webviz_services.utils.surface_helpers import WellTrajectory
+from webviz_services.utils.surface_to_png import surface_values_to_png_bytes
 from webviz_services.smda_access import StratigraphicUnit
 from webviz_services.utils.surfaces_well_trajectory_formation_segments import FormationSegment
 
@@ -45,75 +42,78 @@ def resample_to_surface_def(
     return target_surface
 
 
-def to_api_surface_data_float(xtgeo_surf: xtgeo.RegularSurface) -> schemas.SurfaceDataFloat:
+def resample_decoded_surface_to_surface_def(
+    decoded_surf: DecodedSurface, target_surface_def: schemas.SurfaceDef
+) -> DecodedSurface:
     """
-    Create API SurfaceDataFloat from xtgeo regular surface
+    Resample a decoded surface, see resample_to_surface_def()
     """
+    resampled_xtgeo_surf = resample_to_surface_def(decoded_surf.to_xtgeo_surface(), target_surface_def)
+    return DecodedSurface.from_xtgeo_surface(resampled_xtgeo_surf)
 
-    float32_np_arr: NDArray[np.float32] = surface_to_float32_numpy_array(xtgeo_surf)
-    values_b64arr = b64_encode_float_array_as_float32(float32_np_arr)
 
-    surface_def = schemas.SurfaceDef(
-        npoints_x=xtgeo_surf.ncol,
-        npoints_y=xtgeo_surf.nrow,
-        inc_x=xtgeo_surf.xinc,
-        inc_y=xtgeo_surf.yinc,
-        origin_utm_x=xtgeo_surf.xori,
-        origin_utm_y=xtgeo_surf.yori,
-        rot_deg=xtgeo_surf.rotation,
-    )
+def to_api_surface_data_float(decoded_surf: DecodedSurface) -> schemas.SurfaceDataFloat:
+    """
+    Create API SurfaceDataFloat from decoded surface
+    """
 
-    trans_bb_utm = schemas.BoundingBox2d(
-        min_x=xtgeo_surf.xmin, min_y=xtgeo_surf.ymin, max_x=xtgeo_surf.xmax, max_y=xtgeo_surf.ymax
-    )
+    float32_np_arr: NDArray[np.float32] = decoded_surf.get_flat_float32_values_for_api()
+    values_b64arr = b64_encode_float_array_as_float32(float32_np_arr)
 
-    surf_min_max_vals = get_min_max_surface_values(xtgeo_surf)
-    if surf_min_max_vals is None:
+    if decoded_surf.value_min is None or decoded_surf.value_max is None:
         raise ValueError("Failed to get valid min/max values for surface")
 
     return schemas.SurfaceDataFloat(
         format="float",
-        surface_def=surface_def,
-        transformed_bbox_utm=trans_bb_utm,
-        value_min=surf_min_max_vals.min,
-        value_max=surf_min_max_vals.max,
+        surface_def=_to_api_surface_def(decoded_surf),
+        transformed_bbox_utm=_to_api_transformed_bbox_utm(decoded_surf),
+        value_min=decoded_surf.value_min,
+        value_max=decoded_surf.value_max,
         values_b64arr=values_b64arr,
     )
 
 
-def to_api_surface_data_png(xtgeo_surf: xtgeo.RegularSurface) -> schemas.SurfaceDataPng:
+def to_api_surface_data_png(decoded_surf: DecodedSurface) -> schemas.SurfaceDataPng:
     """
-    Create API SurfaceDataPng from xtgeo regular surface
+    Create API SurfaceDataPng from decoded surface
     """
 
-    png_bytes: bytes = surface_to_png_bytes_optimized(xtgeo_surf)
+    if decoded_surf.value_min is None or decoded_surf.value_max is None:
+        raise ValueError("Failed to get valid min/max attribute values for surface")
+
+    # Scale using the stored min/max, which are computed from the float64 values, so that the png encoding
+    # matches the min/max values in the response
+    png_bytes: bytes = surface_values_to_png_bytes(
+        decoded_surf.get_masked_values(), value_range=(decoded_surf.value_min, decoded_surf.value_max)
+    )
     png_bytes_base64 = base64.b64encode(png_bytes).decode("ascii")
 
-    surface_def = schemas.SurfaceDef(
-        npoints_x=xtgeo_surf.ncol,
-        npoints_y=xtgeo_surf.nrow,
-        inc_x=xtgeo_surf.xinc,
-        inc_y=xtgeo_surf.yinc,
-        origin_utm_x=xtgeo_surf.xori,
-        origin_utm_y=xtgeo_surf.yori,
-        rot_deg=xtgeo_surf.rotation,
+    return schemas.SurfaceDataPng(
+        format="png",
+        surface_def=_to_api_surface_def(decoded_surf),
+        transformed_bbox_utm=_to_api_transformed_bbox_utm(decoded_surf),
+        value_min=decoded_surf.value_min,
+        value_max=decoded_surf.value_max,
+        png_image_base64=png_bytes_base64,
     )
 
-    trans_bb_utm = schemas.BoundingBox2d(
-        min_x=xtgeo_surf.xmin, min_y=xtgeo_surf.ymin, max_x=xtgeo_surf.xmax, max_y=xtgeo_surf.ymax
+
+def _to_api_surface_def(decoded_surf: DecodedSurface) -> schemas.SurfaceDef:
+    surf_def = decoded_surf.surface_def
+    return schemas.SurfaceDef(
+        npoints_x=surf_def.ncol,
+        npoints_y=surf_def.nrow,
+        inc_x=surf_def.xinc,
+        inc_y=surf_def.yinc,
+        origin_utm_x=surf_def.xori,
+        origin_utm_y=surf_def.yori,
+        rot_deg=surf_def.rotation,
     )
 
-    surf_min_max_vals = get_min_max_surface_values(xtgeo_surf)
-    if surf_min_max_vals is None:
-        raise ValueError("Failed to get valid min/max attribute values for surface")
 
-    return schemas.SurfaceDataPng(
-        format="png",
-        surface_def=surface_def,
-        transformed_bbox_utm=trans_bb_utm,
-        value_min=surf_min_max_vals.min,
-        value_max=surf_min_max_vals.max,
-        png_image_base64=png_bytes_base64,
+def _to_api_transformed_bbox_utm(decoded_surf: DecodedSurface) -> schemas.BoundingBox2d:
+    return schemas.BoundingBox2d(
+        min_x=decoded_surf.xmin, min_y=decoded_surf.ymin, max_x=decoded_surf.xmax, max_y=decoded_surf.ymax
     )
 
 
@@ -5,9 +5,11 @@ from typing import Annotated, List, Optional, Literal
 import xtgeo
 from fastapi import APIRouter, Depends, HTTPException, Query, Response, Body, status
 
+from webviz_core_utils.cpu_executors import PrefixedMetricsSink, run_in_thread_executor_async
 from webviz_core_utils.perf_metrics import PerfMetrics
 from webviz_core_utils.type_utils import expect_type
 from webviz_services.sumo_access.case_inspector import CaseInspector
+from webviz_services.sumo_access.decoded_surface_cache import get_decoded_surface_cache
 from webviz_services.sumo_access.surface_access import SurfaceAccess
 from webviz_services.sumo_access.surface_access import ExpectedError, InProgress
 from webviz_services.smda_access import SmdaAccess, StratigraphicUnit
@@ -16,6 +18,7 @@ from webviz_services.smda_access.drogon import DrogonSmdaAccess
 from webviz_services.utils.statistic_function import StatisticFunction
 from webviz_services.utils.surface_intersect_with_polyline import intersect_surface_with_polyline
 from webviz_services.utils.authenticated_user import AuthenticatedUser
+from webviz_services.utils.decoded_surface import DecodedSurface
 from webviz_services.utils.task_meta_tracker import get_task_meta_tracker_for_user
 from webviz_services.surface_query_service.surface_query_service import batch_sample_surface_in_points_async
 from webviz_services.surface_query_service.surface_query_service import RealizationSampleResult
@@ -30,6 +33,7 @@ from primary.middleware.cache_control_middleware import cache_time, set_cache_ti
 from primary.utils.response_perf_metrics import ResponsePerfMetrics
 from primary.utils.drogon import is_drogon_identifier
 
+from .._shared.ensemble_fingerprint import get_ensemble_fp_for_surface_cache_async
 from .._shared.long_running_operations import LroInProgressResp, LroFailureResp, LroSuccessResp
 
 from . import converters
@@ -41,6 +45,7 @@ from .surface_address import RealizationSurfaceAddress, ObservedSurfaceAddress,
 
 
 from .surface_address import decode_surf_addr_str
+from .surface_response_cache import get_surface_response_cache, make_surface_response_cache_key
 
 LOGGER = logging.getLogger(__name__)
 
@@ -172,23 +177,36 @@ async def get_surface_data(
 ) -> schemas.SurfaceDataFloat | schemas.SurfaceDataPng:
     perf_metrics = ResponsePerfMetrics(response)
 
-    access_token = authenticated_user.get_sumo_access_token()
-
     addr = decode_surf_addr_str(surf_addr_str)
     if not isinstance(addr, RealizationSurfaceAddress | ObservedSurfaceAddress | StatisticalSurfaceAddress):
         raise HTTPException(status_code=404, detail="Endpoint only supports address types REAL, OBS and STAT")
 
-    xtgeo_surf = await _get_xtgeo_surface_from_sumo_async(
-        access_token=access_token, surf_addr_str=surf_addr_str, perf_metrics=perf_metrics
-    )
+    surface_cache_key = await _make_surface_cache_key_async(authenticated_user, addr, perf_metrics)
 
-    if not xtgeo_surf:
-        raise HTTPException(status_code=500, detail="Did not get a valid xtgeo surface from Sumo")
+    # Try the cache of final encoded responses first, a hit skips both retrieval and all CPU-bound work
+    response_cache = get_surface_response_cache()
+    response_cache_key: str | None = None
+    if response_cache is not None and surface_cache_key is not None:
+        response_cache_key = make_surface_response_cache_key(surface_cache_key, data_format, resample_to)
+        cached_response = response_cache.get(response_cache_key)
+        if cached_response is not None:
+            perf_metrics.record_lap("resp-cache-hit")
+            LOGGER.info(f"Got {addr.address_type} surface from response cache in: {perf_metrics.to_string()}")
+            return cached_response
+
+        perf_metrics.record_lap("resp-cache-miss")
 
-    surf_data_response = _resample_and_convert_to_surface_data_response(
-        xtgeo_surf=xtgeo_surf, resample_to=resample_to, data_format=data_format, perf_metrics=perf_metrics
+    decoded_surf = await _get_decoded_surface_async(
+        authenticated_user=authenticated_user, addr=addr, surface_cache_key=surface_cache_key, perf_metrics=perf_metrics
     )
 
+    surf_data_response = await _resample_and_convert_to_surface_data_response_async(
+        decoded_surf=decoded_surf, resample_to=resample_to, data_format=data_format, perf_metrics=perf_metrics
+    )
+
+    if response_cache is not None and response_cache_key is not None:
+        response_cache.put(response_cache_key, surf_data_response)
+
     LOGGER.info(f"Got {addr.address_type} surface in: {perf_metrics.to_string()}")
 
     return surf_data_response
@@ -340,8 +358,13 @@ async def get_statistical_surface_data_hybrid(
 
         # We should now be left with a xtgeo RegularSurface
         xtgeo_surf: xtgeo.RegularSurface = expect_type(maybe_xtgeo_surf, xtgeo.RegularSurface)
-        api_surf_data = _resample_and_convert_to_surface_data_response(
-            xtgeo_surf=xtgeo_surf, resample_to=resample_to, data_format=data_format, perf_metrics=perf_metrics
+        decoded_surf = await run_in_thread_executor_async(
+            DecodedSurface.from_xtgeo_surface, xtgeo_surf, metrics_sink=PrefixedMetricsSink(perf_metrics, "decode")
+        )
+        perf_metrics.record_lap("decode")
+
+        api_surf_data = await _resample_and_convert_to_surface_data_response_async(
+            decoded_surf=decoded_surf, resample_to=resample_to, data_format=data_format, perf_metrics=perf_metrics
         )
 
         LOGGER.info(f"Got statistical surface data (hybrid) in: {perf_metrics.to_string()}")
@@ -474,30 +497,106 @@ async def _get_stratigraphic_units_for_strat_column_async(
     return strat_units
 
 
-def _resample_and_convert_to_surface_data_response(
-    xtgeo_surf: xtgeo.RegularSurface,
+async def _resample_and_convert_to_surface_data_response_async(
+    decoded_surf: DecodedSurface,
     resample_to: schemas.SurfaceDef | None,
     data_format: Literal["float", "png"],
     perf_metrics: ResponsePerfMetrics,
 ) -> schemas.SurfaceDataFloat | schemas.SurfaceDataPng:
     """
     Helper to do both resampling (if any) and conversion to API response format.
+    Both steps are CPU-bound and are run in the thread pool executor to avoid blocking the event loop.
     """
+    convert_metrics_sink = PrefixedMetricsSink(perf_metrics, "convert")
     if resample_to is not None:
-        xtgeo_surf = converters.resample_to_surface_def(xtgeo_surf, resample_to)
+        decoded_surf = await run_in_thread_executor_async(
+            converters.resample_decoded_surface_to_surface_def,
+            decoded_surf,
+            resample_to,
+            metrics_sink=PrefixedMetricsSink(perf_metrics, "resample"),
+        )
         perf_metrics.record_lap("resample")
 
     surf_data_response: schemas.SurfaceDataFloat | schemas.SurfaceDataPng
     if data_format == "float":
-        surf_data_response = converters.to_api_surface_data_float(xtgeo_surf)
+        surf_data_response = await run_in_thread_executor_async(
+            converters.to_api_surface_data_float, decoded_surf, metrics_sink=convert_metrics_sink
+        )
     elif data_format == "png":
-        surf_data_response = converters.to_api_surface_data_png(xtgeo_surf)
+        surf_data_response = await run_in_thread_executor_async(
+            converters.to_api_surface_data_png, decoded_surf, metrics_sink=convert_metrics_sink
+        )
 
     perf_metrics.record_lap("convert")
 
     return surf_data_response
 
 
+async def _make_surface_cache_key_async(
+    authenticated_user: AuthenticatedUser,
+    addr: RealizationSurfaceAddress | ObservedSurfaceAddress | StatisticalSurfaceAddress,
+    perf_metrics: ResponsePerfMetrics,
+) -> str | None:
+    """
+    Make the key for the decoded surface cache, which is the normalized surface address combined with the
+    ensemble fingerprint.
+
+    Returns None if the decoded surface cache is disabled or the fingerprint could not be determined. Observed
+    surfaces are not associated with an ensemble and thus have no fingerprint, so they always bypass the cache.
+    """
+    if isinstance(addr, ObservedSurfaceAddress):
+        return None
+
+    # Record the lap also when the fingerprint could not be determined, since that may have taken a while too
+    try:
+        ensemble_fp = await get_ensemble_fp_for_surface_cache_async(
+            authenticated_user, addr.case_uuid, addr.ensemble_name
+        )
+    finally:
+        perf_metrics.record_lap("fingerprint")
+
+    if ensemble_fp is None:
+        return None
+
+    return f"{addr.to_addr_str()}::{ensemble_fp}"
+
+
+async def _get_decoded_surface_async(
+    authenticated_user: AuthenticatedUser,
+    addr: RealizationSurfaceAddress | ObservedSurfaceAddress | StatisticalSurfaceAddress,
+    surface_cache_key: str | None,
+    perf_metrics: ResponsePerfMetrics,
+) -> DecodedSurface:
+    """
+    Get decoded surface from the decoded surface cache, or retrieve it from Sumo and put it into the cache.
+    If surface_cache_key is None, the cache is bypassed.
+    """
+    surface_cache = get_decoded_surface_cache()
+    if surface_cache is not None and surface_cache_key is not None:
+        cached_surf = await surface_cache.get_async(surface_cache_key)
+        perf_metrics.record_lap("cache-get")
+        if cached_surf is not None:
+            return cached_surf
+
+    xtgeo_surf = await _get_xtgeo_surface_from_sumo_async(
+        access_token=authenticated_user.get_sumo_access_token(),
+        surf_addr_str=addr.to_addr_str(),
+        perf_metrics=perf_metrics,
+    )
+    if not xtgeo_surf:
+        raise HTTPException(status_code=500, detail="Did not get a valid xtgeo surface from Sumo")
+
+    decoded_surf = await run_in_thread_executor_async(
+        DecodedSurface.from_xtgeo_surface, xtgeo_surf, metrics_sink=PrefixedMetricsSink(perf_metrics, "decode")
+    )
+    perf_metrics.record_lap("decode")
+
+    if surface_cache is not None and surface_cache_key is not None:
+        surface_cache.put(surface_cache_key, decoded_surf)
+
+    return decoded_surf
+
+
 async def _get_xtgeo_surface_from_sumo_async(
     access_token: str,
     surf_addr_str: str,
@@ -0,0 +1,77 @@
+from typing import Literal
+
+from webviz_core_utils.bounded_lru_cache import BoundedLruCache, CacheStats
+
+from . import schemas
+
+SurfaceDataResponse = schemas.SurfaceDataFloat | schemas.SurfaceDataPng
+
+
+class SurfaceResponseCache:
+    """
+    Process-wide cache of final, encoded surface data responses.
+
+    Sits on top of the decoded surface cache, and is keyed by the surface cache key (surface address plus ensemble
+    fingerprint), the data format and the resample target. On a hit, all the CPU-bound work of resampling,
+    computing min/max values and encoding to b64 or png is skipped.
+
+    The cached response objects are shared between requests and must not be modified.
+    """
+
+    def __init__(self, max_size_bytes: int) -> None:
+        self._lru_cache: BoundedLruCache[str, SurfaceDataResponse] = BoundedLruCache(
+            max_size_bytes=max_size_bytes, size_fn=_estimate_response_size_bytes
+        )
+
+    def get(self, key: str) -> SurfaceDataResponse | None:
+        return self._lru_cache.get(key)
+
+    def put(self, key: str, surf_data_response: SurfaceDataResponse) -> None:
+        self._lru_cache.put(key, surf_data_response)
+
+    def get_stats(self) -> CacheStats:
+        return self._lru_cache.get_stats()
+
+
+def make_surface_response_cache_key(
+    surface_cache_key: str, data_format: Literal["float", "png"], resample_to: schemas.SurfaceDef | None
+) -> str:
+    resample_to_str = "none"
+    if resample_to is not None:
+        resample_to_str = (
+            f"{resample_to.npoints_x}:{resample_to.npoints_y}:{resample_to.inc_x!r}:{resample_to.inc_y!r}:"
+            f"{resample_to.origin_utm_x!r}:{resample_to.origin_utm_y!r}:{resample_to.rot_deg!r}"
+        )
+
+    return f"{surface_cache_key}::{data_format}::{resample_to_str}"
+
+
+def _estimate_response_size_bytes(surf_data_response: SurfaceDataResponse) -> int:
+    if isinstance(surf_data_response, schemas.SurfaceDataFloat):
+        return len(surf_data_response.values_b64arr.data_b64str)
+
+    return len(surf_data_response.png_image_base64)
+
+
+# Process-wide state (private to module)
+_global_cache: SurfaceResponseCache | None = None  # pylint: disable=invalid-name
+
+
+def init_surface_response_cache(max_size_bytes: int) -> None:
+    """
+    One-time initialization of the process-wide surface response cache.
+    Until this function has been called, get_surface_response_cache() will return None and caching is disabled.
+    """
+    # pylint: disable=global-statement
+    global _global_cache
+    if _global_cache is not None:
+        raise RuntimeError("SurfaceResponseCache is already initialized")
+
+    _global_cache = SurfaceResponseCache(max_size_bytes)
+
+
+def get_surface_response_cache() -> SurfaceResponseCache | None:
+    """
+    Get the process-wide surface response cache, returns None if the cache has not been initialized.
+    """
+    return _global_cache
@@ -1,5 +1,9 @@
 from typing import Sequence
 
+import numpy as np
+import pyarrow as pa
+from webviz_core_utils.b64 import b64_encode_float_array_as_float32, b64_encode_float_array_as_float64
+from webviz_services.utils.arrow_helpers import sort_table_on_real_then_date
 from webviz_services.summary_vector_statistics import VectorStatistics
 from webviz_services.sumo_access.summary_access import RealizationVector
 from webviz_services.utils.statistic_function import StatisticFunction
@@ -25,6 +29,43 @@ def to_api_derived_vector_info(derived_type: DerivedVectorType, source_vector: s
     )
 
 
+def vector_table_to_api_vector_realizations_data_b64(
+    vector_table: pa.Table,
+    vector_name: str,
+    unit: str,
+    is_rate: bool,
+    derived_vector_info: schemas.DerivedVectorInfo | None = None,
+) -> schemas.VectorRealizationsDataB64:
+    """
+    Create API VectorRealizationsDataB64 directly from a table with DATE, REAL and vector columns,
+    without going via per realization Python lists.
+    """
+    sorted_table = sort_table_on_real_then_date(vector_table)
+
+    unique_reals, real_counts = np.unique(sorted_table["REAL"].to_numpy(), return_counts=True)
+    timestamps_np = sorted_table["DATE"].to_numpy().astype("datetime64[ms]").astype(np.int64)
+
+    # When all realizations have the exact same timestamps, which is usually the case after resampling,
+    # we only need to send the timestamps once
+    timestamps_are_shared = False
+    if len(unique_reals) > 0 and np.all(real_counts == real_counts[0]):
+        timestamps_per_real = timestamps_np.reshape(len(unique_reals), real_counts[0])
+        if np.all(timestamps_per_real == timestamps_per_real[0]):
+            timestamps_are_shared = True
+            timestamps_np = timestamps_per_real[0]
+
+    return schemas.VectorRealizationsDataB64(
+        realizations=unique_reals.tolist(),
+        realizationRowCounts=real_counts.tolist(),
+        timestampsAreShared=timestamps_are_shared,
+        timestampsUtcMs_b64arr=b64_encode_float_array_as_float64(timestamps_np.astype(np.float64)),
+        values_b64arr=b64_encode_float_array_as_float32(sorted_table[vector_name].to_numpy()),
+        unit=unit,
+        isRate=is_rate,
+        derivedVectorInfo=derived_vector_info,
+    )
+
+
 def realization_vector_list_to_api_vector_realization_data_list(
     realization_vector_list: list[RealizationVector],
 ) -> list[schemas.VectorRealizationData]:
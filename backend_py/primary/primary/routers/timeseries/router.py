@@ -6,9 +6,14 @@ import pyarrow as pa
 import pyarrow.compute as pc
 from fastapi import APIRouter, Depends, HTTPException, Query, Response
 
-from webviz_services.summary_vector_statistics import compute_vector_statistics
+from webviz_services.summary_vector_statistics import (
+    compute_vector_statistics_async,
+    compute_vector_statistics_per_sensitivity_case_async,
+)
 from webviz_services.sumo_access.parameter_access import ParameterAccess
-from webviz_services.sumo_access.summary_access import Frequency, SummaryAccess
+from webviz_services.sumo_access.summary_access import Frequency, SummaryAccess, create_realization_vector_list
+from webviz_services.sumo_access.summary_types import VectorMetadata
+from webviz_services.utils.statistic_function import StatisticFunction
 from webviz_services.utils.authenticated_user import AuthenticatedUser
 from webviz_services.summary_delta_vectors import (
     DeltaVectorMetadata,
@@ -29,6 +34,7 @@ from webviz_services.summary_derived_vectors import (
 
 from primary.auth.auth_helper import AuthHelper
 from primary.middleware.cache_control_middleware import cache_time, CacheTime
+from primary.routers._shared.ensemble_fingerprint import get_ensemble_fp_for_table_cache_async
 from primary.utils.response_perf_metrics import ResponsePerfMetrics
 from primary.utils.query_string_utils import decode_uint_list_str
 
@@ -159,8 +165,12 @@ async def get_realizations_vector_data(
     if realizations_encoded_as_uint_list_str:
         realizations = decode_uint_list_str(realizations_encoded_as_uint_list_str)
 
-    access = SummaryAccess.from_ensemble_name(authenticated_user.get_sumo_access_token(), case_uuid, ensemble_name)
+    ensemble_fp = await get_ensemble_fp_for_table_cache_async(authenticated_user, case_uuid, ensemble_name)
+    access = SummaryAccess.from_ensemble_name(
+        authenticated_user.get_sumo_access_token(), case_uuid, ensemble_name, ensemble_fp
+    )
     sumo_freq = Frequency.from_string_value(resampling_frequency.value if resampling_frequency else "dummy")
+    perf_metrics.record_lap("get-access")
 
     is_vector_derived = is_derived_vector(vector_name)
     vector_name_to_fetch = vector_name if not is_vector_derived else get_total_vector_name(vector_name)
@@ -200,6 +210,129 @@ async def get_realizations_vector_data(
     return ret_arr
 
 
+@router.get("/realizations_vector_data_b64/")
+@cache_time(CacheTime.LONG)
+# pylint: disable-next=too-many-locals
+async def get_realizations_vector_data_b64(
+    # fmt:off
+    response: Response,
+    authenticated_user: Annotated[AuthenticatedUser, Depends(AuthHelper.get_authenticated_user)],
+    case_uuid: Annotated[str, Query(description="Sumo case uuid")],
+    ensemble_name:  Annotated[str, Query(description="Ensemble name")],
+    vector_name:  Annotated[str, Query(description="Name of the vector")],
+    resampling_frequency: Annotated[schemas.Frequency | None, Query(description="Resampling frequency. If not specified, raw data without resampling wil be returned.")] = None,
+    realizations_encoded_as_uint_list_str: Annotated[str | None, Query(description="Optional list of realizations encoded as string to include. If not specified, all realizations will be included.")] = None,
+    # fmt:on
+) -> schemas.VectorRealizationsDataB64:
+    """Get vector data for all realizations in a compact format using base64 encoded typed arrays.
+
+    Returns the same data as the realizations_vector_data endpoint, but is much faster to produce and transfer for
+    large numbers of realizations and dates.
+    """
+
+    perf_metrics = ResponsePerfMetrics(response)
+
+    realizations: list[int] | None = None
+    if realizations_encoded_as_uint_list_str:
+        realizations = decode_uint_list_str(realizations_encoded_as_uint_list_str)
+
+    ensemble_fp = await get_ensemble_fp_for_table_cache_async(authenticated_user, case_uuid, ensemble_name)
+    access = SummaryAccess.from_ensemble_name(
+        authenticated_user.get_sumo_access_token(), case_uuid, ensemble_name, ensemble_fp
+    )
+    sumo_freq = Frequency.from_string_value(resampling_frequency.value if resampling_frequency else "dummy")
+    perf_metrics.record_lap("get-access")
+
+    is_vector_derived = is_derived_vector(vector_name)
+    vector_name_to_fetch = vector_name if not is_vector_derived else get_total_vector_name(vector_name)
+
+    vector_table_pa, vector_metadata = await access.get_vector_table_async(
+        vector_name=vector_name_to_fetch,
+        resampling_frequency=sumo_freq,
+        realizations=realizations,
+    )
+    perf_metrics.record_lap("get-table")
+
+    ret_data: schemas.VectorRealizationsDataB64
+    if not is_vector_derived:
+        ret_data = converters.vector_table_to_api_vector_realizations_data_b64(
+            vector_table_pa, vector_name, unit=vector_metadata.unit, is_rate=vector_metadata.is_rate
+        )
+    else:
+        derived_vector_type = get_derived_vector_type(vector_name)
+        derived_vector_unit = create_derived_vector_unit(vector_metadata.unit, derived_vector_type)
+        derived_vector_info = converters.to_api_derived_vector_info(derived_vector_type, vector_name_to_fetch)
+
+        derived_vector_table_pa = create_derived_vector_table_for_type(vector_table_pa, derived_vector_type)
+        ret_data = converters.vector_table_to_api_vector_realizations_data_b64(
+            derived_vector_table_pa,
+            vector_name,
+            unit=derived_vector_unit,
+            is_rate=vector_metadata.is_rate,
+            derived_vector_info=derived_vector_info,
+        )
+    perf_metrics.record_lap("convert-data")
+
+    LOGGER.info(f"Loaded realization summary data (b64) in: {perf_metrics.to_string()}")
+    return ret_data
+
+
+@router.get("/realizations_vector_data_for_vectors/")
+@cache_time(CacheTime.LONG)
+# pylint: disable-next=too-many-locals
+async def get_realizations_vector_data_for_vectors(
+    # fmt:off
+    response: Response,
+    authenticated_user: Annotated[AuthenticatedUser, Depends(AuthHelper.get_authenticated_user)],
+    case_uuid: Annotated[str, Query(description="Sumo case uuid")],
+    ensemble_name:  Annotated[str, Query(description="Ensemble name")],
+    vector_names:  Annotated[list[str], Query(description="Names of the vectors")],
+    resampling_frequency: Annotated[schemas.Frequency | None, Query(description="Resampling frequency. If not specified, raw data without resampling wil be returned.")] = None,
+    realizations_encoded_as_uint_list_str: Annotated[str | None, Query(description="Optional list of realizations encoded as string to include. If not specified, all realizations will be included.")] = None,
+    # fmt:on
+) -> list[schemas.VectorRealizationsDataForVector]:
+    """Get vector data per realization for multiple vectors in one request.
+
+    All vectors are loaded concurrently and resampled together, the returned list has one entry per requested vector.
+    """
+
+    perf_metrics = ResponsePerfMetrics(response)
+
+    realizations: list[int] | None = None
+    if realizations_encoded_as_uint_list_str:
+        realizations = decode_uint_list_str(realizations_encoded_as_uint_list_str)
+
+    ensemble_fp = await get_ensemble_fp_for_table_cache_async(authenticated_user, case_uuid, ensemble_name)
+    access = SummaryAccess.from_ensemble_name(
+        authenticated_user.get_sumo_access_token(), case_uuid, ensemble_name, ensemble_fp
+    )
+    sumo_freq = Frequency.from_string_value(resampling_frequency.value if resampling_frequency else "dummy")
+    perf_metrics.record_lap("get-access")
+
+    vector_names_to_fetch = _get_unique_vector_names_to_fetch(vector_names)
+    vectors_table, vector_metadata_list = await access.get_vectors_table_async(
+        vector_names=vector_names_to_fetch,
+        resampling_frequency=sumo_freq,
+        realizations=realizations,
+    )
+    vector_metadata_dict = dict(zip(vector_names_to_fetch, vector_metadata_list))
+    perf_metrics.record_lap("get-table")
+
+    ret_arr: list[schemas.VectorRealizationsDataForVector] = []
+    for vector_name in vector_names:
+        vector_name_to_fetch = vector_name if not is_derived_vector(vector_name) else get_total_vector_name(vector_name)
+        realization_data = _create_api_vector_realization_data_list(
+            vectors_table, vector_name, vector_metadata_dict[vector_name_to_fetch]
+        )
+        ret_arr.append(
+            schemas.VectorRealizationsDataForVector(vectorName=vector_name, realizationData=realization_data)
+        )
+    perf_metrics.record_lap("convert-data")
+
+    LOGGER.info(f"Loaded realization summary data for {len(vector_names)} vectors in: {perf_metrics.to_string()}")
+    return ret_arr
+
+
 @router.get("/delta_ensemble_realizations_vector_data/")
 @cache_time(CacheTime.LONG)
 # pylint: disable-next=too-many-locals
@@ -299,7 +432,10 @@ async def get_historical_vector_data(
     non_historical_vector_name: Annotated[str, Query(description="Name of the non-historical vector")],
     resampling_frequency: Annotated[schemas.Frequency | None, Query(description="Resampling frequency")] = None,
 ) -> schemas.VectorHistoricalData:
-    access = SummaryAccess.from_ensemble_name(authenticated_user.get_sumo_access_token(), case_uuid, ensemble_name)
+    ensemble_fp = await get_ensemble_fp_for_table_cache_async(authenticated_user, case_uuid, ensemble_name)
+    access = SummaryAccess.from_ensemble_name(
+        authenticated_user.get_sumo_access_token(), case_uuid, ensemble_name, ensemble_fp
+    )
 
     sumo_freq = Frequency.from_string_value(resampling_frequency.value if resampling_frequency else "dummy")
     sumo_hist_vec = await access.get_matching_historical_vector_async(
@@ -340,7 +476,11 @@ async def get_statistical_vector_data(
     if realizations_encoded_as_uint_list_str:
         realizations = decode_uint_list_str(realizations_encoded_as_uint_list_str)
 
-    access = SummaryAccess.from_ensemble_name(authenticated_user.get_sumo_access_token(), case_uuid, ensemble_name)
+    ensemble_fp = await get_ensemble_fp_for_table_cache_async(authenticated_user, case_uuid, ensemble_name)
+    access = SummaryAccess.from_ensemble_name(
+        authenticated_user.get_sumo_access_token(), case_uuid, ensemble_name, ensemble_fp
+    )
+    perf_metrics.record_lap("get-access")
 
     service_freq = Frequency.from_string_value(resampling_frequency.value)
     service_stat_funcs_to_compute = converters.to_service_statistic_functions(statistic_functions)
@@ -359,7 +499,7 @@ async def get_statistical_vector_data(
     # Calculate statistics
     ret_data: schemas.VectorStatisticData | None = None
     if not is_vector_derived:
-        statistics = compute_vector_statistics(vector_table, vector_name, service_stat_funcs_to_compute)
+        statistics = await compute_vector_statistics_async(vector_table, vector_name, service_stat_funcs_to_compute)
         if not statistics:
             raise HTTPException(status_code=404, detail="Could not compute statistics")
 
@@ -370,7 +510,9 @@ async def get_statistical_vector_data(
         derived_vector_info = converters.to_api_derived_vector_info(derived_vector_type, vector_name_to_fetch)
 
         derived_vector_table_pa = create_derived_vector_table_for_type(vector_table, derived_vector_type)
-        statistics = compute_vector_statistics(derived_vector_table_pa, vector_name, service_stat_funcs_to_compute)
+        statistics = await compute_vector_statistics_async(
+            derived_vector_table_pa, vector_name, service_stat_funcs_to_compute
+        )
 
         if not statistics:
             raise HTTPException(status_code=404, detail="Could not compute statistics")
@@ -385,6 +527,65 @@ async def get_statistical_vector_data(
     return ret_data
 
 
+@router.get("/statistical_vector_data_for_vectors/")
+@cache_time(CacheTime.LONG)
+# pylint: disable-next=too-many-locals
+async def get_statistical_vector_data_for_vectors(
+    # fmt:off
+    response: Response,
+    authenticated_user: Annotated[AuthenticatedUser, Depends(AuthHelper.get_authenticated_user)],
+    case_uuid: Annotated[str, Query(description="Sumo case uuid")],
+    ensemble_name:  Annotated[str, Query(description="Ensemble name")],
+    vector_names: Annotated[list[str], Query(description="Names of the vectors")],
+    resampling_frequency: Annotated[schemas.Frequency, Query(description="Resampling frequency")],
+    statistic_functions: Annotated[list[schemas.StatisticFunction] | None, Query(description="Optional list of statistics to calculate. If not specified, all statistics will be calculated.")] = None,
+    realizations_encoded_as_uint_list_str: Annotated[str | None, Query(description="Optional list of realizations encoded as string to include. If not specified, all realizations will be included.")] = None,
+    # fmt:on
+) -> list[schemas.VectorStatisticDataForVector]:
+    """Get statistical vector data for an ensemble for multiple vectors in one request.
+
+    All vectors are loaded concurrently and resampled together, the returned list has one entry per requested vector.
+    """
+
+    perf_metrics = ResponsePerfMetrics(response)
+
+    realizations: list[int] | None = None
+    if realizations_encoded_as_uint_list_str:
+        realizations = decode_uint_list_str(realizations_encoded_as_uint_list_str)
+
+    ensemble_fp = await get_ensemble_fp_for_table_cache_async(authenticated_user, case_uuid, ensemble_name)
+    access = SummaryAccess.from_ensemble_name(
+        authenticated_user.get_sumo_access_token(), case_uuid, ensemble_name, ensemble_fp
+    )
+    perf_metrics.record_lap("get-access")
+
+    service_freq = Frequency.from_string_value(resampling_frequency.value)
+    service_stat_funcs_to_compute = converters.to_service_statistic_functions(statistic_functions)
+
+    vector_names_to_fetch = _get_unique_vector_names_to_fetch(vector_names)
+    vectors_table, vector_metadata_list = await access.get_vectors_table_async(
+        vector_names=vector_names_to_fetch,
+        resampling_frequency=service_freq,
+        realizations=realizations,
+    )
+    vector_metadata_dict = dict(zip(vector_names_to_fetch, vector_metadata_list))
+    perf_metrics.record_lap("get-table")
+
+    ret_arr: list[schemas.VectorStatisticDataForVector] = []
+    for vector_name in vector_names:
+        vector_name_to_fetch = vector_name if not is_derived_vector(vector_name) else get_total_vector_name(vector_name)
+        statistic_data = await _create_api_vector_statistic_data_async(
+            vectors_table, vector_name, vector_metadata_dict[vector_name_to_fetch], service_stat_funcs_to_compute
+        )
+        ret_arr.append(schemas.VectorStatisticDataForVector(vectorName=vector_name, statisticData=statistic_data))
+    perf_metrics.record_lap("calc-stat")
+
+    LOGGER.info(
+        f"Loaded and computed statistical summary data for {len(vector_names)} vectors in: {perf_metrics.to_string()}"
+    )
+    return ret_arr
+
+
 @router.get("/delta_ensemble_statistical_vector_data/")
 @cache_time(CacheTime.LONG)
 # pylint: disable=too-many-arguments
@@ -447,7 +648,9 @@ async def get_delta_ensemble_statistical_vector_data(
     # Calculate statistics
     ret_data: schemas.VectorStatisticData | None = None
     if not is_vector_derived:
-        statistics = compute_vector_statistics(delta_vector_table_pa, vector_name, service_stat_funcs_to_compute)
+        statistics = await compute_vector_statistics_async(
+            delta_vector_table_pa, vector_name, service_stat_funcs_to_compute
+        )
 
         if not statistics:
             raise HTTPException(status_code=404, detail="Could not compute statistics")
@@ -461,7 +664,7 @@ async def get_delta_ensemble_statistical_vector_data(
         derived_vector_info = converters.to_api_derived_vector_info(derived_vector_type, vector_name_to_fetch)
 
         delta_derived_vector_table_pa = create_derived_vector_table_for_type(delta_vector_table_pa, derived_vector_type)
-        statistics = compute_vector_statistics(
+        statistics = await compute_vector_statistics_async(
             delta_derived_vector_table_pa, vector_name, service_stat_funcs_to_compute
         )
 
@@ -498,8 +701,9 @@ async def get_statistical_vector_data_per_sensitivity(
     if realizations_encoded_as_uint_list_str:
         realizations = decode_uint_list_str(realizations_encoded_as_uint_list_str)
 
+    ensemble_fp = await get_ensemble_fp_for_table_cache_async(authenticated_user, case_uuid, ensemble_name)
     summmary_access = SummaryAccess.from_ensemble_name(
-        authenticated_user.get_sumo_access_token(), case_uuid, ensemble_name
+        authenticated_user.get_sumo_access_token(), case_uuid, ensemble_name, ensemble_fp
     )
     parameter_access = ParameterAccess.from_ensemble_name(
         authenticated_user.get_sumo_access_token(), case_uuid, ensemble_name
@@ -515,24 +719,23 @@ async def get_statistical_vector_data_per_sensitivity(
     if not sensitivities:
         return ret_data
 
-    requested_realizations_mask = (
-        pc.is_in(vector_table["REAL"], value_set=pa.array(realizations)) if realizations else None
+    if realizations:
+        vector_table = vector_table.filter(pc.is_in(vector_table["REAL"], value_set=pa.array(realizations)))
+
+    # Statistics for all sensitivity cases are computed in a single grouped pass over the table
+    statistics_per_case = await compute_vector_statistics_per_sensitivity_case_async(
+        vector_table, vector_name, service_stat_funcs_to_compute, sensitivities
     )
+
     for sensitivity in sensitivities:
         for case in sensitivity.cases:
-            sens_case_realization_mask = pc.is_in(vector_table["REAL"], value_set=pa.array(case.realizations))
-            if requested_realizations_mask is not None:
-                sens_case_realization_mask = pc.and_(requested_realizations_mask, sens_case_realization_mask)
-            table = vector_table.filter(sens_case_realization_mask)
-
-            if table.num_rows == 0 and requested_realizations_mask is not None:
-                raise HTTPException(
-                    status_code=404,
-                    detail="The combination of realizations to include and sensitivity case realizations results in no valid realizations",
-                )
-
-            statistics = compute_vector_statistics(table, vector_name, service_stat_funcs_to_compute)
+            statistics = statistics_per_case.get((sensitivity.name, case.name))
             if not statistics:
+                if realizations:
+                    raise HTTPException(
+                        status_code=404,
+                        detail="The combination of realizations to include and sensitivity case realizations results in no valid realizations",
+                    )
                 raise HTTPException(status_code=404, detail="Could not compute statistics")
 
             statistic_data: schemas.VectorStatisticData = converters.to_api_vector_statistic_data(
@@ -551,6 +754,86 @@ async def get_statistical_vector_data_per_sensitivity(
     return ret_data
 
 
+def _get_unique_vector_names_to_fetch(vector_names: list[str]) -> list[str]:
+    """
+    Get the unique names of the vectors that must be fetched to provide the requested vectors, preserving order.
+    Derived vectors are computed from their total vector, so for those the total vector is fetched instead.
+    """
+    if not vector_names:
+        raise HTTPException(status_code=400, detail="At least one vector name must be specified")
+
+    vector_names_to_fetch: list[str] = []
+    for vector_name in vector_names:
+        vector_name_to_fetch = vector_name if not is_derived_vector(vector_name) else get_total_vector_name(vector_name)
+        if vector_name_to_fetch not in vector_names_to_fetch:
+            vector_names_to_fetch.append(vector_name_to_fetch)
+
+    return vector_names_to_fetch
+
+
+def _create_api_vector_realization_data_list(
+    vectors_table: pa.Table, vector_name: str, vector_metadata: VectorMetadata
+) -> list[schemas.VectorRealizationData]:
+    """
+    Create realization data for one (possibly derived) vector from a table holding multiple vector columns.
+    """
+    is_vector_derived = is_derived_vector(vector_name)
+    vector_name_to_fetch = vector_name if not is_vector_derived else get_total_vector_name(vector_name)
+    vector_table = vectors_table.select(["DATE", "REAL", vector_name_to_fetch])
+
+    if not is_vector_derived:
+        realization_vector_list = create_realization_vector_list(vector_table, vector_name_to_fetch, vector_metadata)
+        return converters.realization_vector_list_to_api_vector_realization_data_list(realization_vector_list)
+
+    derived_vector_type = get_derived_vector_type(vector_name)
+    derived_vector_unit = create_derived_vector_unit(vector_metadata.unit, derived_vector_type)
+    derived_vector_info = converters.to_api_derived_vector_info(derived_vector_type, vector_name_to_fetch)
+
+    derived_vector_table_pa = create_derived_vector_table_for_type(vector_table, derived_vector_type)
+    derived_realization_vector_list = create_derived_realization_vector_list(
+        derived_vector_table_pa, vector_name, vector_metadata.is_rate, derived_vector_unit
+    )
+    return converters.derived_vector_realizations_to_api_vector_realization_data_list(
+        derived_realization_vector_list, derived_vector_info
+    )
+
+
+async def _create_api_vector_statistic_data_async(
+    vectors_table: pa.Table,
+    vector_name: str,
+    vector_metadata: VectorMetadata,
+    service_stat_funcs_to_compute: list[StatisticFunction] | None,
+) -> schemas.VectorStatisticData:
+    """
+    Compute statistics for one (possibly derived) vector from a table holding multiple vector columns.
+    """
+    is_vector_derived = is_derived_vector(vector_name)
+    vector_name_to_fetch = vector_name if not is_vector_derived else get_total_vector_name(vector_name)
+    vector_table = vectors_table.select(["DATE", "REAL", vector_name_to_fetch])
+
+    if not is_vector_derived:
+        statistics = await compute_vector_statistics_async(vector_table, vector_name, service_stat_funcs_to_compute)
+        if not statistics:
+            raise HTTPException(status_code=404, detail=f"Could not compute statistics for {vector_name}")
+
+        return converters.to_api_vector_statistic_data(statistics, vector_metadata.is_rate, vector_metadata.unit)
+
+    derived_vector_type = get_derived_vector_type(vector_name)
+    derived_vector_unit = create_derived_vector_unit(vector_metadata.unit, derived_vector_type)
+    derived_vector_info = converters.to_api_derived_vector_info(derived_vector_type, vector_name_to_fetch)
+
+    derived_vector_table_pa = create_derived_vector_table_for_type(vector_table, derived_vector_type)
+    statistics = await compute_vector_statistics_async(
+        derived_vector_table_pa, vector_name, service_stat_funcs_to_compute
+    )
+    if not statistics:
+        raise HTTPException(status_code=404, detail=f"Could not compute statistics for {vector_name}")
+
+    return converters.to_api_vector_statistic_data(
+        statistics, vector_metadata.is_rate, derived_vector_unit, derived_vector_info
+    )
+
+
 def _create_vector_descriptions_for_derived_vectors(
     vector_names: list[str] | set[str],
 ) -> list[schemas.VectorDescription]:
@@ -601,12 +884,20 @@ async def _get_vector_tables_and_create_delta_vector_table_and_metadata_async(
     """
     Get vector tables for comparison and reference ensembles and create delta ensemble vector table and metadata
     """
+    comparison_ensemble_fp, reference_ensemble_fp = await asyncio.gather(
+        get_ensemble_fp_for_table_cache_async(authenticated_user, comparison_case_uuid, comparison_ensemble_name),
+        get_ensemble_fp_for_table_cache_async(authenticated_user, reference_case_uuid, reference_ensemble_name),
+    )
+
     # Separate summary access to comparison and reference ensemble
     comparison_ensemble_access = SummaryAccess.from_ensemble_name(
-        authenticated_user.get_sumo_access_token(), comparison_case_uuid, comparison_ensemble_name
+        authenticated_user.get_sumo_access_token(),
+        comparison_case_uuid,
+        comparison_ensemble_name,
+        comparison_ensemble_fp,
     )
     reference_ensemble_access = SummaryAccess.from_ensemble_name(
-        authenticated_user.get_sumo_access_token(), reference_case_uuid, reference_ensemble_name
+        authenticated_user.get_sumo_access_token(), reference_case_uuid, reference_ensemble_name, reference_ensemble_fp
     )
 
     # Get tables parallel
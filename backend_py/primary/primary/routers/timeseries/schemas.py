@@ -1,6 +1,7 @@
 from enum import StrEnum
 
 from pydantic import BaseModel
+from webviz_core_utils.b64 import B64FloatArray
 
 
 class Frequency(StrEnum):
@@ -53,6 +54,27 @@ class VectorRealizationData(BaseModel):
     derivedVectorInfo: DerivedVectorInfo | None = None
 
 
+class VectorRealizationsDataB64(BaseModel):
+    """
+    Compact representation of the data for all realizations of a vector, using base64 encoded typed arrays.
+
+    The values of all realizations are concatenated into values_b64arr (float32), ordered by realization, with
+    realizationRowCounts[i] values for realizations[i].
+    If timestampsAreShared is true, all realizations have the same timestamps and timestampsUtcMs_b64arr only holds the
+    timestamps of one realization. Otherwise it holds the timestamps of all the concatenated values.
+    The timestamps are encoded as float64, which represents millisecond timestamps exactly.
+    """
+
+    realizations: list[int]
+    realizationRowCounts: list[int]
+    timestampsAreShared: bool
+    timestampsUtcMs_b64arr: B64FloatArray
+    values_b64arr: B64FloatArray
+    unit: str
+    isRate: bool
+    derivedVectorInfo: DerivedVectorInfo | None = None
+
+
 class StatisticValueObject(BaseModel):
     statisticFunction: StatisticFunction
     values: list[float]
@@ -67,6 +89,16 @@ class VectorStatisticData(BaseModel):
     derivedVectorInfo: DerivedVectorInfo | None = None
 
 
+class VectorRealizationsDataForVector(BaseModel):
+    vectorName: str
+    realizationData: list[VectorRealizationData]
+
+
+class VectorStatisticDataForVector(BaseModel):
+    vectorName: str
+    statisticData: VectorStatisticData
+
+
 class VectorStatisticSensitivityData(BaseModel):
     realizations: list[int]
     timestampsUtcMs: list[int]
@@ -1,3 +1,6 @@
+import numpy as np
+from webviz_core_utils.b64 import b64_encode_float_array_as_float64
+
 from webviz_services.smda_access.types import (
     WellboreHeader,
     WellboreTrajectory,
@@ -467,3 +470,44 @@ def _get_sample_data_point_for_curve(curve_name: str, survey_sample: WellboreSur
         return survey_sample.dogleg_severity
 
     raise ValueError(f"Unrecognized survey geometry curve name, {curve_name}")
+
+
+def convert_log_curve_data_to_compact_schema(
+    curve_data: schemas.WellboreLogCurveData,
+) -> schemas.WellboreLogCurveDataCompact:
+    """Splits the data points of a curve into typed arrays"""
+
+    index_values = np.fromiter((point[0] for point in curve_data.dataPoints), dtype=np.float64)
+
+    curve_values = [point[1] for point in curve_data.dataPoints]
+    has_str_values = any(isinstance(value, str) for value in curve_values)
+
+    curve_values_b64arr = None
+    curve_values_str: list[str | None] | None = None
+    if has_str_values:
+        curve_values_str = [None if value is None else str(value) for value in curve_values]
+    else:
+        curve_values_np = np.fromiter(
+            (np.nan if value is None else value for value in curve_values), dtype=np.float64, count=len(curve_values)
+        )
+        curve_values_b64arr = b64_encode_float_array_as_float64(curve_values_np)
+
+    return schemas.WellboreLogCurveDataCompact(
+        source=curve_data.source,
+        name=curve_data.name,
+        logName=curve_data.logName,
+        indexMin=curve_data.indexMin,
+        indexMax=curve_data.indexMax,
+        minCurveValue=curve_data.minCurveValue,
+        maxCurveValue=curve_data.maxCurveValue,
+        curveAlias=curve_data.curveAlias,
+        curveDescription=curve_data.curveDescription,
+        indexUnit=curve_data.indexUnit,
+        noDataValue=curve_data.noDataValue,
+        unit=curve_data.unit,
+        curveUnitDesc=curve_data.curveUnitDesc,
+        indexValuesB64arr=b64_encode_float_array_as_float64(index_values),
+        curveValuesB64arr=curve_values_b64arr,
+        curveValuesStr=curve_values_str,
+        discreteValueMetadata=curve_data.discreteValueMetadata,
+    )
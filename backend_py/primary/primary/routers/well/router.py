@@ -1,19 +1,27 @@
+import asyncio
+import functools
 import logging
-from typing import List, Union
+from typing import Annotated, Any, Awaitable, Callable, List, TypeVar, Union, cast
 
-from fastapi import APIRouter, Depends, Query
+from fastapi import APIRouter, Body, Depends, Query, Response
 
 from webviz_services.smda_access.drogon import DrogonSmdaAccess
 from webviz_services.smda_access import SmdaAccess
 from webviz_services.smda_access import GeologyAccess as SmdaGeologyAccess
-from webviz_services.service_exceptions import NoDataError, Service
+from webviz_services.service_exceptions import NoDataError, Service, ServiceLayerException
 from webviz_services.ssdl_access.well_access import WellAccess as SsdlWellAccess
+from webviz_services.ssdl_access.reference_data_cache import get_field_uuid_async as get_ssdl_field_uuid_async
+from webviz_services.ssdl_access.reference_data_cache import (
+    warm_reference_data_in_background as warm_ssdl_reference_data_in_background,
+)
 from webviz_services.ssdl_access.drogon import DrogonWellAccess
 from webviz_services.utils.authenticated_user import AuthenticatedUser
 
 from primary.auth.auth_helper import AuthHelper
-from primary.middleware.cache_control_middleware import cache_time, custom_cache_time, CacheTime
+from primary.middleware.cache_control_middleware import cache_time, custom_cache_time, set_cache_time, CacheTime
 from primary.utils.drogon import is_drogon_identifier
+from primary.utils.fan_out import fan_out_async
+from primary.utils.response_perf_metrics import ResponsePerfMetrics
 
 from . import schemas
 from . import converters
@@ -22,6 +30,18 @@ LOGGER = logging.getLogger(__name__)
 
 router = APIRouter()
 
+# Per-source timeout when fetching log curve headers from multiple sources
+_LOG_CURVE_HEADER_SOURCE_TIMEOUT_S = 20
+
+# Response header listing the sources that failed (or timed out) when only partial log curve headers are returned
+_FAILED_SOURCES_HEADER = "x-failed-sources"
+
+# Max number of curves that are fetched concurrently from the upstream services in a batch request
+_MAX_CONCURRENT_LOG_CURVE_FETCHES = 8
+_MAX_LOG_CURVE_BATCH_SIZE = 200
+
+T = TypeVar("T")
+
 
 @router.get("/drilled_wellbore_headers/")
 @cache_time(CacheTime.NORMAL)
@@ -40,6 +60,10 @@ async def get_drilled_wellbore_headers(
     else:
         well_access = SmdaAccess(authenticated_user.get_smda_access_token())
 
+        # Field level SSDL requests for this field are likely to follow, warm the lookup of field uuids
+        if authenticated_user.has_ssdl_access_token():
+            warm_ssdl_reference_data_in_background(authenticated_user.get_ssdl_access_token())
+
     wellbore_headers = await well_access.get_wellbore_headers_async(field_identifier)
 
     return [converters.convert_wellbore_header_to_schema(wellbore_header) for wellbore_header in wellbore_headers]
@@ -58,8 +82,7 @@ async def get_field_perforations(
         # Only fetch completions for non-DROGON fields
     well_access_ssdl = SsdlWellAccess(authenticated_user.get_ssdl_access_token())
 
-    fields_info = await well_access_ssdl.get_fields_async()
-    field_uuid = next((field.field_uuid for field in fields_info if field.field_identifier == field_identifier), None)
+    field_uuid = await get_ssdl_field_uuid_async(authenticated_user.get_ssdl_access_token(), field_identifier)
 
     if not field_uuid:
         raise NoDataError(f"Field not found: {field_identifier}", Service.SSDL)
@@ -81,8 +104,7 @@ async def get_field_screens(
         # Only fetch screens for non-DROGON fields
     well_access_ssdl = SsdlWellAccess(authenticated_user.get_ssdl_access_token())
 
-    fields_info = await well_access_ssdl.get_fields_async()
-    field_uuid = next((field.field_uuid for field in fields_info if field.field_identifier == field_identifier), None)
+    field_uuid = await get_ssdl_field_uuid_async(authenticated_user.get_ssdl_access_token(), field_identifier)
 
     if not field_uuid:
         raise NoDataError(f"Field not found: {field_identifier}", Service.SSDL)
@@ -286,9 +308,9 @@ async def get_wellbore_perforations(
 
 
 @router.get("/wellbore_log_curve_headers/")
-@cache_time(CacheTime.NORMAL)
 async def get_wellbore_log_curve_headers(
     # fmt:off
+    response: Response,
     authenticated_user: AuthenticatedUser = Depends(AuthHelper.get_authenticated_user),
     wellbore_uuid: str = Query(description="Wellbore uuid"),
     sources: List[schemas.WellLogCurveSourceEnum] = Query(
@@ -300,25 +322,57 @@ async def get_wellbore_log_curve_headers(
     """
     Get all log curve headers for a single well bore.
     Logs are available from multiple sources, which can be specificed by the "sources" parameter.
-    """
 
-    curve_headers = []
+    The sources are queried concurrently. If some, but not all, of the sources fail, the headers from the
+    successful sources are returned, and the failed sources are listed in the "x-failed-sources" response header.
+    Each entry is a source value with the reason for the failure, e.g. "smda.survey; reason=timeout".
+    """
+    perf_metrics = ResponsePerfMetrics(response)
+
+    header_getters = {
+        schemas.WellLogCurveSourceEnum.SSDL_WELL_LOG: _get_headers_from_ssdl_well_log_async,
+        schemas.WellLogCurveSourceEnum.SMDA_GEOLOGY: _get_headers_from_smda_geology_async,
+        schemas.WellLogCurveSourceEnum.SMDA_STRATIGRAPHY: _get_headers_from_smda_stratigraghpy_async,
+        schemas.WellLogCurveSourceEnum.SMDA_SURVEY: _get_headers_from_smda_survey_async,
+    }
+
+    # Keep the order of the sources in the response stable, regardless of which source finishes first
+    selected_sources = [source for source in header_getters if source in sources]
+    fan_out_result = await fan_out_async(
+        {
+            source.value: functools.partial(header_getters[source], authenticated_user, wellbore_uuid)
+            for source in selected_sources
+        },
+        timeout_s=_LOG_CURVE_HEADER_SOURCE_TIMEOUT_S,
+        metrics_sink=perf_metrics,
+    )
 
-    if schemas.WellLogCurveSourceEnum.SSDL_WELL_LOG in sources:
-        curve_headers += await _get_headers_from_ssdl_well_log_async(authenticated_user, wellbore_uuid)
+    if selected_sources and len(fan_out_result.errors) == len(selected_sources):
+        raise next(iter(fan_out_result.errors.values()))
 
-    if schemas.WellLogCurveSourceEnum.SMDA_GEOLOGY in sources:
-        curve_headers += await _get_headers_from_smda_geology_async(authenticated_user, wellbore_uuid)
+    # Partial results should not be cached by the browser
+    if fan_out_result.all_succeeded():
+        set_cache_time(CacheTime.NORMAL)
+    else:
+        response.headers[_FAILED_SOURCES_HEADER] = _make_failed_sources_header_value(fan_out_result.errors)
 
-    if schemas.WellLogCurveSourceEnum.SMDA_STRATIGRAPHY in sources:
-        curve_headers += await _get_headers_from_smda_stratigraghpy_async(authenticated_user, wellbore_uuid)
+    curve_headers: list[schemas.WellboreLogCurveHeader] = []
+    for source in selected_sources:
+        curve_headers += fan_out_result.results.get(source.value, [])
 
-    if schemas.WellLogCurveSourceEnum.SMDA_SURVEY in sources:
-        curve_headers += await _get_headers_from_smda_survey_async(authenticated_user, wellbore_uuid)
+    LOGGER.debug(f"Got log curve headers for {wellbore_uuid=} in: {perf_metrics.to_string()}")
 
     return curve_headers
 
 
+def _make_failed_sources_header_value(errors: dict[str, Exception]) -> str:
+    entries: list[str] = []
+    for source_name, exc in sorted(errors.items()):
+        reason = "timeout" if isinstance(exc, TimeoutError) else "error"
+        entries.append(f"{source_name}; reason={reason}")
+    return ", ".join(entries)
+
+
 async def _get_headers_from_ssdl_well_log_async(
     authenticated_user: AuthenticatedUser, wellbore_uuid: str
 ) -> list[schemas.WellboreLogCurveHeader]:
@@ -390,6 +444,104 @@ async def get_log_curve_data(
 ) -> schemas.WellboreLogCurveData:
     """Get log curve data"""
 
+    request_item = schemas.WellboreLogCurveDataRequestItem(
+        wellboreUuid=wellbore_uuid, source=source, curveName=curve_name, logName=log_name
+    )
+    return await _get_log_curve_data_async(authenticated_user, request_item, _SharedLookups())
+
+
+@router.post("/log_curve_data_batch/")
+async def post_log_curve_data_batch(
+    # fmt:off
+    response: Response,
+    authenticated_user: Annotated[AuthenticatedUser, Depends(AuthHelper.get_authenticated_user)],
+    request_items: Annotated[list[schemas.WellboreLogCurveDataRequestItem], Body(embed=True, max_length=_MAX_LOG_CURVE_BATCH_SIZE, description="Curves to fetch")],
+    # fmt:on
+) -> list[schemas.WellboreLogCurveDataBatchItem]:
+    """
+    Get log curve data for multiple curves, possibly from different wellbores and sources, in one request.
+
+    Lookups that are shared between curves, such as the geology or survey headers of a wellbore, are only done once.
+    The returned list matches the order of the request items, and a curve that could not be fetched is returned
+    with an error message instead of failing the whole request.
+    """
+    perf_metrics = ResponsePerfMetrics(response)
+
+    shared_lookups = _SharedLookups()
+    semaphore = asyncio.Semaphore(_MAX_CONCURRENT_LOG_CURVE_FETCHES)
+
+    async def fetch_item_async(
+        request_item: schemas.WellboreLogCurveDataRequestItem,
+    ) -> schemas.WellboreLogCurveDataBatchItem:
+        try:
+            async with semaphore:
+                curve_data = await _get_log_curve_data_async(authenticated_user, request_item, shared_lookups)
+        except Exception as exc:  # pylint: disable=broad-exception-caught
+            LOGGER.warning(f"Failed to get log curve data for {request_item=}: {exc!r}")
+            return schemas.WellboreLogCurveDataBatchItem(
+                request=request_item, curveData=None, errorMessage=_make_batch_item_error_message(exc)
+            )
+
+        compact_curve_data = converters.convert_log_curve_data_to_compact_schema(curve_data)
+        return schemas.WellboreLogCurveDataBatchItem(
+            request=request_item, curveData=compact_curve_data, errorMessage=None
+        )
+
+    # Identical request items share a single fetch. They are deduplicated up front, so that duplicates do not
+    # occupy slots of the semaphore while waiting for the same fetch
+    unique_request_items: dict[tuple, schemas.WellboreLogCurveDataRequestItem] = {}
+    for request_item in request_items:
+        unique_request_items.setdefault(_make_request_item_key(request_item), request_item)
+
+    fetched_items = await asyncio.gather(*(fetch_item_async(item) for item in unique_request_items.values()))
+    fetched_item_by_key = dict(zip(unique_request_items, fetched_items))
+    batch_items = [fetched_item_by_key[_make_request_item_key(item)] for item in request_items]
+    perf_metrics.record_lap("fetch-curves")
+
+    LOGGER.debug(f"Got {len(batch_items)} log curves in: {perf_metrics.to_string()}")
+
+    return batch_items
+
+
+def _make_request_item_key(request_item: schemas.WellboreLogCurveDataRequestItem) -> tuple:
+    return (request_item.wellboreUuid, request_item.source, request_item.curveName, request_item.logName)
+
+
+def _make_batch_item_error_message(exc: Exception) -> str:
+    # Only expose the message of service layer exceptions, other exceptions may contain internal details
+    if isinstance(exc, ServiceLayerException):
+        return exc.message
+    return "Failed to get log curve data"
+
+
+class _SharedLookups:
+    """
+    Memoizes upstream lookups by key within a single request, so that concurrent fetches of different curves share
+    lookups such as the headers of a wellbore. Failures are memoized as well.
+    """
+
+    def __init__(self) -> None:
+        self._futures: dict[tuple, asyncio.Future[Any]] = {}
+
+    async def get_or_run_async(self, key: tuple, factory: Callable[[], Awaitable[T]]) -> T:
+        future = self._futures.get(key)
+        if future is None:
+            future = asyncio.ensure_future(factory())
+            self._futures[key] = future
+
+        return cast(T, await future)
+
+
+async def _get_log_curve_data_async(
+    authenticated_user: AuthenticatedUser,
+    request_item: schemas.WellboreLogCurveDataRequestItem,
+    shared_lookups: _SharedLookups,
+) -> schemas.WellboreLogCurveData:
+    wellbore_uuid = request_item.wellboreUuid
+    curve_name = request_item.curveName
+    log_name = request_item.logName
+    source = request_item.source
+
     # Handle DROGON
     if is_drogon_identifier(wellbore_uuid=wellbore_uuid):
         well_access_drogon = DrogonWellAccess(authenticated_user.get_ssdl_access_token())
@@ -408,7 +560,9 @@ async def get_log_curve_data(
 
         geol_access = SmdaGeologyAccess(authenticated_user.get_smda_access_token())
 
-        geo_headers = await geol_access.get_wellbore_geology_headers_async(wellbore_uuid)
+        geo_headers = await shared_lookups.get_or_run_async(
+            ("geology_headers", wellbore_uuid), lambda: geol_access.get_wellbore_geology_headers_async(wellbore_uuid)
+        )
         geo_headers = [h for h in geo_headers if h.identifier == curve_name and h.interpreter == log_name]
 
         if not geo_headers:
@@ -433,14 +587,18 @@ async def get_log_curve_data(
         smda_access = SmdaAccess(authenticated_user.get_smda_access_token())
 
         # Header needed again to get curve units, and the correct samples (incase there's multiple surveys)
-        survey_headers = await smda_access.get_survey_headers_for_wellbore_async(wellbore_uuid)
+        survey_headers = await shared_lookups.get_or_run_async(
+            ("survey_headers", wellbore_uuid), lambda: smda_access.get_survey_headers_for_wellbore_async(wellbore_uuid)
+        )
         # As mentioned in the header endpoint, we assume there's only one
         survey_header = survey_headers[0]
         if not survey_header:
             raise ValueError(f"Could not find survey header for {log_name}")
 
-        survey_samples = await smda_access.get_survey_samples_for_wellbore_async(
-            wellbore_uuid, survey_header.survey_identifier
+        # All curves of a survey come from the same samples
+        survey_samples = await shared_lookups.get_or_run_async(
+            ("survey_samples", wellbore_uuid, survey_header.survey_identifier),
+            lambda: smda_access.get_survey_samples_for_wellbore_async(wellbore_uuid, survey_header.survey_identifier),
         )
 
         return converters.convert_survey_sample_to_log_curve_schemas(survey_samples, survey_header, curve_name)
@@ -2,6 +2,8 @@ from enum import Enum
 from typing import List, Optional, TypeAlias
 from pydantic import BaseModel
 
+from webviz_core_utils.b64 import B64FloatArray
+
 
 class WellboreHeader(BaseModel):
     wellboreUuid: str
@@ -173,3 +175,47 @@ class WellboreLogCurveData(BaseModel):
     curveUnitDesc: str | None
     dataPoints: list[tuple[float, float | str | None]]
     discreteValueMetadata: list[DiscreteValueMetadata] | None
+
+
+class WellboreLogCurveDataRequestItem(BaseModel):
+    wellboreUuid: str
+    source: WellLogCurveSourceEnum
+    curveName: str
+    logName: str
+
+
+class WellboreLogCurveDataCompact(BaseModel):
+    """
+    Same as WellboreLogCurveData, but with the data points split into typed arrays.
+
+    The curve values are given as float64 with NaN for missing values, except for curves with string values,
+    in which case they are given in curveValuesStr instead.
+    """
+
+    source: WellLogCurveSourceEnum
+    name: str
+    logName: str
+    indexMin: float
+    indexMax: float
+    minCurveValue: float | None
+    maxCurveValue: float | None
+    curveAlias: str | None
+    curveDescription: str | None
+    indexUnit: str
+    noDataValue: float | None
+    unit: str | None
+    curveUnitDesc: str | None
+    indexValuesB64arr: B64FloatArray
+    curveValuesB64arr: B64FloatArray | None
+    curveValuesStr: list[str | None] | None
+    discreteValueMetadata: list[DiscreteValueMetadata] | None
+
+
+class WellboreLogCurveDataBatchItem(BaseModel):
+    """
+    Result for one requested curve in a batch, holds either the curve data or an error message
+    """
+
+    request: WellboreLogCurveDataRequestItem
+    curveData: WellboreLogCurveDataCompact | None
+    errorMessage: str | None
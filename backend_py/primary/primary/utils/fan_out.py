@@ -0,0 +1,60 @@
+import asyncio
+import logging
+from dataclasses import dataclass
+from typing import Awaitable, Callable, Generic, Mapping, TypeVar
+
+from webviz_core_utils.cpu_executors import MetricsSink
+from webviz_core_utils.perf_timer import PerfTimer
+
+T = TypeVar("T")
+
+LOGGER = logging.getLogger(__name__)
+
+
+@dataclass(frozen=True, kw_only=True)
+class FanOutResult(Generic[T]):
+    """
+    Outcome of a fan-out, with the results and errors keyed by source name.
+    A source that timed out has a TimeoutError in errors.
+    """
+
+    results: dict[str, T]
+    errors: dict[str, Exception]
+    durations_ms: dict[str, int]
+
+    def all_succeeded(self) -> bool:
+        return not self.errors
+
+
+async def fan_out_async(
+    source_factories: Mapping[str, Callable[[], Awaitable[T]]],
+    timeout_s: float | None,
+    metrics_sink: MetricsSink | None = None,
+) -> FanOutResult[T]:
+    """
+    Run the given sources concurrently, each one bounded by timeout_s, and collect whatever results are available.
+
+    A failing or timed out source does not affect the others, its exception is returned in the errors of the result
+    instead. The duration of each source is recorded in the (optional) metrics sink using the source name as metric
+    name, e.g. so that the timings of all sources show up in the Server-Timing header of a response.
+    """
+    results: dict[str, T] = {}
+    errors: dict[str, Exception] = {}
+    durations_ms: dict[str, int] = {}
+
+    async def run_source_async(source_name: str, factory: Callable[[], Awaitable[T]]) -> None:
+        timer = PerfTimer()
+        try:
+            async with asyncio.timeout(timeout_s):
+                results[source_name] = await factory()
+        except Exception as exc:  # pylint: disable=broad-exception-caught
+            LOGGER.warning(f"Fan-out source '{source_name}' failed after {timer.elapsed_ms()}ms: {exc!r}")
+            errors[source_name] = exc
+
+        durations_ms[source_name] = timer.elapsed_ms()
+        if metrics_sink is not None:
+            metrics_sink.set_metric(source_name, durations_ms[source_name])
+
+    await asyncio.gather(*(run_source_async(name, factory) for name, factory in source_factories.items()))
+
+    return FanOutResult(results=results, errors=errors, durations_ms=durations_ms)
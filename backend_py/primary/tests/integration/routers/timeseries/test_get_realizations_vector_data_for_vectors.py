@@ -0,0 +1,43 @@
+# pylint: disable=async-suffix
+
+import numpy as np
+
+from primary.routers.timeseries import router
+from primary.routers.timeseries import schemas
+from tests.integration.conftest import SumoTestEnsemble
+
+
+async def test_get_realizations_vector_data_for_vectors_matches_single_vector(
+    test_user: router.AuthenticatedUser,
+    sumo_test_ensemble_ahm: SumoTestEnsemble,
+) -> None:
+
+    vector_names = ["FOPT", "FOPR", "FGPT"]
+    batch_data = await router.get_realizations_vector_data_for_vectors(
+        None,  # type: ignore
+        test_user,
+        sumo_test_ensemble_ahm.case_uuid,
+        sumo_test_ensemble_ahm.ensemble_name,
+        vector_names,
+        schemas.Frequency.YEARLY,
+    )
+
+    assert [item.vectorName for item in batch_data] == vector_names
+
+    for item in batch_data:
+        single_data = await router.get_realizations_vector_data(
+            None,  # type: ignore
+            test_user,
+            sumo_test_ensemble_ahm.case_uuid,
+            sumo_test_ensemble_ahm.ensemble_name,
+            item.vectorName,
+            schemas.Frequency.YEARLY,
+        )
+
+        assert len(item.realizationData) == len(single_data)
+        for batch_real, single_real in zip(item.realizationData, single_data):
+            assert batch_real.realization == single_real.realization
+            assert batch_real.timestampsUtcMs == single_real.timestampsUtcMs
+            assert np.allclose(batch_real.values, single_real.values)
+            assert batch_real.unit == single_real.unit
+            assert batch_real.isRate == single_real.isRate
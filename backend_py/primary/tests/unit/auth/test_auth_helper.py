@@ -0,0 +1,184 @@
+# pylint: disable=async-suffix, protected-access
+
+from typing import Any, Iterator
+
+import pytest
+from starlette.requests import Request
+from starlette.types import Message, Receive, Scope, Send
+from webviz_core_utils import bounded_lru_cache
+
+from primary.auth import auth_helper
+from primary.auth.auth_helper import AuthHelper, _TokenEntry, _UserAuthInfo
+from primary.auth.enforce_logged_in_middleware import EnforceLoggedInMiddleware
+from primary.routers.general import post_logout
+
+_NOW = 1_700_000_000.0
+
+
+class _FakeClock:
+    def __init__(self) -> None:
+        self.now = _NOW
+
+    def time(self) -> float:
+        return self.now
+
+    def monotonic(self) -> float:
+        return self.now
+
+
+class _FakeSessionHandler:
+    def __init__(self, session_id: str) -> None:
+        self.session_id = session_id
+        self.is_loaded = False
+        self.num_loads = 0
+
+    async def load(self) -> None:
+        self.num_loads += 1
+        self.is_loaded = True
+
+
+class _FakeConfidentialClientApp:
+    def initiate_auth_code_flow(self, **_kwargs: Any) -> dict:
+        return {"auth_uri": "https://login.example.com"}
+
+    def acquire_token_by_auth_code_flow(self, **_kwargs: Any) -> dict:
+        return {"error": "invalid_grant"}
+
+
+@pytest.fixture(name="clock")
+def fixture_clock(monkeypatch: pytest.MonkeyPatch) -> Iterator[_FakeClock]:
+    clock = _FakeClock()
+    monkeypatch.setattr(auth_helper, "time", clock)
+    monkeypatch.setattr(bounded_lru_cache, "time", clock)
+    monkeypatch.setattr(
+        auth_helper, "_create_msal_confidential_client_app", lambda token_cache: _FakeConfidentialClientApp()
+    )
+
+    auth_helper._USER_AUTH_CACHE.clear()
+    yield clock
+    auth_helper._USER_AUTH_CACHE.clear()
+
+
+def _make_request(session_id: str = "session_id", session_data: dict | None = None) -> Request:
+    scope = {
+        "type": "http",
+        "method": "GET",
+        "path": "/alive_protected",
+        "root_path": "",
+        "query_string": b"",
+        "headers": [],
+        "session": session_data if session_data is not None else {},
+        "session_handler": _FakeSessionHandler(session_id),
+    }
+    return Request(scope)
+
+
+def _make_user_auth_info(earliest_expiry_time: float) -> _UserAuthInfo:
+    return _UserAuthInfo(
+        user_id="user_id",
+        user_name="user@equinor.com",
+        user_identity_expires_at=int(earliest_expiry_time),
+        access_tokens={"sumo": _TokenEntry(token="sumo_token", expires_at=int(earliest_expiry_time))},
+        earliest_expiry_time=int(earliest_expiry_time),
+    )
+
+
+def _put_in_cache(request: Request, earliest_expiry_time: float) -> None:
+    user_auth_info = _make_user_auth_info(earliest_expiry_time)
+    auth_helper._put_in_user_auth_cache(request, user_auth_info, user_auth_info.to_authenticated_user())
+
+
+def test_cached_user_expires_when_auth_info_needs_refresh(clock: _FakeClock) -> None:
+    # Tokens expire in 8 minutes, so the entry must be dropped 5 minutes before that
+    _put_in_cache(_make_request(), _NOW + 8 * 60)
+
+    clock.now = _NOW + 3 * 60 - 1
+    cached_user = AuthHelper.get_cached_authenticated_user(_make_request())
+    assert cached_user is not None
+    assert cached_user.get_sumo_access_token() == "sumo_token"
+
+    clock.now = _NOW + 3 * 60 + 1
+    assert AuthHelper.get_cached_authenticated_user(_make_request()) is None
+
+
+def test_cached_user_time_to_live_is_capped(clock: _FakeClock) -> None:
+    _put_in_cache(_make_request(), _NOW + 60 * 60)
+
+    clock.now = _NOW + 10 * 60 - 1
+    assert AuthHelper.get_cached_authenticated_user(_make_request()) is not None
+
+    clock.now = _NOW + 10 * 60 + 1
+    assert AuthHelper.get_cached_authenticated_user(_make_request()) is None
+
+
+def test_auth_info_about_to_expire_is_not_cached(clock: _FakeClock) -> None:
+    # pylint: disable=unused-argument
+    _put_in_cache(_make_request(), _NOW + 4 * 60)
+    assert AuthHelper.get_cached_authenticated_user(_make_request()) is None
+
+
+def test_cached_user_is_scoped_to_session(clock: _FakeClock) -> None:
+    # pylint: disable=unused-argument
+    _put_in_cache(_make_request("session_a"), _NOW + 60 * 60)
+
+    assert AuthHelper.get_cached_authenticated_user(_make_request("session_a")) is not None
+    assert AuthHelper.get_cached_authenticated_user(_make_request("session_b")) is None
+
+
+async def test_logout_invalidates_cached_user(clock: _FakeClock) -> None:
+    # pylint: disable=unused-argument
+    _put_in_cache(_make_request(), _NOW + 60 * 60)
+
+    await post_logout(_make_request())
+
+    assert AuthHelper.get_cached_authenticated_user(_make_request()) is None
+
+
+async def test_login_invalidates_cached_user(clock: _FakeClock, monkeypatch: pytest.MonkeyPatch) -> None:
+    # pylint: disable=unused-argument
+    # Avoids the need for a router to build the redirect uri
+    monkeypatch.setenv("CODESPACE_NAME", "codespace")
+    _put_in_cache(_make_request(), _NOW + 60 * 60)
+
+    await AuthHelper()._login_route(_make_request())
+
+    assert AuthHelper.get_cached_authenticated_user(_make_request()) is None
+
+
+async def test_auth_callback_invalidates_cached_user(clock: _FakeClock) -> None:
+    # pylint: disable=unused-argument
+    _put_in_cache(_make_request(), _NOW + 60 * 60)
+
+    response = await AuthHelper()._authorized_callback_route(_make_request())
+
+    assert response.status_code == 400
+    assert AuthHelper.get_cached_authenticated_user(_make_request()) is None
+
+
+async def test_middleware_only_loads_session_when_user_is_not_cached(clock: _FakeClock) -> None:
+    # pylint: disable=unused-argument
+    num_app_calls = 0
+
+    async def app(_scope: Scope, _receive: Receive, _send: Send) -> None:
+        nonlocal num_app_calls
+        num_app_calls += 1
+
+    async def receive() -> Message:
+        return {"type": "http.request"}
+
+    async def send(_message: Message) -> None:
+        pass
+
+    middleware = EnforceLoggedInMiddleware(app)
+    session_data = {"user_auth_info": _make_user_auth_info(_NOW + 60 * 60).model_dump_json()}
+
+    # First request must go to the session store, after which the user is cached for the session
+    first_request = _make_request(session_data=session_data)
+    await middleware(first_request.scope, receive, send)
+    assert first_request.scope["session_handler"].num_loads == 1
+
+    second_request = _make_request(session_data=session_data)
+    await middleware(second_request.scope, receive, send)
+    assert second_request.scope["session_handler"].num_loads == 0
+
+    assert num_app_calls == 2
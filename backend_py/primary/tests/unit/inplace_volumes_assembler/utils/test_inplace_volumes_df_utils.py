@@ -6,7 +6,7 @@ from webviz_services.sumo_access.inplace_volumes_table_types import InplaceVolum
 from webviz_services.inplace_volumes_table_assembler._utils.inplace_volumes_df_utils import (
     create_inplace_volumes_df_per_unique_fluid_value,
     remove_invalid_optional_index_columns,
-    sum_inplace_volumes_grouped_by_indices_and_real_df,
+    sum_inplace_volumes_grouped_by_indices_and_real_lf,
     validate_inplace_volumes_df_selector_columns,
 )
 
@@ -51,7 +51,7 @@ def test_validate_inplace_volumes_df_selector_columns_missing_real_column() -> N
     assert "The 'REAL' column is missing" in str(excinfo.value)
 
 
-def test_sum_inplace_volumes_grouped_by_indices_and_real_df_with_group_by() -> None:
+def test_sum_inplace_volumes_grouped_by_indices_and_real_lf_with_group_by() -> None:
 
     # Create test data
     input_df = pl.DataFrame(
@@ -66,7 +66,9 @@ def test_sum_inplace_volumes_grouped_by_indices_and_real_df_with_group_by() -> N
     )
 
     # Test grouping by ZONE
-    result_df = sum_inplace_volumes_grouped_by_indices_and_real_df(input_df, [InplaceVolumes.TableIndexColumns.ZONE])
+    result_df = sum_inplace_volumes_grouped_by_indices_and_real_lf(
+        input_df.lazy(), [InplaceVolumes.TableIndexColumns.ZONE]
+    ).collect()
 
     # Define expected DataFrame
     expected_df = pl.DataFrame(
@@ -85,7 +87,7 @@ def test_sum_inplace_volumes_grouped_by_indices_and_real_df_with_group_by() -> N
     assert expected_df.equals(result_df.sort(["ZONE", "REAL"]))
 
 
-def test_sum_inplace_volumes_grouped_by_indices_and_real_df_with_multiple_indices() -> None:
+def test_sum_inplace_volumes_grouped_by_indices_and_real_lf_with_multiple_indices() -> None:
 
     # Create test data
     input_df = pl.DataFrame(
@@ -100,9 +102,9 @@ def test_sum_inplace_volumes_grouped_by_indices_and_real_df_with_multiple_indice
     )
 
     # Test grouping by multiple indices
-    result_df = sum_inplace_volumes_grouped_by_indices_and_real_df(
-        input_df, [InplaceVolumes.TableIndexColumns.FLUID, InplaceVolumes.TableIndexColumns.REGION]
-    )
+    result_df = sum_inplace_volumes_grouped_by_indices_and_real_lf(
+        input_df.lazy(), [InplaceVolumes.TableIndexColumns.FLUID, InplaceVolumes.TableIndexColumns.REGION]
+    ).collect()
 
     # Define expected DataFrame
     expected_df = pl.DataFrame(
@@ -122,7 +124,7 @@ def test_sum_inplace_volumes_grouped_by_indices_and_real_df_with_multiple_indice
     assert expected_df.equals(result_df)
 
 
-def test_sum_inplace_volumes_grouped_by_indices_and_real_df_without_group_by() -> None:
+def test_sum_inplace_volumes_grouped_by_indices_and_real_lf_without_group_by() -> None:
 
     # Create test data
     input_df = pl.DataFrame(
@@ -135,7 +137,7 @@ def test_sum_inplace_volumes_grouped_by_indices_and_real_df_without_group_by() -
     )
 
     # Test with no grouping indices (only by REAL)
-    result_df = sum_inplace_volumes_grouped_by_indices_and_real_df(input_df, None)
+    result_df = sum_inplace_volumes_grouped_by_indices_and_real_lf(input_df.lazy(), None).collect()
 
     # Define expected DataFrame
     expected_df = pl.DataFrame({"REAL": [1, 2], "STOIIP": [150, 270], "GIIP": [110, 220]})
@@ -144,14 +146,14 @@ def test_sum_inplace_volumes_grouped_by_indices_and_real_df_without_group_by() -
     assert expected_df.equals(result_df.sort("REAL"))
 
 
-def test_sum_inplace_volumes_grouped_by_indices_and_real_df_missing_columns() -> None:
+def test_sum_inplace_volumes_grouped_by_indices_and_real_lf_missing_columns() -> None:
 
     # Create test data with missing REAL column
     input_df = pl.DataFrame({"FLUID": ["oil", "gas"], "ZONE": ["A", "B"], "STOIIP": [100, 50]})
 
     # Test with missing required column
     with pytest.raises(ValueError) as excinfo:
-        sum_inplace_volumes_grouped_by_indices_and_real_df(input_df, [InplaceVolumes.TableIndexColumns.ZONE])
+        sum_inplace_volumes_grouped_by_indices_and_real_lf(input_df.lazy(), [InplaceVolumes.TableIndexColumns.ZONE])
 
     assert "Missing required selector columns" in str(excinfo.value)
     assert "REAL" in str(excinfo.value)
@@ -0,0 +1,114 @@
+# pylint: disable=async-suffix
+
+from typing import Any
+
+import pytest
+from webviz_core_utils.b64 import b64_encode_float_array_as_float32
+
+from primary.routers.surface import router as surface_router
+from primary.routers.surface import schemas
+from primary.routers.surface.surface_address import RealizationSurfaceAddress
+from primary.routers.surface.surface_response_cache import SurfaceResponseCache, make_surface_response_cache_key
+
+_SURFACE_DEF = schemas.SurfaceDef(
+    npoints_x=3, npoints_y=2, inc_x=25.0, inc_y=25.0, origin_utm_x=1000.5, origin_utm_y=2000.25, rot_deg=30.0
+)
+
+
+def _make_float_response(num_values: int) -> schemas.SurfaceDataFloat:
+    return schemas.SurfaceDataFloat(
+        surface_def=_SURFACE_DEF,
+        transformed_bbox_utm=schemas.BoundingBox2d(min_x=0, min_y=0, max_x=1, max_y=1),
+        value_min=0,
+        value_max=1,
+        values_b64arr=b64_encode_float_array_as_float32([0.5] * num_values),
+    )
+
+
+def test_cache_key_is_composed_of_surface_key_format_and_resample_target() -> None:
+    assert make_surface_response_cache_key("addr::fp", "float", None) == "addr::fp::float::none"
+    assert (
+        make_surface_response_cache_key("addr::fp", "png", _SURFACE_DEF)
+        == "addr::fp::png::3:2:25.0:25.0:1000.5:2000.25:30.0"
+    )
+
+
+def test_cache_key_differs_for_every_part() -> None:
+    other_surface_def = _SURFACE_DEF.model_copy(update={"rot_deg": 30.000001})
+    keys = {
+        make_surface_response_cache_key("addr::fp", "float", None),
+        make_surface_response_cache_key("addr::other_fp", "float", None),
+        make_surface_response_cache_key("addr::fp", "png", None),
+        make_surface_response_cache_key("addr::fp", "float", _SURFACE_DEF),
+        make_surface_response_cache_key("addr::fp", "float", other_surface_def),
+    }
+    assert len(keys) == 5
+
+
+def test_cache_hit_and_miss() -> None:
+    cache = SurfaceResponseCache(max_size_bytes=1024 * 1024)
+    response = _make_float_response(10)
+
+    assert cache.get("key") is None
+    cache.put("key", response)
+    assert cache.get("key") is response
+
+    stats = cache.get_stats()
+    assert (stats.hits, stats.misses) == (1, 1)
+
+
+def test_cache_evicts_least_recently_used_when_over_size_budget() -> None:
+    response = _make_float_response(100)
+    response_size = len(response.values_b64arr.data_b64str)
+    cache = SurfaceResponseCache(max_size_bytes=2 * response_size)
+
+    cache.put("first", response)
+    cache.put("second", response)
+    assert cache.get("first") is response
+
+    cache.put("third", response)
+    assert cache.get("second") is None
+    assert cache.get("first") is response
+    assert cache.get("third") is response
+    assert cache.get_stats().size_bytes == 2 * response_size
+
+
+def test_response_larger_than_budget_is_not_cached() -> None:
+    response = _make_float_response(100)
+    cache = SurfaceResponseCache(max_size_bytes=len(response.values_b64arr.data_b64str) - 1)
+
+    cache.put("key", response)
+    assert cache.get("key") is None
+
+
+class _FakePerfMetrics:
+    def __init__(self) -> None:
+        self.laps: list[str] = []
+
+    def record_lap(self, lap_name: str) -> None:
+        self.laps.append(lap_name)
+
+
+@pytest.mark.parametrize("fingerprint_result", ["fp", None, ValueError("failed")])
+async def test_fingerprint_lap_is_always_recorded(
+    monkeypatch: pytest.MonkeyPatch, fingerprint_result: str | None | Exception
+) -> None:
+    async def fake_get_ensemble_fp_for_surface_cache_async(*_args: Any) -> str | None:
+        if isinstance(fingerprint_result, Exception):
+            raise fingerprint_result
+        return fingerprint_result
+
+    monkeypatch.setattr(
+        surface_router, "get_ensemble_fp_for_surface_cache_async", fake_get_ensemble_fp_for_surface_cache_async
+    )
+    addr = RealizationSurfaceAddress("case_uuid", "iter-0", "surf.name", "attr", 1, None)
+    perf_metrics = _FakePerfMetrics()
+
+    # pylint: disable=protected-access
+    try:
+        cache_key = await surface_router._make_surface_cache_key_async(None, addr, perf_metrics)  # type: ignore
+    except ValueError:
+        cache_key = None
+
+    assert perf_metrics.laps == ["fingerprint"]
+    assert cache_key == (f"{addr.to_addr_str()}::fp" if fingerprint_result == "fp" else None)
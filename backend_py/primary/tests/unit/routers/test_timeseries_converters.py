@@ -0,0 +1,54 @@
+import numpy as np
+import pyarrow as pa
+
+from webviz_core_utils.b64 import b64_decode_float_array
+from primary.routers.timeseries.converters import vector_table_to_api_vector_realizations_data_b64
+
+
+def _create_vector_table(dates: list[str], reals: list[int], values: list[float]) -> pa.Table:
+    return pa.table(
+        {
+            "DATE": pa.array(np.array(dates, dtype="datetime64[ms]"), type=pa.timestamp("ms")),
+            "REAL": pa.array(reals, type=pa.int16()),
+            "FOPT": pa.array(values, type=pa.float32()),
+        }
+    )
+
+
+def test_vector_table_to_b64_with_shared_timestamps() -> None:
+    # Realizations deliberately not sorted in the input table
+    table = _create_vector_table(
+        dates=["2020-01-01", "2020-02-01", "2020-01-01", "2020-02-01"],
+        reals=[3, 3, 1, 1],
+        values=[30.0, 31.0, 10.0, 11.0],
+    )
+
+    data = vector_table_to_api_vector_realizations_data_b64(table, "FOPT", unit="SM3", is_rate=False)
+
+    assert data.realizations == [1, 3]
+    assert data.realizationRowCounts == [2, 2]
+    assert data.timestampsAreShared
+    timestamps = b64_decode_float_array(data.timestampsUtcMs_b64arr)
+    assert timestamps.tolist() == [
+        np.datetime64("2020-01-01", "ms").astype(np.int64),
+        np.datetime64("2020-02-01", "ms").astype(np.int64),
+    ]
+    assert b64_decode_float_array(data.values_b64arr).tolist() == [10.0, 11.0, 30.0, 31.0]
+    assert data.unit == "SM3"
+    assert not data.isRate
+
+
+def test_vector_table_to_b64_with_differing_timestamps() -> None:
+    table = _create_vector_table(
+        dates=["2020-01-01", "2020-02-01", "2020-03-01", "2020-01-01"],
+        reals=[0, 0, 0, 1],
+        values=[1.0, 2.0, 3.0, 4.0],
+    )
+
+    data = vector_table_to_api_vector_realizations_data_b64(table, "FOPT", unit="SM3", is_rate=False)
+
+    assert data.realizations == [0, 1]
+    assert data.realizationRowCounts == [3, 1]
+    assert not data.timestampsAreShared
+    assert len(b64_decode_float_array(data.timestampsUtcMs_b64arr)) == 4
+    assert b64_decode_float_array(data.values_b64arr).tolist() == [1.0, 2.0, 3.0, 4.0]
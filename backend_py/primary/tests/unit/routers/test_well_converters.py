@@ -0,0 +1,42 @@
+import numpy as np
+
+from webviz_core_utils.b64 import b64_decode_float_array
+
+from primary.routers.well import converters, schemas
+
+
+def _make_curve_data(data_points: list[tuple[float, float | str | None]]) -> schemas.WellboreLogCurveData:
+    return schemas.WellboreLogCurveData(
+        source=schemas.WellLogCurveSourceEnum.SSDL_WELL_LOG,
+        name="GR",
+        logName="LOG",
+        indexMin=1,
+        indexMax=3,
+        minCurveValue=None,
+        maxCurveValue=None,
+        curveAlias=None,
+        curveDescription=None,
+        indexUnit="m",
+        noDataValue=None,
+        unit=None,
+        curveUnitDesc=None,
+        dataPoints=data_points,
+        discreteValueMetadata=None,
+    )
+
+
+def test_numeric_curve_is_converted_to_typed_arrays() -> None:
+    compact = converters.convert_log_curve_data_to_compact_schema(_make_curve_data([(1, 10), (2, None), (3, 12.5)]))
+
+    assert compact.curveValuesStr is None
+    assert compact.curveValuesB64arr is not None
+    np.testing.assert_array_equal(b64_decode_float_array(compact.indexValuesB64arr), [1, 2, 3])
+    np.testing.assert_array_equal(b64_decode_float_array(compact.curveValuesB64arr), [10, np.nan, 12.5])
+
+
+def test_curve_with_string_values_keeps_values_as_strings() -> None:
+    compact = converters.convert_log_curve_data_to_compact_schema(_make_curve_data([(1, "A"), (2, None)]))
+
+    assert compact.curveValuesB64arr is None
+    assert compact.curveValuesStr == ["A", None]
+    np.testing.assert_array_equal(b64_decode_float_array(compact.indexValuesB64arr), [1, 2])
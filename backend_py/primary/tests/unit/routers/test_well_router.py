@@ -0,0 +1,158 @@
+# pylint: disable=async-suffix
+
+import asyncio
+from typing import Any
+
+import pytest
+from fastapi import Response
+
+from primary.routers.well import router as well_router
+from primary.routers.well import schemas
+
+
+def _make_request_item(curve_name: str) -> schemas.WellboreLogCurveDataRequestItem:
+    return schemas.WellboreLogCurveDataRequestItem(
+        wellboreUuid="wellbore",
+        source=schemas.WellLogCurveSourceEnum.SSDL_WELL_LOG,
+        curveName=curve_name,
+        logName="log",
+    )
+
+
+def _make_curve_data(curve_name: str) -> schemas.WellboreLogCurveData:
+    return schemas.WellboreLogCurveData(
+        source=schemas.WellLogCurveSourceEnum.SSDL_WELL_LOG,
+        name=curve_name,
+        logName="log",
+        indexMin=0,
+        indexMax=1,
+        minCurveValue=0,
+        maxCurveValue=1,
+        curveAlias=None,
+        curveDescription=None,
+        indexUnit="m",
+        noDataValue=None,
+        unit=None,
+        curveUnitDesc=None,
+        dataPoints=[(0, 0), (1, 1)],
+        discreteValueMetadata=None,
+    )
+
+
+@pytest.fixture(name="fetched_curve_names")
+def fixture_fetched_curve_names(monkeypatch: pytest.MonkeyPatch) -> list[str]:
+    fetched_curve_names: list[str] = []
+
+    async def fake_get_log_curve_data_async(
+        _authenticated_user: Any, request_item: schemas.WellboreLogCurveDataRequestItem, _shared_lookups: Any
+    ) -> schemas.WellboreLogCurveData:
+        fetched_curve_names.append(request_item.curveName)
+        await asyncio.sleep(0.01)
+        if request_item.curveName == "broken":
+            raise ValueError("Internal details")
+        return _make_curve_data(request_item.curveName)
+
+    monkeypatch.setattr(well_router, "_get_log_curve_data_async", fake_get_log_curve_data_async)
+    return fetched_curve_names
+
+
+async def test_log_curve_batch_fetches_identical_items_once(fetched_curve_names: list[str]) -> None:
+    request_items = [_make_request_item(name) for name in ["a", "b", "a", "broken", "broken"]]
+
+    batch_items = await well_router.post_log_curve_data_batch(Response(), None, request_items)  # type: ignore
+
+    assert sorted(fetched_curve_names) == ["a", "b", "broken"]
+    assert [item.request for item in batch_items] == request_items
+    assert [item.curveData.name if item.curveData else None for item in batch_items] == ["a", "b", "a", None, None]
+    assert batch_items[3].errorMessage == "Failed to get log curve data"
+
+
+async def test_log_curve_batch_duplicates_do_not_occupy_fetch_slots(
+    fetched_curve_names: list[str], monkeypatch: pytest.MonkeyPatch
+) -> None:
+    monkeypatch.setattr(well_router, "_MAX_CONCURRENT_LOG_CURVE_FETCHES", 2)
+
+    active_curve_names: set[str] = set()
+    active_curve_names_on_start: dict[str, set[str]] = {}
+    original_get_log_curve_data_async = well_router._get_log_curve_data_async  # pylint: disable=protected-access
+
+    async def tracking_get_log_curve_data_async(
+        authenticated_user: Any, request_item: schemas.WellboreLogCurveDataRequestItem, shared_lookups: Any
+    ) -> schemas.WellboreLogCurveData:
+        active_curve_names_on_start[request_item.curveName] = set(active_curve_names)
+        active_curve_names.add(request_item.curveName)
+        try:
+            return await original_get_log_curve_data_async(authenticated_user, request_item, shared_lookups)
+        finally:
+            active_curve_names.discard(request_item.curveName)
+
+    monkeypatch.setattr(well_router, "_get_log_curve_data_async", tracking_get_log_curve_data_async)
+
+    request_items = [_make_request_item("a")] * 10 + [_make_request_item("b"), _make_request_item("c")]
+    batch_items = await well_router.post_log_curve_data_batch(Response(), None, request_items)  # type: ignore
+
+    assert sorted(fetched_curve_names) == ["a", "b", "c"]
+    assert all(item.curveData is not None for item in batch_items)
+
+    # The second slot goes to "b", rather than to a duplicate of "a" waiting for the same fetch
+    assert active_curve_names_on_start["b"] == {"a"}
+
+
+async def test_log_curve_headers_report_failed_sources(monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setattr(well_router, "_LOG_CURVE_HEADER_SOURCE_TIMEOUT_S", 0.05)
+
+    async def ssdl_headers_async(_authenticated_user: Any, _wellbore_uuid: str) -> list[schemas.WellboreLogCurveHeader]:
+        return [
+            schemas.WellboreLogCurveHeader(
+                source=schemas.WellLogCurveSourceEnum.SSDL_WELL_LOG,
+                curveType=schemas.WellLogCurveTypeEnum.CONTINUOUS,
+                logName="log",
+                curveName="a",
+                curveUnit=None,
+            )
+        ]
+
+    async def failing_headers_async(
+        _authenticated_user: Any, _wellbore_uuid: str
+    ) -> list[schemas.WellboreLogCurveHeader]:
+        raise ValueError("Internal details")
+
+    async def hanging_headers_async(
+        _authenticated_user: Any, _wellbore_uuid: str
+    ) -> list[schemas.WellboreLogCurveHeader]:
+        await asyncio.sleep(10)
+        return []
+
+    monkeypatch.setattr(well_router, "_get_headers_from_ssdl_well_log_async", ssdl_headers_async)
+    monkeypatch.setattr(well_router, "_get_headers_from_smda_geology_async", failing_headers_async)
+    monkeypatch.setattr(well_router, "_get_headers_from_smda_survey_async", hanging_headers_async)
+
+    response = Response()
+    curve_headers = await well_router.get_wellbore_log_curve_headers(
+        response,
+        None,  # type: ignore
+        "wellbore",
+        [
+            schemas.WellLogCurveSourceEnum.SSDL_WELL_LOG,
+            schemas.WellLogCurveSourceEnum.SMDA_GEOLOGY,
+            schemas.WellLogCurveSourceEnum.SMDA_SURVEY,
+        ],
+    )
+
+    assert [header.curveName for header in curve_headers] == ["a"]
+    assert response.headers["x-failed-sources"] == "smda.geology; reason=error, smda.survey; reason=timeout"
+
+
+async def test_log_curve_headers_have_no_failed_sources_header_on_success(monkeypatch: pytest.MonkeyPatch) -> None:
+    async def no_headers_async(_authenticated_user: Any, _wellbore_uuid: str) -> list[schemas.WellboreLogCurveHeader]:
+        return []
+
+    monkeypatch.setattr(well_router, "_get_headers_from_ssdl_well_log_async", no_headers_async)
+
+    response = Response()
+    curve_headers = await well_router.get_wellbore_log_curve_headers(
+        response, None, "wellbore", [schemas.WellLogCurveSourceEnum.SSDL_WELL_LOG]  # type: ignore
+    )
+
+    assert not curve_headers
+    assert "x-failed-sources" not in response.headers
@@ -0,0 +1,119 @@
+# pylint: disable=async-suffix
+
+import asyncio
+import json
+from typing import Iterator
+
+import httpx
+import pytest
+
+from webviz_services.services_config import ServicesConfig, init_services_config
+from webviz_services.service_exceptions import NoDataError, ServiceRequestError
+from webviz_services.smda_access import _smda_get_request
+from webviz_services.smda_access._smda_get_request import (
+    smda_get_request_as_dataframe_async,
+    smda_get_request_async,
+    smda_get_request_cached_async,
+    smda_get_request_pages_async,
+)
+from webviz_services.utils.httpx_async_client_wrapper import HTTPX_ASYNC_CLIENT_WRAPPER
+
+# Three pages of results, keyed by the `_next` cursor used to request them (None for the first page)
+_PAGES: dict[str | None, dict] = {
+    None: {"results": [{"md": 1.0, "name": "a"}, {"md": 2.0, "name": "a"}], "next": "cursor1"},
+    "cursor1": {"results": [{"md": 3.0, "name": None}], "next": "cursor2"},
+    "cursor2": {"results": [{"md": 4.0, "name": "b"}], "next": None},
+}
+
+
+@pytest.fixture(name="requested_cursors")
+def fixture_requested_cursors(monkeypatch: pytest.MonkeyPatch) -> Iterator[list[str | None]]:
+    init_services_config(
+        ServicesConfig(
+            sumo_env="dev",
+            smda_subscription_key="key",
+            enterprise_subscription_key="key",
+            surface_query_url="",
+            vds_host_address="",
+            redis_user_session_url="",
+        )
+    )
+
+    requested_cursors: list[str | None] = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        cursor = request.url.params.get("_next")
+        requested_cursors.append(cursor)
+        if request.headers["authorization"] == "Bearer rejected_token":
+            return httpx.Response(401)
+        if request.url.params.get("_items") != "10000":
+            return httpx.Response(400)
+        if cursor not in _PAGES:
+            return httpx.Response(404)
+        return httpx.Response(200, content=json.dumps({"data": _PAGES[cursor]}).encode())
+
+    # pylint: disable=protected-access
+    HTTPX_ASYNC_CLIENT_WRAPPER._async_client = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+    monkeypatch.setattr(
+        _smda_get_request, "_results_cache", _smda_get_request._make_results_cache(max_size_bytes=1024 * 1024)
+    )
+    yield requested_cursors
+    HTTPX_ASYNC_CLIENT_WRAPPER._async_client = None
+
+
+async def test_all_pages_are_collected(requested_cursors: list[str | None]) -> None:
+    params = {"field_identifier": "FIELD"}
+    results = await smda_get_request_async("token", "endpoint", params)
+
+    assert [res["md"] for res in results] == [1.0, 2.0, 3.0, 4.0]
+    assert requested_cursors == [None, "cursor1", "cursor2"]
+
+    # The caller's params should not be modified
+    assert params == {"field_identifier": "FIELD"}
+
+
+async def test_next_page_is_prefetched_while_current_page_is_processed(requested_cursors: list[str | None]) -> None:
+    page_iter = smda_get_request_pages_async("token", "endpoint", {})
+
+    first_page = await anext(page_iter)
+    assert len(first_page) == 2
+
+    # Without pulling the next page, the request for it should already have been issued
+    await asyncio.sleep(0.01)
+    assert requested_cursors == [None, "cursor1"]
+
+    await page_iter.aclose()
+
+
+async def test_pages_are_concatenated_into_dataframe(requested_cursors: list[str | None]) -> None:
+    # pylint: disable=unused-argument
+    df = await smda_get_request_as_dataframe_async("token", "endpoint", {})
+
+    assert df.height == 4
+    assert df["md"].to_list() == [1.0, 2.0, 3.0, 4.0]
+    assert df["name"].to_list() == ["a", "a", None, "b"]
+
+
+async def test_error_status_is_raised(requested_cursors: list[str | None]) -> None:
+    # pylint: disable=unused-argument
+    with pytest.raises(ServiceRequestError):
+        await smda_get_request_async("token", "endpoint", {"_next": "unknown"})
+
+
+async def test_empty_result_raises_no_data(requested_cursors: list[str | None]) -> None:
+    # pylint: disable=unused-argument
+    _PAGES["empty"] = {"results": [], "next": None}
+    try:
+        with pytest.raises(NoDataError):
+            await smda_get_request_async("token", "endpoint", {"_next": "empty"})
+    finally:
+        del _PAGES["empty"]
+
+
+async def test_cached_results_are_not_served_to_rejected_user(requested_cursors: list[str | None]) -> None:
+    results = await smda_get_request_cached_async("token", "endpoint", {})
+    assert await smda_get_request_cached_async("token", "endpoint", {}) is results
+    assert requested_cursors == [None, "cursor1", "cursor2"]
+
+    with pytest.raises(ServiceRequestError):
+        await smda_get_request_cached_async("rejected_token", "endpoint", {})
@@ -0,0 +1,157 @@
+# pylint: disable=async-suffix
+
+import asyncio
+import json
+from typing import Iterator
+
+import httpx
+import pytest
+
+from webviz_services.services_config import ServicesConfig, init_services_config
+from webviz_services.ssdl_access import _ssdl_get_request, reference_data_cache
+from webviz_services.ssdl_access.types import FieldInfo
+from webviz_services.ssdl_access.well_access import WellAccess
+from webviz_services.utils.httpx_async_client_wrapper import HTTPX_ASYNC_CLIENT_WRAPPER
+
+
+@pytest.fixture(name="ssdl_fields")
+def fixture_ssdl_fields() -> list[FieldInfo]:
+    return [FieldInfo(field_uuid="uuid-a", field_identifier="FIELD A", country_identifier="NO")]
+
+
+@pytest.fixture(name="fake_clock")
+def fixture_fake_clock(monkeypatch: pytest.MonkeyPatch) -> list[float]:
+    # Single element list holding the current time, shared with the tests so that they can advance it
+    fake_clock = [1000.0]
+    monkeypatch.setattr(reference_data_cache.time, "monotonic", lambda: fake_clock[0])
+    return fake_clock
+
+
+@pytest.fixture(name="used_tokens")
+def fixture_used_tokens(monkeypatch: pytest.MonkeyPatch, ssdl_fields: list[FieldInfo]) -> Iterator[list[str]]:
+    used_tokens: list[str] = []
+
+    async def fake_get_fields_async(self: WellAccess) -> list[FieldInfo]:
+        # pylint: disable=protected-access
+        used_tokens.append(self._ssdl_token)
+        if self._ssdl_token == "failing_token":
+            raise ValueError("SSDL error")
+        return list(ssdl_fields)
+
+    monkeypatch.setattr(WellAccess, "get_fields_async", fake_get_fields_async)
+    monkeypatch.setattr(reference_data_cache, "_last_fields_load_time_s", None)
+
+    # pylint: disable=protected-access
+    reference_data_cache._REFERENCE_DATA_CACHE.clear()
+    yield used_tokens
+    reference_data_cache._REFERENCE_DATA_CACHE.clear()
+
+
+async def test_field_uuids_are_shared_between_users(used_tokens: list[str]) -> None:
+    assert await reference_data_cache.get_field_uuid_async("token_1", "FIELD A") == "uuid-a"
+    assert await reference_data_cache.get_field_uuid_async("token_2", "FIELD A") == "uuid-a"
+
+    assert used_tokens == ["token_1"]
+
+
+async def test_warm_loads_fields_in_background(used_tokens: list[str]) -> None:
+    reference_data_cache.warm_reference_data_in_background("token_1")
+    await asyncio.sleep(0)
+    reference_data_cache.warm_reference_data_in_background("token_2")
+
+    assert await reference_data_cache.get_field_uuid_async("token_3", "FIELD A") == "uuid-a"
+    assert used_tokens == ["token_1"]
+
+
+async def test_miss_reloads_fields_once(
+    used_tokens: list[str], ssdl_fields: list[FieldInfo], fake_clock: list[float]
+) -> None:
+    assert await reference_data_cache.get_field_uuid_async("token_1", "FIELD A") == "uuid-a"
+
+    # A field added to SSDL after the fields were cached is found by reloading on the miss
+    ssdl_fields.append(FieldInfo(field_uuid="uuid-b", field_identifier="FIELD B", country_identifier="NO"))
+    fake_clock[0] += reference_data_cache._MISS_RELOAD_MIN_INTERVAL_S  # pylint: disable=protected-access
+    assert await reference_data_cache.get_field_uuid_async("token_2", "FIELD B") == "uuid-b"
+    assert await reference_data_cache.get_field_uuid_async("token_3", "FIELD B") == "uuid-b"
+
+    assert used_tokens == ["token_1", "token_2"]
+
+
+async def test_miss_reloads_are_rate_limited(
+    used_tokens: list[str], ssdl_fields: list[FieldInfo], fake_clock: list[float]
+) -> None:
+    # pylint: disable=protected-access
+    # No reload on a miss right after the fields were loaded
+    assert await reference_data_cache.get_field_uuid_async("token_1", "UNKNOWN") is None
+    assert used_tokens == ["token_1"]
+
+    fake_clock[0] += reference_data_cache._MISS_RELOAD_MIN_INTERVAL_S
+    assert await reference_data_cache.get_field_uuid_async("token_2", "UNKNOWN") is None
+    assert used_tokens == ["token_1", "token_2"]
+
+    # Within the interval after the reload, a newly added field is not picked up
+    ssdl_fields.append(FieldInfo(field_uuid="uuid-b", field_identifier="FIELD B", country_identifier="NO"))
+    fake_clock[0] += 60
+    assert await reference_data_cache.get_field_uuid_async("token_3", "FIELD B") is None
+    assert used_tokens == ["token_1", "token_2"]
+
+    fake_clock[0] += reference_data_cache._MISS_RELOAD_MIN_INTERVAL_S
+    assert await reference_data_cache.get_field_uuid_async("token_4", "FIELD B") == "uuid-b"
+    assert used_tokens == ["token_1", "token_2", "token_4"]
+
+
+async def test_failed_miss_reload_keeps_cached_fields(used_tokens: list[str], fake_clock: list[float]) -> None:
+    assert await reference_data_cache.get_field_uuid_async("token_1", "FIELD A") == "uuid-a"
+    fake_clock[0] += reference_data_cache._MISS_RELOAD_MIN_INTERVAL_S  # pylint: disable=protected-access
+    assert await reference_data_cache.get_field_uuid_async("failing_token", "UNKNOWN") is None
+    assert await reference_data_cache.get_field_uuid_async("token_2", "FIELD A") == "uuid-a"
+
+    assert used_tokens == ["token_1", "failing_token"]
+
+
+@pytest.fixture(name="ssdl_field_requests")
+def fixture_ssdl_field_requests(monkeypatch: pytest.MonkeyPatch, ssdl_fields: list[FieldInfo]) -> Iterator[list[str]]:
+    """Serves ssdl_fields from a fake SSDL Field endpoint, only the HTTP layer is replaced"""
+    init_services_config(
+        ServicesConfig(
+            sumo_env="dev",
+            smda_subscription_key="key",
+            enterprise_subscription_key="key",
+            surface_query_url="",
+            vds_host_address="",
+            redis_user_session_url="",
+        )
+    )
+
+    ssdl_field_requests: list[str] = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        assert request.url.path.endswith("/Field")
+        ssdl_field_requests.append(request.headers["authorization"])
+        return httpx.Response(200, content=json.dumps([field.model_dump() for field in ssdl_fields]).encode())
+
+    # pylint: disable=protected-access
+    HTTPX_ASYNC_CLIENT_WRAPPER._async_client = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+    monkeypatch.setattr(
+        _ssdl_get_request, "_results_cache", _ssdl_get_request._make_results_cache(max_size_bytes=1024 * 1024)
+    )
+    reference_data_cache._REFERENCE_DATA_CACHE.clear()
+    reference_data_cache._last_fields_load_time_s = None
+    yield ssdl_field_requests
+    reference_data_cache._REFERENCE_DATA_CACHE.clear()
+    reference_data_cache._last_fields_load_time_s = None
+    HTTPX_ASYNC_CLIENT_WRAPPER._async_client = None
+
+
+async def test_miss_reload_fetches_new_field_from_ssdl(
+    ssdl_field_requests: list[str], ssdl_fields: list[FieldInfo], fake_clock: list[float]
+) -> None:
+    assert await reference_data_cache.get_field_uuid_async("token", "FIELD A") == "uuid-a"
+    assert await reference_data_cache.get_field_uuid_async("token", "FIELD B") is None
+    assert len(ssdl_field_requests) == 1
+
+    # The reload must reach SSDL, rather than being served by a cache of SSDL results for the same token
+    ssdl_fields.append(FieldInfo(field_uuid="uuid-b", field_identifier="FIELD B", country_identifier="NO"))
+    fake_clock[0] += reference_data_cache._MISS_RELOAD_MIN_INTERVAL_S  # pylint: disable=protected-access
+    assert await reference_data_cache.get_field_uuid_async("token", "FIELD B") == "uuid-b"
+    assert ssdl_field_requests == ["Bearer token", "Bearer token"]
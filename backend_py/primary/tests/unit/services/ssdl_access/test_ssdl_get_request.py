@@ -0,0 +1,60 @@
+# pylint: disable=async-suffix
+
+from typing import Iterator
+
+import httpx
+import pytest
+
+from webviz_services.services_config import ServicesConfig, init_services_config
+from webviz_services.service_exceptions import AuthorizationError
+from webviz_services.ssdl_access import _ssdl_get_request
+from webviz_services.ssdl_access._ssdl_get_request import ssdl_get_request_cached_async
+from webviz_services.utils.httpx_async_client_wrapper import HTTPX_ASYNC_CLIENT_WRAPPER
+
+
+@pytest.fixture(name="requested_tokens")
+def fixture_requested_tokens(monkeypatch: pytest.MonkeyPatch) -> Iterator[list[str]]:
+    init_services_config(
+        ServicesConfig(
+            sumo_env="dev",
+            smda_subscription_key="key",
+            enterprise_subscription_key="key",
+            surface_query_url="",
+            vds_host_address="",
+            redis_user_session_url="",
+        )
+    )
+
+    requested_tokens: list[str] = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        token = request.headers["authorization"].removeprefix("Bearer ")
+        requested_tokens.append(token)
+        if token != "authorized_token":
+            return httpx.Response(403)
+        return httpx.Response(200, json=[{"wellbore_uuid": "uuid"}])
+
+    # pylint: disable=protected-access
+    HTTPX_ASYNC_CLIENT_WRAPPER._async_client = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+    monkeypatch.setattr(
+        _ssdl_get_request, "_results_cache", _ssdl_get_request._make_results_cache(max_size_bytes=1024 * 1024)
+    )
+    yield requested_tokens
+    HTTPX_ASYNC_CLIENT_WRAPPER._async_client = None
+
+
+async def test_cached_results_are_reused_for_same_user(requested_tokens: list[str]) -> None:
+    first_results = await ssdl_get_request_cached_async("authorized_token", "endpoint", {"field": "FIELD"})
+    second_results = await ssdl_get_request_cached_async("authorized_token", "endpoint", {"field": "FIELD"})
+
+    assert first_results is second_results
+    assert requested_tokens == ["authorized_token"]
+
+
+async def test_cached_results_are_not_served_to_rejected_user(requested_tokens: list[str]) -> None:
+    await ssdl_get_request_cached_async("authorized_token", "endpoint", {"field": "FIELD"})
+
+    with pytest.raises(AuthorizationError):
+        await ssdl_get_request_cached_async("rejected_token", "endpoint", {"field": "FIELD"})
+
+    assert requested_tokens == ["authorized_token", "rejected_token"]
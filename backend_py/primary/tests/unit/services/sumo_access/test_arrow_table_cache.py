@@ -0,0 +1,109 @@
+# pylint: disable=async-suffix
+
+import asyncio
+import threading
+from pathlib import Path
+
+import pyarrow as pa
+import pytest
+
+from webviz_services.sumo_access import arrow_table_cache
+from webviz_services.sumo_access.arrow_table_cache import ArrowTableCache, DiskArrowIpcStore
+
+
+def _create_vector_table(num_rows: int) -> pa.Table:
+    schema = pa.schema(
+        [
+            pa.field("DATE", pa.timestamp("ms")),
+            pa.field("REAL", pa.int16()),
+            pa.field("FOPT", pa.float32(), metadata={b"unit": b"SM3"}),
+        ]
+    )
+    return pa.table(
+        {
+            "DATE": pa.array(range(num_rows), type=pa.timestamp("ms")),
+            "REAL": pa.array([0] * num_rows, type=pa.int16()),
+            "FOPT": pa.array([float(i) for i in range(num_rows)], type=pa.float32()),
+        },
+        schema=schema,
+    )
+
+
+async def test_memory_tier_returns_same_table_instance() -> None:
+    cache = ArrowTableCache(mem_max_size_bytes=1024 * 1024, second_tier_store=None)
+    table = _create_vector_table(10)
+
+    assert await cache.get_async("key") is None
+
+    cache.put("key", table)
+    assert await cache.get_async("key") is table
+
+
+async def test_memory_tier_evicts_when_over_budget() -> None:
+    table = _create_vector_table(10)
+    cache = ArrowTableCache(mem_max_size_bytes=int(table.nbytes * 1.5), second_tier_store=None)
+
+    cache.put("first", table)
+    cache.put("second", table)
+
+    assert await cache.get_async("first") is None
+    assert await cache.get_async("second") is table
+
+
+async def test_disk_tier_round_trip_preserves_schema_metadata(tmp_path: Path) -> None:
+    table = _create_vector_table(10)
+    disk_store = DiskArrowIpcStore(cache_dir=str(tmp_path), max_size_bytes=1024 * 1024)
+
+    # Memory budget too small to hold the table, so it must come back from the disk tier
+    cache = ArrowTableCache(mem_max_size_bytes=1, second_tier_store=disk_store)
+    cache.put("key", table)
+
+    # Let the background write to disk finish
+    for _ in range(100):
+        if list(tmp_path.glob("*.arrows")):
+            break
+        await asyncio.sleep(0.01)
+
+    cached_table = await cache.get_async("key")
+    assert cached_table is not None
+    assert cached_table.equals(table)
+    assert cached_table.schema.field("FOPT").metadata == {b"unit": b"SM3"}
+
+
+async def test_disk_tier_indexes_existing_files_and_evicts(tmp_path: Path) -> None:
+    first_store = DiskArrowIpcStore(cache_dir=str(tmp_path), max_size_bytes=100)
+    await first_store.put_async("a", b"x" * 60)
+
+    # A new store instance should pick up the file written by the first one
+    second_store = DiskArrowIpcStore(cache_dir=str(tmp_path), max_size_bytes=100)
+    assert await second_store.get_async("a") == b"x" * 60
+
+    # Writing another file exceeds the budget, so the oldest file should be deleted
+    await second_store.put_async("b", b"y" * 60)
+    assert await second_store.get_async("a") is None
+    assert await second_store.get_async("b") == b"y" * 60
+    assert len(list(tmp_path.glob("*.arrows"))) == 1
+
+
+async def test_put_does_not_serialize_on_calling_thread(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    serializing_thread_ids: list[int] = []
+    original_serialize_table = arrow_table_cache._serialize_table  # pylint: disable=protected-access
+
+    def spy_serialize_table(table: pa.Table) -> bytes:
+        serializing_thread_ids.append(threading.get_ident())
+        return original_serialize_table(table)
+
+    monkeypatch.setattr(arrow_table_cache, "_serialize_table", spy_serialize_table)
+
+    disk_store = DiskArrowIpcStore(cache_dir=str(tmp_path), max_size_bytes=1024 * 1024)
+    cache = ArrowTableCache(mem_max_size_bytes=1024 * 1024, second_tier_store=disk_store)
+    cache.put("key", _create_vector_table(10))
+    assert not serializing_thread_ids
+
+    for _ in range(100):
+        if list(tmp_path.glob("*.arrows")):
+            break
+        await asyncio.sleep(0.01)
+
+    assert len(serializing_thread_ids) == 1
+    assert serializing_thread_ids[0] != threading.get_ident()
@@ -0,0 +1,214 @@
+# pylint: disable=async-suffix
+
+import asyncio
+import io
+import json
+import os
+import threading
+from pathlib import Path
+from typing import Any
+
+import numpy as np
+import pytest
+import xtgeo
+from PIL import Image
+
+from webviz_services.sumo_access import decoded_surface_cache
+from webviz_services.sumo_access.decoded_surface_cache import DecodedSurfaceCache, DiskDecodedSurfaceStore
+from webviz_services.utils.decoded_surface import DecodedSurface
+from webviz_services.utils.surface_helpers import get_min_max_surface_values, surface_to_float32_numpy_array
+from webviz_services.utils.surface_to_png import surface_to_png_bytes_optimized, surface_values_to_png_bytes
+
+
+def _create_xtgeo_surface() -> xtgeo.RegularSurface:
+    values = np.ma.masked_array(np.arange(20, dtype=np.float64).reshape(4, 5) * 1.5)
+    values[0, 0] = np.ma.masked
+    return xtgeo.RegularSurface(
+        ncol=4, nrow=5, xinc=25.0, yinc=50.0, xori=1000.0, yori=2000.0, rotation=30.0, values=values
+    )
+
+
+def test_decoded_surface_matches_xtgeo_helpers() -> None:
+    xtgeo_surf = _create_xtgeo_surface()
+    decoded_surf = DecodedSurface.from_xtgeo_surface(xtgeo_surf)
+
+    assert np.array_equal(
+        decoded_surf.get_flat_float32_values_for_api(), surface_to_float32_numpy_array(xtgeo_surf), equal_nan=True
+    )
+    assert surface_values_to_png_bytes(decoded_surf.get_masked_values()) == surface_to_png_bytes_optimized(xtgeo_surf)
+
+    min_max = get_min_max_surface_values(xtgeo_surf)
+    assert min_max is not None
+    assert decoded_surf.value_min == min_max.min
+    assert decoded_surf.value_max == min_max.max
+    assert (decoded_surf.xmin, decoded_surf.ymax) == (xtgeo_surf.xmin, xtgeo_surf.ymax)
+
+
+def test_decoded_surface_round_trips_to_xtgeo() -> None:
+    xtgeo_surf = _create_xtgeo_surface()
+    round_tripped_surf = DecodedSurface.from_xtgeo_surface(xtgeo_surf).to_xtgeo_surface()
+
+    assert round_tripped_surf.compare_topology(xtgeo_surf)
+    assert np.ma.allequal(round_tripped_surf.values, xtgeo_surf.values)
+
+
+async def test_memory_tier_returns_same_instance_and_evicts() -> None:
+    decoded_surf = DecodedSurface.from_xtgeo_surface(_create_xtgeo_surface())
+    cache = DecodedSurfaceCache(mem_max_size_bytes=int(decoded_surf.nbytes * 1.5), disk_store=None)
+
+    cache.put("first", decoded_surf)
+    assert await cache.get_async("first") is decoded_surf
+    assert not decoded_surf.values.flags.writeable
+
+    cache.put("second", DecodedSurface.from_xtgeo_surface(_create_xtgeo_surface()))
+    assert await cache.get_async("first") is None
+    assert cache.get_stats().evictions == 1
+
+
+async def test_disk_tier_round_trip_is_memory_mapped(tmp_path: Path) -> None:
+    decoded_surf = DecodedSurface.from_xtgeo_surface(_create_xtgeo_surface())
+    disk_store = DiskDecodedSurfaceStore(cache_dir=str(tmp_path), max_size_bytes=1024 * 1024)
+
+    # Memory budget too small to hold the surface, so it must come back from the disk tier
+    cache = DecodedSurfaceCache(mem_max_size_bytes=1, disk_store=disk_store)
+    cache.put("key", decoded_surf)
+
+    # Let the background write to disk finish
+    for _ in range(100):
+        if list(tmp_path.glob("*.npy")):
+            break
+        await asyncio.sleep(0.01)
+
+    cached_surf = await cache.get_async("key")
+    assert cached_surf is not None
+    assert isinstance(cached_surf.values, np.memmap)
+    assert np.array_equal(cached_surf.values, decoded_surf.values, equal_nan=True)
+    assert cached_surf.surface_def == decoded_surf.surface_def
+    assert cached_surf.value_min == decoded_surf.value_min
+
+
+async def test_disk_tier_indexes_existing_files_and_evicts(tmp_path: Path) -> None:
+    decoded_surf = DecodedSurface.from_xtgeo_surface(_create_xtgeo_surface())
+
+    first_store = DiskDecodedSurfaceStore(cache_dir=str(tmp_path), max_size_bytes=1024 * 1024)
+    await first_store.put_async("a", decoded_surf)
+    file_size = next(tmp_path.glob("*.npy")).stat().st_size
+
+    # A new store instance should pick up the files written by the first one
+    second_store = DiskDecodedSurfaceStore(cache_dir=str(tmp_path), max_size_bytes=int(file_size * 1.5))
+    assert await second_store.get_async("a") is not None
+
+    # Writing another entry exceeds the budget, so the oldest entry should be deleted
+    await second_store.put_async("b", decoded_surf)
+    assert await second_store.get_async("a") is None
+    assert await second_store.get_async("b") is not None
+    assert len(list(tmp_path.glob("*.npy"))) == 1
+    assert len(list(tmp_path.glob("*.json"))) == 1
+
+
+async def test_disk_tier_deletes_evicted_files_off_calling_thread(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    decoded_surf = DecodedSurface.from_xtgeo_surface(_create_xtgeo_surface())
+    disk_store = DiskDecodedSurfaceStore(cache_dir=str(tmp_path), max_size_bytes=1024 * 1024)
+    await disk_store.put_async("a", decoded_surf)
+    file_size = next(tmp_path.glob("*.npy")).stat().st_size
+
+    deleting_thread_ids: list[int] = []
+    original_remove = os.remove
+
+    def spy_remove(file_path: Path) -> None:
+        deleting_thread_ids.append(threading.get_ident())
+        original_remove(file_path)
+
+    monkeypatch.setattr(decoded_surface_cache.os, "remove", spy_remove)
+
+    disk_store = DiskDecodedSurfaceStore(cache_dir=str(tmp_path), max_size_bytes=int(file_size * 1.5))
+    await disk_store.put_async("b", decoded_surf)
+
+    assert len(deleting_thread_ids) == 2
+    assert threading.get_ident() not in deleting_thread_ids
+    assert len(list(tmp_path.glob("*.npy"))) == 1
+
+
+async def test_disk_tier_deletes_leftovers_from_interrupted_writes(tmp_path: Path) -> None:
+    decoded_surf = DecodedSurface.from_xtgeo_surface(_create_xtgeo_surface())
+    first_store = DiskDecodedSurfaceStore(cache_dir=str(tmp_path), max_size_bytes=1024 * 1024)
+    await first_store.put_async("complete", decoded_surf)
+
+    # Simulate a write that was interrupted after the meta file, and one that was interrupted mid-file
+    (tmp_path / "incomplete.json").write_text("{}")
+    (tmp_path / "incomplete.npy.0123abcd.tmp").write_bytes(b"partial")
+
+    second_store = DiskDecodedSurfaceStore(cache_dir=str(tmp_path), max_size_bytes=1024 * 1024)
+
+    assert sorted(p.suffix for p in tmp_path.iterdir()) == [".json", ".npy"]
+    assert await second_store.get_async("complete") is not None
+
+
+def test_min_max_are_computed_before_float32_downcast() -> None:
+    values = np.ma.masked_array(np.full((4, 5), 1000.0, dtype=np.float64))
+    values[1, 1] = 1000.00001
+    values[2, 2] = np.ma.masked
+    xtgeo_surf = xtgeo.RegularSurface(ncol=4, nrow=5, xinc=1.0, yinc=1.0, values=values)
+
+    decoded_surf = DecodedSurface.from_xtgeo_surface(xtgeo_surf)
+    assert decoded_surf.values.dtype == np.float32
+    assert decoded_surf.value_max == 1000.00001
+    assert float(np.nanmax(decoded_surf.values)) != 1000.00001
+
+
+def test_all_undefined_surface_has_no_min_max() -> None:
+    values = np.ma.masked_all((4, 5), dtype=np.float64)
+    xtgeo_surf = xtgeo.RegularSurface(ncol=4, nrow=5, xinc=1.0, yinc=1.0, values=values)
+
+    decoded_surf = DecodedSurface.from_xtgeo_surface(xtgeo_surf)
+    assert decoded_surf.value_min is None
+    assert decoded_surf.value_max is None
+
+
+async def test_disk_tier_hit_uses_stored_min_max(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    decoded_surf = DecodedSurface.from_xtgeo_surface(_create_xtgeo_surface())
+    disk_store = DiskDecodedSurfaceStore(cache_dir=str(tmp_path), max_size_bytes=1024 * 1024)
+    await disk_store.put_async("key", decoded_surf)
+
+    def fail_if_called(*_args: Any, **_kwargs: Any) -> None:
+        raise AssertionError("min/max should not be recomputed on a disk hit")
+
+    monkeypatch.setattr(np, "nanmin", fail_if_called)
+    monkeypatch.setattr(np, "nanmax", fail_if_called)
+
+    cached_surf = await disk_store.get_async("key")
+    assert cached_surf is not None
+    assert (cached_surf.value_min, cached_surf.value_max) == (decoded_surf.value_min, decoded_surf.value_max)
+
+
+async def test_disk_tier_treats_entry_without_min_max_as_miss(tmp_path: Path) -> None:
+    decoded_surf = DecodedSurface.from_xtgeo_surface(_create_xtgeo_surface())
+    disk_store = DiskDecodedSurfaceStore(cache_dir=str(tmp_path), max_size_bytes=1024 * 1024)
+    await disk_store.put_async("key", decoded_surf)
+
+    # Simulate an entry written before the value range was stored in the meta file
+    meta_file_path = next(tmp_path.glob("*.json"))
+    meta_dict = json.loads(meta_file_path.read_text())
+    del meta_dict["value_min"], meta_dict["value_max"]
+    meta_file_path.write_text(json.dumps(meta_dict))
+
+    assert await disk_store.get_async("key") is None
+
+
+def test_png_is_scaled_with_given_value_range() -> None:
+    decoded_surf = DecodedSurface.from_xtgeo_surface(_create_xtgeo_surface())
+    assert decoded_surf.value_min is not None and decoded_surf.value_max is not None
+
+    masked_values = decoded_surf.get_masked_values()
+    value_range = (decoded_surf.value_min, decoded_surf.value_max)
+    assert surface_values_to_png_bytes(masked_values, value_range=value_range) == surface_values_to_png_bytes(
+        masked_values
+    )
+
+    # Values outside the given range must be clipped rather than wrap around
+    png_bytes = surface_values_to_png_bytes(masked_values, value_range=(0.0, 10.0))
+    rgba_arr = np.asarray(Image.open(io.BytesIO(png_bytes)))
+    assert rgba_arr[..., :3].max() == 255
+    assert rgba_arr[0, -1, :3].tolist() == [255, 255, 255]
@@ -0,0 +1,69 @@
+# pylint: disable=async-suffix
+
+import asyncio
+from typing import Iterator
+from unittest.mock import MagicMock
+
+import pytest
+
+from webviz_services.sumo_access import inplace_volumes_table_access
+from webviz_services.sumo_access.inplace_volumes_table_access import InplaceVolumesTableAccess
+from webviz_services.sumo_access.inplace_volumes_table_types import VolumeColumnsAndIndexUniqueValues
+
+
+@pytest.fixture(name="loaded_metadata")
+def fixture_loaded_metadata(monkeypatch: pytest.MonkeyPatch) -> Iterator[list[str]]:
+    loaded_metadata: list[str] = []
+
+    # pylint: disable=protected-access
+    async def fake_load_tables_info_async(
+        self: InplaceVolumesTableAccess,
+    ) -> inplace_volumes_table_access._EnsembleTablesInfo:
+        loaded_metadata.append(f"{self._ensemble_name}:tables_info")
+        await asyncio.sleep(0)
+        return inplace_volumes_table_access._EnsembleTablesInfo(is_deprecated_format=False, table_names=["geogrid"])
+
+    async def fake_load_volume_columns_and_index_unique_values_async(
+        self: InplaceVolumesTableAccess, table_name: str
+    ) -> VolumeColumnsAndIndexUniqueValues:
+        loaded_metadata.append(f"{self._ensemble_name}:{table_name}")
+        return VolumeColumnsAndIndexUniqueValues(volume_columns=["BULK"], index_unique_values_map={"ZONE": ["A"]})
+
+    monkeypatch.setattr(InplaceVolumesTableAccess, "_load_tables_info_async", fake_load_tables_info_async)
+    monkeypatch.setattr(
+        InplaceVolumesTableAccess,
+        "_load_volume_columns_and_index_unique_values_async",
+        fake_load_volume_columns_and_index_unique_values_async,
+    )
+
+    inplace_volumes_table_access._TABLES_INFO_CACHE.clear()
+    inplace_volumes_table_access._COLUMNS_META_CACHE.clear()
+    yield loaded_metadata
+    inplace_volumes_table_access._TABLES_INFO_CACHE.clear()
+    inplace_volumes_table_access._COLUMNS_META_CACHE.clear()
+
+
+def _create_access(ensemble_name: str, ensemble_fingerprint: str | None) -> InplaceVolumesTableAccess:
+    return InplaceVolumesTableAccess(MagicMock(), "case_uuid", ensemble_name, ensemble_fingerprint)
+
+
+async def test_metadata_is_shared_between_requests_for_same_fingerprint(loaded_metadata: list[str]) -> None:
+    accesses = [_create_access("iter-0", "fp") for _ in range(3)]
+
+    are_deprecated = await asyncio.gather(*(access.is_deprecated_format_async() for access in accesses))
+    assert are_deprecated == [False, False, False]
+    assert await accesses[0].get_inplace_volumes_table_names_async() == ["geogrid"]
+
+    first_meta = await accesses[0].get_volume_columns_and_index_unique_values_async("geogrid")
+    second_meta = await accesses[1].get_volume_columns_and_index_unique_values_async("geogrid")
+    assert first_meta is second_meta
+
+    assert loaded_metadata == ["iter-0:tables_info", "iter-0:geogrid"]
+
+
+async def test_metadata_is_not_cached_without_fingerprint(loaded_metadata: list[str]) -> None:
+    await _create_access("iter-0", None).is_deprecated_format_async()
+    await _create_access("iter-0", None).is_deprecated_format_async()
+    await _create_access("iter-1", "fp").is_deprecated_format_async()
+
+    assert loaded_metadata == ["iter-0:tables_info", "iter-0:tables_info", "iter-1:tables_info"]
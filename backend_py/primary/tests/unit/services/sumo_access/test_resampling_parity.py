@@ -0,0 +1,212 @@
+import numpy as np
+import pyarrow as pa
+import pytest
+
+from webviz_services.sumo_access._resampling import (
+    Frequency,
+    generate_normalized_sample_dates,
+    interpolate_backfill,
+    resample_segmented_multi_real_table,
+)
+from webviz_services.sumo_access._field_metadata import is_rate_from_field_meta
+
+
+def _reference_resample_segmented_multi_real_table(table: pa.Table, freq: Frequency) -> pa.Table:
+    """
+    Straight forward per-realization resampling using np.interp() and interpolate_backfill().
+    This is the implementation that the vectorized resampling replaced, kept here as a reference.
+    """
+    # pylint: disable=too-many-locals
+    real_arr_np = table.column("REAL").to_numpy()
+    unique_reals, first_occurrence_idx, real_counts = np.unique(real_arr_np, return_index=True, return_counts=True)
+
+    output_columns_dict: dict[str, pa.ChunkedArray] = {}
+    date_arr_list = []
+    real_arr_list = []
+    per_real_dates = []
+    for i, real in enumerate(unique_reals):
+        raw_dates = table["DATE"].slice(first_occurrence_idx[i], real_counts[i]).to_numpy()
+        sample_dates = generate_normalized_sample_dates(np.min(raw_dates), np.max(raw_dates), freq)
+        per_real_dates.append((raw_dates.astype(np.uint64), sample_dates.astype(np.uint64)))
+        date_arr_list.append(sample_dates)
+        real_arr_list.append(np.full(len(sample_dates), real))
+
+    for colname in table.schema.names:
+        if colname in ["DATE", "REAL"]:
+            continue
+
+        is_rate = is_rate_from_field_meta(table.field(colname))
+        raw_whole_numpy_arr = table.column(colname).to_numpy()
+
+        vec_arr_list = []
+        for i, (raw_dates_as_uint, sample_dates_as_uint) in enumerate(per_real_dates):
+            start_row_idx = first_occurrence_idx[i]
+            raw_numpy_arr = raw_whole_numpy_arr[start_row_idx : start_row_idx + real_counts[i]]
+            if is_rate:
+                vec_arr_list.append(interpolate_backfill(sample_dates_as_uint, raw_dates_as_uint, raw_numpy_arr, 0, 0))
+            else:
+                vec_arr_list.append(np.interp(sample_dates_as_uint, raw_dates_as_uint, raw_numpy_arr))
+
+        output_columns_dict[colname] = pa.chunked_array(vec_arr_list)
+
+    output_columns_dict["DATE"] = pa.chunked_array(date_arr_list)
+    output_columns_dict["REAL"] = pa.chunked_array(real_arr_list)
+
+    return pa.table(output_columns_dict, schema=table.schema)
+
+
+def _create_random_multi_real_table(
+    seed: int, num_reals: int, shuffle_real_segments: bool, shared_dates: bool, non_finite_fraction: float = 0.0
+) -> pa.Table:
+    # pylint: disable=too-many-locals
+    rng = np.random.default_rng(seed)
+
+    start_date_ms = np.datetime64("2018-01-01", "ms").astype(np.int64)
+    day_ms = 24 * 60 * 60 * 1000
+
+    real_numbers = np.arange(num_reals, dtype=np.int16) * 2
+    if shuffle_real_segments:
+        rng.shuffle(real_numbers)
+
+    shared_date_offsets = np.sort(rng.choice(3 * 365, size=60, replace=False))
+
+    date_list = []
+    real_list = []
+    for real in real_numbers:
+        if shared_dates:
+            date_offsets = shared_date_offsets
+        else:
+            num_dates = int(rng.integers(1, 80))
+            date_offsets = np.sort(rng.choice(3 * 365, size=num_dates, replace=False))
+
+        # Include some dates with a time component to exercise the normalization of sample dates
+        date_ms = start_date_ms + date_offsets * day_ms + rng.integers(0, 2, size=len(date_offsets)) * 3_600_000
+        date_list.append(date_ms)
+        real_list.append(np.full(len(date_ms), real, dtype=np.int16))
+
+    num_rows = sum(len(dates) for dates in date_list)
+
+    schema = pa.schema(
+        [
+            pa.field("DATE", pa.timestamp("ms")),
+            pa.field("REAL", pa.int16()),
+            pa.field("TOTAL", pa.float32(), metadata={b"is_rate": b"False"}),
+            pa.field("RATE", pa.float32(), metadata={b"is_rate": b"True"}),
+        ]
+    )
+    total_values = np.cumsum(rng.random(num_rows)).astype(np.float32)
+    rate_values = rng.random(num_rows).astype(np.float32) * 1000
+    for values in (total_values, rate_values):
+        non_finite_mask = rng.random(num_rows) < non_finite_fraction
+        values[non_finite_mask] = rng.choice([np.nan, np.inf, -np.inf], size=int(non_finite_mask.sum()))
+
+    return pa.table(
+        {
+            "DATE": pa.array(np.concatenate(date_list), type=pa.timestamp("ms")),
+            "REAL": pa.array(np.concatenate(real_list), type=pa.int16()),
+            "TOTAL": pa.array(total_values),
+            "RATE": pa.array(rate_values),
+        },
+        schema=schema,
+    )
+
+
+@pytest.mark.parametrize(
+    "freq", [Frequency.DAILY, Frequency.WEEKLY, Frequency.MONTHLY, Frequency.QUARTERLY, Frequency.YEARLY]
+)
+@pytest.mark.parametrize(
+    ["seed", "num_reals", "shuffle_real_segments", "shared_dates"],
+    [
+        (0, 1, False, True),
+        (1, 10, False, True),
+        (2, 10, True, True),
+        (3, 25, False, False),
+        (4, 25, True, False),
+    ],
+)
+def test_vectorized_resampling_matches_reference(
+    freq: Frequency, seed: int, num_reals: int, shuffle_real_segments: bool, shared_dates: bool
+) -> None:
+    input_table = _create_random_multi_real_table(seed, num_reals, shuffle_real_segments, shared_dates)
+
+    expected_table = _reference_resample_segmented_multi_real_table(input_table, freq)
+    actual_table = resample_segmented_multi_real_table(input_table, freq)
+
+    assert actual_table.schema.equals(expected_table.schema, check_metadata=True)
+    assert actual_table["DATE"].equals(expected_table["DATE"])
+    assert actual_table["REAL"].equals(expected_table["REAL"])
+    assert np.array_equal(actual_table["RATE"].to_numpy(), expected_table["RATE"].to_numpy())
+    assert np.array_equal(actual_table["TOTAL"].to_numpy(), expected_table["TOTAL"].to_numpy())
+
+
+@pytest.mark.parametrize("freq", [Frequency.DAILY, Frequency.MONTHLY, Frequency.YEARLY])
+@pytest.mark.parametrize("seed", [10, 11, 12])
+def test_vectorized_resampling_matches_reference_with_non_finite_values(freq: Frequency, seed: int) -> None:
+    input_table = _create_random_multi_real_table(
+        seed, num_reals=10, shuffle_real_segments=True, shared_dates=False, non_finite_fraction=0.2
+    )
+
+    expected_table = _reference_resample_segmented_multi_real_table(input_table, freq)
+    actual_table = resample_segmented_multi_real_table(input_table, freq)
+
+    assert np.array_equal(actual_table["RATE"].to_numpy(), expected_table["RATE"].to_numpy(), equal_nan=True)
+    assert np.array_equal(actual_table["TOTAL"].to_numpy(), expected_table["TOTAL"].to_numpy(), equal_nan=True)
+
+
+@pytest.mark.parametrize("non_finite_value", [np.nan, np.inf, -np.inf])
+def test_vectorized_resampling_returns_raw_value_on_raw_date_next_to_non_finite_value(non_finite_value: float) -> None:
+    schema = pa.schema(
+        [
+            pa.field("DATE", pa.timestamp("ms")),
+            pa.field("REAL", pa.int16()),
+            pa.field("TOTAL", pa.float64(), metadata={b"is_rate": b"False"}),
+        ]
+    )
+    dates = [np.datetime64(f"2020-0{month}-01", "ms") for month in range(1, 6)]
+    input_table = pa.table(
+        {
+            "DATE": pa.array(dates, type=pa.timestamp("ms")),
+            "REAL": pa.array([0] * 5, type=pa.int16()),
+            "TOTAL": pa.array([1.0, non_finite_value, 3.0, 4.0, 5.0]),
+        },
+        schema=schema,
+    )
+
+    resampled_values = resample_segmented_multi_real_table(input_table, Frequency.MONTHLY)["TOTAL"].to_numpy()
+
+    assert np.array_equal(resampled_values, [1.0, non_finite_value, 3.0, 4.0, 5.0], equal_nan=True)
+
+
+def test_vectorized_resampling_returns_single_chunk_per_column() -> None:
+    input_table = _create_random_multi_real_table(seed=5, num_reals=10, shuffle_real_segments=True, shared_dates=False)
+
+    resampled_table = resample_segmented_multi_real_table(input_table, Frequency.MONTHLY)
+
+    for column in resampled_table.columns:
+        assert column.num_chunks == 1
+
+
+def test_vectorized_resampling_handles_single_date_realizations() -> None:
+    schema = pa.schema(
+        [
+            pa.field("DATE", pa.timestamp("ms")),
+            pa.field("REAL", pa.int16()),
+            pa.field("TOTAL", pa.float32(), metadata={b"is_rate": b"False"}),
+            pa.field("RATE", pa.float32(), metadata={b"is_rate": b"True"}),
+        ]
+    )
+    dates = [np.datetime64("2020-01-15", "ms"), np.datetime64("2020-01-01", "ms"), np.datetime64("2020-03-01", "ms")]
+    input_table = pa.table(
+        {
+            "DATE": pa.array(dates, type=pa.timestamp("ms")),
+            "REAL": pa.array([1, 0, 0], type=pa.int16()),
+            "TOTAL": pa.array([5.0, 10.0, 20.0], type=pa.float32()),
+            "RATE": pa.array([1.0, 2.0, 3.0], type=pa.float32()),
+        },
+        schema=schema,
+    )
+
+    expected_table = _reference_resample_segmented_multi_real_table(input_table, Frequency.MONTHLY)
+    actual_table = resample_segmented_multi_real_table(input_table, Frequency.MONTHLY)
+
+    assert actual_table.equals(expected_table)
@@ -0,0 +1,176 @@
+# pylint: disable=async-suffix
+
+from typing import Any
+
+import asyncio
+
+import pytest
+
+from webviz_services.sumo_access import sumo_fingerprinter
+from webviz_services.sumo_access.sumo_fingerprinter import DocSetDigest, SumoFingerprinter, _SharedFingerprintTier
+from webviz_services.utils.authenticated_user import AuthenticatedUser
+
+
+class _FakePipeline:
+    def __init__(self, redis_client: "_FakeRedis") -> None:
+        self._redis_client = redis_client
+        self._commands: list[tuple[str, Any]] = []
+
+    async def __aenter__(self) -> "_FakePipeline":
+        return self
+
+    async def __aexit__(self, *args: Any) -> None:
+        pass
+
+    def mset(self, mapping: dict[str, str]) -> None:
+        self._commands.append(("mset", mapping))
+
+    def expire(self, name: str, time: int) -> None:
+        self._commands.append(("expire", (name, time)))
+
+    async def execute(self) -> None:
+        self._redis_client.round_trips.append([cmd for cmd, _arg in self._commands])
+        for cmd, arg in self._commands:
+            if cmd == "mset":
+                self._redis_client.store.update(arg)
+            else:
+                self._redis_client.ttls[arg[0]] = arg[1]
+
+
+class _FakeRedis:
+    def __init__(self) -> None:
+        self.store: dict[str, str] = {}
+        self.ttls: dict[str, int] = {}
+        self.round_trips: list[list[str]] = []
+
+    async def get(self, key: str) -> str | None:
+        self.round_trips.append(["get"])
+        return self.store.get(key)
+
+    async def mget(self, keys: list[str]) -> list[str | None]:
+        self.round_trips.append(["mget"])
+        return [self.store.get(key) for key in keys]
+
+    def pipeline(self, transaction: bool) -> _FakePipeline:
+        assert not transaction
+        return _FakePipeline(self)
+
+
+@pytest.fixture(name="gathered_digests")
+def fixture_gathered_digests(monkeypatch: pytest.MonkeyPatch) -> list[tuple[str, ...]]:
+    gathered_digests: list[tuple[str, ...]] = []
+
+    async def fake_gather_case_digest_async(_sumo_client: Any, case_uuid: str) -> DocSetDigest:
+        gathered_digests.append((case_uuid,))
+        if case_uuid == "broken_case":
+            raise ValueError("Sumo error")
+        return DocSetDigest(
+            total_num_docs=1, checksum=f"{case_uuid}_cs", num_docs_in_checksum=1, max_timestamp_utc_ms=0
+        )
+
+    async def fake_gather_ensemble_digest_async(
+        _sumo_client: Any, case_uuid: str, ensemble_name: str, _class_name: str | None
+    ) -> DocSetDigest:
+        gathered_digests.append((case_uuid, ensemble_name))
+        return DocSetDigest(
+            total_num_docs=2, checksum=f"{ensemble_name}_cs", num_docs_in_checksum=2, max_timestamp_utc_ms=0
+        )
+
+    monkeypatch.setattr(sumo_fingerprinter, "_gather_case_digest_async", fake_gather_case_digest_async)
+    monkeypatch.setattr(sumo_fingerprinter, "_gather_ensemble_digest_async", fake_gather_ensemble_digest_async)
+    monkeypatch.setattr(sumo_fingerprinter, "create_sumo_client", lambda _access_token: None)
+    return gathered_digests
+
+
+def _create_fingerprinter(
+    redis_client: _FakeRedis, user_id: str = "user", shared_tier: _SharedFingerprintTier | None = None
+) -> SumoFingerprinter:
+    user = AuthenticatedUser(
+        user_id=user_id, username=f"{user_id}@equinor.com", access_tokens={"sumo_access_token": "token"}  # type: ignore
+    )
+    return SumoFingerprinter(user, redis_client, cache_ttl_s=300, shared_tier=shared_tier)  # type: ignore
+
+
+async def test_case_digest_is_shared_between_ensembles_of_same_case(gathered_digests: list[tuple[str, ...]]) -> None:
+    redis_client = _FakeRedis()
+    fingerprinter = _create_fingerprinter(redis_client)
+
+    fps = await fingerprinter.calc_and_store_ensemble_fps_async([("case1", "iter-0"), ("case1", "iter-1")])
+
+    assert fps == ["NO_TS__case:1:case1_cs__ens:2:iter-0_cs", "NO_TS__case:1:case1_cs__ens:2:iter-1_cs"]
+    assert sorted(gathered_digests) == [("case1",), ("case1", "iter-0"), ("case1", "iter-1")]
+
+    # All fingerprints written in a single pipelined round-trip
+    assert redis_client.round_trips == [["mset", "expire", "expire"]]
+    assert set(redis_client.store.values()) == set(fps)
+    assert set(redis_client.ttls.values()) == {300}
+
+
+async def test_failing_case_only_affects_its_own_ensembles(gathered_digests: list[tuple[str, ...]]) -> None:
+    # pylint: disable=unused-argument
+    redis_client = _FakeRedis()
+    fingerprinter = _create_fingerprinter(redis_client)
+
+    fps = await fingerprinter.calc_and_store_ensemble_fps_async([("broken_case", "iter-0"), ("case1", "iter-0")])
+
+    assert isinstance(fps[0], ValueError)
+    assert fps[1] == "NO_TS__case:1:case1_cs__ens:2:iter-0_cs"
+    assert list(redis_client.store.values()) == [fps[1]]
+
+
+async def test_shared_tier_serves_other_users_after_access_check(
+    gathered_digests: list[tuple[str, ...]], monkeypatch: pytest.MonkeyPatch
+) -> None:
+    users_with_access = {"user_a", "user_b"}
+    verified_users: list[str] = []
+
+    async def fake_verify_case_access_async(self: SumoFingerprinter, _case_uuid: str) -> bool:
+        # pylint: disable=protected-access
+        verified_users.append(self._user_id)
+        return self._user_id in users_with_access
+
+    monkeypatch.setattr(SumoFingerprinter, "_verify_case_access_async", fake_verify_case_access_async)
+
+    redis_client = _FakeRedis()
+    shared_tier = _SharedFingerprintTier()
+
+    fp_a = await _create_fingerprinter(redis_client, "user_a", shared_tier).get_or_calc_ensemble_fp_async(
+        "case1", "iter-0"
+    )
+    await asyncio.sleep(0)
+    assert len(gathered_digests) == 2
+    assert shared_tier.make_redis_key("case1", "iter-0") in redis_client.store
+
+    # Another user with access gets the shared fingerprint without any Sumo aggregations
+    fingerprinter_b = _create_fingerprinter(redis_client, "user_b", shared_tier)
+    assert await fingerprinter_b.get_or_calc_ensemble_fp_async("case1", "iter-0") == fp_a
+    assert len(gathered_digests) == 2
+    assert verified_users == ["user_b"]
+
+    # Once verified, the in-process LRU serves the fingerprint without a Redis round-trip
+    num_round_trips = len(redis_client.round_trips)
+    assert await fingerprinter_b.get_or_calc_ensemble_fp_async("case1", "iter-0") == fp_a
+    assert len(redis_client.round_trips) == num_round_trips
+
+    # A user without access must calculate the fingerprint on their own
+    await _create_fingerprinter(redis_client, "user_c", shared_tier).get_or_calc_ensemble_fp_async("case1", "iter-0")
+    assert verified_users == ["user_b", "user_c"]
+    assert len(gathered_digests) == 4
+
+
+async def test_shared_tier_is_not_filled_when_case_is_not_visible(monkeypatch: pytest.MonkeyPatch) -> None:
+    async def fake_gather_digest_async(*_args: Any) -> DocSetDigest:
+        return DocSetDigest(total_num_docs=0, checksum="", num_docs_in_checksum=0, max_timestamp_utc_ms=-1)
+
+    monkeypatch.setattr(sumo_fingerprinter, "_gather_case_digest_async", fake_gather_digest_async)
+    monkeypatch.setattr(sumo_fingerprinter, "_gather_ensemble_digest_async", fake_gather_digest_async)
+    monkeypatch.setattr(sumo_fingerprinter, "create_sumo_client", lambda _access_token: None)
+
+    redis_client = _FakeRedis()
+    shared_tier = _SharedFingerprintTier()
+    fingerprinter = _create_fingerprinter(redis_client, "user", shared_tier)
+
+    await fingerprinter.calc_and_store_ensemble_fps_async([("case1", "iter-0")])
+
+    assert list(redis_client.store.keys()) == ["sumo_fingerprinter:user:user:case:case1:ens:iter-0"]
+    assert not shared_tier.has_verified_access("user", "case1")
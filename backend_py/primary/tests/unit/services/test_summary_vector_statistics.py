@@ -1,8 +1,14 @@
 from datetime import datetime
 import pytest
 import pyarrow as pa
-
-from webviz_services.summary_vector_statistics import compute_vector_statistics_table
+import pyarrow.compute as pc
+
+from webviz_services.summary_vector_statistics import (
+    compute_vector_statistics,
+    compute_vector_statistics_per_sensitivity_case,
+    compute_vector_statistics_table,
+)
+from webviz_services.sumo_access.parameter_types import EnsembleSensitivity, EnsembleSensitivityCase, SensitivityType
 from webviz_services.utils.statistic_function import StatisticFunction
 from webviz_services.service_exceptions import InvalidParameterError
 
@@ -167,3 +173,88 @@ class TestComputeVectorStatisticsTable:
         # All statistic columns should be float32, not float64
         assert result.field("MIN").type == pa.float32()
         assert result.field("MAX").type == pa.float32()
+
+
+def _create_sensitivity_test_table() -> pa.Table:
+    dates = [datetime(2020, 1, 1), datetime(2020, 2, 1), datetime(2020, 3, 1)]
+    date_column: list[datetime] = []
+    real_column: list[int] = []
+    value_column: list[float] = []
+    for real in range(6):
+        for date_idx, date in enumerate(dates):
+            date_column.append(date)
+            real_column.append(real)
+            value_column.append(float(real * 10 + date_idx) if (real, date_idx) != (4, 1) else float("nan"))
+
+    return pa.table(
+        {
+            "DATE": pa.array(date_column, type=pa.timestamp("ms")),
+            "REAL": pa.array(real_column, type=pa.int16()),
+            "VECTOR": pa.array(value_column, type=pa.float32()),
+        }
+    )
+
+
+_SENSITIVITIES = [
+    EnsembleSensitivity(
+        name="rms_seed",
+        type=SensitivityType.MONTECARLO,
+        cases=[EnsembleSensitivityCase(name="p10_p90", realizations=[0, 1, 2])],
+    ),
+    EnsembleSensitivity(
+        name="faults",
+        type=SensitivityType.SCENARIO,
+        cases=[
+            EnsembleSensitivityCase(name="low", realizations=[2, 3]),
+            EnsembleSensitivityCase(name="high", realizations=[4, 5]),
+            EnsembleSensitivityCase(name="missing", realizations=[99]),
+        ],
+    ),
+]
+
+
+class TestComputeVectorStatisticsPerSensitivityCase:
+
+    def test_matches_per_case_computation(self):
+        """Test that the single pass result equals computing statistics for each case separately"""
+        table = _create_sensitivity_test_table()
+
+        result = compute_vector_statistics_per_sensitivity_case(table, "VECTOR", None, _SENSITIVITIES)
+
+        assert set(result.keys()) == {("rms_seed", "p10_p90"), ("faults", "low"), ("faults", "high")}
+        for sensitivity in _SENSITIVITIES:
+            for case in sensitivity.cases:
+                case_table = table.filter(pc.is_in(table["REAL"], value_set=pa.array(case.realizations)))
+                expected = compute_vector_statistics(case_table, "VECTOR", None)
+                assert result.get((sensitivity.name, case.name)) == expected
+
+    def test_realization_in_several_cases_is_included_in_each(self):
+        """Test that a realization shared between cases contributes to the statistics of all of them"""
+        table = _create_sensitivity_test_table()
+
+        result = compute_vector_statistics_per_sensitivity_case(
+            table, "VECTOR", [StatisticFunction.MEAN], _SENSITIVITIES
+        )
+
+        assert result[("rms_seed", "p10_p90")].realizations == [0, 1, 2]
+        assert result[("faults", "low")].realizations == [2, 3]
+        assert result[("faults", "low")].timestamps_utc_ms == table["DATE"].to_numpy()[:3].astype(int).tolist()
+        assert result[("faults", "low")].values_dict[StatisticFunction.MEAN] == [25.0, 26.0, 27.0]
+
+    def test_no_matching_realizations_returns_empty_dict(self):
+        """Test that no overlap between the table and the sensitivity realizations gives an empty result"""
+        table = _create_sensitivity_test_table()
+        sensitivities = [
+            EnsembleSensitivity(
+                name="other",
+                type=SensitivityType.SCENARIO,
+                cases=[EnsembleSensitivityCase(name="case", realizations=[50, 51])],
+            )
+        ]
+
+        assert not compute_vector_statistics_per_sensitivity_case(table, "VECTOR", None, sensitivities)
+
+    def test_empty_statistic_functions_raises_error(self):
+        """Test that empty statistic functions list raises InvalidParameterError"""
+        with pytest.raises(InvalidParameterError):
+            compute_vector_statistics_per_sensitivity_case(_create_sensitivity_test_table(), "VECTOR", [], [])
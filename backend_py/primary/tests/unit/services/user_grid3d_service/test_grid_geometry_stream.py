@@ -0,0 +1,63 @@
+import numpy as np
+import pytest
+
+from webviz_server_schemas.user_grid3d_ri import api_schemas
+from webviz_server_schemas.user_grid3d_ri.grid_geometry_stream import FrameKind, GridGeometryStreamDecoder
+from webviz_server_schemas.user_grid3d_ri.grid_geometry_stream import encode_array_frame, encode_json_frame
+
+_HEADER = api_schemas.GridGeometryStreamHeader(
+    vertex_count=4,
+    poly_count=2,
+    polys_element_count=10,
+    origin_utm_x=1.0,
+    origin_utm_y=2.0,
+    grid_dimensions=api_schemas.GridDimensions(i_count=2, j_count=1, k_count=1),
+)
+_TRAILER = api_schemas.GridGeometryStreamTrailer(
+    bounding_box=api_schemas.BoundingBox3D(min_x=0, min_y=0, min_z=0, max_x=3, max_y=3, max_z=3),
+    stats=None,
+)
+
+
+def _encode_stream(array_chunks: list[tuple[FrameKind, np.ndarray]]) -> bytes:
+    stream_parts = [encode_json_frame(FrameKind.HEADER, _HEADER)]
+    for kind, arr in array_chunks:
+        prefix, payload = encode_array_frame(kind, arr)
+        stream_parts.extend([prefix, bytes(payload)])
+    stream_parts.append(encode_json_frame(FrameKind.TRAILER, _TRAILER))
+    return b"".join(stream_parts)
+
+
+@pytest.mark.parametrize("feed_size", [1, 7, 1024])
+def test_decoder_reassembles_chunked_arrays(feed_size: int) -> None:
+    vertices = np.arange(12, dtype=np.float32)
+    polys = np.array([4, 0, 1, 2, 3, 4, 1, 2, 3, 0], dtype=np.uint32)
+    stream = _encode_stream(
+        [
+            (FrameKind.VERTICES, vertices[:6]),
+            (FrameKind.POLYS, polys),
+            (FrameKind.VERTICES, vertices[6:]),
+            (FrameKind.POLY_SOURCE_CELL_INDICES, np.array([0, 1])),
+        ]
+    )
+
+    decoder = GridGeometryStreamDecoder()
+    for start in range(0, len(stream), feed_size):
+        decoder.feed(stream[start : start + feed_size])
+    result = decoder.get_result()
+
+    np.testing.assert_array_equal(result.vertices, vertices)
+    np.testing.assert_array_equal(result.polys, polys)
+    np.testing.assert_array_equal(result.poly_source_cell_indices, [0, 1])
+    assert result.header == _HEADER
+    assert result.trailer == _TRAILER
+
+
+def test_decoder_rejects_incomplete_stream() -> None:
+    stream = _encode_stream([(FrameKind.VERTICES, np.arange(12))])
+
+    decoder = GridGeometryStreamDecoder()
+    decoder.feed(stream)
+
+    with pytest.raises(ValueError):
+        decoder.get_result()
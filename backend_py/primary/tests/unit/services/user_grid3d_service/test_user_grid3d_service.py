@@ -0,0 +1,137 @@
+# pylint: disable=async-suffix
+
+from typing import Any, Callable
+from unittest.mock import MagicMock
+
+import httpx
+import numpy as np
+import pytest
+
+from webviz_core_utils.b64 import b64_encode_float_array_as_float32, b64_encode_uint_array_as_smallest_size
+from webviz_server_schemas.user_grid3d_ri import api_schemas
+from webviz_server_schemas.user_grid3d_ri.grid_geometry_stream import FrameKind
+from webviz_server_schemas.user_grid3d_ri.grid_geometry_stream import encode_array_frame, encode_json_frame
+from webviz_services.service_exceptions import ServiceRequestError
+from webviz_services.user_grid3d_service import user_grid3d_service
+from webviz_services.user_grid3d_service.user_grid3d_service import UserGrid3dService
+
+_VERTICES = np.arange(12, dtype=np.float32)
+_POLYS = np.array([4, 0, 1, 2, 3], dtype=np.uint32)
+_POLY_SOURCE_CELL_INDICES = np.array([0], dtype=np.uint32)
+_GRID_DIMENSIONS = api_schemas.GridDimensions(i_count=1, j_count=1, k_count=1)
+_BOUNDING_BOX = api_schemas.BoundingBox3D(min_x=0, min_y=0, min_z=0, max_x=3, max_y=3, max_z=3)
+
+
+def _make_stream_content() -> bytes:
+    header = api_schemas.GridGeometryStreamHeader(
+        vertex_count=4,
+        poly_count=1,
+        polys_element_count=len(_POLYS),
+        origin_utm_x=1.0,
+        origin_utm_y=2.0,
+        grid_dimensions=_GRID_DIMENSIONS,
+    )
+    trailer = api_schemas.GridGeometryStreamTrailer(bounding_box=_BOUNDING_BOX, stats=None)
+
+    stream_parts = [encode_json_frame(FrameKind.HEADER, header)]
+    for kind, arr in [
+        (FrameKind.VERTICES, _VERTICES),
+        (FrameKind.POLYS, _POLYS),
+        (FrameKind.POLY_SOURCE_CELL_INDICES, _POLY_SOURCE_CELL_INDICES),
+    ]:
+        prefix, payload = encode_array_frame(kind, arr)
+        stream_parts.extend([prefix, bytes(payload)])
+    stream_parts.append(encode_json_frame(FrameKind.TRAILER, trailer))
+    return b"".join(stream_parts)
+
+
+def _make_json_content() -> bytes:
+    response = api_schemas.GridGeometryResponse(
+        vertices_b64arr=b64_encode_float_array_as_float32(_VERTICES),
+        polys_b64arr=b64_encode_uint_array_as_smallest_size(_POLYS),
+        poly_source_cell_indices_b64arr=b64_encode_uint_array_as_smallest_size(_POLY_SOURCE_CELL_INDICES),
+        origin_utm_x=1.0,
+        origin_utm_y=2.0,
+        grid_dimensions=_GRID_DIMENSIONS,
+        bounding_box=_BOUNDING_BOX,
+        stats=None,
+    )
+    return response.model_dump_json().encode()
+
+
+@pytest.fixture(name="requested_endpoints")
+def fixture_requested_endpoints(monkeypatch: pytest.MonkeyPatch) -> list[str]:
+    async def fake_get_grid_geometry_blob_id_async(*_args: Any) -> str:
+        return "grid_blob_uuid"
+
+    monkeypatch.setattr(user_grid3d_service, "get_grid_geometry_blob_id_async", fake_get_grid_geometry_blob_id_async)
+    return []
+
+
+def _install_session_handler(
+    monkeypatch: pytest.MonkeyPatch, handler: Callable[[httpx.Request], httpx.Response]
+) -> None:
+    original_async_client = httpx.AsyncClient
+
+    def make_client(**kwargs: Any) -> httpx.AsyncClient:
+        return original_async_client(transport=httpx.MockTransport(handler), **kwargs)
+
+    monkeypatch.setattr(user_grid3d_service.httpx, "AsyncClient", make_client)
+
+
+def _create_service() -> UserGrid3dService:
+    return UserGrid3dService(
+        session_base_url="http://user-session",
+        sumo_client=MagicMock(),
+        case_uuid="case_uuid",
+        sas_token="sas_token",
+        blob_store_base_uri="blob_store_base_uri",
+    )
+
+
+async def test_grid_geometry_is_read_from_stream_endpoint(
+    monkeypatch: pytest.MonkeyPatch, requested_endpoints: list[str]
+) -> None:
+    def handler(request: httpx.Request) -> httpx.Response:
+        requested_endpoints.append(request.url.path)
+        return httpx.Response(200, content=_make_stream_content())
+
+    _install_session_handler(monkeypatch, handler)
+    geometry = await _create_service().get_grid_geometry_async("iter-0", 0, "grid", None)
+
+    assert requested_endpoints == ["/get_grid_geometry_stream"]
+    assert geometry.vertices_b64arr == b64_encode_float_array_as_float32(_VERTICES)
+    assert geometry.polys_b64arr == b64_encode_uint_array_as_smallest_size(_POLYS)
+
+
+async def test_grid_geometry_falls_back_to_json_endpoint_for_older_sessions(
+    monkeypatch: pytest.MonkeyPatch, requested_endpoints: list[str]
+) -> None:
+    def handler(request: httpx.Request) -> httpx.Response:
+        requested_endpoints.append(request.url.path)
+        if request.url.path == "/get_grid_geometry_stream":
+            return httpx.Response(404, json={"detail": "Not Found"})
+        return httpx.Response(200, content=_make_json_content())
+
+    _install_session_handler(monkeypatch, handler)
+    geometry = await _create_service().get_grid_geometry_async("iter-0", 0, "grid", None)
+
+    assert requested_endpoints == ["/get_grid_geometry_stream", "/get_grid_geometry"]
+    assert geometry.vertices_b64arr == b64_encode_float_array_as_float32(_VERTICES)
+    assert geometry.polys_b64arr == b64_encode_uint_array_as_smallest_size(_POLYS)
+    assert geometry.origin_utm_x == 1.0
+    assert geometry.bounding_box.max_z == 3
+
+
+async def test_grid_geometry_does_not_fall_back_on_other_errors(
+    monkeypatch: pytest.MonkeyPatch, requested_endpoints: list[str]
+) -> None:
+    def handler(request: httpx.Request) -> httpx.Response:
+        requested_endpoints.append(request.url.path)
+        return httpx.Response(500, text="Internal error")
+
+    _install_session_handler(monkeypatch, handler)
+    with pytest.raises(ServiceRequestError):
+        await _create_service().get_grid_geometry_async("iter-0", 0, "grid", None)
+
+    assert requested_endpoints == ["/get_grid_geometry_stream"]
@@ -0,0 +1,22 @@
+import json
+
+from webviz_services.utils.json_size import estimate_json_items_size_bytes
+
+
+def test_estimate_grows_with_number_of_items_and_value_size() -> None:
+    short_items = json.loads(json.dumps([{"name": "a", "md": 1.0}] * 100))
+    long_items = json.loads(json.dumps([{"name": "a" * 1000, "md": 1.0}] * 100))
+
+    assert estimate_json_items_size_bytes([]) > 0
+    assert estimate_json_items_size_bytes(short_items[:10]) < estimate_json_items_size_bytes(short_items)
+    assert estimate_json_items_size_bytes(long_items) > 100 * 1000
+
+
+def test_estimate_is_scaled_from_sample_of_items() -> None:
+    items = json.loads(json.dumps([{"name": f"wellbore_{i}", "values": [i, i + 1]} for i in range(10000)]))
+
+    estimate = estimate_json_items_size_bytes(items)
+    exact = sum(len(json.dumps(item)) for item in items)
+
+    # Decoded objects use more memory than their JSON text, but the estimate should stay in the same ballpark
+    assert exact < estimate < 20 * exact
@@ -0,0 +1,107 @@
+import asyncio
+import logging
+
+import pytest
+
+from webviz_services.utils.single_flight import SingleFlightGroup
+
+
+async def test_concurrent_identical_calls_are_coalesced() -> None:
+    group: SingleFlightGroup[str] = SingleFlightGroup("test")
+    num_executions = 0
+
+    async def load_async() -> str:
+        nonlocal num_executions
+        num_executions += 1
+        await asyncio.sleep(0.01)
+        return "result"
+
+    results = await asyncio.gather(*[group.do_async("key", load_async) for _ in range(5)])
+
+    assert results == ["result"] * 5
+    assert num_executions == 1
+
+    stats = group.get_stats()
+    assert stats.num_calls == 5
+    assert stats.num_executions == 1
+    assert stats.num_coalesced_waiters == 4
+    assert stats.num_in_flight == 0
+
+
+async def test_different_keys_are_not_coalesced() -> None:
+    group: SingleFlightGroup[str] = SingleFlightGroup("test")
+
+    async def load_async(value: str) -> str:
+        await asyncio.sleep(0.01)
+        return value
+
+    results = await asyncio.gather(
+        group.do_async("a", lambda: load_async("a")), group.do_async("b", lambda: load_async("b"))
+    )
+
+    assert results == ["a", "b"]
+    assert group.get_stats().num_executions == 2
+
+
+async def test_key_is_released_after_completion() -> None:
+    group: SingleFlightGroup[int] = SingleFlightGroup("test")
+    num_executions = 0
+
+    async def load_async() -> int:
+        nonlocal num_executions
+        num_executions += 1
+        return num_executions
+
+    assert await group.do_async("key", load_async) == 1
+    assert await group.do_async("key", load_async) == 2
+
+
+async def test_exception_is_propagated_to_all_waiters() -> None:
+    group: SingleFlightGroup[str] = SingleFlightGroup("test")
+
+    async def failing_load_async() -> str:
+        await asyncio.sleep(0.01)
+        raise ValueError("load failed")
+
+    results = await asyncio.gather(
+        *[group.do_async("key", failing_load_async) for _ in range(3)], return_exceptions=True
+    )
+
+    assert all(isinstance(res, ValueError) for res in results)
+    assert group.get_stats().num_executions == 1
+
+
+async def test_cancelled_waiter_does_not_cancel_shared_work() -> None:
+    group: SingleFlightGroup[str] = SingleFlightGroup("test")
+
+    async def load_async() -> str:
+        await asyncio.sleep(0.05)
+        return "result"
+
+    first_waiter = asyncio.create_task(group.do_async("key", load_async))
+    second_waiter = asyncio.create_task(group.do_async("key", load_async))
+    await asyncio.sleep(0.01)
+
+    first_waiter.cancel()
+    with pytest.raises(asyncio.CancelledError):
+        await first_waiter
+
+    assert await second_waiter == "result"
+
+
+async def test_coalesced_flight_is_logged_with_stats(caplog: pytest.LogCaptureFixture) -> None:
+    group: SingleFlightGroup[str] = SingleFlightGroup("test")
+
+    async def load_async() -> str:
+        await asyncio.sleep(0.01)
+        return "result"
+
+    with caplog.at_level(logging.INFO, logger="webviz_services.utils.single_flight"):
+        await group.do_async("single", load_async)
+        await asyncio.gather(*[group.do_async("key", load_async) for _ in range(3)])
+        await asyncio.sleep(0)
+
+    assert [record.getMessage() for record in caplog.records] == [
+        "SingleFlightGroup[test] coalesced 2 waiter(s) into one execution "
+        "(total calls=4, executions=2, coalesced=2, in flight=0)"
+    ]
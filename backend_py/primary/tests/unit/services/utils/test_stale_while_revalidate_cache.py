@@ -0,0 +1,99 @@
+# pylint: disable=async-suffix
+
+import asyncio
+from typing import Callable
+
+import pytest
+
+from webviz_services.utils.stale_while_revalidate_cache import StaleWhileRevalidateCache
+
+
+def _create_cache(fresh_ttl_s: float, stale_ttl_s: float, max_entries: int = 10) -> StaleWhileRevalidateCache[str]:
+    return StaleWhileRevalidateCache(
+        name="test",
+        fresh_ttl_s=fresh_ttl_s,
+        stale_ttl_s=stale_ttl_s,
+        max_size_bytes=1024,
+        max_entries=max_entries,
+        size_fn=len,
+    )
+
+
+def _create_counting_loader() -> tuple[Callable, list[int]]:
+    num_loads = [0]
+
+    async def load_async() -> str:
+        num_loads[0] += 1
+        await asyncio.sleep(0.01)
+        return f"value{num_loads[0]}"
+
+    return load_async, num_loads
+
+
+async def test_fresh_entry_is_served_without_loading() -> None:
+    cache = _create_cache(fresh_ttl_s=60, stale_ttl_s=60)
+    loader, num_loads = _create_counting_loader()
+
+    assert await cache.get_or_load_async("key", loader) == "value1"
+    assert await cache.get_or_load_async("key", loader) == "value1"
+    assert num_loads[0] == 1
+
+
+async def test_concurrent_misses_are_coalesced() -> None:
+    cache = _create_cache(fresh_ttl_s=60, stale_ttl_s=60)
+    loader, num_loads = _create_counting_loader()
+
+    results = await asyncio.gather(*[cache.get_or_load_async("key", loader) for _ in range(5)])
+    assert results == ["value1"] * 5
+    assert num_loads[0] == 1
+
+
+async def test_stale_entry_is_served_and_refreshed_in_background() -> None:
+    cache = _create_cache(fresh_ttl_s=0.02, stale_ttl_s=60)
+    loader, num_loads = _create_counting_loader()
+
+    assert await cache.get_or_load_async("key", loader) == "value1"
+    await asyncio.sleep(0.03)
+
+    # Stale, so the old value is returned right away while a single refresh is started
+    assert await cache.get_or_load_async("key", loader) == "value1"
+    assert await cache.get_or_load_async("key", loader) == "value1"
+    assert cache.get_num_stale_hits() == 2
+
+    await asyncio.sleep(0.05)
+    assert num_loads[0] == 2
+    assert await cache.get_or_load_async("key", loader) == "value2"
+
+
+async def test_expired_entry_is_reloaded() -> None:
+    cache = _create_cache(fresh_ttl_s=0.01, stale_ttl_s=0.01)
+    loader, num_loads = _create_counting_loader()
+
+    assert await cache.get_or_load_async("key", loader) == "value1"
+    await asyncio.sleep(0.03)
+
+    assert await cache.get_or_load_async("key", loader) == "value2"
+    assert num_loads[0] == 2
+
+
+async def test_failed_load_is_not_cached() -> None:
+    cache = _create_cache(fresh_ttl_s=60, stale_ttl_s=60)
+
+    async def failing_load_async() -> str:
+        raise ValueError("load failed")
+
+    with pytest.raises(ValueError):
+        await cache.get_or_load_async("key", failing_load_async)
+
+    loader, _num_loads = _create_counting_loader()
+    assert await cache.get_or_load_async("key", loader) == "value1"
+
+
+async def test_entries_are_bounded_by_count() -> None:
+    cache = _create_cache(fresh_ttl_s=60, stale_ttl_s=60, max_entries=1)
+    loader, num_loads = _create_counting_loader()
+
+    await cache.get_or_load_async("a", loader)
+    await cache.get_or_load_async("b", loader)
+    await cache.get_or_load_async("a", loader)
+    assert num_loads[0] == 3
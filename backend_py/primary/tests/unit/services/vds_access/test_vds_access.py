@@ -0,0 +1,112 @@
+# pylint: disable=async-suffix
+
+import json
+from typing import Iterator
+
+import httpx
+import numpy as np
+import pytest
+
+from webviz_services.services_config import ServicesConfig
+from webviz_services.service_exceptions import InvalidDataError
+from webviz_services.utils.httpx_async_client_wrapper import HTTPX_ASYNC_CLIENT_WRAPPER
+from webviz_services.vds_access._multipart import parse_multipart_body_parts
+from webviz_services.vds_access import vds_access as vds_access_module
+from webviz_services.vds_access.vds_access import VdsAccess
+
+_BOUNDARY = "be2e3d4b"
+_SLICE_VALUES = np.arange(6, dtype="<f4")
+
+
+def _encode_multipart(parts: list[bytes]) -> bytes:
+    body = b""
+    for part in parts:
+        body += f"--{_BOUNDARY}\r\nContent-Type: application/octet-stream\r\n\r\n".encode() + part + b"\r\n"
+    return body + f"--{_BOUNDARY}--\r\n".encode()
+
+
+def _slice_response_content() -> bytes:
+    slice_metadata = {
+        "format": "<f4",
+        "shape": [2, 3],
+        "x": {"annotation": "Inline", "max": 2.0, "min": 1.0, "samples": 2, "unit": "unitless"},
+        "y": {"annotation": "Sample", "max": 3.0, "min": 1.0, "samples": 3, "unit": "ms"},
+        "geospatial": [[0.0, 0.0], [1.0, 0.0], [1.0, 1.0], [0.0, 1.0]],
+    }
+    return _encode_multipart([json.dumps(slice_metadata).encode(), _SLICE_VALUES.tobytes()])
+
+
+@pytest.fixture(name="requested_endpoints")
+def fixture_requested_endpoints(monkeypatch: pytest.MonkeyPatch) -> Iterator[list[str]]:
+    # The process-wide services config may already have been initialized by other tests
+    services_config = ServicesConfig(
+        sumo_env="dev",
+        smda_subscription_key="key",
+        enterprise_subscription_key="key",
+        surface_query_url="",
+        vds_host_address="http://vds",
+        redis_user_session_url="",
+    )
+    monkeypatch.setattr(vds_access_module, "get_services_config", lambda: services_config)
+
+    requested_endpoints: list[str] = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        endpoint = request.url.path.strip("/")
+        requested_endpoints.append(endpoint)
+        if endpoint == "slice":
+            return httpx.Response(
+                200,
+                content=_slice_response_content(),
+                headers={"Content-Type": f'multipart/mixed; boundary="{_BOUNDARY}"'},
+            )
+        if endpoint == "metadata":
+            return httpx.Response(200, json={"axis": [], "boundingBox": {"cdp": [], "ij": [], "ilxl": []}, "crs": ""})
+        return httpx.Response(404)
+
+    # pylint: disable=protected-access
+    HTTPX_ASYNC_CLIENT_WRAPPER._async_client = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+    yield requested_endpoints
+    HTTPX_ASYNC_CLIENT_WRAPPER._async_client = None
+
+
+def test_multipart_parts_are_views_into_content() -> None:
+    content = _encode_multipart([b"first", b"second\r\npart"])
+
+    parts = parse_multipart_body_parts(content, f"multipart/mixed; boundary={_BOUNDARY}")
+
+    assert [bytes(part) for part in parts] == [b"first", b"second\r\npart"]
+    assert all(part.obj is content for part in parts)
+
+
+def test_multipart_without_closing_boundary_raises() -> None:
+    content = f"--{_BOUNDARY}\r\n\r\nfirst".encode()
+
+    with pytest.raises(InvalidDataError):
+        parse_multipart_body_parts(content, f"multipart/mixed; boundary={_BOUNDARY}")
+
+
+def test_non_multipart_content_type_raises() -> None:
+    with pytest.raises(InvalidDataError):
+        parse_multipart_body_parts(b"{}", "application/json")
+
+
+async def test_slices_are_decoded_without_copy(requested_endpoints: list[str]) -> None:
+    vds_access = VdsAccess(sas_token="sas", vds_url="vds_url_slices")
+
+    inline, crossline, depth_slice = await vds_access.get_inline_crossline_and_depth_slices_async(1, 2, 3)
+
+    assert requested_endpoints == ["slice", "slice", "slice"]
+    for values, metadata in (inline, crossline, depth_slice):
+        assert metadata.shape == [2, 3]
+        np.testing.assert_array_equal(values, _SLICE_VALUES)
+        assert not values.flags.writeable
+
+
+async def test_metadata_is_cached_per_vds_url(requested_endpoints: list[str]) -> None:
+    first_metadata = await VdsAccess(sas_token="sas1", vds_url="vds_url_metadata").get_metadata_async()
+    second_metadata = await VdsAccess(sas_token="sas2", vds_url="vds_url_metadata").get_metadata_async()
+    await VdsAccess(sas_token="sas1", vds_url="other_vds_url_metadata").get_metadata_async()
+
+    assert first_metadata is second_metadata
+    assert requested_endpoints == ["metadata", "metadata"]
@@ -0,0 +1,143 @@
+# pylint: disable=async-suffix
+
+import asyncio
+import json
+from typing import Iterator
+
+import httpx
+import numpy as np
+import pytest
+
+from webviz_services.services_config import ServicesConfig
+from webviz_services.utils.httpx_async_client_wrapper import HTTPX_ASYNC_CLIENT_WRAPPER
+from webviz_services.vds_access import vds_access as vds_access_module
+from webviz_services.vds_access.request_types import VdsDirection
+from webviz_services.vds_access.response_types import VdsMetadata
+from webviz_services.vds_access.vds_access import VdsAccess, _get_neighbour_line_numbers
+from webviz_services.vds_access.vds_slice_cache import VdsSliceCache
+
+_BOUNDARY = "be2e3d4b"
+
+# Inlines 1..10 with step 1, crosslines 1..19 with step 2 and depths 0..10 with step 0.4
+_METADATA_DICT = {
+    "axis": [
+        {"annotation": "Inline", "max": 10.0, "min": 1.0, "samples": 10, "unit": "unitless"},
+        {"annotation": "Crossline", "max": 19.0, "min": 1.0, "samples": 10, "unit": "unitless"},
+        {"annotation": "Sample", "max": 10.0, "min": 0.0, "samples": 26, "unit": "m"},
+    ],
+    "boundingBox": {"cdp": [], "ij": [], "ilxl": []},
+    "crs": "",
+}
+
+
+def _slice_response_content(line_no: int) -> bytes:
+    slice_metadata = {
+        "format": "<f4",
+        "shape": [1, 2],
+        "x": {"annotation": "Inline", "max": 2.0, "min": 1.0, "samples": 2, "unit": "unitless"},
+        "y": {"annotation": "Sample", "max": 1.0, "min": 1.0, "samples": 1, "unit": "ms"},
+        "geospatial": [[0.0, 0.0], [1.0, 0.0], [1.0, 1.0], [0.0, 1.0]],
+    }
+    parts = [json.dumps(slice_metadata).encode(), np.array([line_no, line_no], dtype="<f4").tobytes()]
+
+    body = b""
+    for part in parts:
+        body += f"--{_BOUNDARY}\r\n\r\n".encode() + part + b"\r\n"
+    return body + f"--{_BOUNDARY}--\r\n".encode()
+
+
+@pytest.fixture(name="requested_slices")
+def fixture_requested_slices(monkeypatch: pytest.MonkeyPatch) -> Iterator[list[tuple[str, int]]]:
+    services_config = ServicesConfig(
+        sumo_env="dev",
+        smda_subscription_key="key",
+        enterprise_subscription_key="key",
+        surface_query_url="",
+        vds_host_address="http://vds",
+        redis_user_session_url="",
+    )
+    monkeypatch.setattr(vds_access_module, "get_services_config", lambda: services_config)
+
+    requested_slices: list[tuple[str, int]] = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        endpoint = request.url.path.strip("/")
+        if endpoint == "metadata":
+            return httpx.Response(200, json=_METADATA_DICT)
+
+        params = json.loads(request.content)
+        requested_slices.append((params["direction"], params["lineno"]))
+        return httpx.Response(
+            200,
+            content=_slice_response_content(params["lineno"]),
+            headers={"Content-Type": f"multipart/mixed; boundary={_BOUNDARY}"},
+        )
+
+    # pylint: disable=protected-access
+    HTTPX_ASYNC_CLIENT_WRAPPER._async_client = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+    yield requested_slices
+    HTTPX_ASYNC_CLIENT_WRAPPER._async_client = None
+
+
+def _use_slice_cache(monkeypatch: pytest.MonkeyPatch, prefetch_distance: int) -> VdsSliceCache:
+    slice_cache = VdsSliceCache(max_size_bytes=1024 * 1024, prefetch_distance=prefetch_distance)
+    monkeypatch.setattr(vds_access_module, "get_vds_slice_cache", lambda: slice_cache)
+    return slice_cache
+
+
+def test_neighbour_line_numbers_follow_axis_spacing_and_range() -> None:
+    metadata = VdsMetadata(**_METADATA_DICT)
+
+    assert _get_neighbour_line_numbers(metadata, VdsDirection.INLINE, 5, 2) == [6, 4, 7, 3]
+    assert _get_neighbour_line_numbers(metadata, VdsDirection.INLINE, 1, 2) == [2, 3]
+    assert _get_neighbour_line_numbers(metadata, VdsDirection.CROSSLINE, 19, 1) == [17]
+
+    # Depth spacing is not a whole number, so no integer line numbers can be prefetched
+    assert not _get_neighbour_line_numbers(metadata, VdsDirection.DEPTH, 4, 1)
+
+
+async def test_repeated_slice_is_served_from_cache(
+    requested_slices: list[tuple[str, int]], monkeypatch: pytest.MonkeyPatch
+) -> None:
+    slice_cache = _use_slice_cache(monkeypatch, prefetch_distance=0)
+    vds_access = VdsAccess(sas_token="sas", vds_url="vds_url_no_prefetch")
+
+    first_values, _ = await vds_access.get_inline_slice_async(3)
+    second_values, _ = await VdsAccess(sas_token="other_sas", vds_url="vds_url_no_prefetch").get_inline_slice_async(3)
+
+    assert first_values is second_values
+    assert requested_slices == [("inline", 3)]
+    assert slice_cache.get_stats().hits == 1
+
+
+async def test_neighbouring_slices_are_prefetched(
+    requested_slices: list[tuple[str, int]], monkeypatch: pytest.MonkeyPatch
+) -> None:
+    slice_cache = _use_slice_cache(monkeypatch, prefetch_distance=1)
+    vds_access = VdsAccess(sas_token="sas", vds_url="vds_url_prefetch")
+
+    await vds_access.get_crossline_slice_async(5)
+    await asyncio.sleep(0.05)
+
+    assert sorted(requested_slices) == [("crossline", 3), ("crossline", 5), ("crossline", 7)]
+    assert slice_cache.get_num_prefetched() == 2
+
+    # Scrolling to a prefetched line is served from the cache and triggers prefetch of the next line only
+    values, _ = await vds_access.get_crossline_slice_async(7)
+    await asyncio.sleep(0.05)
+
+    np.testing.assert_array_equal(values, [7, 7])
+    assert sorted(requested_slices) == [("crossline", 3), ("crossline", 5), ("crossline", 7), ("crossline", 9)]
+
+
+async def test_combined_slices_call_does_not_prefetch(
+    requested_slices: list[tuple[str, int]], monkeypatch: pytest.MonkeyPatch
+) -> None:
+    slice_cache = _use_slice_cache(monkeypatch, prefetch_distance=1)
+    vds_access = VdsAccess(sas_token="sas", vds_url="vds_url_combined")
+
+    await vds_access.get_inline_crossline_and_depth_slices_async(5, 5, 4)
+    await asyncio.sleep(0.05)
+
+    assert sorted(requested_slices) == [("crossline", 5), ("depth", 4), ("inline", 5)]
+    assert slice_cache.get_num_prefetched() == 0
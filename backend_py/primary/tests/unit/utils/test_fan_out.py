@@ -0,0 +1,57 @@
+# pylint: disable=async-suffix
+
+import asyncio
+
+from primary.utils.fan_out import fan_out_async
+
+
+class _MetricsCollector:
+    def __init__(self) -> None:
+        self.metrics: dict[str, int | float] = {}
+
+    def set_metric(self, metric_name: str, duration_ms: int | float) -> None:
+        self.metrics[metric_name] = duration_ms
+
+
+async def _delayed_value(value: str, delay_s: float) -> str:
+    await asyncio.sleep(delay_s)
+    return value
+
+
+async def _failing_source() -> str:
+    raise ValueError("Source is down")
+
+
+async def test_sources_run_concurrently() -> None:
+    loop = asyncio.get_running_loop()
+    start_time = loop.time()
+
+    result = await fan_out_async(
+        {"a": lambda: _delayed_value("a", 0.1), "b": lambda: _delayed_value("b", 0.1)},
+        timeout_s=1,
+    )
+
+    assert loop.time() - start_time < 0.19
+    assert result.results == {"a": "a", "b": "b"}
+    assert result.all_succeeded()
+
+
+async def test_failing_and_slow_sources_give_partial_result() -> None:
+    metrics_collector = _MetricsCollector()
+
+    result = await fan_out_async(
+        {
+            "ok": lambda: _delayed_value("ok", 0),
+            "failing": _failing_source,
+            "slow": lambda: _delayed_value("slow", 10),
+        },
+        timeout_s=0.05,
+        metrics_sink=metrics_collector,
+    )
+
+    assert result.results == {"ok": "ok"}
+    assert isinstance(result.errors["failing"], ValueError)
+    assert isinstance(result.errors["slow"], TimeoutError)
+    assert not result.all_succeeded()
+    assert set(metrics_collector.metrics) == {"ok", "failing", "slow"}
+    assert metrics_collector.metrics["slow"] >= 50
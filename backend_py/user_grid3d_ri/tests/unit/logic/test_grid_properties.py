@@ -0,0 +1,80 @@
+# pylint: disable=async-suffix, protected-access
+
+from pathlib import Path
+from typing import Callable
+
+import numpy as np
+import pytest
+
+from user_grid3d_ri.logic.grid_properties import GridPropertiesExtractor
+from user_grid3d_ri.logic.grid_properties import _try_load_from_prop_store_async, _write_prop_store
+
+
+def _make_float_extractor() -> GridPropertiesExtractor:
+    return GridPropertiesExtractor(
+        flat_prop_arr=np.array([1.5, np.nan, -2.25, 8.0], dtype=np.float64),
+        is_discrete=False,
+        min_global_prop_val=np.float64(-2.25),
+        max_global_prop_val=np.float64(8.0),
+    )
+
+
+def _make_discrete_extractor() -> GridPropertiesExtractor:
+    return GridPropertiesExtractor(
+        flat_prop_arr=np.array([3, -1, 1, 2], dtype=np.int32),
+        is_discrete=True,
+        min_global_prop_val=1,
+        max_global_prop_val=3,
+    )
+
+
+@pytest.mark.parametrize("make_extractor", [_make_float_extractor, _make_discrete_extractor])
+async def test_prop_store_round_trip(tmp_path: Path, make_extractor: Callable[[], GridPropertiesExtractor]) -> None:
+    roff_prop_file = str(tmp_path / "PROPERTY__uuid.roff")
+    extractor = make_extractor()
+
+    assert _write_prop_store(roff_prop_file, extractor)
+    loaded_extractor = await _try_load_from_prop_store_async(roff_prop_file)
+
+    assert loaded_extractor is not None
+    assert isinstance(loaded_extractor._flat_prop_arr, np.memmap)
+    np.testing.assert_array_equal(loaded_extractor._flat_prop_arr, extractor._flat_prop_arr)
+    assert loaded_extractor._flat_prop_arr.dtype == extractor._flat_prop_arr.dtype
+    assert loaded_extractor.is_discrete() == extractor.is_discrete()
+    assert loaded_extractor.get_min_global_val() == extractor.get_min_global_val()
+    assert loaded_extractor.get_max_global_val() == extractor.get_max_global_val()
+    assert loaded_extractor.get_discrete_undef_value() == extractor.get_discrete_undef_value()
+
+    cell_indices = [3, 0, 1]
+    assert loaded_extractor.get_prop_values_for_cells_as_float_list(
+        cell_indices
+    ) == extractor.get_prop_values_for_cells_as_float_list(cell_indices)
+
+
+async def test_missing_npy_file_is_treated_as_no_store(tmp_path: Path) -> None:
+    roff_prop_file = str(tmp_path / "PROPERTY__uuid.roff")
+    assert _write_prop_store(roff_prop_file, _make_float_extractor())
+    (tmp_path / "PROPERTY__uuid.roff.npy").unlink()
+
+    assert await _try_load_from_prop_store_async(roff_prop_file) is None
+
+
+@pytest.mark.parametrize("sidecar_content", ["{not valid json", '{"is_discrete": false}', None])
+async def test_corrupt_or_missing_sidecar_is_ignored(tmp_path: Path, sidecar_content: str | None) -> None:
+    roff_prop_file = str(tmp_path / "PROPERTY__uuid.roff")
+    assert _write_prop_store(roff_prop_file, _make_float_extractor())
+
+    sidecar_path = tmp_path / "PROPERTY__uuid.roff.meta.json"
+    if sidecar_content is None:
+        sidecar_path.unlink()
+    else:
+        sidecar_path.write_text(sidecar_content)
+
+    assert await _try_load_from_prop_store_async(roff_prop_file) is None
+
+
+async def test_no_temp_files_are_left_behind(tmp_path: Path) -> None:
+    roff_prop_file = str(tmp_path / "PROPERTY__uuid.roff")
+    assert _write_prop_store(roff_prop_file, _make_discrete_extractor())
+
+    assert sorted(p.name for p in tmp_path.iterdir()) == ["PROPERTY__uuid.roff.meta.json", "PROPERTY__uuid.roff.npy"]
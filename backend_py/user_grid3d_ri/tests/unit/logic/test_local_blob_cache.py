@@ -0,0 +1,85 @@
+# pylint: disable=async-suffix
+
+import os
+from pathlib import Path
+
+import pytest
+
+from user_grid3d_ri.logic.local_blob_cache import _BlobStoreIndex, _get_owning_blob_filename
+
+
+def _write_file(dir_path: Path, filename: str, size: int, access_time: float | None = None) -> None:
+    file_path = dir_path / filename
+    file_path.write_bytes(b"x" * size)
+    if access_time is not None:
+        os.utime(file_path, (access_time, access_time))
+
+
+def _list_files(dir_path: Path) -> list[str]:
+    return sorted(p.name for p in dir_path.iterdir())
+
+
+@pytest.mark.parametrize(
+    "filename, expected_blob_filename",
+    [
+        ("GRID__uuid1.roff", "GRID__uuid1.roff"),
+        ("PROPERTY__uuid2.roff.npy", "PROPERTY__uuid2.roff"),
+        ("PROPERTY__uuid2.roff.meta.json", "PROPERTY__uuid2.roff"),
+        ("unrelated_file", "unrelated_file"),
+    ],
+)
+def test_get_owning_blob_filename(filename: str, expected_blob_filename: str) -> None:
+    assert _get_owning_blob_filename(filename) == expected_blob_filename
+
+
+async def test_least_recently_used_blob_is_evicted_with_its_derived_files(tmp_path: Path) -> None:
+    index = _BlobStoreIndex(str(tmp_path), max_size_bytes=250)
+
+    for blob_filename in ["PROPERTY__a.roff", "PROPERTY__b.roff", "PROPERTY__c.roff"]:
+        _write_file(tmp_path, blob_filename, 50)
+        await index.touch_async(blob_filename)
+    _write_file(tmp_path, "PROPERTY__a.roff.npy", 30)
+    await index.add_file_async("PROPERTY__a.roff", "PROPERTY__a.roff.npy")
+    assert index.get_total_size_bytes() == 180
+
+    # Using blob a again makes b the least recently used blob
+    await index.touch_async("PROPERTY__a.roff")
+    _write_file(tmp_path, "PROPERTY__d.roff", 100)
+    await index.touch_async("PROPERTY__d.roff")
+
+    assert _list_files(tmp_path) == ["PROPERTY__a.roff", "PROPERTY__a.roff.npy", "PROPERTY__c.roff", "PROPERTY__d.roff"]
+    assert index.get_total_size_bytes() == 230
+
+    # Next in line is c, and then a together with its derived file
+    _write_file(tmp_path, "PROPERTY__e.roff", 150)
+    await index.touch_async("PROPERTY__e.roff")
+
+    assert _list_files(tmp_path) == ["PROPERTY__d.roff", "PROPERTY__e.roff"]
+    assert index.get_total_size_bytes() == 250
+
+
+async def test_reregistered_derived_file_is_not_double_counted(tmp_path: Path) -> None:
+    index = _BlobStoreIndex(str(tmp_path), max_size_bytes=1000)
+
+    _write_file(tmp_path, "PROPERTY__a.roff", 50)
+    await index.touch_async("PROPERTY__a.roff")
+    _write_file(tmp_path, "PROPERTY__a.roff.npy", 30)
+    await index.add_file_async("PROPERTY__a.roff", "PROPERTY__a.roff.npy")
+    await index.add_file_async("PROPERTY__a.roff", "PROPERTY__a.roff.npy")
+
+    assert index.get_total_size_bytes() == 80
+
+
+async def test_scan_orders_existing_blobs_by_access_time_and_removes_leftovers(tmp_path: Path) -> None:
+    _write_file(tmp_path, "GRID__new.roff", 100, access_time=3000)
+    _write_file(tmp_path, "GRID__old.roff", 100, access_time=1000)
+    _write_file(tmp_path, "GRID__old.roff.npy", 10, access_time=1000)
+    _write_file(tmp_path, "GRID__mid.roff", 100, access_time=2000)
+    _write_file(tmp_path, "GRID__gone.roff.npy", 10)
+    _write_file(tmp_path, "GRID__partial.roff__abc.tmp", 10)
+
+    # Budget only leaves room for the two most recently used blobs
+    index = _BlobStoreIndex(str(tmp_path), max_size_bytes=200)
+
+    assert _list_files(tmp_path) == ["GRID__mid.roff", "GRID__new.roff"]
+    assert index.get_total_size_bytes() == 200
@@ -6,6 +6,7 @@ from fastapi import FastAPI
 from webviz_core_utils.radix_utils import is_running_on_radix_platform
 
 from .utils.inactivity_shutdown import InactivityShutdown
+from .logic.local_blob_cache import init_local_blob_store
 from .utils.azure_monitor_setup import setup_azure_monitor_telemetry_for_user_grid3d_ri
 from .routers import health_router
 from .routers import grid_router
@@ -29,6 +30,8 @@ LOGGER = logging.getLogger(__name__)
 
 app = FastAPI()
 
+init_local_blob_store()
+
 setup_azure_monitor_telemetry_for_user_grid3d_ri(app)
 
 app.include_router(health_router.router)
@@ -1,5 +1,6 @@
-import io
 import logging
+import os
+from typing import TypeVar
 
 import diskcache
 import numpy as np
@@ -11,37 +12,54 @@ LOGGER = logging.getLogger(__name__)
 
 
 _CACHE_ROOOT_DIR = "/home/appuser/data_cache"
+_DEFAULT_TTL_S = int(os.environ.get("DATA_CACHE_TTL_S", "300"))
+_DEFAULT_MAX_SIZE_BYTES = int(os.environ.get("DATA_CACHE_MAX_SIZE_MB", "1024")) * 1024 * 1024
+
+_SUPPORTED_DTYPES = [np.dtype(np.float32), np.dtype(np.int32), np.dtype(np.uint32)]
+
+NumpyArrT = TypeVar("NumpyArrT", bound=np.generic)
 
 
 class DataCache:
-    def __init__(self) -> None:
+    """
+    Disk backed cache of numpy arrays.
+
+    The arrays are stored as their raw buffers, with the dtype and shape kept in the entry's tag. Reading an entry
+    wraps the bytes returned by the cache using np.frombuffer() without any further copies, thus the returned arrays
+    are read-only.
+    """
+
+    def __init__(self, ttl_s: int | None = _DEFAULT_TTL_S, max_size_bytes: int = _DEFAULT_MAX_SIZE_BYTES) -> None:
         # Default eviction policy is "least-recently-stored" which avoids writes when accessing the cache
         # Try out "least-recently-used", keeping in mind that it is slower since does  writes when accessing the cache
-        self._cache = diskcache.Cache(directory=_CACHE_ROOOT_DIR, eviction_policy="least-recently-used")
+        self._cache = diskcache.Cache(
+            directory=_CACHE_ROOOT_DIR, eviction_policy="least-recently-used", size_limit=max_size_bytes
+        )
+
+        # Expiry is in seconds, None means that entries only leave the cache through eviction
+        self._ttl_s = ttl_s
 
-    def set_uint32_numpy_arr(self, key: str, numpy_arr: NDArray[np.unsignedinteger]) -> None:
-        byte_stream = io.BytesIO()
-        np.save(byte_stream, numpy_arr)
+    def set_numpy_arr(self, key: str, numpy_arr: NDArray[np.generic]) -> None:
+        if numpy_arr.dtype not in _SUPPORTED_DTYPES:
+            raise TypeError(f"Unsupported dtype for data cache: {numpy_arr.dtype}")
 
-        use_key = "nparr_uint32_" + key
+        contiguous_arr = np.ascontiguousarray(numpy_arr)
+        header = _make_header(contiguous_arr.dtype, contiguous_arr.shape)
 
-        # Expiry is in seconds!
-        # What expiry should we set here?
-        # Maybe just skip it and relay on the cache eviction policy?
-        # For now, experiment with 5 minutes
-        self._cache.set(use_key, byte_stream.getvalue(), expire=5 * 60)
-        # self._cache.set(use_key, byte_stream.getvalue())
+        # Values of type bytes are stored raw by diskcache, without pickling
+        self._cache.set(_make_key(key), contiguous_arr.tobytes(), expire=self._ttl_s, tag=header)
 
-    def get_uint32_numpy_arr(self, key: str) -> NDArray[np.unsignedinteger] | None:
-        use_key = "nparr_uint32_" + key
-        raw_data = self._cache.get(use_key)
+    def get_numpy_arr(self, key: str, dtype: type[NumpyArrT]) -> NDArray[NumpyArrT] | None:
+        raw_data, header = self._cache.get(_make_key(key), tag=True)
         if raw_data is None:
             return None
 
-        byte_stream = io.BytesIO(raw_data)
-        np_arr = np.load(byte_stream)
+        stored_dtype, shape = _parse_header(header)
+        if stored_dtype != np.dtype(dtype):
+            LOGGER.warning(f"Ignoring data cache entry with unexpected dtype, {stored_dtype=}, {key=}")
+            return None
 
-        return np_arr
+        return np.frombuffer(raw_data, dtype=stored_dtype).reshape(shape)
 
     """
     def set_message_GetGridSurfaceResponse(
@@ -60,3 +78,17 @@ class DataCache:
 
         return message
     """
+
+
+def _make_key(key: str) -> str:
+    return "nparr_" + key
+
+
+def _make_header(dtype: np.dtype, shape: tuple[int, ...]) -> str:
+    return f"{dtype.str}|{','.join(str(dim) for dim in shape)}"
+
+
+def _parse_header(header: str) -> tuple[np.dtype, tuple[int, ...]]:
+    dtype_str, _, shape_str = header.partition("|")
+    shape = tuple(int(dim) for dim in shape_str.split(",")) if shape_str else ()
+    return np.dtype(dtype_str), shape
@@ -1,15 +1,36 @@
+import asyncio
 import logging
 import io
+import json
+import os
+import tempfile
+from dataclasses import asdict, dataclass
+from typing import IO, Any, Callable
+
 import aiofiles
+import aiofiles.os
 
 import numpy as np
 import xtgeo
 from numpy.typing import NDArray
 
+from user_grid3d_ri.logic.local_blob_cache import register_derived_file_async
+
 LOGGER = logging.getLogger(__name__)
 
 _DISCRETE_PROP_UNDEF_VALUE: int = -1
 
+# Suffixes of the converted property store that is written next to the cached ROFF blob
+_NPY_STORE_SUFFIX = ".npy"
+_META_STORE_SUFFIX = ".meta.json"
+
+
+@dataclass(frozen=True, kw_only=True)
+class _PropStoreMeta:
+    is_discrete: bool
+    min_global_prop_val: float | int
+    max_global_prop_val: float | int
+
 
 class GridPropertiesExtractor:
     def __init__(
@@ -26,6 +47,26 @@ class GridPropertiesExtractor:
 
     @classmethod
     async def from_roff_property_file_async(cls, roff_prop_file: str) -> "GridPropertiesExtractor":
+        """
+        Create extractor for a ROFF property file, using the converted property store if it exists.
+
+        On first access, the ROFF file is parsed and the flattened property array is written as a raw .npy file next
+        to it, with the global min/max and discreteness in a json sidecar. Subsequent accesses memory map the .npy
+        file, so that no ROFF parsing is needed and only the pages holding the requested cells are read from disk.
+        """
+        mapped_extractor = await _try_load_from_prop_store_async(roff_prop_file)
+        if mapped_extractor is not None:
+            return mapped_extractor
+
+        new_object = await cls._from_roff_property_file_uncached_async(roff_prop_file)
+        if await asyncio.to_thread(_write_prop_store, roff_prop_file, new_object):
+            await register_derived_file_async(roff_prop_file, roff_prop_file + _META_STORE_SUFFIX)
+            await register_derived_file_async(roff_prop_file, roff_prop_file + _NPY_STORE_SUFFIX)
+
+        return new_object
+
+    @classmethod
+    async def _from_roff_property_file_uncached_async(cls, roff_prop_file: str) -> "GridPropertiesExtractor":
         async with aiofiles.open(roff_prop_file, mode="rb") as f:
             file_contents: bytes = await f.read()
 
@@ -52,6 +93,13 @@ class GridPropertiesExtractor:
         )
         return new_object
 
+    def _get_store_meta(self) -> _PropStoreMeta:
+        return _PropStoreMeta(
+            is_discrete=bool(self._is_discrete),
+            min_global_prop_val=_to_python_scalar(self._min_global_prop_val),
+            max_global_prop_val=_to_python_scalar(self._max_global_prop_val),
+        )
+
     def is_discrete(self) -> bool:
         return self._is_discrete
 
@@ -88,3 +136,65 @@ class GridPropertiesExtractor:
 
     def get_max_global_val(self) -> float | int:
         return self._max_global_prop_val
+
+
+async def _try_load_from_prop_store_async(roff_prop_file: str) -> GridPropertiesExtractor | None:
+    npy_path = roff_prop_file + _NPY_STORE_SUFFIX
+    meta_path = roff_prop_file + _META_STORE_SUFFIX
+
+    # The .npy file is moved into place last, so if it exists the sidecar is complete as well
+    if not await aiofiles.os.path.isfile(npy_path):
+        return None
+
+    try:
+        async with aiofiles.open(meta_path, mode="r") as f:
+            meta = _PropStoreMeta(**json.loads(await f.read()))
+        flat_prop_arr = np.load(npy_path, mmap_mode="r")
+    except (OSError, ValueError, TypeError) as exception:
+        LOGGER.warning(f"Ignoring unreadable property store for {roff_prop_file=} {exception=}")
+        return None
+
+    return GridPropertiesExtractor(
+        flat_prop_arr=flat_prop_arr,
+        is_discrete=meta.is_discrete,
+        min_global_prop_val=meta.min_global_prop_val,
+        max_global_prop_val=meta.max_global_prop_val,
+    )
+
+
+def _write_prop_store(roff_prop_file: str, extractor: GridPropertiesExtractor) -> bool:
+    # pylint: disable=protected-access
+    store_meta = asdict(extractor._get_store_meta())
+    contiguous_arr = np.ascontiguousarray(extractor._flat_prop_arr)
+
+    # The sidecar must be in place before the .npy file, since the .npy file marks the store as complete
+    try:
+        _write_file_atomically(roff_prop_file + _META_STORE_SUFFIX, "w", lambda f: json.dump(store_meta, f))
+        _write_file_atomically(roff_prop_file + _NPY_STORE_SUFFIX, "wb", lambda f: np.save(f, contiguous_arr))
+    except OSError as exception:
+        LOGGER.warning(f"Failed to write property store for {roff_prop_file=} {exception=}")
+        return False
+
+    return True
+
+
+def _write_file_atomically(file_name: str, mode: str, write_fn: Callable[[IO[Any]], None]) -> None:
+    # Write to a temp file in the same directory and rename it into place, so that concurrent readers
+    # never see a partially written file
+    with tempfile.NamedTemporaryFile(
+        mode=mode, dir=os.path.dirname(file_name), suffix=".tmp", delete=False
+    ) as tmp_file:
+        try:
+            write_fn(tmp_file)
+        except BaseException:
+            tmp_file.close()
+            os.remove(tmp_file.name)
+            raise
+
+    os.replace(tmp_file.name, file_name)
+
+
+def _to_python_scalar(value: float | int | np.generic) -> float | int:
+    if isinstance(value, np.generic):
+        return value.item()
+    return value
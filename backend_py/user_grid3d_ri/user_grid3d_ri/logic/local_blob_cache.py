@@ -2,6 +2,7 @@ from enum import Enum
 import logging
 import os
 
+from collections import OrderedDict
 from dataclasses import dataclass
 import asyncio
 import aiofiles
@@ -11,14 +12,15 @@ from azure.storage.blob.aio import BlobClient
 
 from webviz_core_utils.background_tasks import run_in_background_task
 from webviz_core_utils.perf_timer import PerfTimer
-from webviz_core_utils.time_countdown import TimeCountdown
 
 LOGGER = logging.getLogger(__name__)
 
 
 _CACHE_ROOOT_DIR = "/home/appuser/blob_cache"
+_CACHE_MAX_SIZE_BYTES = int(os.environ.get("BLOB_CACHE_MAX_SIZE_MB", "20480")) * 1024 * 1024
 
-_blob_keys_in_flight: set[str] = set()
+# Events that are set when the download of a blob (keyed by local blob filename) finishes
+_blob_download_events_in_flight: dict[str, asyncio.Event] = {}
 
 
 class DownloadResult(Enum):
@@ -34,14 +36,161 @@ class _BlobItem:
     file_suffix: str
 
 
+class _BlobStoreIndex:
+    """
+    Keeps track of the blobs in the local cache directory and evicts the least recently used blobs when the total size
+    of the cache exceeds the configured budget.
+
+    Derived files, such as converted property stores, are named by appending a suffix to the blob's filename. They are
+    tracked as part of their blob and are deleted together with it.
+
+    On creation, the cache directory is scanned so that blobs downloaded by an earlier process are indexed and count
+    towards the budget. The initial access order is given by the files' access (or modification) times, and the
+    access time is updated whenever a blob is used so that the ordering survives restarts.
+    """
+
+    def __init__(self, cache_root_dir: str, max_size_bytes: int) -> None:
+        self._cache_root_dir = cache_root_dir
+        self._max_size_bytes = max_size_bytes
+
+        # Maps from blob filename to the sizes of the blob's files, i.e. the blob itself and its derived files.
+        # Ordered from least to most recently used blob.
+        self._blob_files: OrderedDict[str, dict[str, int]] = OrderedDict()
+        self._total_size_bytes = 0
+
+        os.makedirs(self._cache_root_dir, exist_ok=True)
+        self._scan_cache_dir()
+
+    async def touch_async(self, blob_filename: str) -> None:
+        """
+        Mark blob as most recently used, adding it to the index if needed
+        """
+        if blob_filename not in self._blob_files:
+            await self.add_file_async(blob_filename, blob_filename)
+            return
+
+        self._blob_files.move_to_end(blob_filename)
+        await asyncio.to_thread(_try_update_access_time, os.path.join(self._cache_root_dir, blob_filename))
+
+    async def add_file_async(self, blob_filename: str, filename: str) -> None:
+        """
+        Account for a blob or a derived file that was written to the cache directory and evict blobs if over budget
+        """
+        file_size = await asyncio.to_thread(_try_get_file_size, os.path.join(self._cache_root_dir, filename))
+        if file_size is None:
+            return
+
+        blob_files = self._blob_files.setdefault(blob_filename, {})
+        self._total_size_bytes += file_size - blob_files.get(filename, 0)
+        blob_files[filename] = file_size
+        self._blob_files.move_to_end(blob_filename)
+
+        evicted_filenames = self._evict_to_budget(keep_blob_filename=blob_filename)
+        if evicted_filenames:
+            await asyncio.to_thread(self._remove_files, evicted_filenames)
+
+    def get_total_size_bytes(self) -> int:
+        return self._total_size_bytes
+
+    def _evict_to_budget(self, keep_blob_filename: str) -> list[str]:
+        """
+        Remove least recently used blobs from the index until within budget, returning the filenames to delete
+        """
+        evicted_filenames: list[str] = []
+        while self._total_size_bytes > self._max_size_bytes and len(self._blob_files) > 1:
+            lru_blob_filename = next(iter(self._blob_files))
+            if lru_blob_filename == keep_blob_filename:
+                break
+
+            blob_files = self._blob_files.pop(lru_blob_filename)
+            blob_size = sum(blob_files.values())
+            self._total_size_bytes -= blob_size
+            evicted_filenames.extend(blob_files)
+            LOGGER.info(
+                f"Evicted blob from cache: {lru_blob_filename} [{blob_size / (1024 * 1024):.2f}MB, "
+                f"total={self._total_size_bytes / (1024 * 1024):.2f}MB]"
+            )
+
+        return evicted_filenames
+
+    def _remove_files(self, filenames: list[str]) -> None:
+        for filename in filenames:
+            _try_remove_file(os.path.join(self._cache_root_dir, filename))
+
+    def _scan_cache_dir(self) -> None:
+        timer = PerfTimer()
+        blob_entries: dict[str, tuple[int, float]] = {}
+        derived_files: dict[str, dict[str, int]] = {}
+
+        with os.scandir(self._cache_root_dir) as dir_entries:
+            for entry in dir_entries:
+                if not entry.is_file():
+                    continue
+
+                # Remove temp files left behind by an earlier process
+                if entry.name.endswith(".tmp"):
+                    _try_remove_file(entry.path)
+                    continue
+
+                stat_res = entry.stat()
+                blob_filename = _get_owning_blob_filename(entry.name)
+                if blob_filename == entry.name:
+                    blob_entries[blob_filename] = (stat_res.st_size, max(stat_res.st_atime, stat_res.st_mtime))
+                else:
+                    derived_files.setdefault(blob_filename, {})[entry.name] = stat_res.st_size
+
+        for blob_filename, (blob_size, _access_time) in sorted(blob_entries.items(), key=lambda item: item[1][1]):
+            blob_files = {blob_filename: blob_size, **derived_files.pop(blob_filename, {})}
+            self._blob_files[blob_filename] = blob_files
+            self._total_size_bytes += sum(blob_files.values())
+
+        # Derived files whose blob is gone are of no use
+        for orphan_files in derived_files.values():
+            self._remove_files(list(orphan_files))
+
+        LOGGER.info(
+            f"Indexed {len(self._blob_files)} blobs in cache in {timer.elapsed_s():.2f}s "
+            f"[{self._total_size_bytes / (1024 * 1024):.2f}MB of {self._max_size_bytes / (1024 * 1024):.2f}MB]"
+        )
+        self._remove_files(self._evict_to_budget(keep_blob_filename=""))
+
+
+# Process-wide state (private to module)
+_global_blob_store_index: _BlobStoreIndex | None = None  # pylint: disable=invalid-name
+
+
+def init_local_blob_store() -> None:
+    """
+    Index the blobs already present in the local cache directory, should be called once at startup.
+    If not called, the index is created on first use of LocalBlobCache.
+    """
+    _get_blob_store_index()
+
+
+def _get_blob_store_index() -> _BlobStoreIndex:
+    # pylint: disable=global-statement
+    global _global_blob_store_index
+    if _global_blob_store_index is None:
+        _global_blob_store_index = _BlobStoreIndex(_CACHE_ROOOT_DIR, _CACHE_MAX_SIZE_BYTES)
+
+    return _global_blob_store_index
+
+
+async def register_derived_file_async(local_blob_path: str, derived_file_path: str) -> None:
+    """
+    Account for a file derived from a cached blob, e.g. a converted property store.
+    The derived file must be named by appending a suffix to the blob's filename.
+    """
+    await _get_blob_store_index().add_file_async(os.path.basename(local_blob_path), os.path.basename(derived_file_path))
+
+
 class LocalBlobCache:
     def __init__(self, sas_token: str, blob_store_base_uri: str) -> None:
         self._sas_token = sas_token
         self._blob_store_base_uri = blob_store_base_uri
         self._cache_root_dir = _CACHE_ROOOT_DIR
         self._timeout = 60
-
-        os.makedirs(self._cache_root_dir, exist_ok=True)
+        self._store_index = _get_blob_store_index()
 
     async def ensure_grid_blob_downloaded_async(self, object_uuid: str) -> str | None:
         return await self._ensure_blob_downloaded(object_uuid, "GRID", ".roff")
@@ -57,19 +206,23 @@ class LocalBlobCache:
         # If the blob is already in the cache, we can return immediately
         if await self._is_blob_in_cache(blob_item):
             LOGGER.debug(f"Found {blob_kind} blob in cache, returning immediately: {local_blob_path}")
+            await self._store_index.touch_async(blob_key)
             return local_blob_path
 
         # We don't have the blob in our local cache yet, so we'll need to download it
         # Provided that no download of this blob is in progress, we'll start one
-        if not blob_key in _blob_keys_in_flight:
+        download_event = _blob_download_events_in_flight.get(blob_key)
+        if download_event is None:
             LOGGER.debug(f"Starting download of {blob_kind} blob {object_uuid=}")
-            _blob_keys_in_flight.add(blob_key)
+            download_event = asyncio.Event()
+            _blob_download_events_in_flight[blob_key] = download_event
             try:
                 # dl_res = await self._download_blob_simple(blob_item)
                 dl_res = await self._download_blob_using_ms_client_lib(blob_item)
                 # dl_res = await self._download_blob_with_queued_writer(blob_item)
             finally:
-                _blob_keys_in_flight.discard(blob_key)
+                del _blob_download_events_in_flight[blob_key]
+                download_event.set()
 
             if dl_res == DownloadResult.FAILED:
                 LOGGER.error(f"Failed to download {blob_kind} blob {object_uuid=}")
@@ -78,29 +231,24 @@ class LocalBlobCache:
                 LOGGER.debug(f"Download of {blob_kind} blob was abandoned, returning from cache: {local_blob_path}")
                 return local_blob_path
 
+            await self._store_index.touch_async(blob_key)
             LOGGER.debug(f"Returning downloaded {blob_kind} blob: {local_blob_path}")
             return local_blob_path
 
-        # A download of this blob is already in progress, we'll try and wait for it to finish
-        time_countdown = TimeCountdown(duration_s=self._timeout, action_interval_s=2)
+        # A download of this blob is already in progress, we'll wait for it to finish
         LOGGER.debug(f"Download of {blob_kind} blob is already in progress, waiting for it to finish {object_uuid=}")
-        while blob_key in _blob_keys_in_flight and not time_countdown.is_finished():
-            if time_countdown.is_action_due():
-                LOGGER.debug(
-                    f"  - waiting for {blob_kind} blob {object_uuid} to appear ({time_countdown.elapsed_s():.1f}s elapsed)"
-                )
-
-            await asyncio.sleep(0.2)
-            if await self._is_blob_in_cache(blob_item):
-                LOGGER.debug(f"While waiting for {blob_kind} blob it appeared in cache, returning: {local_blob_path}")
-                return local_blob_path
+        try:
+            await asyncio.wait_for(download_event.wait(), timeout=self._timeout)
+        except TimeoutError:
+            LOGGER.error(f"Timed out while waiting for {blob_kind} blob to appear in cache")
+            return None
 
-        if not blob_key in _blob_keys_in_flight:
+        if not await self._is_blob_in_cache(blob_item):
             LOGGER.error(f"The {blob_kind} blob download we were waiting finished but no data is visible in cache")
             return None
 
-        LOGGER.error(f"Timed out while waiting for {blob_kind} blob to appear in cache")
-        return None
+        LOGGER.debug(f"Waited for {blob_kind} blob to appear in cache, returning: {local_blob_path}")
+        return local_blob_path
 
     async def _download_blob_simple(self, blob_item: _BlobItem) -> DownloadResult:
         object_uuid = blob_item.object_uuid
@@ -315,6 +463,38 @@ def _make_local_blob_filename(blob_item: _BlobItem) -> str:
     return f"{blob_item.blob_kind}__{blob_item.object_uuid}{blob_item.file_suffix}"
 
 
+def _get_owning_blob_filename(filename: str) -> str:
+    # Derived files are named by appending a suffix to the blob filename, i.e. "<kind>__<uuid><suffix>.<more>"
+    blob_kind, sep, remainder = filename.partition("__")
+    if not sep:
+        return filename
+
+    object_uuid, dot, blob_suffix = remainder.partition(".")
+    blob_suffix, _, _derived_suffix = blob_suffix.partition(".")
+    return f"{blob_kind}__{object_uuid}{dot}{blob_suffix}"
+
+
+def _try_remove_file(file_name: str) -> None:
+    try:
+        os.remove(file_name)
+    except FileNotFoundError:
+        pass
+
+
+def _try_get_file_size(file_name: str) -> int | None:
+    try:
+        return os.path.getsize(file_name)
+    except FileNotFoundError:
+        return None
+
+
+def _try_update_access_time(file_name: str) -> None:
+    try:
+        os.utime(file_name)
+    except FileNotFoundError:
+        pass
+
+
 async def _does_file_exist(file_name: str) -> bool:
     return await aiofiles.os.path.isfile(file_name)
 
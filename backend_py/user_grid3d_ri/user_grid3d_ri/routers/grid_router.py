@@ -1,9 +1,11 @@
 import logging
-from typing import Any
+from typing import Any, AsyncIterator
 
 import grpc
 import numpy as np
 from fastapi import APIRouter, HTTPException
+from fastapi.responses import StreamingResponse
+from numpy.typing import NDArray
 
 import rips
 from rips.generated import GridGeometryExtraction_pb2, GridGeometryExtraction_pb2_grpc
@@ -13,6 +15,8 @@ from webviz_core_utils.b64 import b64_encode_float_array_as_float32
 from webviz_core_utils.b64 import b64_encode_uint_array_as_smallest_size, b64_encode_int_array_as_smallest_size
 from webviz_core_utils.perf_metrics import PerfMetrics
 from webviz_server_schemas.user_grid3d_ri import api_schemas
+from webviz_server_schemas.user_grid3d_ri.grid_geometry_stream import FrameKind
+from webviz_server_schemas.user_grid3d_ri.grid_geometry_stream import encode_array_frame, encode_json_frame
 
 from user_grid3d_ri.logic.data_cache import DataCache
 from user_grid3d_ri.logic.grid_properties import GridPropertiesExtractor
@@ -23,6 +27,9 @@ LOGGER = logging.getLogger(__name__)
 
 DATA_CACHE = DataCache()
 
+# Number of vertices or polys per chunk when streaming grid geometry
+_STREAM_CHUNK_ELEMENT_COUNT = 256 * 1024
+
 router = APIRouter()
 
 
@@ -45,43 +52,7 @@ async def post_get_grid_geometry(
 
     perf_metrics = PerfMetrics()
 
-    blob_cache = LocalBlobCache(req_body.sas_token, req_body.blob_store_base_uri)
-
-    grid_path_name = await blob_cache.ensure_grid_blob_downloaded_async(req_body.grid_blob_object_uuid)
-    if grid_path_name is None:
-        raise HTTPException(500, detail=f"Failed to download grid blob: {req_body.grid_blob_object_uuid=}")
-    LOGGER.debug(f"{myfunc} - {grid_path_name=}")
-    perf_metrics.record_lap("get-blob")
-
-    grpc_channel: grpc.aio.Channel = await RESINSIGHT_MANAGER.get_channel_for_running_ri_instance_async()
-    perf_metrics.record_lap("get-ri")
-
-    grpc_ijk_index_filter = None
-    if req_body.ijk_index_filter:
-        grpc_ijk_index_filter = GridGeometryExtraction_pb2.IJKIndexFilter(
-            iMin=req_body.ijk_index_filter.min_i,
-            iMax=req_body.ijk_index_filter.max_i,
-            jMin=req_body.ijk_index_filter.min_j,
-            jMax=req_body.ijk_index_filter.max_j,
-            kMin=req_body.ijk_index_filter.min_k,
-            kMax=req_body.ijk_index_filter.max_k,
-        )
-    LOGGER.debug(f"{myfunc} - grpc_ijk_index_filter: {_proto_msg_as_oneliner(grpc_ijk_index_filter)}")
-
-    perf_metrics.reset_lap_timer()
-
-    request = GridGeometryExtraction_pb2.GetGridSurfaceRequest(
-        gridFilename=grid_path_name,
-        includeInactiveCells=req_body.include_inactive_cells,
-        ijkIndexFilter=grpc_ijk_index_filter,
-        cellIndexFilter=None,
-        propertyFilter=None,
-    )
-
-    geo_extraction_stub = GridGeometryExtraction_pb2_grpc.GridGeometryExtractionStub(grpc_channel)
-    grpc_response = await geo_extraction_stub.GetGridSurface(request)
-
-    perf_metrics.record_lap("ri-grid-geo")
+    grpc_response = await _get_grid_surface_async(req_body, perf_metrics)
 
     grid_dims = grpc_response.gridDimensions
     cell_count = grid_dims.i * grid_dims.j * grid_dims.k
@@ -113,7 +84,7 @@ async def post_get_grid_geometry(
         filter=req_body.ijk_index_filter,
     )
     LOGGER.debug(f"{myfunc} - {data_cache_key=}")
-    DATA_CACHE.set_uint32_numpy_arr(data_cache_key, source_cell_indices_np)
+    DATA_CACHE.set_numpy_arr(data_cache_key, source_cell_indices_np)
     perf_metrics.record_lap("write-cache")
 
     ret_obj = api_schemas.GridGeometryResponse(
@@ -154,6 +125,159 @@ async def post_get_grid_geometry(
     return ret_obj
 
 
+@router.post("/get_grid_geometry_stream")
+async def post_get_grid_geometry_stream(req_body: api_schemas.GridGeometryRequest) -> StreamingResponse:
+    """
+    Same as get_grid_geometry, but the response is streamed as binary frames, see grid_geometry_stream.
+    The arrays are converted from the gRPC response and sent in chunks, so that no full size copies are made.
+
+    Like the other endpoints of this service, it is only called by the primary backend (user_grid3d_service) and is
+    not part of the frontend API client, which is generated from the primary backend's OpenAPI schema only.
+    """
+    myfunc = "post_get_grid_geometry_stream()"
+    LOGGER.debug(f"{myfunc}")
+
+    perf_metrics = PerfMetrics()
+
+    grpc_response = await _get_grid_surface_async(req_body, perf_metrics)
+
+    # The source cell indices are needed in full for the data cache anyway
+    source_cell_indices_np = np.asarray(grpc_response.sourceCellIndicesArr, dtype=np.uint32)
+    data_cache_key = _make_grid_geo_key(
+        grid_blob_object_uuid=req_body.grid_blob_object_uuid,
+        include_inactive_cells=req_body.include_inactive_cells,
+        filter=req_body.ijk_index_filter,
+    )
+    DATA_CACHE.set_numpy_arr(data_cache_key, source_cell_indices_np)
+    perf_metrics.record_lap("write-cache")
+
+    frames_generator = _generate_grid_geometry_frames_async(grpc_response, source_cell_indices_np, perf_metrics)
+    return StreamingResponse(frames_generator, media_type="application/octet-stream")
+
+
+async def _generate_grid_geometry_frames_async(
+    grpc_response: GridGeometryExtraction_pb2.GetGridSurfaceResponse,
+    source_cell_indices_np: NDArray[np.uint32],
+    perf_metrics: PerfMetrics,
+) -> AsyncIterator[bytes | memoryview]:
+    vertex_count = len(grpc_response.vertexArray) // 3
+    poly_count = len(source_cell_indices_np)
+
+    header = api_schemas.GridGeometryStreamHeader(
+        vertex_count=vertex_count,
+        poly_count=poly_count,
+        polys_element_count=5 * poly_count,
+        origin_utm_x=grpc_response.originUtmXy.x,
+        origin_utm_y=grpc_response.originUtmXy.y,
+        grid_dimensions=api_schemas.GridDimensions(
+            i_count=grpc_response.gridDimensions.i,
+            j_count=grpc_response.gridDimensions.j,
+            k_count=grpc_response.gridDimensions.k,
+        ),
+    )
+    yield encode_json_frame(FrameKind.HEADER, header)
+
+    min_coord = np.full(3, np.inf, dtype=np.float32)
+    max_coord = np.full(3, -np.inf, dtype=np.float32)
+    for start in range(0, vertex_count, _STREAM_CHUNK_ELEMENT_COUNT):
+        end = min(start + _STREAM_CHUNK_ELEMENT_COUNT, vertex_count)
+        vertices_chunk_np = np.asarray(grpc_response.vertexArray[3 * start : 3 * end], dtype=np.float32).reshape(-1, 3)
+        np.minimum(min_coord, vertices_chunk_np.min(axis=0), out=min_coord)
+        np.maximum(max_coord, vertices_chunk_np.max(axis=0), out=max_coord)
+        for frame_part in encode_array_frame(FrameKind.VERTICES, vertices_chunk_np):
+            yield frame_part
+    perf_metrics.record_lap("stream-verts")
+
+    # Build VTK style polys, where each quad is prefixed by its vertex count
+    for start in range(0, poly_count, _STREAM_CHUNK_ELEMENT_COUNT):
+        end = min(start + _STREAM_CHUNK_ELEMENT_COUNT, poly_count)
+        polys_chunk_np = np.empty((end - start, 5), dtype=np.uint32)
+        polys_chunk_np[:, 0] = 4
+        polys_chunk_np[:, 1:] = np.asarray(grpc_response.quadIndicesArr[4 * start : 4 * end]).reshape(-1, 4)
+        for frame_part in encode_array_frame(FrameKind.POLYS, polys_chunk_np):
+            yield frame_part
+    perf_metrics.record_lap("stream-polys")
+
+    for start in range(0, poly_count, _STREAM_CHUNK_ELEMENT_COUNT):
+        cell_indices_chunk_np = source_cell_indices_np[start : start + _STREAM_CHUNK_ELEMENT_COUNT]
+        for frame_part in encode_array_frame(FrameKind.POLY_SOURCE_CELL_INDICES, cell_indices_chunk_np):
+            yield frame_part
+    perf_metrics.record_lap("stream-cell-indices")
+
+    if vertex_count == 0:
+        min_coord[:] = 0
+        max_coord[:] = 0
+
+    grpc_time_elapsed_info = grpc_response.timeElapsedInfo
+    trailer = api_schemas.GridGeometryStreamTrailer(
+        bounding_box=api_schemas.BoundingBox3D(
+            min_x=min_coord[0],
+            min_y=min_coord[1],
+            min_z=min_coord[2],
+            max_x=max_coord[0],
+            max_y=max_coord[1],
+            max_z=max_coord[2],
+        ),
+        stats=api_schemas.Stats(
+            total_time=perf_metrics.get_elapsed_ms(),
+            perf_metrics=perf_metrics.to_dict(),
+            ri_total_time=grpc_time_elapsed_info.totalTimeElapsedMs,
+            ri_perf_metrics=dict(grpc_time_elapsed_info.namedEventsAndTimeElapsedMs),
+            vertex_count=vertex_count,
+            poly_count=poly_count,
+        ),
+    )
+    yield encode_json_frame(FrameKind.TRAILER, trailer)
+
+    LOGGER.debug(f"Streamed grid geometry in: {perf_metrics.to_string_s()}")
+
+
+async def _get_grid_surface_async(
+    req_body: api_schemas.GridGeometryRequest, perf_metrics: PerfMetrics
+) -> GridGeometryExtraction_pb2.GetGridSurfaceResponse:
+    myfunc = "_get_grid_surface_async()"
+
+    blob_cache = LocalBlobCache(req_body.sas_token, req_body.blob_store_base_uri)
+
+    grid_path_name = await blob_cache.ensure_grid_blob_downloaded_async(req_body.grid_blob_object_uuid)
+    if grid_path_name is None:
+        raise HTTPException(500, detail=f"Failed to download grid blob: {req_body.grid_blob_object_uuid=}")
+    LOGGER.debug(f"{myfunc} - {grid_path_name=}")
+    perf_metrics.record_lap("get-blob")
+
+    grpc_channel: grpc.aio.Channel = await RESINSIGHT_MANAGER.get_channel_for_running_ri_instance_async()
+    perf_metrics.record_lap("get-ri")
+
+    grpc_ijk_index_filter = None
+    if req_body.ijk_index_filter:
+        grpc_ijk_index_filter = GridGeometryExtraction_pb2.IJKIndexFilter(
+            iMin=req_body.ijk_index_filter.min_i,
+            iMax=req_body.ijk_index_filter.max_i,
+            jMin=req_body.ijk_index_filter.min_j,
+            jMax=req_body.ijk_index_filter.max_j,
+            kMin=req_body.ijk_index_filter.min_k,
+            kMax=req_body.ijk_index_filter.max_k,
+        )
+    LOGGER.debug(f"{myfunc} - grpc_ijk_index_filter: {_proto_msg_as_oneliner(grpc_ijk_index_filter)}")
+
+    perf_metrics.reset_lap_timer()
+
+    request = GridGeometryExtraction_pb2.GetGridSurfaceRequest(
+        gridFilename=grid_path_name,
+        includeInactiveCells=req_body.include_inactive_cells,
+        ijkIndexFilter=grpc_ijk_index_filter,
+        cellIndexFilter=None,
+        propertyFilter=None,
+    )
+
+    geo_extraction_stub = GridGeometryExtraction_pb2_grpc.GridGeometryExtractionStub(grpc_channel)
+    grpc_response = await geo_extraction_stub.GetGridSurface(request)
+
+    perf_metrics.record_lap("ri-grid-geo")
+
+    return grpc_response
+
+
 @router.post("/get_mapped_grid_properties")
 async def post_get_mapped_grid_properties(
     req_body: api_schemas.MappedGridPropertiesRequest,
@@ -191,7 +315,7 @@ async def post_get_mapped_grid_properties(
         filter=req_body.ijk_index_filter,
     )
     LOGGER.debug(f"{myfunc} - {data_cache_key=}")
-    source_cell_indices_np = DATA_CACHE.get_uint32_numpy_arr(data_cache_key)
+    source_cell_indices_np = DATA_CACHE.get_numpy_arr(data_cache_key, np.uint32)
     perf_metrics.record_lap("read-cache")
 
     ri_total_time: int | None = None
@@ -229,7 +353,7 @@ async def post_get_mapped_grid_properties(
         perf_metrics.record_lap("ri-grid-geo")
 
         source_cell_indices_np = np.asarray(grpc_response.sourceCellIndicesArr, dtype=np.uint32)
-        DATA_CACHE.set_uint32_numpy_arr(data_cache_key, source_cell_indices_np)
+        DATA_CACHE.set_numpy_arr(data_cache_key, source_cell_indices_np)
         perf_metrics.record_lap("write-cache")
 
     prop_extractor = await GridPropertiesExtractor.from_roff_property_file_async(property_path_name)
@@ -48,6 +48,8 @@ import {
     getRealizationFlowNetwork,
     getRealizationSurfacesMetadata,
     getRealizationsVectorData,
+    getRealizationsVectorDataB64,
+    getRealizationsVectorDataForVectors,
     getRftRealizationData,
     getRftTableDefinition,
     getSeismicCubeMetaList,
@@ -60,6 +62,7 @@ import {
     getSnapshotsMetadata,
     getStatisticalSurfaceDataHybrid,
     getStatisticalVectorData,
+    getStatisticalVectorDataForVectors,
     getStatisticalVectorDataPerSensitivity,
     getSurfaceData,
     getUserInfo,
@@ -86,6 +89,7 @@ import {
     postGetSeismicFence,
     postGetSurfaceIntersection,
     postGetWellTrajectoriesFormationSegments,
+    postLogCurveDataBatch,
     postLogout,
     postRefreshFingerprintsForEnsembles,
     root,
@@ -192,8 +196,14 @@ import type {
     GetRealizationSurfacesMetadataData_api,
     GetRealizationSurfacesMetadataError_api,
     GetRealizationSurfacesMetadataResponse_api,
+    GetRealizationsVectorDataB64Data_api,
+    GetRealizationsVectorDataB64Error_api,
+    GetRealizationsVectorDataB64Response_api,
     GetRealizationsVectorDataData_api,
     GetRealizationsVectorDataError_api,
+    GetRealizationsVectorDataForVectorsData_api,
+    GetRealizationsVectorDataForVectorsError_api,
+    GetRealizationsVectorDataForVectorsResponse_api,
     GetRealizationsVectorDataResponse_api,
     GetRftRealizationDataData_api,
     GetRftRealizationDataError_api,
@@ -230,6 +240,9 @@ import type {
     GetStatisticalSurfaceDataHybridResponse_api,
     GetStatisticalVectorDataData_api,
     GetStatisticalVectorDataError_api,
+    GetStatisticalVectorDataForVectorsData_api,
+    GetStatisticalVectorDataForVectorsError_api,
+    GetStatisticalVectorDataForVectorsResponse_api,
     GetStatisticalVectorDataPerSensitivityData_api,
     GetStatisticalVectorDataPerSensitivityError_api,
     GetStatisticalVectorDataPerSensitivityResponse_api,
@@ -305,6 +318,9 @@ import type {
     PostGetWellTrajectoriesFormationSegmentsData_api,
     PostGetWellTrajectoriesFormationSegmentsError_api,
     PostGetWellTrajectoriesFormationSegmentsResponse_api,
+    PostLogCurveDataBatchData_api,
+    PostLogCurveDataBatchError_api,
+    PostLogCurveDataBatchResponse_api,
     PostLogoutData_api,
     PostLogoutResponse_api,
     PostRefreshFingerprintsForEnsemblesData_api,
@@ -581,6 +597,68 @@ export const getRealizationsVectorDataOptions = (options: Options<GetRealization
         queryKey: getRealizationsVectorDataQueryKey(options),
     });
 
+export const getRealizationsVectorDataB64QueryKey = (options: Options<GetRealizationsVectorDataB64Data_api>) =>
+    createQueryKey("getRealizationsVectorDataB64", options);
+
+/**
+ * Get Realizations Vector Data B64
+ *
+ * Get vector data for all realizations in a compact format using base64 encoded typed arrays.
+ *
+ * Returns the same data as the realizations_vector_data endpoint, but is much faster to produce and transfer for
+ * large numbers of realizations and dates.
+ */
+export const getRealizationsVectorDataB64Options = (options: Options<GetRealizationsVectorDataB64Data_api>) =>
+    queryOptions<
+        GetRealizationsVectorDataB64Response_api,
+        AxiosError<GetRealizationsVectorDataB64Error_api>,
+        GetRealizationsVectorDataB64Response_api,
+        ReturnType<typeof getRealizationsVectorDataB64QueryKey>
+    >({
+        queryFn: async ({ queryKey, signal }) => {
+            const { data } = await getRealizationsVectorDataB64({
+                ...options,
+                ...queryKey[0],
+                signal,
+                throwOnError: true,
+            });
+            return data;
+        },
+        queryKey: getRealizationsVectorDataB64QueryKey(options),
+    });
+
+export const getRealizationsVectorDataForVectorsQueryKey = (
+    options: Options<GetRealizationsVectorDataForVectorsData_api>,
+) => createQueryKey("getRealizationsVectorDataForVectors", options);
+
+/**
+ * Get Realizations Vector Data For Vectors
+ *
+ * Get vector data per realization for multiple vectors in one request.
+ *
+ * All vectors are loaded concurrently and resampled together, the returned list has one entry per requested vector.
+ */
+export const getRealizationsVectorDataForVectorsOptions = (
+    options: Options<GetRealizationsVectorDataForVectorsData_api>,
+) =>
+    queryOptions<
+        GetRealizationsVectorDataForVectorsResponse_api,
+        AxiosError<GetRealizationsVectorDataForVectorsError_api>,
+        GetRealizationsVectorDataForVectorsResponse_api,
+        ReturnType<typeof getRealizationsVectorDataForVectorsQueryKey>
+    >({
+        queryFn: async ({ queryKey, signal }) => {
+            const { data } = await getRealizationsVectorDataForVectors({
+                ...options,
+                ...queryKey[0],
+                signal,
+                throwOnError: true,
+            });
+            return data;
+        },
+        queryKey: getRealizationsVectorDataForVectorsQueryKey(options),
+    });
+
 export const getDeltaEnsembleRealizationsVectorDataQueryKey = (
     options: Options<GetDeltaEnsembleRealizationsVectorDataData_api>,
 ) => createQueryKey("getDeltaEnsembleRealizationsVectorData", options);
@@ -667,6 +745,38 @@ export const getStatisticalVectorDataOptions = (options: Options<GetStatisticalV
         queryKey: getStatisticalVectorDataQueryKey(options),
     });
 
+export const getStatisticalVectorDataForVectorsQueryKey = (
+    options: Options<GetStatisticalVectorDataForVectorsData_api>,
+) => createQueryKey("getStatisticalVectorDataForVectors", options);
+
+/**
+ * Get Statistical Vector Data For Vectors
+ *
+ * Get statistical vector data for an ensemble for multiple vectors in one request.
+ *
+ * All vectors are loaded concurrently and resampled together, the returned list has one entry per requested vector.
+ */
+export const getStatisticalVectorDataForVectorsOptions = (
+    options: Options<GetStatisticalVectorDataForVectorsData_api>,
+) =>
+    queryOptions<
+        GetStatisticalVectorDataForVectorsResponse_api,
+        AxiosError<GetStatisticalVectorDataForVectorsError_api>,
+        GetStatisticalVectorDataForVectorsResponse_api,
+        ReturnType<typeof getStatisticalVectorDataForVectorsQueryKey>
+    >({
+        queryFn: async ({ queryKey, signal }) => {
+            const { data } = await getStatisticalVectorDataForVectors({
+                ...options,
+                ...queryKey[0],
+                signal,
+                throwOnError: true,
+            });
+            return data;
+        },
+        queryKey: getStatisticalVectorDataForVectorsQueryKey(options),
+    });
+
 export const getDeltaEnsembleStatisticalVectorDataQueryKey = (
     options: Options<GetDeltaEnsembleStatisticalVectorDataData_api>,
 ) => createQueryKey("getDeltaEnsembleStatisticalVectorData", options);
@@ -1866,6 +1976,10 @@ export const getWellboreLogCurveHeadersQueryKey = (options: Options<GetWellboreL
  *
  * Get all log curve headers for a single well bore.
  * Logs are available from multiple sources, which can be specificed by the "sources" parameter.
+ *
+ * The sources are queried concurrently. If some, but not all, of the sources fail, the headers from the
+ * successful sources are returned, and the failed sources are listed in the "x-failed-sources" response header.
+ * Each entry is a source value with the reason for the failure, e.g. "smda.survey; reason=timeout".
  */
 export const getWellboreLogCurveHeadersOptions = (options: Options<GetWellboreLogCurveHeadersData_api>) =>
     queryOptions<
@@ -1913,6 +2027,70 @@ export const getLogCurveDataOptions = (options: Options<GetLogCurveDataData_api>
         queryKey: getLogCurveDataQueryKey(options),
     });
 
+export const postLogCurveDataBatchQueryKey = (options: Options<PostLogCurveDataBatchData_api>) =>
+    createQueryKey("postLogCurveDataBatch", options);
+
+/**
+ * Post Log Curve Data Batch
+ *
+ * Get log curve data for multiple curves, possibly from different wellbores and sources, in one request.
+ *
+ * Lookups that are shared between curves, such as the geology or survey headers of a wellbore, are only done once.
+ * The returned list matches the order of the request items, and a curve that could not be fetched is returned
+ * with an error message instead of failing the whole request.
+ */
+export const postLogCurveDataBatchOptions = (options: Options<PostLogCurveDataBatchData_api>) =>
+    queryOptions<
+        PostLogCurveDataBatchResponse_api,
+        AxiosError<PostLogCurveDataBatchError_api>,
+        PostLogCurveDataBatchResponse_api,
+        ReturnType<typeof postLogCurveDataBatchQueryKey>
+    >({
+        queryFn: async ({ queryKey, signal }) => {
+            const { data } = await postLogCurveDataBatch({
+                ...options,
+                ...queryKey[0],
+                signal,
+                throwOnError: true,
+            });
+            return data;
+        },
+        queryKey: postLogCurveDataBatchQueryKey(options),
+    });
+
+/**
+ * Post Log Curve Data Batch
+ *
+ * Get log curve data for multiple curves, possibly from different wellbores and sources, in one request.
+ *
+ * Lookups that are shared between curves, such as the geology or survey headers of a wellbore, are only done once.
+ * The returned list matches the order of the request items, and a curve that could not be fetched is returned
+ * with an error message instead of failing the whole request.
+ */
+export const postLogCurveDataBatchMutation = (
+    options?: Partial<Options<PostLogCurveDataBatchData_api>>,
+): UseMutationOptions<
+    PostLogCurveDataBatchResponse_api,
+    AxiosError<PostLogCurveDataBatchError_api>,
+    Options<PostLogCurveDataBatchData_api>
+> => {
+    const mutationOptions: UseMutationOptions<
+        PostLogCurveDataBatchResponse_api,
+        AxiosError<PostLogCurveDataBatchError_api>,
+        Options<PostLogCurveDataBatchData_api>
+    > = {
+        mutationFn: async (fnOptions) => {
+            const { data } = await postLogCurveDataBatch({
+                ...options,
+                ...fnOptions,
+                throwOnError: true,
+            });
+            return data;
+        },
+    };
+    return mutationOptions;
+};
+
 export const getSeismicCubeMetaListQueryKey = (options: Options<GetSeismicCubeMetaListData_api>) =>
     createQueryKey("getSeismicCubeMetaList", options);
 
@@ -72,6 +72,10 @@ export {
     getRealizationFlowNetworkQueryKey,
     getRealizationSurfacesMetadataOptions,
     getRealizationSurfacesMetadataQueryKey,
+    getRealizationsVectorDataB64Options,
+    getRealizationsVectorDataB64QueryKey,
+    getRealizationsVectorDataForVectorsOptions,
+    getRealizationsVectorDataForVectorsQueryKey,
     getRealizationsVectorDataOptions,
     getRealizationsVectorDataQueryKey,
     getRftRealizationDataOptions,
@@ -102,6 +106,8 @@ export {
     getSnapshotsMetadataQueryKey,
     getStatisticalSurfaceDataHybridOptions,
     getStatisticalSurfaceDataHybridQueryKey,
+    getStatisticalVectorDataForVectorsOptions,
+    getStatisticalVectorDataForVectorsQueryKey,
     getStatisticalVectorDataOptions,
     getStatisticalVectorDataPerSensitivityOptions,
     getStatisticalVectorDataPerSensitivityQueryKey,
@@ -161,6 +167,9 @@ export {
     postGetWellTrajectoriesFormationSegmentsMutation,
     postGetWellTrajectoriesFormationSegmentsOptions,
     postGetWellTrajectoriesFormationSegmentsQueryKey,
+    postLogCurveDataBatchMutation,
+    postLogCurveDataBatchOptions,
+    postLogCurveDataBatchQueryKey,
     postLogoutMutation,
     postLogoutOptions,
     postLogoutQueryKey,
@@ -211,6 +220,8 @@ export {
     getRealizationFlowNetwork,
     getRealizationSurfacesMetadata,
     getRealizationsVectorData,
+    getRealizationsVectorDataB64,
+    getRealizationsVectorDataForVectors,
     getRftRealizationData,
     getRftTableDefinition,
     getSeismicCubeMetaList,
@@ -223,6 +234,7 @@ export {
     getSnapshotsMetadata,
     getStatisticalSurfaceDataHybrid,
     getStatisticalVectorData,
+    getStatisticalVectorDataForVectors,
     getStatisticalVectorDataPerSensitivity,
     getSurfaceData,
     getUserInfo,
@@ -249,6 +261,7 @@ export {
     postGetSeismicFence,
     postGetSurfaceIntersection,
     postGetWellTrajectoriesFormationSegments,
+    postLogCurveDataBatch,
     postLogout,
     postRefreshFingerprintsForEnsembles,
     root,
@@ -267,6 +280,7 @@ export {
     type BodyPostGetSeismicFence_api,
     type BodyPostGetSurfaceIntersection_api,
     type BodyPostGetWellTrajectoriesFormationSegments_api,
+    type BodyPostLogCurveDataBatch_api,
     type BoundingBox2d_api,
     type BoundingBox3d_api,
     type CaseInfo_api,
@@ -457,9 +471,19 @@ export {
     type GetRealizationSurfacesMetadataErrors_api,
     type GetRealizationSurfacesMetadataResponse_api,
     type GetRealizationSurfacesMetadataResponses_api,
+    type GetRealizationsVectorDataB64Data_api,
+    type GetRealizationsVectorDataB64Error_api,
+    type GetRealizationsVectorDataB64Errors_api,
+    type GetRealizationsVectorDataB64Response_api,
+    type GetRealizationsVectorDataB64Responses_api,
     type GetRealizationsVectorDataData_api,
     type GetRealizationsVectorDataError_api,
     type GetRealizationsVectorDataErrors_api,
+    type GetRealizationsVectorDataForVectorsData_api,
+    type GetRealizationsVectorDataForVectorsError_api,
+    type GetRealizationsVectorDataForVectorsErrors_api,
+    type GetRealizationsVectorDataForVectorsResponse_api,
+    type GetRealizationsVectorDataForVectorsResponses_api,
     type GetRealizationsVectorDataResponse_api,
     type GetRealizationsVectorDataResponses_api,
     type GetRftRealizationDataData_api,
@@ -520,6 +544,11 @@ export {
     type GetStatisticalVectorDataData_api,
     type GetStatisticalVectorDataError_api,
     type GetStatisticalVectorDataErrors_api,
+    type GetStatisticalVectorDataForVectorsData_api,
+    type GetStatisticalVectorDataForVectorsError_api,
+    type GetStatisticalVectorDataForVectorsErrors_api,
+    type GetStatisticalVectorDataForVectorsResponse_api,
+    type GetStatisticalVectorDataForVectorsResponses_api,
     type GetStatisticalVectorDataPerSensitivityData_api,
     type GetStatisticalVectorDataPerSensitivityError_api,
     type GetStatisticalVectorDataPerSensitivityErrors_api,
@@ -681,6 +710,11 @@ export {
     type PostGetWellTrajectoriesFormationSegmentsErrors_api,
     type PostGetWellTrajectoriesFormationSegmentsResponse_api,
     type PostGetWellTrajectoriesFormationSegmentsResponses_api,
+    type PostLogCurveDataBatchData_api,
+    type PostLogCurveDataBatchError_api,
+    type PostLogCurveDataBatchErrors_api,
+    type PostLogCurveDataBatchResponse_api,
+    type PostLogCurveDataBatchResponses_api,
     type PostLogoutData_api,
     type PostLogoutResponse_api,
     type PostLogoutResponses_api,
@@ -747,7 +781,10 @@ export {
     type VectorDescription_api,
     type VectorHistoricalData_api,
     type VectorRealizationData_api,
+    type VectorRealizationsDataB64_api,
+    type VectorRealizationsDataForVector_api,
     type VectorStatisticData_api,
+    type VectorStatisticDataForVector_api,
     type VectorStatisticSensitivityData_api,
     type VfpInjTable_api,
     type VfpProdTable_api,
@@ -756,6 +793,9 @@ export {
     type WellboreCompletions_api,
     type WellboreHeader_api,
     type WellboreLogCurveData_api,
+    type WellboreLogCurveDataBatchItem_api,
+    type WellboreLogCurveDataCompact_api,
+    type WellboreLogCurveDataRequestItem_api,
     type WellboreLogCurveHeader_api,
     type WellborePerforation_api,
     type WellborePerforations_api,
@@ -107,8 +107,14 @@ import type {
     GetRealizationSurfacesMetadataData_api,
     GetRealizationSurfacesMetadataErrors_api,
     GetRealizationSurfacesMetadataResponses_api,
+    GetRealizationsVectorDataB64Data_api,
+    GetRealizationsVectorDataB64Errors_api,
+    GetRealizationsVectorDataB64Responses_api,
     GetRealizationsVectorDataData_api,
     GetRealizationsVectorDataErrors_api,
+    GetRealizationsVectorDataForVectorsData_api,
+    GetRealizationsVectorDataForVectorsErrors_api,
+    GetRealizationsVectorDataForVectorsResponses_api,
     GetRealizationsVectorDataResponses_api,
     GetRftRealizationDataData_api,
     GetRftRealizationDataErrors_api,
@@ -145,6 +151,9 @@ import type {
     GetStatisticalSurfaceDataHybridResponses_api,
     GetStatisticalVectorDataData_api,
     GetStatisticalVectorDataErrors_api,
+    GetStatisticalVectorDataForVectorsData_api,
+    GetStatisticalVectorDataForVectorsErrors_api,
+    GetStatisticalVectorDataForVectorsResponses_api,
     GetStatisticalVectorDataPerSensitivityData_api,
     GetStatisticalVectorDataPerSensitivityErrors_api,
     GetStatisticalVectorDataPerSensitivityResponses_api,
@@ -221,6 +230,9 @@ import type {
     PostGetWellTrajectoriesFormationSegmentsData_api,
     PostGetWellTrajectoriesFormationSegmentsErrors_api,
     PostGetWellTrajectoriesFormationSegmentsResponses_api,
+    PostLogCurveDataBatchData_api,
+    PostLogCurveDataBatchErrors_api,
+    PostLogCurveDataBatchResponses_api,
     PostLogoutData_api,
     PostLogoutResponses_api,
     PostRefreshFingerprintsForEnsemblesData_api,
@@ -366,6 +378,47 @@ export const getRealizationsVectorData = <ThrowOnError extends boolean = false>(
         ...options,
     });
 
+/**
+ * Get Realizations Vector Data B64
+ *
+ * Get vector data for all realizations in a compact format using base64 encoded typed arrays.
+ *
+ * Returns the same data as the realizations_vector_data endpoint, but is much faster to produce and transfer for
+ * large numbers of realizations and dates.
+ */
+export const getRealizationsVectorDataB64 = <ThrowOnError extends boolean = false>(
+    options: Options<GetRealizationsVectorDataB64Data_api, ThrowOnError>,
+) =>
+    (options.client ?? client).get<
+        GetRealizationsVectorDataB64Responses_api,
+        GetRealizationsVectorDataB64Errors_api,
+        ThrowOnError
+    >({
+        responseType: "json",
+        url: "/timeseries/realizations_vector_data_b64/",
+        ...options,
+    });
+
+/**
+ * Get Realizations Vector Data For Vectors
+ *
+ * Get vector data per realization for multiple vectors in one request.
+ *
+ * All vectors are loaded concurrently and resampled together, the returned list has one entry per requested vector.
+ */
+export const getRealizationsVectorDataForVectors = <ThrowOnError extends boolean = false>(
+    options: Options<GetRealizationsVectorDataForVectorsData_api, ThrowOnError>,
+) =>
+    (options.client ?? client).get<
+        GetRealizationsVectorDataForVectorsResponses_api,
+        GetRealizationsVectorDataForVectorsErrors_api,
+        ThrowOnError
+    >({
+        responseType: "json",
+        url: "/timeseries/realizations_vector_data_for_vectors/",
+        ...options,
+    });
+
 /**
  * Get Delta Ensemble Realizations Vector Data
  *
@@ -422,6 +475,26 @@ export const getStatisticalVectorData = <ThrowOnError extends boolean = false>(
         ...options,
     });
 
+/**
+ * Get Statistical Vector Data For Vectors
+ *
+ * Get statistical vector data for an ensemble for multiple vectors in one request.
+ *
+ * All vectors are loaded concurrently and resampled together, the returned list has one entry per requested vector.
+ */
+export const getStatisticalVectorDataForVectors = <ThrowOnError extends boolean = false>(
+    options: Options<GetStatisticalVectorDataForVectorsData_api, ThrowOnError>,
+) =>
+    (options.client ?? client).get<
+        GetStatisticalVectorDataForVectorsResponses_api,
+        GetStatisticalVectorDataForVectorsErrors_api,
+        ThrowOnError
+    >({
+        responseType: "json",
+        url: "/timeseries/statistical_vector_data_for_vectors/",
+        ...options,
+    });
+
 /**
  * Get Delta Ensemble Statistical Vector Data
  *
@@ -1062,6 +1135,10 @@ export const getWellborePerforations = <ThrowOnError extends boolean = false>(
  *
  * Get all log curve headers for a single well bore.
  * Logs are available from multiple sources, which can be specificed by the "sources" parameter.
+ *
+ * The sources are queried concurrently. If some, but not all, of the sources fail, the headers from the
+ * successful sources are returned, and the failed sources are listed in the "x-failed-sources" response header.
+ * Each entry is a source value with the reason for the failure, e.g. "smda.survey; reason=timeout".
  */
 export const getWellboreLogCurveHeaders = <ThrowOnError extends boolean = false>(
     options: Options<GetWellboreLogCurveHeadersData_api, ThrowOnError>,
@@ -1090,6 +1167,28 @@ export const getLogCurveData = <ThrowOnError extends boolean = false>(
         ...options,
     });
 
+/**
+ * Post Log Curve Data Batch
+ *
+ * Get log curve data for multiple curves, possibly from different wellbores and sources, in one request.
+ *
+ * Lookups that are shared between curves, such as the geology or survey headers of a wellbore, are only done once.
+ * The returned list matches the order of the request items, and a curve that could not be fetched is returned
+ * with an error message instead of failing the whole request.
+ */
+export const postLogCurveDataBatch = <ThrowOnError extends boolean = false>(
+    options: Options<PostLogCurveDataBatchData_api, ThrowOnError>,
+) =>
+    (options.client ?? client).post<PostLogCurveDataBatchResponses_api, PostLogCurveDataBatchErrors_api, ThrowOnError>({
+        responseType: "json",
+        url: "/well/log_curve_data_batch/",
+        ...options,
+        headers: {
+            "Content-Type": "application/json",
+            ...options.headers,
+        },
+    });
+
 /**
  * Get Seismic Cube Meta List
  *
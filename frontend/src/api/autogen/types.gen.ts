@@ -112,6 +112,18 @@ export type BodyPostGetWellTrajectoriesFormationSegments_api = {
     well_trajectories: Array<WellTrajectory_api>;
 };
 
+/**
+ * Body_post_log_curve_data_batch
+ */
+export type BodyPostLogCurveDataBatch_api = {
+    /**
+     * Request Items
+     *
+     * Curves to fetch
+     */
+    request_items: Array<WellboreLogCurveDataRequestItem_api>;
+};
+
 /**
  * BoundingBox2d
  */
@@ -2381,6 +2393,57 @@ export type VectorRealizationData_api = {
     derivedVectorInfo?: DerivedVectorInfo_api | null;
 };
 
+/**
+ * VectorRealizationsDataB64
+ *
+ * Compact representation of the data for all realizations of a vector, using base64 encoded typed arrays.
+ *
+ * The values of all realizations are concatenated into values_b64arr (float32), ordered by realization, with
+ * realizationRowCounts[i] values for realizations[i].
+ * If timestampsAreShared is true, all realizations have the same timestamps and timestampsUtcMs_b64arr only holds the
+ * timestamps of one realization. Otherwise it holds the timestamps of all the concatenated values.
+ * The timestamps are encoded as float64, which represents millisecond timestamps exactly.
+ */
+export type VectorRealizationsDataB64_api = {
+    /**
+     * Realizations
+     */
+    realizations: Array<number>;
+    /**
+     * Realizationrowcounts
+     */
+    realizationRowCounts: Array<number>;
+    /**
+     * Timestampsareshared
+     */
+    timestampsAreShared: boolean;
+    timestampsUtcMs_b64arr: B64FloatArray_api;
+    values_b64arr: B64FloatArray_api;
+    /**
+     * Unit
+     */
+    unit: string;
+    /**
+     * Israte
+     */
+    isRate: boolean;
+    derivedVectorInfo?: DerivedVectorInfo_api | null;
+};
+
+/**
+ * VectorRealizationsDataForVector
+ */
+export type VectorRealizationsDataForVector_api = {
+    /**
+     * Vectorname
+     */
+    vectorName: string;
+    /**
+     * Realizationdata
+     */
+    realizationData: Array<VectorRealizationData_api>;
+};
+
 /**
  * VectorStatisticData
  */
@@ -2408,6 +2471,17 @@ export type VectorStatisticData_api = {
     derivedVectorInfo?: DerivedVectorInfo_api | null;
 };
 
+/**
+ * VectorStatisticDataForVector
+ */
+export type VectorStatisticDataForVector_api = {
+    /**
+     * Vectorname
+     */
+    vectorName: string;
+    statisticData: VectorStatisticData_api;
+};
+
 /**
  * VectorStatisticSensitivityData
  */
@@ -3073,6 +3147,109 @@ export type WellboreLogCurveData_api = {
     discreteValueMetadata: Array<DiscreteValueMetadata_api> | null;
 };
 
+/**
+ * WellboreLogCurveDataBatchItem
+ *
+ * Result for one requested curve in a batch, holds either the curve data or an error message
+ */
+export type WellboreLogCurveDataBatchItem_api = {
+    request: WellboreLogCurveDataRequestItem_api;
+    curveData: WellboreLogCurveDataCompact_api | null;
+    /**
+     * Errormessage
+     */
+    errorMessage: string | null;
+};
+
+/**
+ * WellboreLogCurveDataCompact
+ *
+ * Same as WellboreLogCurveData, but with the data points split into typed arrays.
+ *
+ * The curve values are given as float64 with NaN for missing values, except for curves with string values,
+ * in which case they are given in curveValuesStr instead.
+ */
+export type WellboreLogCurveDataCompact_api = {
+    source: WellLogCurveSourceEnum_api;
+    /**
+     * Name
+     */
+    name: string;
+    /**
+     * Logname
+     */
+    logName: string;
+    /**
+     * Indexmin
+     */
+    indexMin: number;
+    /**
+     * Indexmax
+     */
+    indexMax: number;
+    /**
+     * Mincurvevalue
+     */
+    minCurveValue: number | null;
+    /**
+     * Maxcurvevalue
+     */
+    maxCurveValue: number | null;
+    /**
+     * Curvealias
+     */
+    curveAlias: string | null;
+    /**
+     * Curvedescription
+     */
+    curveDescription: string | null;
+    /**
+     * Indexunit
+     */
+    indexUnit: string;
+    /**
+     * Nodatavalue
+     */
+    noDataValue: number | null;
+    /**
+     * Unit
+     */
+    unit: string | null;
+    /**
+     * Curveunitdesc
+     */
+    curveUnitDesc: string | null;
+    indexValuesB64arr: B64FloatArray_api;
+    curveValuesB64arr: B64FloatArray_api | null;
+    /**
+     * Curvevaluesstr
+     */
+    curveValuesStr: Array<string | null> | null;
+    /**
+     * Discretevaluemetadata
+     */
+    discreteValueMetadata: Array<DiscreteValueMetadata_api> | null;
+};
+
+/**
+ * WellboreLogCurveDataRequestItem
+ */
+export type WellboreLogCurveDataRequestItem_api = {
+    /**
+     * Wellboreuuid
+     */
+    wellboreUuid: string;
+    source: WellLogCurveSourceEnum_api;
+    /**
+     * Curvename
+     */
+    curveName: string;
+    /**
+     * Logname
+     */
+    logName: string;
+};
+
 /**
  * WellboreLogCurveHeader
  */
@@ -3545,6 +3722,126 @@ export type GetRealizationsVectorDataResponses_api = {
 export type GetRealizationsVectorDataResponse_api =
     GetRealizationsVectorDataResponses_api[keyof GetRealizationsVectorDataResponses_api];
 
+export type GetRealizationsVectorDataB64Data_api = {
+    body?: never;
+    path?: never;
+    query: {
+        /**
+         * Case Uuid
+         *
+         * Sumo case uuid
+         */
+        case_uuid: string;
+        /**
+         * Ensemble Name
+         *
+         * Ensemble name
+         */
+        ensemble_name: string;
+        /**
+         * Vector Name
+         *
+         * Name of the vector
+         */
+        vector_name: string;
+        /**
+         * Resampling Frequency
+         *
+         * Resampling frequency. If not specified, raw data without resampling wil be returned.
+         */
+        resampling_frequency?: Frequency_api | null;
+        /**
+         * Realizations Encoded As Uint List Str
+         *
+         * Optional list of realizations encoded as string to include. If not specified, all realizations will be included.
+         */
+        realizations_encoded_as_uint_list_str?: string | null;
+        zCacheBust?: string;
+    };
+    url: "/timeseries/realizations_vector_data_b64/";
+};
+
+export type GetRealizationsVectorDataB64Errors_api = {
+    /**
+     * Validation Error
+     */
+    422: HTTPValidationError_api;
+};
+
+export type GetRealizationsVectorDataB64Error_api =
+    GetRealizationsVectorDataB64Errors_api[keyof GetRealizationsVectorDataB64Errors_api];
+
+export type GetRealizationsVectorDataB64Responses_api = {
+    /**
+     * Successful Response
+     */
+    200: VectorRealizationsDataB64_api;
+};
+
+export type GetRealizationsVectorDataB64Response_api =
+    GetRealizationsVectorDataB64Responses_api[keyof GetRealizationsVectorDataB64Responses_api];
+
+export type GetRealizationsVectorDataForVectorsData_api = {
+    body?: never;
+    path?: never;
+    query: {
+        /**
+         * Case Uuid
+         *
+         * Sumo case uuid
+         */
+        case_uuid: string;
+        /**
+         * Ensemble Name
+         *
+         * Ensemble name
+         */
+        ensemble_name: string;
+        /**
+         * Vector Names
+         *
+         * Names of the vectors
+         */
+        vector_names: Array<string>;
+        /**
+         * Resampling Frequency
+         *
+         * Resampling frequency. If not specified, raw data without resampling wil be returned.
+         */
+        resampling_frequency?: Frequency_api | null;
+        /**
+         * Realizations Encoded As Uint List Str
+         *
+         * Optional list of realizations encoded as string to include. If not specified, all realizations will be included.
+         */
+        realizations_encoded_as_uint_list_str?: string | null;
+        zCacheBust?: string;
+    };
+    url: "/timeseries/realizations_vector_data_for_vectors/";
+};
+
+export type GetRealizationsVectorDataForVectorsErrors_api = {
+    /**
+     * Validation Error
+     */
+    422: HTTPValidationError_api;
+};
+
+export type GetRealizationsVectorDataForVectorsError_api =
+    GetRealizationsVectorDataForVectorsErrors_api[keyof GetRealizationsVectorDataForVectorsErrors_api];
+
+export type GetRealizationsVectorDataForVectorsResponses_api = {
+    /**
+     * Response Get Realizations Vector Data For Vectors
+     *
+     * Successful Response
+     */
+    200: Array<VectorRealizationsDataForVector_api>;
+};
+
+export type GetRealizationsVectorDataForVectorsResponse_api =
+    GetRealizationsVectorDataForVectorsResponses_api[keyof GetRealizationsVectorDataForVectorsResponses_api];
+
 export type GetDeltaEnsembleRealizationsVectorDataData_api = {
     body?: never;
     path?: never;
@@ -3732,6 +4029,71 @@ export type GetStatisticalVectorDataResponses_api = {
 export type GetStatisticalVectorDataResponse_api =
     GetStatisticalVectorDataResponses_api[keyof GetStatisticalVectorDataResponses_api];
 
+export type GetStatisticalVectorDataForVectorsData_api = {
+    body?: never;
+    path?: never;
+    query: {
+        /**
+         * Case Uuid
+         *
+         * Sumo case uuid
+         */
+        case_uuid: string;
+        /**
+         * Ensemble Name
+         *
+         * Ensemble name
+         */
+        ensemble_name: string;
+        /**
+         * Vector Names
+         *
+         * Names of the vectors
+         */
+        vector_names: Array<string>;
+        /**
+         * Resampling frequency
+         */
+        resampling_frequency: Frequency_api;
+        /**
+         * Statistic Functions
+         *
+         * Optional list of statistics to calculate. If not specified, all statistics will be calculated.
+         */
+        statistic_functions?: Array<StatisticFunction_api> | null;
+        /**
+         * Realizations Encoded As Uint List Str
+         *
+         * Optional list of realizations encoded as string to include. If not specified, all realizations will be included.
+         */
+        realizations_encoded_as_uint_list_str?: string | null;
+        zCacheBust?: string;
+    };
+    url: "/timeseries/statistical_vector_data_for_vectors/";
+};
+
+export type GetStatisticalVectorDataForVectorsErrors_api = {
+    /**
+     * Validation Error
+     */
+    422: HTTPValidationError_api;
+};
+
+export type GetStatisticalVectorDataForVectorsError_api =
+    GetStatisticalVectorDataForVectorsErrors_api[keyof GetStatisticalVectorDataForVectorsErrors_api];
+
+export type GetStatisticalVectorDataForVectorsResponses_api = {
+    /**
+     * Response Get Statistical Vector Data For Vectors
+     *
+     * Successful Response
+     */
+    200: Array<VectorStatisticDataForVector_api>;
+};
+
+export type GetStatisticalVectorDataForVectorsResponse_api =
+    GetStatisticalVectorDataForVectorsResponses_api[keyof GetStatisticalVectorDataForVectorsResponses_api];
+
 export type GetDeltaEnsembleStatisticalVectorDataData_api = {
     body?: never;
     path?: never;
@@ -5597,6 +5959,36 @@ export type GetLogCurveDataResponses_api = {
 
 export type GetLogCurveDataResponse_api = GetLogCurveDataResponses_api[keyof GetLogCurveDataResponses_api];
 
+export type PostLogCurveDataBatchData_api = {
+    body: BodyPostLogCurveDataBatch_api;
+    path?: never;
+    query?: {
+        zCacheBust?: string;
+    };
+    url: "/well/log_curve_data_batch/";
+};
+
+export type PostLogCurveDataBatchErrors_api = {
+    /**
+     * Validation Error
+     */
+    422: HTTPValidationError_api;
+};
+
+export type PostLogCurveDataBatchError_api = PostLogCurveDataBatchErrors_api[keyof PostLogCurveDataBatchErrors_api];
+
+export type PostLogCurveDataBatchResponses_api = {
+    /**
+     * Response Post Log Curve Data Batch
+     *
+     * Successful Response
+     */
+    200: Array<WellboreLogCurveDataBatchItem_api>;
+};
+
+export type PostLogCurveDataBatchResponse_api =
+    PostLogCurveDataBatchResponses_api[keyof PostLogCurveDataBatchResponses_api];
+
 export type GetSeismicCubeMetaListData_api = {
     body?: never;
     path?: never;